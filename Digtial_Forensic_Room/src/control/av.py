@@ -15,5 +15,253 @@ Examples:
 # Python imports
 
 # Extron Library imports
+from extronlib import event
+from extronlib.device import UIDevice
+from extronlib.system import MESet
+from extronlib.ui import Button
 
 # Project imports
+import variables as v
+import modules.helper.Watchdog as Watchdog
+
+
+# Panel alias: UIDevice, so rooms that share a panel share its UIDevice
+_panels = {}
+
+
+def get_panel(alias):
+    panel = _panels.get(alias)
+    if panel is None:
+        panel = _panels[alias] = UIDevice(alias)
+    return panel
+
+
+class Router:
+    def __init__(self, switcher, log, name='Router'):
+        self.switcher = switcher
+        self.current_source = 0
+        self.log = log
+        self.name = name
+        self.log.Log(self.name, 'Router initialized')
+
+    def set_source(self, src):
+        self.current_source = src
+        self.log.Log(self.name, 'Source selected:', src, severity='debug')
+
+    def route_to(self, out_num, src=None, tie_type='Audio/Video', refresh=True):
+        if src is not None:
+            self.current_source = src
+            self.log.Log(self.name, 'Source overridden to', src, severity='debug')
+        self.log.Log(self.name, 'Routing Input', self.current_source, '→ Output', out_num,
+                     tie_type, severity='debug')
+        self.switcher.Set('MatrixTieCommand', None, {
+            'Input': str(self.current_source),
+            'Output': str(out_num),
+            'Tie Type': tie_type
+        })
+        if refresh:
+            self.log.Log(self.name, 'Refreshing matrix', severity='debug')
+            self.switcher.Set('RefreshMatrix', None)
+
+    def clear_to(self, out_num, tie_type='Audio/Video', refresh=True):
+        self.log.Log(self.name, 'Clearing Output', out_num, severity='debug')
+        self.switcher.Set('MatrixTieCommand', None, {
+            'Input': '0',
+            'Output': str(out_num),
+            'Tie Type': tie_type
+        })
+        if refresh:
+            self.log.Log(self.name, 'Refreshing matrix', severity='debug')
+            self.switcher.Set('RefreshMatrix', None)
+
+
+class Display:
+    def __init__(self, handler, power_on_btn, power_off_btn, name=None):
+        self.name = name
+        self.handler = handler
+        self.power_on_btn = power_on_btn
+        self.power_off_btn = power_off_btn
+
+    def power(self, value):
+        self.handler.Set('Power', value)
+        self.handler.Update('Power')
+
+    def power_feedback(self, command, value, qualifier):
+        on = value == 'On'
+        self.power_on_btn.SetState(1 if on else 0)
+        self.power_off_btn.SetState(0 if on else 1)
+
+
+class Room:
+    """One room: its devices and handlers, Router, panel bindings and state.
+
+    Every event, status and connection callback of the room runs through guard(), so an error in
+    one room is logged with the room's name and counted in its errors, and does not reach the
+    other rooms, and a callback that stalls is reported by the watchdog under the room's name.
+    """
+
+    def __init__(self, spec, log, poll_scheduler=None):
+        self.spec = spec
+        self.name = spec.Name
+        self.log = log
+        self.errors = 0
+        self.last_error = None
+
+        self.panel = get_panel(spec.Panel)
+        options = {} if poll_scheduler is None else {'pollScheduler': poll_scheduler}
+        self.devices = spec.DefineDevices(**options)
+        self.switcher = self.devices[spec.Router.Switcher]
+        self.router = Router(self.switcher, log, self.name)
+
+        self.start_btn = Button(self.panel, spec.Buttons['Start'])
+        self.shutdown_btn = Button(self.panel, spec.Buttons['Shutdown'])
+        self.shutdown_confirm_btn = Button(self.panel, spec.Buttons['ShutdownConfirm'])
+        self.shutdown_cancel_btn = Button(self.panel, spec.Buttons['ShutdownCancel'])
+        self.displays = [Display(self.devices[d.Device], Button(self.panel, d.PowerOn),
+                                 Button(self.panel, d.PowerOff), d.Device)
+                         for d in spec.Displays]
+        # Set by track_status
+        self.snapshot = None
+
+        self.src_btns_dict = {Button(self.panel, ID): src for ID, src in spec.Router.Sources}
+        self.dest_btns_dict = {Button(self.panel, ID): out_num
+                               for ID, out_num in spec.Router.Destinations}
+        self.outputs = [out_num for _, out_num in spec.Router.Destinations]
+        self.sw_src_group = MESet(list(self.src_btns_dict))
+        self.sw_dest_group = MESet(list(self.dest_btns_dict))
+
+        self._bind_events()
+
+    def guard(self, func):
+        """Return func wrapped so that an exception it raises is logged and counted for this
+        room instead of propagating."""
+        def guarded(*args):
+            try:
+                return func(*args)
+            except Exception as err:
+                self.errors += 1
+                self.last_error = '{}: {}'.format(type(err).__name__, err)
+                self.log.Log(self.name, getattr(func, '__name__', func), 'raised',
+                             self.last_error, severity='error')
+        guarded.__name__ = getattr(func, '__name__', 'guarded')
+        return Watchdog.Watch(guarded, '{}: {}'.format(self.name, guarded.__name__))
+
+    def _bind_events(self):
+        def on(obj, event_name):
+            def deco(func):
+                event(obj, event_name)(self.guard(func))
+                return func
+            return deco
+
+        @on(self.start_btn, 'Pressed')
+        def start_pressed(button, state):
+            self.startup()
+
+        @on(self.shutdown_btn, 'Pressed')
+        def shutdown_pressed(button, state):
+            if state == 'Pressed':
+                self.panel.ShowPopup(v.PopupShutdown)
+                button.SetState(1)
+
+        @on(self.shutdown_confirm_btn, 'Pressed')
+        def shutdown_confirm_pressed(button, state):
+            if state == 'Pressed':
+                self.shutdown()
+                self.shutdown_btn.SetState(0)
+
+        @on(self.shutdown_cancel_btn, 'Pressed')
+        def shutdown_cancel_pressed(button, state):
+            if state == 'Pressed':
+                self.panel.HidePopup(v.PopupShutdown)
+                self.panel.ShowPopup(v.PopupRouting)
+                self.shutdown_btn.SetState(0)
+
+        for display in self.displays:
+            event(display.power_on_btn, 'Pressed')(
+                self.guard(lambda button, state, d=display: d.power('On')))
+            event(display.power_off_btn, 'Pressed')(
+                self.guard(lambda button, state, d=display: d.power('Off')))
+
+        @on(self.sw_src_group.Objects, 'Pressed')
+        def src_pressed(button, state):
+            src = self.src_btns_dict[button]
+            self.log.Log(self.name, 'Source button pressed →', src, severity='debug')
+            self.sw_src_group.SetCurrent(button)
+            self.router.set_source(src)
+
+        @on(self.sw_dest_group.Objects, 'Pressed')
+        def dest_pressed(button, state):
+            out_num = self.dest_btns_dict[button]
+            self.log.Log(self.name, 'Destination button pressed → Output', out_num,
+                         severity='debug')
+            self.sw_dest_group.SetCurrent(button)
+            self.router.route_to(out_num, refresh=True)
+
+    def show_start_page(self):
+        self.panel.ShowPage(v.PageStart)
+        self.panel.HideAllPopups()
+
+    def status_name(self, device_name):
+        """The name a device of this room is kept under in the status snapshot."""
+        return '{}/{}'.format(self.name, device_name)
+
+    def track_status(self, snapshot):
+        """Keep the statuses of the room's devices in snapshot (a StatusSnapshot), restoring
+        the saved ones as provisional values. Call after the devices are built and before
+        connect()."""
+        self.snapshot = snapshot
+        for name, device in self.devices.items():
+            attributes = ('matrix_tie_status',) if device is self.switcher else ()
+            snapshot.Track(self.status_name(name), device, Attributes=attributes)
+
+    def _checked_by_poll(self, display):
+        # A restored power state is left to the display's keep alive poll if that polls Power.
+        if self.snapshot is None or \
+                not self.snapshot.IsProvisional(self.status_name(display.name), 'Power'):
+            return False
+        spec = next(d for d in self.spec.Devices if d.Name == display.name)
+        return (spec.Handler or {}).get('keepAliveQuery') == 'Power'
+
+    def connect(self):
+        """Subscribe to feedback and connect the room's devices. The devices must have been
+        built (DeviceRegistry.BuildAll)."""
+        for display in self.displays:
+            feedback = self.guard(display.power_feedback)
+            display.handler.SubscribeStatus('Power', None, feedback)
+            # A power state restored from the snapshot is shown at once.
+            power = display.handler.ReadStatus('Power')
+            if power is not None:
+                feedback('Power', power, None)
+        for handler in self.devices.values():
+            handler.Connect()
+        for display in self.displays:
+            if not self._checked_by_poll(display):
+                display.handler.Update('Power')
+
+    def startup(self):
+        self.log.Log(self.name, 'Startup sequence start')
+        self.panel.ShowPopup(v.PopupStartingUp, v.WaitDuration)
+        self.panel.HideAllPopups()
+        self.panel.ShowPage(v.PageMain)
+        self.panel.ShowPopup(v.PopupRouting)
+        self.log.Log(self.name, 'Power displays On')
+        for display in self.displays:
+            display.power('On')
+        self.log.Log(self.name, 'Applying default routing')
+        self.router.set_source(self.spec.Router.DefaultInput)
+        for out_num in self.outputs:
+            self.router.route_to(out_num, refresh=out_num == self.outputs[-1])
+        self.log.Log(self.name, 'Applying default routes')
+
+    def shutdown(self):
+        self.log.Log(self.name, 'Shutdown sequence begin')
+        self.panel.ShowPopup(v.PopupPoweringDown)
+        self.panel.HideAllPopups()
+        self.log.Log(self.name, 'Power displays off')
+        for display in self.displays:
+            display.power('Off')
+        self.panel.ShowPage(v.PageStart)
+        self.log.Log(self.name, 'Clearing matrix routes')
+        for out_num in self.outputs:
+            self.router.clear_to(out_num, refresh=out_num == self.outputs[-1])
+        self.log.Log(self.name, 'Shutdown sequence complete')
@@ -1,8 +1,731 @@
 from extronlib.interface import SerialInterface, EthernetClientInterface
 from extronlib.system import Wait, ProgramLog
 import re
+from types import MappingProxyType
+
+from modules.helper.Latency import GetRecorder
+from modules.helper.Protocol import Level, Protocol, Range, StereoChannel, Table
+from modules.helper.Trace import GetChannel
+
+
+_OnOff = {'On': '1', 'Off': '0'}
+_Side = {'Left': '16', 'Right': '17'}
+_ScaledOutput = Range('ScaledOutputConstraints.Min', 'ScaledOutputConstraints.Max')
+_Logos = {str(logo): str(logo) for logo in range(1, 17)}
+_VirtualChannel = Table({'A': '0', 'B': '1', 'C': '2', 'D': '3', 'E': '4', 'F': '5', 'G': '6', 'H': '7'})
+
+_Resolutions = {
+    '640x480 (60Hz)'            : '10',
+    '800x600 (60Hz)'            : '11',
+    '1024x768 (60Hz)'           : '12',
+    '1280x768 (60Hz)'           : '13',
+    '1280x800 (60Hz)'           : '14',
+    '1280x1024 (60Hz)'          : '15',
+    '1360x768 (60Hz)'           : '16',
+    '1366x768 (60Hz)'           : '17',
+    '1440x900 (60Hz)'           : '18',
+    '1400x1050 (60Hz)'          : '19',
+    '1600x900 (60Hz)'           : '20',
+    '1680x1050 (60Hz)'          : '21',
+    '1600x1200 (60Hz)'          : '22',
+    '1920x1200 (60Hz)'          : '23',
+    '480p (59.94Hz)'            : '24',
+    '480p (60Hz)'               : '25',
+    '576p (50Hz)'               : '26',
+    '720p (23.98Hz)'            : '27',
+    '720p (24Hz)'               : '28',
+    '720p (25Hz)'               : '29',
+    '720p (29.97Hz)'            : '30',
+    '720p (30Hz)'               : '31',
+    '720p (50Hz)'               : '32',
+    '720p (59.94Hz)'            : '33',
+    '720p (60Hz)'               : '34',
+    '1080i (50Hz)'              : '35',
+    '1080i (59.94Hz)'           : '36',
+    '1080i (60Hz)'              : '37',
+    '1080p (23.98Hz)'           : '38',
+    '1080p (24Hz)'              : '39',
+    '1080p (25Hz)'              : '40',
+    '1080p (29.97Hz)'           : '41',
+    '1080p (30Hz)'              : '42',
+    '1080p (50Hz)'              : '43',
+    '1080p (59.94Hz)'           : '44',
+    '1080p (60Hz)'              : '45',
+    '2048x1080 2K (23.98Hz)'    : '46',
+    '2048x1080 2K (24Hz)'       : '47',
+    '2048x1080 2K (25Hz)'       : '48',
+    '2048x1080 2K (29.97Hz)'    : '49',
+    '2048x1080 2K (30Hz)'       : '50',
+    '2048x1080 2K (50Hz)'       : '51',
+    '2048x1080 2K (59.94Hz)'    : '52',
+    '2048x1080 2K (60Hz)'       : '53',
+    '1920x2160 (23.98Hz)'       : '54',
+    '1920x2160 (24Hz)'          : '55',
+    '1920x2160 (25Hz)'          : '56',
+    '1920x2160 (29.97Hz)'       : '57',
+    '1920x2160 (30Hz)'          : '58',
+    '1920x2160 (50Hz)'          : '59',
+    '1920x2160 (59.94Hz)'       : '60',
+    '1920x2160 (60Hz)'          : '61',
+    '1920x2400 (30Hz)'          : '62',
+    '1920x2400 (60Hz)'          : '63',
+    '2048x1200 (60Hz)'          : '64',
+    '2048x1536 (60Hz)'          : '65',
+    '2048x2160 (23.98Hz)'       : '66',
+    '2048x2160 (24Hz)'          : '67',
+    '2048x2160 (25Hz)'          : '68',
+    '2048x2160 (29.97Hz)'       : '69',
+    '2048x2160 (30Hz)'          : '70',
+    '2048x2160 (50Hz)'          : '71',
+    '2048x2160 (59.94Hz)'       : '72',
+    '2048x2160 (60Hz)'          : '73',
+    '2048x2400 (30Hz)'          : '74',
+    '2560x1080 (60Hz)'          : '76',
+    '2560x1440 (60Hz)'          : '77',
+    '2560x1600 (60Hz)'          : '78',
+    '3840x2160 (23.98Hz)'       : '79',
+    '3840x2160 (24Hz)'          : '80',
+    '3840x2160 (25Hz)'          : '81',
+    '3840x2160 (29.97Hz)'       : '82',
+    '3840x2160 (30Hz)'          : '83',
+    '3840x2400 (30Hz)'          : '87',
+    '3840x2400 (60Hz)'          : '88',
+    '4096x2160 (23.98Hz)'       : '89',
+    '4096x2160 (24Hz)'          : '90',
+    '4096x2160 (25Hz)'          : '91',
+    '4096x2160 (29.97Hz)'       : '92',
+    '4096x2160 (30Hz)'          : '93',
+}
+
+# Rates the device reports but does not accept.
+_ReportedResolutions = {wire: name for name, wire in _Resolutions.items()}
+_ReportedResolutions.update({
+    '75': '2048x2400 (60Hz)',
+    '84': '3840x2160 (50Hz)',
+    '85': '3840x2160 (59.94Hz)',
+    '86': '3840x2160 (60Hz)',
+})
+
+# Commands whose strings and replies are plain table lookups and ranges. The rest of the
+# protocol (ties, groups, mixpoints, amplifier replies, multi-value queries, presets and
+# device modes) is written out in DeviceClass.
+Spec = {
+    'AmplifierAttenuationSA': {
+        'Parameters': {'Side': Table(_Side, Key='L/R')},
+        'Value': Level(-100, 0),
+        'Set': 'WG600{Side}*{Value}AU\r',
+        'Update': 'WG600{Side}AU\r',
+    },
+    'AmplifierAttenuationMA': {
+        'Value': Level(-100, 0),
+        'Set': 'WG60016*{Value}AU\r',
+        'Update': 'WG60016AU\r',
+    },
+    'AmplifierMuteSA': {
+        'Parameters': {'Side': Table(_Side, Key='L/R')},
+        'Value': Table(_OnOff),
+        'Set': 'WM600{Side}*{Value}AU\r',
+        'Update': 'WM600{Side}AU\r',
+    },
+    'AmplifierMuteMA': {
+        'Value': Table(_OnOff),
+        'Set': 'WM60016*{Value}AU\r',
+        'Update': 'WM60016AU\r',
+    },
+    'AmplifierPostmixerTrim': {
+        'Parameters': {'Side': Table({'Left': '6', 'Right': '7'}, Key='L/R')},
+        'Value': Level(-12, 12),
+        'Set': 'WG6011{Side}*{Value}AU\r',
+        'Update': 'WG6011{Side}AU\r',
+        'Match': rb'Ds[gG]6011([67])\*([0-9 -]{1,4})\r\n',
+    },
+    'AnalogAttenuation': {
+        'Parameters': {'Channel': StereoChannel('OutputConstraints.Min', 'OutputConstraints.Max')},
+        'Value': Level(-100, 0),
+        'Set': 'WG6000{Channel}*{Value}AU\r',
+        'Update': 'WG6000{Channel}AU\r',
+        'Match': rb'Ds[gG]6000([0-7])\*([-]\d{1,4}|0)\r\n',
+    },
+    'AnalogMute': {
+        'Parameters': {'Channel': StereoChannel('OutputConstraints.Min', 'OutputConstraints.Max')},
+        'Value': Table(_OnOff),
+        'Set': 'WM6000{Channel}*{Value}AU\r',
+        'Update': 'WM6000{Channel}AU\r',
+        'Match': rb'Ds[mM]6000([0-7])\*(0|1)\r\n',
+    },
+    'AspectRatio': {
+        'Parameters': {'Input': Range(1, 'InputSize')},
+        'Value': Table({'Fill': '1', 'Follow': '2'}),
+        'Set': 'w{Input}*{Value}ASPR\r\n',
+        'Update': 'w{Input}ASPR\r\n',
+        'Match': rb'Aspr(\d{2})\*(1|2)\r\n',
+    },
+    'AutoImage': {
+        'Parameters': {'Output': _ScaledOutput},
+        'Set': '{Output}*A',
+    },
+    'EDIDAssignment': {
+        'Parameters': {'Input': Range(1, 'InputSize')},
+        'Value': Table(Decode='EDIDStates'),
+        'Update': 'wA{Input}EDID\r',
+        'Match': rb'EdidA(0[1-8])\*(0?[1-9]|[1-5][0-9]|60)\r\n',
+    },
+    'ExecutiveMode': {
+        'Value': Table({'Mode 1': '1X', 'Mode 2': '2X', 'Off': '0X'},
+                       Decode={'1': 'Mode 1', '2': 'Mode 2', '0': 'Off'}),
+        'Set': '{Value}',
+        'Update': 'X',
+        'Match': rb'Exe([0-2])\r\n',
+    },
+    'ExpansionPremixerGain': {
+        'Parameters': {'Input': Range(1, 16, Offset=50199, MatchOffset=1)},
+        'Value': Level(-100, 12, Format='{:05d}'),
+        'Set': 'wG{Input}*{Value}AU\r',
+        'Update': 'wG{Input}AU\r',
+        'Match': rb'Ds[gG]502([01][0-9])\*([0-9 -]{1,5})\r\n',
+    },
+    'ExpansionPremixerMute': {
+        'Parameters': {'Input': Range(1, 16, Offset=50199, MatchOffset=1)},
+        'Value': Table(_OnOff),
+        'Set': 'wM{Input}*{Value}AU\r',
+        'Update': 'wM{Input}AU\r',
+        'Match': rb'Ds[mM]502([01][0-9])\*([01])\r\n',
+    },
+    'Freeze': {
+        'Parameters': {'Output': _ScaledOutput},
+        'Value': Table(_OnOff, Decode={'01': 'On', '00': 'Off'}),
+        'Set': '{Output}*{Value}F',
+        'Update': '{Output}F',
+        'Match': rb'Frz(\d{2})\*(00|01)\r\n',
+    },
+    'GlobalVideoMute': {
+        'Value': Table({'Video': '1', 'Video & Sync': '2', 'Off': '0'}),
+        'Set': '{Value}*B',
+    },
+    'HDCPInputAuthorization': {
+        'Parameters': {'Input': Range(1, 'InputSize')},
+        'Value': Table(_OnOff),
+        'Set': 'wE{Input}*{Value}HDCP\r\n',
+        'Update': 'wE{Input}HDCP\r\n',
+        'Match': rb'HdcpE(\d{2})\*(0|1)\r\n',
+    },
+    'HDCPInputStatus': {
+        'Parameters': {'Input': Range(1, 'InputSize')},
+        'Value': Table(Decode={
+            '0': 'No Source Connected',
+            '1': 'HDCP Content',
+            '2': 'No HDCP Content'
+        }),
+        'Update': 'wI{Input}HDCP\r',
+        'Match': rb'HdcpI(\d{2})\*([0-2])\r\n',
+    },
+    'HDCPOutputAuthorization': {
+        'Parameters': {'Output': Table('OutputStates', Decode='OutputStates', Upper=True)},
+        'Value': Table({'On': '1', 'Auto': '0'}),
+        'Set': 'wS{Output}*{Value}HDCP\r\n',
+        'Update': 'wS{Output}HDCP\r\n',
+        'Match': rb'HdcpS(([1-4])(A|B|a|b|))\*(0|1)\r\n',
+        'Groups': ('Output', None, None, 'Value'),
+    },
+    'HDCPOutputStatus': {
+        'Parameters': {'Output': Table('OutputStates', Decode='OutputStates')},
+        'Value': Table(Decode={
+            '0': 'No monitor connected',
+            '1': 'Monitor connected, HDCP not supported',
+            '2': 'Monitor connected, not encrypted',
+            '3': 'Monitor connected, currently encrypted'
+        }),
+        'Update': 'wO{Output}HDCP\r',
+        'Match': rb'HdcpO(1|1A|1B|2|2A|2B|3|3A|3B|4|4A|4B)\*([0-3])\r\n',
+    },
+    'HDMIAttenuation': {
+        'Parameters': {'Channel': StereoChannel('OutputConstraints.Min', 'OutputConstraints.Max')},
+        'Value': Level(-100, 0),
+        'Set': 'WG6020{Channel}*{Value}AU\r',
+        'Update': 'WG6020{Channel}AU\r',
+        'Match': rb'Ds[gG]6020([0-7])\*([-]\d{1,4}|0)\r\n',
+    },
+    'HDMIMute': {
+        'Parameters': {'Channel': StereoChannel('OutputConstraints.Min', 'OutputConstraints.Max')},
+        'Value': Table(_OnOff),
+        'Set': 'WM6020{Channel}*{Value}AU\r',
+        'Update': 'WM6020{Channel}AU\r',
+        'Match': rb'Ds[mM]6020([0-7])\*(0|1)\r\n',
+    },
+    'InputFormat': {
+        'Parameters': {'Input': Range(1, 'InputSize')},
+        'Value': Table(Decode={
+            '0': 'No signal detected',
+            '1': 'DVI RGB 444',
+            '2': 'HDMI RGB 444 Full',
+            '3': 'HDMI RGB 444 Limited',
+            '4': 'HDMI YUV 444 Full',
+            '5': 'HDMI YUV 444 Limited',
+            '6': 'HDMI YUV 422 Full',
+            '7': 'HDMI YUV 422 Limited'
+        }),
+        'Update': '{Input}*\\\r',
+        'Match': rb'Ityp(0[1-9]|10)\*([0-7])\r\n',
+    },
+    'InputGain': {
+        'Parameters': {
+            'Format': Table({'Analog': 'G', 'Digital': 'H'}, Upper=True),
+            'Channel': StereoChannel(1, 8, Offset=30000, MatchOffset=0, Key='Input'),
+        },
+        'Value': Level(-18, 24, Format='{:05d}'),
+        'Set': 'w{Format}{Channel}*{Value}AU\r',
+        'Update': 'w{Format}{Channel}AU\r',
+        'Match': rb'Ds([gGhH])300([01][0-9])\*([0-9 -]{1,4})\r\n',
+    },
+    'InputMute': {
+        'Parameters': {'Channel': StereoChannel(1, 8, Offset=30000, MatchOffset=0, Key='Input')},
+        'Value': Table(_OnOff),
+        'Set': 'wM{Channel}*{Value}AU\r',
+        'Update': 'wM{Channel}AU\r',
+        'Match': rb'Ds[mM]300([01][0-9])\*([01])\r\n',
+    },
+    'Logo': {
+        'Parameters': {'Output': _ScaledOutput},
+        'Value': Table(dict(_Logos, Off='0'), Decode=dict(_Logos, **{'0': 'Off', '-1': 'Off'})),
+        'Set': 'wE{Output}*{Value}LOGO\r',
+        'Update': 'wE{Output}LOGO\r',
+        'Match': rb'LogoE([1-4])\*([0-9]|1[0-6])\r\n',
+    },
+    'LogoKeySetting': {
+        'Parameters': {'Logo': Range(1, 16)},
+        'Value': Table({
+            'Disabled': '0',
+            'Transparency': '1',
+            'RGB Key': '2',
+            'Level Key': '3',
+            'Alpha Key': '4'
+        }),
+        'Set': 'w{Logo}*{Value}VKEF\r\n',
+        'Update': 'w{Logo}VKEF\r\n',
+        'Match': rb'Vkef0(0[1-9]|1[0-6])\*([0-4])\r\n',
+    },
+    'MicLineMute': {
+        'Parameters': {'Input': Range(1, 4, Offset=-1)},
+        'Value': Table(_OnOff),
+        'Set': 'wM4000{Input}*{Value}AU\r',
+        'Update': 'wM4000{Input}AU\r',
+        'Match': rb'Ds[mM]4000([0-3])\*(0|1)\r\n',
+    },
+    'OutputPostmixerTrim': {
+        'Parameters': {'Channel': StereoChannel('OutputConstraints.Min', 'OutputConstraints.Max')},
+        'Value': Level(-12, 12),
+        'Set': 'wG6010{Channel}*{Value}AU\r',
+        'Update': 'wG6010{Channel}AU\r',
+        'Match': rb'Ds[gG]6010([0-7])\*([0-9 -]{1,4})\r\n',
+    },
+    'OutputResolution': {
+        'Parameters': {'Output': _ScaledOutput},
+        'Value': Table(_Resolutions, Decode=_ReportedResolutions),
+        'Set': 'w{Output}*{Value}RATE\r\n',
+        'Update': 'w{Output}RATE\r\n',
+        'Match': rb'Rate(\d{2})\*(\d{2})\r\n',
+    },
+    'PhantomPower': {
+        'Parameters': {'Input': Table({'1': '0', '2': '1', '3': '2', '4': '3'})},
+        'Value': Table(_OnOff),
+        'Set': 'wZ4000{Input}*{Value}AU\r',
+        'Update': 'wZ4000{Input}AU\r',
+        'Match': rb'DsZ4000([0-3])\*([01])\r\n',
+    },
+    'PostMatrixGain': {
+        'Parameters': {'Channel': StereoChannel(1, 'OutputSize', Format='{:02d}')},
+        'Value': Level(-100, 12),
+        'Set': 'WG500{Channel}*{Value}AU\r',
+        'Update': 'WG500{Channel}AU\r',
+        'Match': rb'Ds[gG]500(00|01|02|03|04|05|06|07|08|09|10|11|12|13|14|15)\*([-]\d{1,4}|\d{1,3})\r\n',
+    },
+    'PostMatrixMute': {
+        'Parameters': {'Channel': StereoChannel(1, 'OutputSize', Format='{:02d}')},
+        'Value': Table(_OnOff),
+        'Set': 'WM500{Channel}*{Value}AU\r',
+        'Update': 'WM500{Channel}AU\r',
+        'Match': rb'Ds[mM]500(00|01|02|03|04|05|06|07|08|09|10|11|12|13|14|15)\*(0|1)\r\n',
+    },
+    'PrematrixTrim': {
+        'Parameters': {'Channel': StereoChannel(1, 8, Offset=30100, MatchOffset=0, Key='Input')},
+        'Value': Level(-12, 12),
+        'Set': 'wG{Channel}*{Value}AU\r',
+        'Update': 'wG{Channel}AU\r',
+        'Match': rb'Ds[gG]301([01][0-9])\*([0-9 -]{1,4})\r\n',
+    },
+    'PremixerGain': {
+        'Parameters': {'Input': Range(1, 4, Offset=-1)},
+        'Value': Level(-100, 12),
+        'Set': 'WG4010{Input}*{Value}AU\r',
+        'Update': 'WG4010{Input}AU\r',
+        'Match': rb'Ds[gG]4010([0-7])\*(-*\d{1,4})\r\n',
+    },
+    'PremixerMute': {
+        'Parameters': {'Input': Range(1, 4, Offset=-1)},
+        'Value': Table(_OnOff),
+        'Set': 'WM4010{Input}*{Value}AU\r\n',
+        'Update': 'WM4010{Input}AU\r',
+        'Match': rb'Ds[mM]4010([0-7])\*(0|1)\r\n',
+    },
+    'PresetRecall': {
+        'Value': Range(1, 32),
+        'Set': '{Value}.',
+    },
+    'ScalerPresetRecall': {
+        'Parameters': {'Output': _ScaledOutput},
+        'Value': Range(1, 128),
+        'Set': '2*{Output}*{Value}.\r\n',
+    },
+    'ScalerPresetSave': {
+        'Parameters': {'Output': _ScaledOutput},
+        'Value': Range(1, 128),
+        'Set': '2*{Output}*{Value},\r\n',
+    },
+    'TestPattern': {
+        'Parameters': {'Output': _ScaledOutput},
+        'Value': Table({
+            'Off': '0',
+            'Crop': '1',
+            'Alternating Pixels': '2',
+            'Crosshatch': '3',
+            'Color Bars': '4',
+            'Grayscale': '5',
+            'Blue Mode': '6'
+        }),
+        'Set': 'W{Output}*{Value}TEST\r',
+        'Update': 'W{Output}TEST\r',
+        'Match': rb'Test0([1-4])\*0([0-6])\r\n',
+    },
+    'VideoMute': {
+        'Parameters': {'Output': Table('OutputStates', Decode='OutputStates', Upper=True)},
+        'Value': Table({'Video': '1', 'Video & Sync': '2', 'Off': '0'}),
+        'Set': '{Output}*{Value}B',
+        'Update': '{Output}B',
+        'Match': rb'Vmt(([1-4])(A|B|a|b|))\*([0-2])\r\n',
+        'Groups': ('Output', None, None, 'Value'),
+    },
+    'VirtualReturnGain': {
+        'Parameters': {'Input': _VirtualChannel},
+        'Value': Level(-100, 12),
+        'Set': 'WG5010{Input}*{Value}AU\r\n',
+        'Update': 'WG5010{Input}AU\r\n',
+        'Match': rb'Ds[gG]5010([0-7])\*([-]\d{1,4}|\d{1,3})\r\n',
+    },
+    'VirtualReturnMute': {
+        'Parameters': {'Input': _VirtualChannel},
+        'Value': Table(_OnOff),
+        'Set': 'WM5010{Input}*{Value}AU\r\n',
+        'Update': 'WM5010{Input}AU\r\n',
+        'Match': rb'Ds[mM]5010([0-7])\*([0-1])\r\n',
+    },
+}
+
+SwitcherProtocol = Protocol(Spec)
+
+# Commands answered by a response that is not their own, by the key of that response. Every
+# other command's answer key is its name. See DeviceClass.__BuildMatchStrings.
+_AnswerKeys = {
+    'AmplifierAttenuationSA': 'AmplifierAttenuation',
+    'AmplifierAttenuationMA': 'AmplifierAttenuation',
+    'AmplifierMuteSA': 'AmplifierMute',
+    'AmplifierMuteMA': 'AmplifierMute',
+    'GroupMicLineInputGain': 'Group',
+    'GroupMixpoint': 'Group',
+    'GroupMute': 'Group',
+    'GroupOutputAttenuation': 'Group',
+    'GroupPremixerGain': 'Group',
+    'GroupPrematrixTrim': 'Group',
+    'GroupPostmixerTrim': 'Group',
+    'MicVolume': 'Group',
+    'Volume': 'Group',
+}
+
+# Answer key of an error response, which answers whichever command was sent first
+_AnyCommand = object()
+
+
+def _ModelProfile(**tables):
+    # Model tables are built once at import and shared, read-only, by every instance of the model.
+    return MappingProxyType({name: MappingProxyType(value) if isinstance(value, dict) else value
+                             for name, value in tables.items()})
+
+
+# DTP CrossPoint 84 4K family.
+_Model84 = _ModelProfile(
+    InputSize=8,
+    OutputSize=4,
+    OutputConstraints={
+        'Min': 1,
+        'Max': 4
+    },
+    ScaledOutputConstraints={
+        'Min': 3,
+        'Max': 4
+    },
+    EDIDStates={
+        '1' : 'Output 1',
+        '2' : 'Output 2',
+        '3' : 'Output 3A',
+        '4' : 'Output 3B',
+        '5' : 'Output 4A',
+        '6' : 'Output 4B',
+        '7' : '1024x768 @ 50Hz',
+        '8' : '1024x768 @ 60Hz',
+        '9' : '1280x720 @ 50Hz',
+        '10' : '1280x720 @ 60Hz',
+        '11' : '1280x768 @ 50Hz',
+        '12' : '1280x768 @ 60Hz',
+        '13' : '1280x800 @ 50Hz',
+        '14' : '1280x800 @ 60Hz',
+        '15' : '1280x1024 @ 50Hz',
+        '16' : '1280x1024 @ 60Hz',
+        '17' : '1360x768 @ 50Hz',
+        '18' : '1360x768 @ 60Hz',
+        '19' : '1366x768 @ 50Hz',
+        '20' : '1366x768 @ 60Hz',
+        '21' : '1400x1050 @ 50Hz',
+        '22' : '1400x1050 @ 60Hz',
+        '23' : '1440x900 @ 50Hz',
+        '24' : '1440x900 @ 60Hz',
+        '25' : '1600x900 @ 50Hz',
+        '26' : '1600x900 @ 60Hz',
+        '27' : '1600x1200 @ 50Hz',
+        '28' : '1600x1200 @ 60Hz',
+        '29' : '1680x1050 @ 50Hz',
+        '30' : '1680x1050 @ 60Hz',
+        '31' : '1920x1080 @ 50Hz',
+        '32' : '1920x1080 @ 60Hz',
+        '33' : '1920x1200 @ 50Hz',
+        '34' : '1920x1200 @ 60Hz',
+        '35' : '2048x1080 @ 50Hz',
+        '36' : '2048x1080 @ 60Hz',
+        '37' : '480p 2_Ch Audio @ 60Hz',
+        '38' : '576p 2_Ch Audio @ 50Hz',
+        '39' : '720p 2_Ch Audio @ 50Hz',
+        '40' : '720p 2_Ch Audio @ 60Hz',
+        '41' : '720p Multi_Ch Audio @ 50Hz',
+        '42' : '720p Multi_Ch Audio @ 60Hz',
+        '43' : '1080i 2_Ch Audio @ 50Hz',
+        '44' : '1080i 2_Ch Audio @ 60Hz',
+        '45' : '1080i Multi_Ch Audio @ 50Hz',
+        '46' : '1080i Multi_Ch Audio @ 60Hz',
+        '47' : '1080p 2_Ch Audio @ 50Hz',
+        '48' : '1080p 2_Ch Audio @ 60Hz',
+        '49' : '1080p Multi_Ch Audio @ 50Hz',
+        '50' : '1080p Multi_Ch Audio @ 60Hz',
+        '51' : '3840x2160 2_Ch Audio @ 30Hz',
+        '52' : '3840x2160 Multi_Ch Audio @ 30Hz',
+        '53' : 'User Assigned 1',
+        '54' : 'User Assigned 2',
+        '55' : 'User Assigned 3',
+        '56' : 'User Assigned 4',
+        '57' : 'User Assigned 5',
+        '58' : 'User Assigned 6',
+        '59' : 'User Assigned 7',
+        '60' : 'User Assigned 8'
+    },
+    MixPointInputs={
+        'Output 1 Left'  : '00',
+        'Output 1 Right' : '01',
+        'Output 2 Left'  : '02',
+        'Output 2 Right' : '03',
+        'Output 3 Left'  : '04',
+        'Output 3 Right' : '05',
+        'Output 4 Left'  : '06',
+        'Output 4 Right' : '07',
+        'Mic 1' : '16',
+        'Mic 2' : '17',
+        'Mic 3' : '18',
+        'Mic 4' : '19',
+        'V. Return A' : '20',
+        'V. Return B' : '21',
+        'V. Return C' : '22',
+        'V. Return D' : '23',
+        'V. Return E' : '24',
+        'V. Return F' : '25',
+        'V. Return G' : '26',
+        'V. Return H' : '27',
+        'Exp. 1' : '28',
+        'Exp. 2' : '29',
+        'Exp. 3' : '30',
+        'Exp. 4' : '31',
+        'Exp. 5' : '32',
+        'Exp. 6' : '33',
+        'Exp. 7' : '34',
+        'Exp. 8' : '35',
+        'Exp. 9'  : '36',
+        'Exp. 10' : '37',
+        'Exp. 11' : '38',
+        'Exp. 12' : '39',
+        'Exp. 13' : '40',
+        'Exp. 14' : '41',
+        'Exp. 15' : '42',
+        'Exp. 16' : '43'
+    },
+    MixPointOutputs={
+        'Output 1 Left'  : '00',
+        'Output 1 Right' : '01',
+        'Output 2 Left'  : '02',
+        'Output 2 Right' : '03',
+        'Output 3 Left'  : '04',
+        'Output 3 Right' : '05',
+        'Output 4 Left'  : '06',
+        'Output 4 Right' : '07',
+        'V. Send A' : '16',
+        'V. Send B' : '17',
+        'V. Send C' : '18',
+        'V. Send D' : '19',
+        'V. Send E' : '20',
+        'V. Send F' : '21',
+        'V. Send G' : '22',
+        'V. Send H' : '23',
+    },
+    OutputStates={
+        '1'  : '1',
+        '2'  : '2',
+        '3A' : '3A',
+        '3B' : '3B',
+        '4A' : '4A',
+        '4B' : '4B'
+    },
+)
+
+# DTP CrossPoint 82 4K family.
+_Model82 = _ModelProfile(
+    InputSize=8,
+    OutputSize=2,
+    OutputConstraints={
+        'Min': 1,
+        'Max': 2
+    },
+    ScaledOutputConstraints={
+        'Min': 1,
+        'Max': 2
+    },
+    EDIDStates={
+        '1' : 'Output 1A',
+        '2' : 'Output 1B',
+        '3' : 'Output 2A',
+        '4' : 'Output 2B',
+        '5' : '1024x768 @ 50Hz',
+        '6' : '1024x768 @ 60Hz',
+        '7' : '1280x720 @ 50Hz',
+        '8' : '1280x720 @ 60Hz',
+        '9' : '1280x768 @ 50Hz',
+        '10' : '1280x768 @ 60Hz',
+        '11' : '1280x800 @ 50Hz',
+        '12' : '1280x800 @ 60Hz',
+        '13' : '1280x1024 @ 50Hz',
+        '14' : '1280x1024 @ 60Hz',
+        '15' : '1360x768 @ 50Hz',
+        '16' : '1360x768 @ 60Hz',
+        '17' : '1366x768 @ 50Hz',
+        '18' : '1366x768 @ 60Hz',
+        '19' : '1400x1050 @ 50Hz',
+        '20' : '1400x1050 @ 60Hz',
+        '21' : '1440x900 @ 50Hz',
+        '22' : '1440x900 @ 60Hz',
+        '23' : '1600x900 @ 50Hz',
+        '24' : '1600x900 @ 60Hz',
+        '25' : '1600x1200 @ 50Hz',
+        '26' : '1600x1200 @ 60Hz',
+        '27' : '1680x1050 @ 50Hz',
+        '28' : '1680x1050 @ 60Hz',
+        '29' : '1920x1080 @ 50Hz',
+        '30' : '1920x1080 @ 60Hz',
+        '31' : '1920x1200 @ 50Hz',
+        '32' : '1920x1200 @ 60Hz',
+        '33' : '2048x1080 @ 50Hz',
+        '34' : '2048x1080 @ 60Hz',
+        '35' : '480p 2_Ch Audio @ 60Hz',
+        '36' : '576p 2_Ch Audio @ 50Hz',
+        '37' : '720p 2_Ch Audio @ 50Hz',
+        '38' : '720p 2_Ch Audio @ 60Hz',
+        '39' : '720p Multi_Ch Audio @ 50Hz',
+        '40' : '720p Multi_Ch Audio @ 60Hz',
+        '41' : '1080i 2_Ch Audio @ 50Hz',
+        '42' : '1080i 2_Ch Audio @ 60Hz',
+        '43' : '1080i Multi_Ch Audio @ 50Hz',
+        '44' : '1080i Multi_Ch Audio @ 60Hz',
+        '45' : '1080p 2_Ch Audio @ 50Hz',
+        '46' : '1080p 2_Ch Audio @ 60Hz',
+        '47' : '1080p Multi_Ch Audio @ 50Hz',
+        '48' : '1080p Multi_Ch Audio @ 60Hz',
+        '49' : '3840x2160 2_Ch Audio @ 30Hz',
+        '50' : '3840x2160 Multi_Ch Audio @ 30Hz',
+        '51' : 'User Assigned 1',
+        '52' : 'User Assigned 2',
+        '53' : 'User Assigned 3',
+        '54' : 'User Assigned 4',
+        '55' : 'User Assigned 5',
+        '56' : 'User Assigned 6',
+        '57' : 'User Assigned 7',
+        '58' : 'User Assigned 8'
+    },
+    MixPointInputs={
+        'Output 1 Left'  : '00',
+        'Output 1 Right' : '01',
+        'Output 2 Left'  : '02',
+        'Output 2 Right' : '03',
+        'Mic 1' : '16',
+        'Mic 2' : '17',
+        'Mic 3' : '18',
+        'Mic 4' : '19',
+        'V. Return A' : '20',
+        'V. Return B' : '21',
+        'V. Return C' : '22',
+        'V. Return D' : '23',
+        'V. Return E' : '24',
+        'V. Return F' : '25',
+        'V. Return G' : '26',
+        'V. Return H' : '27',
+        'Exp. 1' : '28',
+        'Exp. 2' : '29',
+        'Exp. 3' : '30',
+        'Exp. 4' : '31',
+        'Exp. 5' : '32',
+        'Exp. 6' : '33',
+        'Exp. 7' : '34',
+        'Exp. 8' : '35',
+        'Exp. 9'  : '36',
+        'Exp. 10' : '37',
+        'Exp. 11' : '38',
+        'Exp. 12' : '39',
+        'Exp. 13' : '40',
+        'Exp. 14' : '41',
+        'Exp. 15' : '42',
+        'Exp. 16' : '43'
+    },
+    MixPointOutputs={
+        'Output 1 Left'  : '00',
+        'Output 1 Right' : '01',
+        'Output 2 Left'  : '02',
+        'Output 2 Right' : '03',
+        'V. Send A' : '16',
+        'V. Send B' : '17',
+        'V. Send C' : '18',
+        'V. Send D' : '19',
+        'V. Send E' : '20',
+        'V. Send F' : '21',
+        'V. Send G' : '22',
+        'V. Send H' : '23',
+    },
+    OutputStates={
+        '1A'  : '1A',
+        '1B'  : '1B',
+        '2A' : '2A',
+        '2B' : '2B'
+    },
+)
+
 
 class DeviceClass:
+
+    # Shared response table, built by the first instance. See __BuildMatchStrings.
+    _MatchStrings = None
+    # Answer keys of the responses in _MatchStrings
+    _AnswerKeysMatched = frozenset()
+
     def __init__(self):
 
         self.Unidirectional = 'False'
@@ -17,6 +740,9 @@ class DeviceClass:
         self.connectionFlag = True
         self.initializationChk = True
         self.Debug = False
+        self.Trace = GetChannel(__name__, self)
+        # Answers are paired with commands by the response that consumes them. See __Send.
+        self.Latency = GetRecorder(__name__, self)
         self.deviceUsername = 'admin'
         self.devicePassword = None
         self.Models = {
@@ -133,64 +859,84 @@ class DeviceClass:
 
 
         if self.Unidirectional == 'False':
-            self.AddMatchString(re.compile(b'Rpr\d\*\d+\r\n'), self.__MatchPreset, None)
-            self.AddMatchString(re.compile(b'Ds[gG]600(16|17)\*([-]\d{1,4}|0)\r\n'), self.__MatchAmplifierAttenuation, None)
-            self.AddMatchString(re.compile(b'Ds[mM]600(16|17)\*([01])\r\n'), self.__MatchAmplifierMute, None)
-            self.AddMatchString(re.compile(b'Ds[gG]6011([67])\*([0-9 -]{1,4})\r\n'), self.__MatchAmplifierPostmixerTrim, None)
-            self.AddMatchString(re.compile(b'Ds[gG]6000([0-7])\*([-]\d{1,4}|0)\r\n'), self.__MatchAnalogAttenuation, None)
-            self.AddMatchString(re.compile(b'Ds[mM]6000([0-7])\*(0|1)\r\n'), self.__MatchAnalogMute, None)
-            self.AddMatchString(re.compile(b'Aspr(\d{2})\*(1|2)\r\n'), self.__MatchAspectRatio, None)
-            self.AddMatchString(re.compile(b'GrpmD(1|2|3|4|5|6|7|8|9|10|11|12|13|14|15|16|17|18|19|20|21|22|23|24|25|26|27|28|29|30|31|32)\*([-+]{0,1}[0-9]{1,4})\r\n'), self.__MatchGroup, None)               
-            self.AddMatchString(re.compile(b'EdidA(0[1-8])\*(0?[1-9]|[1-5][0-9]|60)\r\n'), self.__MatchEDIDAssignment, None)
-            self.AddMatchString(re.compile(b'Exe([0-2])\r\n'), self.__MatchExecutiveMode, None)
-            self.AddMatchString(re.compile(b'Ds[gG]502([01][0-9])\*([0-9 -]{1,5})\r\n'), self.__MatchExpansionPremixerGain, None)
-            self.AddMatchString(re.compile(b'Ds[mM]502([01][0-9])\*([01])\r\n'), self.__MatchExpansionPremixerMute, None)
-            self.AddMatchString(re.compile(b'Frz(\d{2})\*(00|01)\r\n'), self.__MatchFreeze, None)
-            self.AddMatchString(re.compile(b'Ds[gG]6020([0-7])\*([-]\d{1,4}|0)\r\n'), self.__MatchHDMIAttenuation, None)
-            self.AddMatchString(re.compile(b'Ds[mM]6020([0-7])\*(0|1)\r\n'), self.__MatchHDMIMute, None)
-            self.AddMatchString(re.compile(b'AfmtI(\d{2})\*([0-2])\r\n'), self.__MatchInputAudioSwitchMode, 'Single')
-            self.AddMatchString(re.compile(b'AfmtI([0-2]{10}|[0-2]{8})\r\n'), self.__MatchInputAudioSwitchMode, 'All')
-            self.AddMatchString(re.compile(b'Ds([gGhH])300([01][0-9])\*([0-9 -]{1,4})\r\n'), self.__MatchInputGain, None)
-            self.AddMatchString(re.compile(b'Ds[mM]300([01][0-9])\*([01])\r\n'), self.__MatchInputMute, None)
-            self.AddMatchString(re.compile(b'Ityp(0[1-9]|10)\*([0-7])\r\n'), self.__MatchInputFormat, None)
-            self.AddMatchString(re.compile(b'Frq00 ([0-1]+)\r\n'), self.__MatchInputSignalStatus, None)
-            self.AddMatchString(re.compile(b'HdcpE(\d{2})\*(0|1)\r\n'), self.__MatchHDCPInputAuthorization, None)
-            self.AddMatchString(re.compile(b'LogoE([1-4])\*([0-9]|1[0-6])\r\n'), self.__MatchLogo, None)
-            self.AddMatchString(re.compile(b'LogoQ00\*([01]+)[\*01]+\r\n'), self.__MatchLogoAvailability, None)
-            self.AddMatchString(re.compile(b'Vkef0(0[1-9]|1[0-6])\*([0-4])\r\n'), self.__MatchLogoKeySetting, None)
-            self.AddMatchString(re.compile(b'Ds[gG]4000([0-3])\*([0-9 -]{1,4})\r\n'), self.__MatchMicLineGain, None)
-            self.AddMatchString(re.compile(b'Ds[mM]4000([0-3])\*(0|1)\r\n'), self.__MatchMicLineMute, None)
-            self.AddMatchString(re.compile(b'Ds[vV]4000([0-3])\*[01]\*([0-9]{1,4})\r\n'), self.__MatchMicrophoneSignalStatus, None)
-            self.AddMatchString(re.compile(b'Ds[gG]2([0-9]{2})([0-9]{2})\*([-][0-9]{1,4}|0|[0-9]{1,3})\r\n'), self.__MatchMixpointGain, None)
-            self.AddMatchString(re.compile(b'Ds[mM]2([0-9]{2})([0-9]{2})\*(0|1)\r\n'), self.__MatchMixpointMute, None)
-            self.AddMatchString(re.compile(b'AfmtO(\d{2})\*([0-2])\r\n'), self.__MatchOutputAudioSelect, 'Single')
-            self.AddMatchString(re.compile(b'AfmtO([0-2]{2,8})\r\n'), self.__MatchOutputAudioSelect, 'All')
-            self.AddMatchString(re.compile(b'HdcpS(([1-4])(A|B|a|b|))\*(0|1)\r\n'), self.__MatchHDCPOutputAuthorization, None)
-            self.AddMatchString(re.compile(b'Ds[gG]6010([0-7])\*([0-9 -]{1,4})\r\n'), self.__MatchOutputPostmixerTrim, None)
-            self.AddMatchString(re.compile(b'HdcpI(\d{2})\*([0-2])\r\n'), self.__MatchHDCPInputStatus, None)
-            self.AddMatchString(re.compile(b'HdcpO(1|1A|1B|2|2A|2B|3|3A|3B|4|4A|4B)\*([0-3])\r\n'), self.__MatchHDCPOutputStatus, None)
-            self.AddMatchString(re.compile(b'Rate(\d{2})\*(\d{2})\r\n'), self.__MatchOutputResolution, None)
-            self.AddMatchString(re.compile(b'DsZ4000([0-3])\*([01])\r\n'), self.__MatchPhantomPower, None)
-            self.AddMatchString(re.compile(b'Ds[gG]301([01][0-9])\*([0-9 -]{1,4})\r\n'), self.__MatchPrematrixTrim, None)
-            self.AddMatchString(re.compile(b'Ds[gG]500(00|01|02|03|04|05|06|07|08|09|10|11|12|13|14|15)\*([-]\d{1,4}|\d{1,3})\r\n'), self.__MatchPostMatrixGain, None)
-            self.AddMatchString(re.compile(b'Ds[mM]500(00|01|02|03|04|05|06|07|08|09|10|11|12|13|14|15)\*(0|1)\r\n'), self.__MatchPostMatrixMute, None)
-            self.AddMatchString(re.compile(b'Ds[gG]4010([0-7])\*(-*\d{1,4})\r\n'), self.__MatchPremixerGain, None)
-            self.AddMatchString(re.compile(b'Ds[mM]4010([0-7])\*(0|1)\r\n'), self.__MatchPremixerMute, None)
-            self.AddMatchString(re.compile(b'Sts00\*\d{1,3}\.\d{1,3} (\d{1,3}\.\d{1,3}) \d+ \d+\r\n'), self.__MatchTemperature, None),
-            self.AddMatchString(re.compile(b'Test0([1-4])\*0([0-6])\r\n'), self.__MatchTestPattern, None)
-            self.AddMatchString(re.compile(b'Vmt(([1-4])(A|B|a|b|))\*([0-2])\r\n'), self.__MatchVideoMute, None)
-            self.AddMatchString(re.compile(b'Ds[gG]5010([0-7])\*([-]\d{1,4}|\d{1,3})\r\n'), self.__MatchVirtualReturnGain, None)
-            self.AddMatchString(re.compile(b'Ds[mM]5010([0-7])\*([0-1])\r\n'), self.__MatchVirtualReturnMute, None)
-            self.AddMatchString(re.compile(b'Qik\r\n'), self.__MatchQik, None)
-            self.AddMatchString(re.compile(b'PrstR\d+\r\n'), self.__MatchQik, None)  # Response to a Set Preset Recall command
-            self.AddMatchString(re.compile(b'Vgp00 Out(\d{2})\*([0-9 -]*)Vid\r\n'), self.__MatchAllMatrixTie, 'Video')
-            self.AddMatchString(re.compile(b'Vgp00 Out(\d{2})\*([0-9 -]*)Aud\r\n'), self.__MatchAllMatrixTie, 'Audio')
-            self.AddMatchString(re.compile(b'(?:Out(\d+) In(\d+) (All|Vid|Aud))|(?:In(\d+) (All|Vid|Aud))\r\n'), self.__MatchOutputTieStatus, None)
-
-            self.AddMatchString(re.compile(b'E(\d+)\r\n'), self.__MatchError, None)
-             
-            self.AddMatchString(re.compile(b'Vrb3\r\n'), self.__MatchVerboseMode, None)
-            self.AddMatchString(re.compile(b'Echo0\r\n'), self.__MatchEchoMode, None)
+            if DeviceClass._MatchStrings is None:
+                DeviceClass._MatchStrings = self.__BuildMatchStrings()
+                DeviceClass._AnswerKeysMatched = frozenset(
+                    entry['answers'] for entry in DeviceClass._MatchStrings.values()
+                    if isinstance(entry['answers'], str))
+            self.__matchStringDict = DeviceClass._MatchStrings
+
+    @classmethod
+    def __BuildMatchStrings(cls):
+        # Compiled once and shared, read-only, by every instance. The callbacks are the plain
+        # functions and are called with the instance first. The last item of an entry is the
+        # answer key of the commands the response answers, or None for notifications that answer
+        # no command. A chunk holding several responses is parsed entry by entry, so the entries
+        # keep the order the module registered them in before the port to the protocol engine;
+        # tools/replay/check.py checks it.
+        protocol = {command.Name: (regex, function, command, command.Name)
+                    for regex, function, command in SwitcherProtocol.MatchTable()}
+        matchStrings = (
+            (re.compile(b'Rpr\d\*\d+\r\n'), cls.__MatchPreset, None, 'ScalerPresetRecall'),
+            (re.compile(b'Ds[gG]600(16|17)\*([-]\d{1,4}|0)\r\n'), cls.__MatchAmplifierAttenuation, None, 'AmplifierAttenuation'),
+            (re.compile(b'Ds[mM]600(16|17)\*([01])\r\n'), cls.__MatchAmplifierMute, None, 'AmplifierMute'),
+            protocol.pop('AmplifierPostmixerTrim'),
+            protocol.pop('AnalogAttenuation'),
+            protocol.pop('AnalogMute'),
+            protocol.pop('AspectRatio'),
+            (re.compile(b'GrpmD(1|2|3|4|5|6|7|8|9|10|11|12|13|14|15|16|17|18|19|20|21|22|23|24|25|26|27|28|29|30|31|32)\*([-+]{0,1}[0-9]{1,4})\r\n'), cls.__MatchGroup, None, 'Group'),
+            protocol.pop('EDIDAssignment'),
+            protocol.pop('ExecutiveMode'),
+            protocol.pop('ExpansionPremixerGain'),
+            protocol.pop('ExpansionPremixerMute'),
+            protocol.pop('Freeze'),
+            protocol.pop('HDMIAttenuation'),
+            protocol.pop('HDMIMute'),
+            (re.compile(b'AfmtI(\d{2})\*([0-2])\r\n'), cls.__MatchInputAudioSwitchMode, 'Single', 'InputAudioSwitchMode'),
+            (re.compile(b'AfmtI([0-2]{10}|[0-2]{8})\r\n'), cls.__MatchInputAudioSwitchMode, 'All', 'InputAudioSwitchMode'),
+            protocol.pop('InputGain'),
+            protocol.pop('InputMute'),
+            protocol.pop('InputFormat'),
+            (re.compile(b'Frq00 ([0-1]+)\r\n'), cls.__MatchInputSignalStatus, None, 'InputSignalStatus'),
+            protocol.pop('HDCPInputAuthorization'),
+            protocol.pop('Logo'),
+            (re.compile(b'LogoQ00\*([01]+)[\*01]+\r\n'), cls.__MatchLogoAvailability, None, 'LogoAvailability'),
+            protocol.pop('LogoKeySetting'),
+            (re.compile(b'Ds[gG]4000([0-3])\*([0-9 -]{1,4})\r\n'), cls.__MatchMicLineGain, None, 'MicLineGain'),
+            protocol.pop('MicLineMute'),
+            (re.compile(b'Ds[vV]4000([0-3])\*[01]\*([0-9]{1,4})\r\n'), cls.__MatchMicrophoneSignalStatus, None, 'MicrophoneSignalStatus'),
+            (re.compile(b'Ds[gG]2([0-9]{2})([0-9]{2})\*([-][0-9]{1,4}|0|[0-9]{1,3})\r\n'), cls.__MatchMixpointGain, None, 'MixpointGain'),
+            (re.compile(b'Ds[mM]2([0-9]{2})([0-9]{2})\*(0|1)\r\n'), cls.__MatchMixpointMute, None, 'MixpointMute'),
+            (re.compile(b'AfmtO(\d{2})\*([0-2])\r\n'), cls.__MatchOutputAudioSelect, 'Single', 'OutputAudioSelect'),
+            (re.compile(b'AfmtO([0-2]{2,8})\r\n'), cls.__MatchOutputAudioSelect, 'All', 'OutputAudioSelect'),
+            protocol.pop('HDCPOutputAuthorization'),
+            protocol.pop('OutputPostmixerTrim'),
+            protocol.pop('HDCPInputStatus'),
+            protocol.pop('HDCPOutputStatus'),
+            protocol.pop('OutputResolution'),
+            protocol.pop('PhantomPower'),
+            protocol.pop('PrematrixTrim'),
+            protocol.pop('PostMatrixGain'),
+            protocol.pop('PostMatrixMute'),
+            protocol.pop('PremixerGain'),
+            protocol.pop('PremixerMute'),
+            (re.compile(b'Sts00\*\d{1,3}\.\d{1,3} (\d{1,3}\.\d{1,3}) \d+ \d+\r\n'), cls.__MatchTemperature, None, 'Temperature'),
+            protocol.pop('TestPattern'),
+            protocol.pop('VideoMute'),
+            protocol.pop('VirtualReturnGain'),
+            protocol.pop('VirtualReturnMute'),
+            *protocol.values(),
+            (re.compile(b'Qik\r\n'), cls.__MatchQik, None, None),
+            (re.compile(b'PrstR\d+\r\n'), cls.__MatchQik, None, 'PresetRecall'),  # Response to a Set Preset Recall command
+            (re.compile(b'Vgp00 Out(\d{2})\*([0-9 -]*)Vid\r\n'), cls.__MatchAllMatrixTie, 'Video', 'RefreshMatrix'),
+            (re.compile(b'Vgp00 Out(\d{2})\*([0-9 -]*)Aud\r\n'), cls.__MatchAllMatrixTie, 'Audio', 'RefreshMatrix'),
+            (re.compile(b'(?:Out(\d+) In(\d+) (All|Vid|Aud))|(?:In(\d+) (All|Vid|Aud))\r\n'), cls.__MatchOutputTieStatus, None, 'MatrixTieCommand'),
+            (re.compile(b'E(\d+)\r\n'), cls.__MatchError, None, _AnyCommand),
+            (re.compile(b'Vrb3\r\n'), cls.__MatchVerboseMode, None, 'VerboseMode'),
+            (re.compile(b'Echo0\r\n'), cls.__MatchEchoMode, None, 'EchoMode'),
+        )
+        return MappingProxyType({regex: {'callback': callback, 'para': arg, 'answers': answers}
+                                 for regex, callback, arg, answers in matchStrings})
 
     def __MatchVerboseMode(self, match, qualifier):
         self.OnConnected()
@@ -288,35 +1034,6 @@ class DeviceClass:
             self.InputTieStatusHelper('All')
             self.OutputTieStatusHelper('All')
 
-    def SetAmplifierAttenuationSA(self, value, qualifier):
-
-        channelSide = {
-            'Left'  : '16',
-            'Right' : '17'
-        }
-
-        
-        if -100 <= int(value) <= 0 and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            commandString = 'WG600{0}*{1}AU\r'.format(channel,round(value*10))
-            self.__SetHelper('AmplifierAttenuationSA', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAmplifierAttenuationSA')
-
-    def UpdateAmplifierAttenuationSA(self, value, qualifier):
-
-        channelSide = {
-            'Left' :'16',
-            'Right':'17'
-        }
-        
-        if qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            commandString = 'WG600{0}AU\r'.format(channel)
-            self.__UpdateHelper('AmplifierAttenuationSA', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateAmplifierAttenuationSA')
-            
     def __MatchAmplifierAttenuation(self, match, qualifier):
 
         channelSide = {
@@ -333,52 +1050,6 @@ class DeviceClass:
         else:
             self.Error(['AmplifierAttenuation: Incorrect model'])
 
-    def SetAmplifierAttenuationMA(self, value, qualifier):
-
-        if -100 <= value <= 0:
-            AmplifierAttenuationMACmdString = 'WG60016*{0}AU\r'.format(round(value*10))
-            self.__SetHelper('AmplifierAttenuationMA', AmplifierAttenuationMACmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAmplifierAttenuationMA')
-
-    def UpdateAmplifierAttenuationMA(self, value, qualifier):
-
-        AmplifierAttenuationMACmdString = 'WG60016AU\r'
-        self.__UpdateHelper('AmplifierAttenuationMA', AmplifierAttenuationMACmdString, value, qualifier)
-
-    def SetAmplifierMuteSA(self, value, qualifier):
-
-        MuteState = {
-            'On' :'1',
-            'Off':'0'
-            }
-
-        channelSide = {
-            'Left' :'16',
-            'Right':'17'
-            }
-        
-        if value in MuteState and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            commandString = 'WM600{0}*{1}AU\r'.format(channel,MuteState[value])
-            self.__SetHelper('AmplifierMuteSA', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAmplifierMuteSA')
-            
-    def UpdateAmplifierMuteSA(self, value, qualifier):
-
-        channelSide = {
-            'Left' :'16',
-            'Right':'17'
-            }
-        
-        if qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            commandString = 'WM600{0}AU\r'.format(channel)
-            self.__UpdateHelper('AmplifierMuteSA', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateAmplifierMuteSA')
-            
     def __MatchAmplifierMute(self, match, qualifier):
 
         MuteState = {
@@ -400,455 +1071,6 @@ class DeviceClass:
         else:
             self.Error(['AmplifierMute: Incorrect model'])
 
-    def SetAmplifierMuteMA(self, value, qualifier):
-
-        MuteState = {
-            'On'  : '1',
-            'Off' : '0'
-            }
-        
-        if value in MuteState:
-            commandString = 'WM60016*{0}AU\r'.format(MuteState[value])
-            self.__SetHelper('AmplifierMuteMA', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAmplifierMuteMA')
-            
-    def UpdateAmplifierMuteMA(self, value, qualifier):
-
-        AmplifierMuteMACmdString = 'WM60016AU\r'
-        self.__UpdateHelper('AmplifierMuteMA', AmplifierMuteMACmdString, value, qualifier)
-
-    def SetAmplifierPostmixerTrim(self, value, qualifier):
-
-        channelSide = {
-            'Left' : '6',
-            'Right': '7'
-            }
-        
-        if -12 <= value <= 12 and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            AmplifierPostmixerTrimCmdString = 'WG6011{0}*{1}AU\r'.format(channel, round(value * 10))
-            self.__SetHelper('AmplifierPostmixerTrim', AmplifierPostmixerTrimCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAmplifierPostmixerTrim')
-
-    def UpdateAmplifierPostmixerTrim(self, value, qualifier):
-
-        channelSide = {
-            'Left' : '6',
-            'Right': '7'
-            }
-        
-        if qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            AmplifierPostmixerTrimCmdString = 'WG6011{0}AU\r'.format(channel)
-            self.__UpdateHelper('AmplifierPostmixerTrim', AmplifierPostmixerTrimCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateAmplifierPostmixerTrim')
-            
-    def __MatchAmplifierPostmixerTrim(self, match, tag):
-
-        channelSide = {
-            '6' : 'Left',
-            '7' : 'Right'
-            }
-
-        qualifier = {'L/R' : channelSide[match.group(1).decode()]}
-        value = int(match.group(2).decode()) / 10
-        self.WriteStatus('AmplifierPostmixerTrim', value, qualifier)
-
-    def SetAnalogAttenuation(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            }
-
-        output = int(qualifier['Output'])
-        if -100 <= int(value) <= 0 and qualifier['L/R'] in channelSide:
-            if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max']:
-                channel = channelSide[qualifier['L/R']]
-                TranslationToNumber = translation[str((channel+output))]
-                commandString = 'WG6000{0}*{1}AU\r'.format(TranslationToNumber,round(value*10))
-                self.__SetHelper('AnalogAttenuation', commandString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for SetAnalogAttenuation')     
-        else:
-            self.Discard('Invalid Command for SetAnalogAttenuation')
-
-    def UpdateAnalogAttenuation(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            }
-
-        output = int(qualifier['Output'])
-        
-        if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max'] and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WG6000{0}AU\r'.format(TranslationToNumber)
-            self.__UpdateHelper('AnalogAttenuation', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateAnalogAttenuation')
-
-    def __MatchAnalogAttenuation(self, match, tag):
-
-        channelSide = {
-            0:'Left',
-            1:'Right',
-            2:'Left',
-            3:'Right',
-            4:'Left',
-            5:'Right',
-            6:'Left',
-            7:'Right',
-            }
-
-        translation = {
-            0:'1',
-            1:'1',
-            2:'2',
-            3:'2',
-            4:'3',
-            5:'3',
-            6:'4',
-            7:'4',
-            }
-   
-        qualifier = {'L/R' :channelSide[int(match.group(1).decode())], 'Output':translation[int(match.group(1).decode())]}
-        value = int(match.group(2))/10
-        self.WriteStatus('AnalogAttenuation', value, qualifier)
-
-    def SetAnalogMute(self, value, qualifier):
-
-        MuteState = {
-            'On' :'1',
-            'Off':'0'
-            }
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-        }
-
-        output = int(qualifier['Output'])
-
-        if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max'] and qualifier['L/R'] in channelSide and value in MuteState:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WM6000{0}*{1}AU\r'.format(TranslationToNumber,MuteState[value])
-            self.__SetHelper('AnalogMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAnalogMute')
-
-    def UpdateAnalogMute(self, value, qualifier):
-
-        channelSide = {
-            'Left': 10,
-            'Right': 20
-            }
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            }
-
-        output = int(qualifier['Output'])
-
-        if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max'] and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WM6000{0}AU\r'.format(TranslationToNumber)
-            self.__UpdateHelper('AnalogMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateAnalogMute')
-
-    def __MatchAnalogMute(self, match, tag):
-
-        MuteState = {
-            '1':'On',
-            '0':'Off'
-            }
-
-        channelSide = {
-            0:'Left',
-            1:'Right',
-            2:'Left',
-            3:'Right',
-            4:'Left',
-            5:'Right',
-            6:'Left',
-            7:'Right',
-            }
-
-        translation = {
-            0:'1',
-            1:'1',
-            2:'2',
-            3:'2',
-            4:'3',
-            5:'3',
-            6:'4',
-            7:'4',
-            }
-
-        qualifier = {'L/R' :channelSide[int(match.group(1).decode())], 'Output':translation[int(match.group(1).decode())]}
-        value = MuteState[match.group(2).decode()]
-        self.WriteStatus('AnalogMute', value, qualifier)
-
-    def SetAspectRatio(self, value, qualifier):
-
-        ValueStateValues = {
-            'Fill' : '1', 
-            'Follow' : '2'
-            }
-        
-        tempInput = qualifier['Input']
-        if 1 <= int(tempInput) <= self.InputSize and value in ValueStateValues:
-            AspectRatioCmdString = 'w{0}*{1}ASPR\r\n'.format(tempInput, ValueStateValues[value])
-            self.__SetHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAspectRatio')
-
-    def UpdateAspectRatio(self, value, qualifier):
-
-        tempInput = qualifier['Input']
-        if 1 <= int(tempInput) <= self.InputSize:
-            AspectRatioCmdString = 'w{0}ASPR\r\n'.format(tempInput)
-            self.__UpdateHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateAspectRatio')
-
-    def __MatchAspectRatio(self, match, tag):
-
-        InputStates = {
-            '01' : '1', 
-            '02' : '2', 
-            '03' : '3', 
-            '04' : '4', 
-            '05' : '5', 
-            '06' : '6', 
-            '07' : '7', 
-            '08' : '8'
-            }
-
-        ValueStateValues = {
-            '1' : 'Fill', 
-            '2' : 'Follow'
-            }
-
-        tempInput = InputStates[match.group(1).decode()]
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('AspectRatio', value, {'Input':tempInput})
-
-    def SetAutoImage(self, value, qualifier):
-
-        Output = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max']:
-            AutoImageCmdString = '{0}*A'.format(Output)
-            self.__SetHelper('AutoImage', AutoImageCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAutoImage')
-    def UpdateEDIDAssignment(self, value, qualifier):
-
-        input_ = qualifier['Input']
-        if 1 <= int(input_) <= self.InputSize:
-            EDIDAssignmentCmdString = 'wA{0}EDID\r'.format(input_)
-            self.__UpdateHelper('EDIDAssignment', EDIDAssignmentCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateEDIDAssignment')
-
-    def __MatchEDIDAssignment(self, match, tag):
-
-        qualifier = {'Input': str(int(match.group(1).decode()))}
-        value = self.EDIDStates[match.group(2).decode()]
-        self.WriteStatus('EDIDAssignment', value, qualifier)
-
-    def SetExecutiveMode(self, value, qualifier):
-
-        ValueStateValues = {
-            'Mode 1' : '1X', 
-            'Mode 2' : '2X', 
-            'Off'    : '0X'
-            }
-        
-        if value in ValueStateValues:
-            ExecutiveModeCmdString = ValueStateValues[value]
-            self.__SetHelper('ExecutiveMode', ExecutiveModeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetExecutiveMode')
-            
-    def UpdateExecutiveMode(self, value, qualifier):
-
-
-        ExecutiveModeCmdString = 'X'
-        self.__UpdateHelper('ExecutiveMode', ExecutiveModeCmdString, value, qualifier)
-
-    def __MatchExecutiveMode(self, match, tag):
-
-        ValueStateValues = {
-            '1' : 'Mode 1', 
-            '2' : 'Mode 2', 
-            '0' : 'Off'
-            }
-
-        value = ValueStateValues[match.group(1).decode()]
-        self.WriteStatus('ExecutiveMode', value, None)
-
-    def SetExpansionPremixerGain(self, value, qualifier):
-
-        inputVal = int(qualifier['Input'])
-        if -100 <= value <= 12:
-            if 1 <= inputVal <= 16:
-                level = round(value * 10)
-                ExpansionPremixerGainCmdString = 'wG{0}*{1:05d}AU\r'.format(inputVal + 50199, level)
-                self.__SetHelper('ExpansionPremixerGain', ExpansionPremixerGainCmdString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for SetExpansionPremixerGain')
-        else:
-            self.Discard('Invalid Command for SetExpansionPremixerGain')
-
-    def UpdateExpansionPremixerGain(self, value, qualifier):
-
-        inputVal = int(qualifier['Input'])
-        if 1 <= inputVal <= 16:
-            ExpansionPremixerGainCmdString = 'wG{0}AU\r'.format(inputVal + 50199)
-            self.__UpdateHelper('ExpansionPremixerGain', ExpansionPremixerGainCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateExpansionPremixerGain')
-
-    def __MatchExpansionPremixerGain(self, match, tag):
-
-        qualifier = {'Input': str(int(match.group(1)) + 1)}
-        value = int(match.group(2))/10
-        self.WriteStatus('ExpansionPremixerGain', value, qualifier)
-
-    def SetExpansionPremixerMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'  : '1',
-            'Off' : '0'
-            }
-
-        inputVal = int(qualifier['Input'])
-        if 1 <= inputVal <= 16 and value in ValueStateValues:
-            ExpansionPremixerMuteCmdString = 'wM{0}*{1}AU\r'.format(inputVal + 50199, ValueStateValues[value])
-            self.__SetHelper('ExpansionPremixerMute', ExpansionPremixerMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetExpansionPremixerMute')
-
-    def UpdateExpansionPremixerMute(self, value, qualifier):
-
-        inputVal = int(qualifier['Input'])
-        if 1 <= inputVal <= 16:
-            ExpansionPremixerMuteCmdString = 'wM{0}AU\r'.format(inputVal + 50199)
-            self.__UpdateHelper('ExpansionPremixerMute', ExpansionPremixerMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateExpansionPremixerMute')
-
-    def __MatchExpansionPremixerMute(self, match, tag):
-
-        ValueStateValues = {
-            '1' : 'On',
-            '0' : 'Off'
-            }
-
-        qualifier = {'Input': str(int(match.group(1)) + 1)}
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('ExpansionPremixerMute', value, qualifier)
-
-    def SetFreeze(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'  : '1', 
-            'Off' : '0'
-            }
-
-        Output = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max'] and value in ValueStateValues:
-            FreezeCmdString = '{0}*{1}F'.format(Output, ValueStateValues[value])
-            self.__SetHelper('Freeze', FreezeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetFreeze')
-                
-    def UpdateFreeze(self, value, qualifier):
-
-        Output = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max']:
-            FreezeCmdString = '{0}F'.format(Output)
-            self.__UpdateHelper('Freeze', FreezeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateFreeze')
-
-    def __MatchFreeze(self, match, tag):
-
-        OutputStates = {
-            '01' : '1',
-            '02' : '2',
-            '03' : '3',
-            '04' : '4'
-            }
-
-        ValueStateValues = {
-            '01' : 'On', 
-            '00' : 'Off'
-            }
-
-        qualifier = {}
-        qualifier['Output'] = OutputStates[match.group(1).decode()]
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('Freeze', value, qualifier)
-
-    def SetGlobalVideoMute(self, value, qualifier):
-
-        GlobalMuteState = {
-            'Video':'1',
-            'Video & Sync':'2',
-            'Off':'0'
-            }
-        
-        if value in GlobalMuteState:
-            self.__SetHelper('GlobalVideoMute', '{0}*B'.format(GlobalMuteState[value]), value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetGlobalVideoMute')
-            
     def __MatchGroup(self, match, tag):
       
         group = str(int(match.group(1)))
@@ -1048,211 +1270,29 @@ class DeviceClass:
         else:
             self.Discard('Invalid Command for UpdateGroupPostmixerTrim')
 
-    def SetHDMIAttenuation(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
+    def SetInputAudioSwitchMode(self, value, qualifier):
 
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
+        ValueStateValues = {
+            'Auto'   : '0', 
+            'Digital': '1',
+            'Analog' : '2'
             }
-
-        output = int(qualifier['Output'])
-
-        if -100 <= int(value) <= 0 and qualifier['L/R'] in channelSide:
-            if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max']:
-                channel = channelSide[qualifier['L/R']]
-                TranslationToNumber = translation[str((channel+output))]
-                commandString = 'WG6020{0}*{1}AU\r'.format(TranslationToNumber,round(value*10))
-                self.__SetHelper('HDMIAttenuation', commandString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for SetHDMIAttenuation')   
+        
+        Input = qualifier['Input']
+        if 1 <= int(Input) <= self.InputSize and value in ValueStateValues:
+            InputAudioSwitchModeCmdString = 'wI{0}*{1}AFMT\r\n'.format(Input, ValueStateValues[value])
+            self.__SetHelper('InputAudioSwitchMode', InputAudioSwitchModeCmdString, value, qualifier)
         else:
-            self.Discard('Invalid Command for SetHDMIAttenuation')
-
-    def UpdateHDMIAttenuation(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-
-        translation = {
-            '11':0,
-            
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            }
+            self.Discard('Invalid Command for SetInputAudioSwitchMode')
 
-        output = int(qualifier['Output'])
+    def UpdateInputAudioSwitchMode(self, value, qualifier):
 
-        if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max'] and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WG6020{0}AU\r'.format(TranslationToNumber)
-            self.__UpdateHelper('HDMIAttenuation', commandString, value, qualifier)
+        Input = qualifier['Input']
+        if 1 <= int(Input) <= self.InputSize:
+            InputAudioSwitchModeCmdString = 'wIAFMT\r\n'
+            self.__UpdateHelper('InputAudioSwitchMode', InputAudioSwitchModeCmdString, value, qualifier)
         else:
-            self.Discard('Invalid Command for UpdateHDMIAttenuation')
-
-    def __MatchHDMIAttenuation(self, match, qualifier):
-
-        channelSide = {
-            0:'Left',
-            1:'Right',
-            2:'Left',
-            3:'Right',
-            4:'Left',
-            5:'Right',
-            6:'Left',
-            7:'Right',
-            }
-
-        translation = {
-            0:'1',
-            1:'1',
-            2:'2',
-            3:'2',
-            4:'3',
-            5:'3',
-            6:'4',
-            7:'4',
-            }
-  
-        qualifier = {'L/R' :channelSide[int(match.group(1).decode())], 'Output':translation[int(match.group(1).decode())]}
-        value = int(match.group(2))/10
-        self.WriteStatus('HDMIAttenuation', value, qualifier)
-
-    def SetHDMIMute(self, value, qualifier):
-
-        MuteState = {
-            'On' :'1',
-            'Off':'0'
-            }
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            }
-
-        output = int(qualifier['Output'])
-
-        if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max'] and value in MuteState and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WM6020{0}*{1}AU\r'.format(TranslationToNumber,MuteState[value])
-            self.__SetHelper('HDMIMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetHDMIMute')     
-
-    def UpdateHDMIMute(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            }
-
-        output = int(qualifier['Output'])
-
-        if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max'] and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WM6020{0}AU\r'.format(TranslationToNumber)
-            self.__UpdateHelper('HDMIMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateHDMIMute')
-
-    def __MatchHDMIMute(self, match, qualifier):
-
-        MuteState = {
-            '1':'On',
-            '0':'Off'
-            }
-
-        channelSide = {
-            0:'Left',
-            1:'Right',
-            2:'Left',
-            3:'Right',
-            4:'Left',
-            5:'Right',
-            6:'Left',
-            7:'Right',
-            }
-
-        translation = {
-            0:'1',
-            1:'1',
-            2:'2',
-            3:'2',
-            4:'3',
-            5:'3',
-            6:'4',
-            7:'4',
-            }
-        
-        qualifier = {'L/R' :channelSide[int(match.group(1).decode())], 'Output':translation[int(match.group(1).decode())]}
-        value = MuteState[match.group(2).decode()]
-        self.WriteStatus('HDMIMute', value, qualifier)
-
-    def SetInputAudioSwitchMode(self, value, qualifier):
-
-        ValueStateValues = {
-            'Auto'   : '0', 
-            'Digital': '1',
-            'Analog' : '2'
-            }
-        
-        Input = qualifier['Input']
-        if 1 <= int(Input) <= self.InputSize and value in ValueStateValues:
-            InputAudioSwitchModeCmdString = 'wI{0}*{1}AFMT\r\n'.format(Input, ValueStateValues[value])
-            self.__SetHelper('InputAudioSwitchMode', InputAudioSwitchModeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetInputAudioSwitchMode')
-
-    def UpdateInputAudioSwitchMode(self, value, qualifier):
-
-        Input = qualifier['Input']
-        if 1 <= int(Input) <= self.InputSize:
-            InputAudioSwitchModeCmdString = 'wIAFMT\r\n'
-            self.__UpdateHelper('InputAudioSwitchMode', InputAudioSwitchModeCmdString, value, qualifier)
-        else:
-            self.Discard('Device Is Busy for UpdateInputAudioSwitchMode')
+            self.Discard('Device Is Busy for UpdateInputAudioSwitchMode')
 
     def __MatchInputAudioSwitchMode(self, match, tag):
 
@@ -1284,226 +1324,6 @@ class DeviceClass:
                 inputVal = inputVal + 1
                 self.WriteStatus('InputAudioSwitchMode', value, {'Input':str(inputVal)})
 
-    def SetInputGain(self, value, qualifier):
-
-        formatStates = {
-            'Analog'  : 'G',
-            'Digital' : 'H'
-            }
-
-        channelStates = {
-            'Left'  : 0,
-            'Right' : 1
-            }
-
-        inputVal = int(qualifier['Input'])
-        formatVal = qualifier['Format']
-        channel = qualifier['L/R']
-        if -18 <= value <= 24:
-            if 1 <= inputVal <= 8:
-                if formatVal in formatStates and channel in channelStates:
-                    formatValue = formatStates[formatVal]
-                    level = round(value * 10)
-                    channelValue = (inputVal * 2) - 2
-                    if channel == 'Right':
-                        channelValue = channelValue + 1
-
-                    InputGainCmdString = 'w{0}{1}*{2:05d}AU\r'.format(formatValue, channelValue + 30000, level)
-                    self.__SetHelper('InputGain', InputGainCmdString, value, qualifier)
-                else:
-                    self.Discard('Invalid Command for SetInputGain')
-            else:
-                self.Discard('Invalid Command for SetInputGain')
-        else:
-            self.Discard('Invalid Command for SetInputGain')
-
-    def UpdateInputGain(self, value, qualifier):
-
-        formatStates = {
-            'Analog': 'G',
-            'Digital': 'H'
-            }
-
-        channelStates = {
-            'Left': 0,
-            'Right': 1
-            }
-
-        inputVal = int(qualifier['Input'])
-        formatVal = qualifier['Format']
-        channel = qualifier['L/R']
-        if 1 <= inputVal <= 8:
-            if formatVal in formatStates and channel in channelStates:
-                formatValue = formatStates[formatVal]
-
-                channelValue = (inputVal * 2) - 2
-                if channel == 'Right':
-                    channelValue = channelValue + 1
-
-                InputGainCmdString = 'w{0}{1}AU\r'.format(formatValue, channelValue + 30000)
-                self.__UpdateHelper('InputGain', InputGainCmdString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for UpdateInputGain')
-        else:
-            self.Discard('Invalid Command for UpdateInputGain')
-
-    def __MatchInputGain(self, match, tag):
-
-        formatStates = {
-            'G' : 'Analog',
-            'H' : 'Digital'
-            }
-
-        qualifier = {}
-        qualifier['Format'] = formatStates[match.group(1).decode().upper()]
-        inputValue = int(match.group(2).decode()) #Even
-        if inputValue % 2 == 0:
-            channelValue = int((inputValue + 2) / 2)
-            qualifier['L/R'] = 'Left'
-        else: #Odd
-            channelValue = int((inputValue + 1) / 2)
-            qualifier['L/R'] = 'Right'
-        qualifier['Input'] = str(channelValue)
-
-        value = int(match.group(3).decode()) / 10
-        self.WriteStatus('InputGain', value, qualifier)
-
-    def SetInputMute(self, value, qualifier):
-
-        channelStates = {
-            'Left' : 0,
-            'Right': 1
-            }
-
-        ValueStateValues = {
-            'On'  : '1',
-            'Off' : '0'
-            }
-
-        channel = qualifier['L/R']
-        inputVal = int(qualifier['Input'])
-        if 1 <= inputVal <= 8 and value in ValueStateValues:
-            if channel in channelStates:
-                channelValue = (inputVal * 2) - 2
-                if channel == 'Right':
-                    channelValue = channelValue + 1
-
-                InputMuteCmdString = 'wM{0}*{1}AU\r'.format(channelValue + 30000, ValueStateValues[value])
-                self.__SetHelper('InputMute', InputMuteCmdString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for SetInputMute')
-        else:
-            self.Discard('Invalid Command for SetInputMute')
-
-    def UpdateInputMute(self, value, qualifier):
-
-        channelStates = {
-            'Left'  : 0,
-            'Right' : 1
-            }
-
-        channel = qualifier['L/R']
-        inputVal = int(qualifier['Input'])
-        if channel in channelStates:
-            channelValue = (inputVal * 2) - 2
-            if channel == 'Right':
-                channelValue = channelValue + 1
-            InputMuteCmdString = 'wM{0}AU\r'.format(channelValue + 30000)
-            self.__UpdateHelper('InputMute', InputMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateInputMute')
-
-    def __MatchInputMute(self, match, tag):
-
-        MuteStateNames = {
-            '1': 'On',
-            '0': 'Off'
-            }
-
-        qualifier = {}
-        inputValue = int(match.group(1).decode())  # Even
-        if inputValue % 2 == 0:
-            channelValue = int((inputValue + 2) / 2)
-            qualifier['L/R'] = 'Left'
-        else:  # Odd
-            channelValue = int((inputValue + 1) / 2)
-            qualifier['L/R'] = 'Right'
-        qualifier['Input'] = str(channelValue)
-
-        value = MuteStateNames[match.group(2).decode()]
-        self.WriteStatus('InputMute', value, qualifier)
-
-    def UpdateInputFormat(self, value, qualifier):
-
-        input_ = qualifier['Input']
-        if 1 <= int(input_) <= self.InputSize:
-            InputFormatCmdString = '{0}\x2A\x5C\r'.format(input_)
-            self.__UpdateHelper('InputFormat', InputFormatCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateInputFormat')
-
-    def __MatchInputFormat(self, match, tag):
-
-        ValueStateValues = {
-            '0' : 'No signal detected', 
-            '1' : 'DVI RGB 444', 
-            '2' : 'HDMI RGB 444 Full', 
-            '3' : 'HDMI RGB 444 Limited', 
-            '4' : 'HDMI YUV 444 Full', 
-            '5' : 'HDMI YUV 444 Limited', 
-            '6' : 'HDMI YUV 422 Full', 
-            '7' : 'HDMI YUV 422 Limited'
-            }
-
-        qualifier = {'Input': str(int(match.group(1).decode()))}
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('InputFormat', value, qualifier)
-
-    def SetHDCPInputAuthorization(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'  : '1', 
-            'Off' : '0'
-            }
-
-        tempInput = qualifier['Input']
-        if 1 <= int(tempInput) <= self.InputSize and value in ValueStateValues:
-            HDCPAuthorizationCmdString = 'wE{0}*{1}HDCP\r\n'.format(tempInput, ValueStateValues[value])
-            self.__SetHelper('HDCPInputAuthorization', HDCPAuthorizationCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetHDCPInputAuthorization')
-
-    def UpdateHDCPInputAuthorization(self, value, qualifier):
-
-        tempInput = qualifier['Input']
-        if 1 <= int(tempInput) <= self.InputSize:
-            HDCPAuthorizationCmdString = 'wE{0}HDCP\r\n'.format(tempInput)
-            self.__UpdateHelper('HDCPInputAuthorization', HDCPAuthorizationCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateHDCPInputAuthorization')
-
-    def __MatchHDCPInputAuthorization(self, match, tag):
-
-        InputStates = {
-            '01' : '1', 
-            '02' : '2', 
-            '03' : '3', 
-            '04' : '4', 
-            '05' : '5', 
-            '06' : '6', 
-            '07' : '7', 
-            '08' : '8'
-            }
-
-        ValueStateValues = {
-            '1' : 'On', 
-            '0' : 'Off'
-            }
-
-        tempInput = InputStates[match.group(1).decode()]
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('HDCPInputAuthorization', value, {'Input': tempInput})
-
     def UpdateInputSignalStatus(self, value, qualifier):
 
         tempInput = qualifier['Input']
@@ -1526,71 +1346,6 @@ class DeviceClass:
             self.WriteStatus('InputSignalStatus', ValueStateValues[inputVal], {'Input':str(inputNumber)})
             inputNumber += 1
 
-    def SetLogo(self, value, qualifier):
-
-        ValueStateValues = {
-            '1'   : '1', 
-            '2'   : '2', 
-            '3'   : '3', 
-            '4'   : '4', 
-            '5'   : '5', 
-            '6'   : '6', 
-            '7'   : '7', 
-            '8'   : '8', 
-            '9'   : '9', 
-            '10'  : '10', 
-            '11'  : '11', 
-            '12'  : '12', 
-            '13'  : '13', 
-            '14'  : '14', 
-            '15'  : '15', 
-            '16'  : '16', 
-            'Off' : '0'
-            }
-        
-        Output = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max'] and value in ValueStateValues:
-            LogoCmdString = 'wE{0}*{1}LOGO\r'.format(Output, ValueStateValues[value])
-            self.__SetHelper('Logo', LogoCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetLogo')
-
-    def UpdateLogo(self, value, qualifier):
-
-        Output = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max']:
-            LogoCmdString = 'wE{0}LOGO\r'.format(Output)
-            self.__UpdateHelper('Logo', LogoCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateLogo')
-
-    def __MatchLogo(self, match, tag):
-
-        ValueStateValues = {
-            '1'  : '1',
-            '2'  : '2', 
-            '3'  : '3', 
-            '4'  : '4', 
-            '5'  : '5', 
-            '6'  : '6', 
-            '7'  : '7', 
-            '8'  : '8', 
-            '9'  : '9', 
-            '10' : '10', 
-            '11' : '11', 
-            '12' : '12', 
-            '13' : '13', 
-            '14' : '14', 
-            '15' : '15', 
-            '16' : '16',              
-            '0'  : 'Off',
-            '-1' : 'Off'
-            }
-
-        Output = match.group(1).decode()
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('Logo', value, {'Output':Output})
-
     def SetLogoAssignment(self, value, qualifier):
 
         LogoStates = {
@@ -1640,46 +1395,6 @@ class DeviceClass:
             self.WriteStatus('LogoAvailability', value, {'Logo':str(Logo)})
             Logo += 1
 
-    def SetLogoKeySetting(self, value, qualifier):
-
-        ValueStateValues = {
-            'Disabled'      : '0', 
-            'Transparency'  : '1', 
-            'RGB Key'       : '2', 
-            'Level Key'     : '3', 
-            'Alpha Key'     : '4'
-            }
-
-        logo = qualifier['Logo']
-        if 1 <= int(logo) <= 16 and value in ValueStateValues:
-            LogoKeySettingCmdString = 'w{0}*{1}VKEF\r\n'.format(logo, ValueStateValues[value])
-            self.__SetHelper('LogoKeySetting', LogoKeySettingCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetLogoKeySetting')
-
-    def UpdateLogoKeySetting(self, value, qualifier):
-
-        logo = qualifier['Logo']
-        if 1 <= int(logo) <= 16:
-            LogoKeySettingCmdString = 'w{0}VKEF\r\n'.format(logo)
-            self.__UpdateHelper('LogoKeySetting', LogoKeySettingCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateLogoKeySetting')
-
-    def __MatchLogoKeySetting(self, match, tag):
-
-        ValueStateValues = {
-            '0' : 'Disabled', 
-            '1' : 'Transparency', 
-            '2' : 'RGB Key', 
-            '3' : 'Level Key', 
-            '4' : 'Alpha Key'
-            }
-
-        logo = str(int(match.group(1).decode()))
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('LogoKeySetting', value, {'Logo':logo})
-
     def SetMicLineGain(self, value, qualifier):
 
         inputVal = int(qualifier['Input'])
@@ -1708,43 +1423,6 @@ class DeviceClass:
         value = int(match.group(2)) / 10
         self.WriteStatus('MicLineGain', value, qualifier)
 
-    def SetMicLineMute(self, value, qualifier):
-
-        MicLineMuteStates = {
-            'On' :'1',
-            'Off':'0'
-            }
-
-        MicNum = int(qualifier['Input'])
-        if 1 <= MicNum <= 4 and value in MicLineMuteStates:
-            MicNumFix = MicNum - 1
-            commandString = 'wM4000{0}*{1}AU\r'.format(MicNumFix,MicLineMuteStates[value])
-            self.__SetHelper('MicLineMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetMicLineMute') 
-      
-    def UpdateMicLineMute(self, value, qualifier):
-
-        MicNum = int(qualifier['Input'])
-        if 1 <= int(MicNum) <= 4:
-            MicNumFix = MicNum - 1
-            commandString = 'wM4000{0}AU\r'.format(MicNumFix)
-            self.__UpdateHelper('MicLineMute', commandString, value, qualifier)
-        else :
-            self.Discard('Invalid Command for UpdateMicLineMute') 
-
-    def __MatchMicLineMute(self, match, qualifier):
-
-        MicLineMuteStates = {
-            '1':'On',
-            '0':'Off'
-            }
-
-        MicNumFix = int(match.group(1).decode()) + 1
-        qualifier = {'Input' : str(MicNumFix)}
-        value = MicLineMuteStates[match.group(2).decode()]
-        self.WriteStatus('MicLineMute', value, qualifier)
-
     def UpdateMicrophoneSignalStatus(self, value, qualifier):
 
         MicNum = qualifier['Input']
@@ -1975,336 +1653,6 @@ class DeviceClass:
                 Output = Output + 1
                 self.WriteStatus('OutputAudioSelect', value, {'Output':str(Output)})
 
-    def SetHDCPOutputAuthorization(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'   : '1', 
-            'Auto' : '0'
-            }
-        
-        if value in ValueStateValues and qualifier['Output'] in self.OutputStates:
-            Output = self.OutputStates[qualifier['Output']]
-            OutputHDCPAuthorizationCmdString = 'wS{0}*{1}HDCP\r\n'.format(Output, ValueStateValues[value])
-            self.__SetHelper('HDCPOutputAuthorization', OutputHDCPAuthorizationCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetHDCPOutputAuthorization')
-            
-    def UpdateHDCPOutputAuthorization(self, value, qualifier):
-
-        if qualifier['Output'] in self.OutputStates:
-            Output = self.OutputStates[qualifier['Output']]
-            OutputHDCPAuthorizationCmdString = 'wS{0}HDCP\r\n'.format(Output)
-            self.__UpdateHelper('HDCPOutputAuthorization', OutputHDCPAuthorizationCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateHDCPOutputAuthorization')
-            
-    def __MatchHDCPOutputAuthorization(self, match, tag):
-
-        ValueStateValues = {
-            '1' : 'On', 
-            '0' : 'Auto'
-            }
-
-        Output = self.OutputStates[match.group(1).decode().upper()]
-        value = ValueStateValues[match.group(4).decode()]
-        self.WriteStatus('HDCPOutputAuthorization', value, {'Output':Output})
-
-    def UpdateHDCPInputStatus(self, value, qualifier):
-
-        if 1 <= int(qualifier['Input']) <= self.InputSize:
-            HDCPInputStatusCmdString = 'wI{0}HDCP\r'.format(qualifier['Input'])
-            self.__UpdateHelper('HDCPInputStatus', HDCPInputStatusCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateHDCPInputStatus')
-            
-    def __MatchHDCPInputStatus(self, match, tag):
-
-        ValueStateValues = {
-            '0' : 'No Source Connected', 
-            '1' : 'HDCP Content', 
-            '2' : 'No HDCP Content'
-            }
-
-        qualifier = {'Input': str(int(match.group(1).decode()))}
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('HDCPInputStatus', value, qualifier)
-
-    def UpdateHDCPOutputStatus(self, value, qualifier):
-
-        if qualifier['Output'] in self.OutputStates:
-            HDCPOutputStatusCmdString = 'wO{0}HDCP\r'.format(self.OutputStates[qualifier['Output']])
-            self.__UpdateHelper('HDCPOutputStatus', HDCPOutputStatusCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateHDCPOutputStatus')
-            
-    def __MatchHDCPOutputStatus(self, match, tag):
-
-        ValueStateValues = {
-            '0' : 'No monitor connected', 
-            '1' : 'Monitor connected, HDCP not supported', 
-            '2' : 'Monitor connected, not encrypted', 
-            '3' : 'Monitor connected, currently encrypted'
-            }
-
-        qualifier = {'Output': self.OutputStates[match.group(1).decode()]}
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('HDCPOutputStatus', value, qualifier)
-
-    def SetOutputPostmixerTrim(self, value, qualifier):
-
-        channelStates = {
-            'Left'  : 0,
-            'Right' : 1
-            }
-
-        output = int(qualifier['Output'])
-        channel = qualifier['L/R']
-        if -12 <= value <= 12:
-            if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max']:
-                if channel in channelStates:
-                    level = round(value * 10)
-                    channelValue = (output * 2) - 2
-                    if channel == 'Right':
-                        channelValue = channelValue + 1
-                    OutputPostmixerTrimCmdString = 'wG6010{0}*{1}AU\r'.format(channelValue, level)
-                    self.__SetHelper('OutputPostmixerTrim', OutputPostmixerTrimCmdString, value, qualifier)
-                else:
-                    self.Discard('Invalid Command for SetOutputPostmixerTrim')
-            else:
-                self.Discard('Invalid Command for SetOutputPostmixerTrim')
-        else:
-            self.Discard('Invalid Command for SetOutputPostmixerTrim')
-
-    def UpdateOutputPostmixerTrim(self, value, qualifier):
-
-        channelStates = {
-            'Left'  : 0,
-            'Right' : 1
-            }
-
-        output = int(qualifier['Output'])
-        channel = qualifier['L/R']
-        if self.OutputConstraints['Min'] <= output <= self.OutputConstraints['Max']:
-            if channel in channelStates:
-                channelValue = (output * 2) - 2
-                if channel == 'Right':
-                    channelValue = channelValue + 1
-                OutputPostmixerTrimCmdString = 'wG6010{0}AU\r'.format(channelValue)
-                self.__UpdateHelper('OutputPostmixerTrim', OutputPostmixerTrimCmdString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for UpdateOutputPostmixerTrim')
-        else:
-            self.Discard('Invalid Command for UpdateOutputPostmixerTrim')
-
-    def __MatchOutputPostmixerTrim(self, match, tag):
-
-        qualifier = {}
-        outputValue = int(match.group(1).decode())
-        if outputValue % 2 == 0: #Even
-            channelValue = int((outputValue + 2) / 2)
-            qualifier['L/R'] = 'Left'
-        else:  # Odd
-            channelValue = int((outputValue + 1) / 2)
-            qualifier['L/R'] = 'Right'
-        qualifier['Output'] = str(channelValue)
-
-        value = int(match.group(2))/10
-        self.WriteStatus('OutputPostmixerTrim', value, qualifier)
-
-    def SetOutputResolution(self, value, qualifier):
-
-        ValueStateValues = {
-            '640x480 (60Hz)'            : '10', 
-            '800x600 (60Hz)'            : '11', 
-            '1024x768 (60Hz)'           : '12', 
-            '1280x768 (60Hz)'           : '13', 
-            '1280x800 (60Hz)'           : '14', 
-            '1280x1024 (60Hz)'          : '15', 
-            '1360x768 (60Hz)'           : '16', 
-            '1366x768 (60Hz)'           : '17', 
-            '1440x900 (60Hz)'           : '18', 
-            '1400x1050 (60Hz)'          : '19', 
-            '1600x900 (60Hz)'           : '20', 
-            '1680x1050 (60Hz)'          : '21', 
-            '1600x1200 (60Hz)'          : '22', 
-            '1920x1200 (60Hz)'          : '23', 
-            '480p (59.94Hz)'            : '24', 
-            '480p (60Hz)'               : '25', 
-            '576p (50Hz)'               : '26', 
-            '720p (23.98Hz)'            : '27', 
-            '720p (24Hz)'               : '28', 
-            '720p (25Hz)'               : '29', 
-            '720p (29.97Hz)'            : '30', 
-            '720p (30Hz)'               : '31', 
-            '720p (50Hz)'               : '32', 
-            '720p (59.94Hz)'            : '33', 
-            '720p (60Hz)'               : '34', 
-            '1080i (50Hz)'              : '35', 
-            '1080i (59.94Hz)'           : '36', 
-            '1080i (60Hz)'              : '37', 
-            '1080p (23.98Hz)'           : '38', 
-            '1080p (24Hz)'              : '39', 
-            '1080p (25Hz)'              : '40', 
-            '1080p (29.97Hz)'           : '41', 
-            '1080p (30Hz)'              : '42', 
-            '1080p (50Hz)'              : '43', 
-            '1080p (59.94Hz)'           : '44', 
-            '1080p (60Hz)'              : '45', 
-            '2048x1080 2K (23.98Hz)'    : '46', 
-            '2048x1080 2K (24Hz)'       : '47', 
-            '2048x1080 2K (25Hz)'       : '48', 
-            '2048x1080 2K (29.97Hz)'    : '49', 
-            '2048x1080 2K (30Hz)'       : '50', 
-            '2048x1080 2K (50Hz)'       : '51', 
-            '2048x1080 2K (59.94Hz)'    : '52', 
-            '2048x1080 2K (60Hz)'       : '53', 
-            '1920x2160 (23.98Hz)'       : '54', 
-            '1920x2160 (24Hz)'          : '55', 
-            '1920x2160 (25Hz)'          : '56', 
-            '1920x2160 (29.97Hz)'       : '57', 
-            '1920x2160 (30Hz)'          : '58', 
-            '1920x2160 (50Hz)'          : '59', 
-            '1920x2160 (59.94Hz)'       : '60', 
-            '1920x2160 (60Hz)'          : '61', 
-            '1920x2400 (30Hz)'          : '62', 
-            '1920x2400 (60Hz)'          : '63', 
-            '2048x1200 (60Hz)'          : '64', 
-            '2048x1536 (60Hz)'          : '65', 
-            '2048x2160 (23.98Hz)'       : '66', 
-            '2048x2160 (24Hz)'          : '67', 
-            '2048x2160 (25Hz)'          : '68', 
-            '2048x2160 (29.97Hz)'       : '69', 
-            '2048x2160 (30Hz)'          : '70', 
-            '2048x2160 (50Hz)'          : '71', 
-            '2048x2160 (59.94Hz)'       : '72', 
-            '2048x2160 (60Hz)'          : '73', 
-            '2048x2400 (30Hz)'          : '74',
-            '2560x1080 (60Hz)'          : '76', 
-            '2560x1440 (60Hz)'          : '77', 
-            '2560x1600 (60Hz)'          : '78', 
-            '3840x2160 (23.98Hz)'       : '79', 
-            '3840x2160 (24Hz)'          : '80', 
-            '3840x2160 (25Hz)'          : '81', 
-            '3840x2160 (29.97Hz)'       : '82', 
-            '3840x2160 (30Hz)'          : '83',
-            '3840x2400 (30Hz)'          : '87', 
-            '3840x2400 (60Hz)'          : '88', 
-            '4096x2160 (23.98Hz)'       : '89', 
-            '4096x2160 (24Hz)'          : '90', 
-            '4096x2160 (25Hz)'          : '91', 
-            '4096x2160 (29.97Hz)'       : '92', 
-            '4096x2160 (30Hz)'          : '93', 
-            }
-
-        Output = qualifier['Output']        
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max'] and value in ValueStateValues:
-            OutputResolutionCmdString = 'w{0}*{1}RATE\r\n'.format(Output, ValueStateValues[value])
-            self.__SetHelper('OutputResolution', OutputResolutionCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetOutputResolution')
-
-    def UpdateOutputResolution(self, value, qualifier):
-
-        Output = qualifier['Output']        
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max']:
-            OutputResolutionCmdString = 'w{0}RATE\r\n'.format(Output)
-            self.__UpdateHelper('OutputResolution', OutputResolutionCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateOutputResolution')
-
-    def __MatchOutputResolution(self, match, tag):
-
-        ValueStateValues = {
-            '10' : '640x480 (60Hz)', 
-            '11' : '800x600 (60Hz)', 
-            '12' : '1024x768 (60Hz)', 
-            '13' : '1280x768 (60Hz)', 
-            '14' : '1280x800 (60Hz)', 
-            '15' : '1280x1024 (60Hz)', 
-            '16' : '1360x768 (60Hz)', 
-            '17' : '1366x768 (60Hz)', 
-            '18' : '1440x900 (60Hz)', 
-            '19' : '1400x1050 (60Hz)', 
-            '20' : '1600x900 (60Hz)', 
-            '21' : '1680x1050 (60Hz)', 
-            '22' : '1600x1200 (60Hz)', 
-            '23' : '1920x1200 (60Hz)', 
-            '24' : '480p (59.94Hz)', 
-            '25' : '480p (60Hz)', 
-            '26' : '576p (50Hz)', 
-            '27' : '720p (23.98Hz)', 
-            '28' : '720p (24Hz)', 
-            '29' : '720p (25Hz)', 
-            '30' : '720p (29.97Hz)', 
-            '31' : '720p (30Hz)', 
-            '32' : '720p (50Hz)', 
-            '33' : '720p (59.94Hz)', 
-            '34' : '720p (60Hz)', 
-            '35' : '1080i (50Hz)', 
-            '36' : '1080i (59.94Hz)', 
-            '37' : '1080i (60Hz)', 
-            '38' : '1080p (23.98Hz)', 
-            '39' : '1080p (24Hz)', 
-            '40' : '1080p (25Hz)', 
-            '41' : '1080p (29.97Hz)', 
-            '42' : '1080p (30Hz)', 
-            '43' : '1080p (50Hz)', 
-            '44' : '1080p (59.94Hz)', 
-            '45' : '1080p (60Hz)', 
-            '46' : '2048x1080 2K (23.98Hz)', 
-            '47' : '2048x1080 2K (24Hz)', 
-            '48' : '2048x1080 2K (25Hz)', 
-            '49' : '2048x1080 2K (29.97Hz)', 
-            '50' : '2048x1080 2K (30Hz)', 
-            '51' : '2048x1080 2K (50Hz)', 
-            '52' : '2048x1080 2K (59.94Hz)', 
-            '53' : '2048x1080 2K (60Hz)', 
-            '54' : '1920x2160 (23.98Hz)', 
-            '55' : '1920x2160 (24Hz)', 
-            '56' : '1920x2160 (25Hz)', 
-            '57' : '1920x2160 (29.97Hz)', 
-            '58' : '1920x2160 (30Hz)', 
-            '59' : '1920x2160 (50Hz)', 
-            '60' : '1920x2160 (59.94Hz)', 
-            '61' : '1920x2160 (60Hz)', 
-            '62' : '1920x2400 (30Hz)', 
-            '63' : '1920x2400 (60Hz)', 
-            '64' : '2048x1200 (60Hz)', 
-            '65' : '2048x1536 (60Hz)', 
-            '66' : '2048x2160 (23.98Hz)', 
-            '67' : '2048x2160 (24Hz)', 
-            '68' : '2048x2160 (25Hz)', 
-            '69' : '2048x2160 (29.97Hz)', 
-            '70' : '2048x2160 (30Hz)', 
-            '71' : '2048x2160 (50Hz)', 
-            '72' : '2048x2160 (59.94Hz)', 
-            '73' : '2048x2160 (60Hz)', 
-            '74' : '2048x2400 (30Hz)', 
-            '75' : '2048x2400 (60Hz)', 
-            '76' : '2560x1080 (60Hz)', 
-            '77' : '2560x1440 (60Hz)', 
-            '78' : '2560x1600 (60Hz)', 
-            '79' : '3840x2160 (23.98Hz)', 
-            '80' : '3840x2160 (24Hz)', 
-            '81' : '3840x2160 (25Hz)', 
-            '82' : '3840x2160 (29.97Hz)', 
-            '83' : '3840x2160 (30Hz)', 
-            '84' : '3840x2160 (50Hz)', 
-            '85' : '3840x2160 (59.94Hz)', 
-            '86' : '3840x2160 (60Hz)', 
-            '87' : '3840x2400 (30Hz)', 
-            '88' : '3840x2400 (60Hz)', 
-            '89' : '4096x2160 (23.98Hz)', 
-            '90' : '4096x2160 (24Hz)', 
-            '91' : '4096x2160 (25Hz)', 
-            '92' : '4096x2160 (29.97Hz)', 
-            '93' : '4096x2160 (30Hz)'
-            }
-
-        Output = str(int(match.group(1).decode()))
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('OutputResolution', value, {'Output':Output})
-
     def __MatchOutputTieStatus(self, match, qualifier):
         if match.group(1):
             self.__MatchIndividualTie(match, None)
@@ -2382,466 +1730,6 @@ class DeviceClass:
 
         self.InputTieStatusHelper('All')
         self.OutputTieStatusHelper('All')
-    def SetPhantomPower(self, value, qualifier):
-
-        InputStates = {
-            '1' : '0', 
-            '2' : '1', 
-            '3' : '2', 
-            '4' : '3'
-            }
-
-        ValueStateValues = {
-            'On' : '1', 
-            'Off' : '0'
-            }
-        
-        if qualifier['Input'] in InputStates and value in ValueStateValues:
-            PhantomPowerCmdString = 'wZ4000{0}*{1}AU\r'.format(InputStates[qualifier['Input']], ValueStateValues[value])
-            self.__SetHelper('PhantomPower', PhantomPowerCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetPhantomPower')
-            
-    def UpdatePhantomPower(self, value, qualifier):
-
-        InputStates = {
-            '1' : '0', 
-            '2' : '1', 
-            '3' : '2', 
-            '4' : '3'
-            }
-        
-        if qualifier['Input'] in InputStates:
-            PhantomPowerCmdString = 'wZ4000{0}AU\r'.format(InputStates[qualifier['Input']])
-            self.__UpdateHelper('PhantomPower', PhantomPowerCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdatePhantomPower')
-            
-    def __MatchPhantomPower(self, match, tag):
-
-        InputStates = {
-            '0' : '1', 
-            '1' : '2', 
-            '2' : '3', 
-            '3' : '4'
-            }
-
-        ValueStateValues = {
-            '1' : 'On', 
-            '0' : 'Off'
-            }
-
-        qualifier = {}
-        qualifier['Input'] = InputStates[match.group(1).decode()]
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('PhantomPower', value, qualifier)
-
-    def SetPostMatrixGain(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            '15':8,
-            '25':9,
-            '16':10,
-            '26':11,
-            '17':12,
-            '27':13,
-            '18':14,
-            '28':15
-            }
-
-        output = int(qualifier['Output'])
-
-        if -100 <= int(value) <= 12 and qualifier['L/R'] in channelSide:
-            if 1 <= output <= self.OutputSize:
-                channel = channelSide[qualifier['L/R']]
-                TranslationToNumber = translation[str((channel+output))]
-                commandString = 'WG500{0:02d}*{1}AU\r'.format(TranslationToNumber,round(value*10))
-                self.__SetHelper('PostMatrixGain', commandString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for SetPostMatrixGain')     
-        else:
-            self.Discard('Invalid Command for SetPostMatrixGain')
-
-    def UpdatePostMatrixGain(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            '15':8,
-            '25':9,
-            '16':10,
-            '26':11,
-            '17':12,
-            '27':13,
-            '18':14,
-            '28':15
-            }
-
-        output = int(qualifier['Output'])
-
-        if 1 <= output <= self.OutputSize and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WG500{0:02d}AU\r'.format(TranslationToNumber)
-            self.__UpdateHelper('PostMatrixGain', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdatePostMatrixGain')
-
-    def __MatchPostMatrixGain(self, match, qualifier):
-
-        channelSide = {
-            0  :'Left',
-            1  :'Right',
-            2  :'Left',
-            3  :'Right',
-            4  :'Left',
-            5  :'Right',
-            6  :'Left',
-            7  :'Right',
-            8  :'Left',
-            9  :'Right',
-            10 :'Left',
-            11 :'Right',
-            12 :'Left',
-            13 :'Right',
-            14 :'Left',
-            15 :'Right',
-            }
-
-        translation = {
-            0 :'1',
-            1 :'1',
-            2 :'2',
-            3 :'2',
-            4 :'3',
-            5 :'3',
-            6 :'4',
-            7 :'4',
-            8 :'5',
-            9 :'5',
-            10:'6',
-            11:'6',
-            12:'7',
-            13:'7',
-            14:'8',
-            15:'8',
-            }
-                
-        qualifier = {'L/R' :channelSide[int(match.group(1).decode())], 'Output':translation[int(match.group(1).decode())]}
-        value = int(match.group(2))/10
-        self.WriteStatus('PostMatrixGain', value, qualifier)
-
-    def SetPostMatrixMute(self, value, qualifier):
-
-        MuteState = {
-            'On' :'1',
-            'Off':'0'
-            }
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            '15':8,
-            '25':9,
-            '16':10,
-            '26':11,
-            '17':12,
-            '27':13,
-            '18':14,
-            '28':15
-            }
-
-        output = int(qualifier['Output'])
-
-        if 1 <= output <= self.OutputSize and value in MuteState and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WM500{0:02d}*{1}AU\r'.format(TranslationToNumber,MuteState[value])
-            self.__SetHelper('PostMatrixMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetPostMatrixMute')   
-
-    def UpdatePostMatrixMute(self, value, qualifier):
-
-        channelSide = {
-            'Left' : 10,
-            'Right': 20
-            }
-
-        translation = {
-            '11':0,
-            '21':1,
-            '12':2,
-            '22':3,
-            '13':4,
-            '23':5,
-            '14':6,
-            '24':7,
-            '15':8,
-            '25':9,
-            '16':10,
-            '26':11,
-            '17':12,
-            '27':13,
-            '18':14,
-            '28':15
-            }
-
-        output = int(qualifier['Output'])
-
-        if 1 <= output <= self.OutputSize and qualifier['L/R'] in channelSide:
-            channel = channelSide[qualifier['L/R']]
-            TranslationToNumber = translation[str((channel+output))]
-            commandString = 'WM500{0:02d}AU\r'.format(TranslationToNumber)
-            self.__UpdateHelper('PostMatrixMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdatePostMatrixMute')
-
-    def __MatchPostMatrixMute(self, match, qualifier):
-
-        MuteState = {
-            '1':'On',
-            '0':'Off'
-            }
-
-        channelSide = {
-            0 :'Left',
-            1 :'Right',
-            2 :'Left',
-            3 :'Right',
-            4 :'Left',
-            5 :'Right',
-            6 :'Left',
-            7 :'Right',
-            8 :'Left',
-            9 :'Right',
-            10:'Left',
-            11:'Right',
-            12:'Left',
-            13:'Right',
-            14:'Left',
-            15:'Right',
-            }
-
-        translation = {
-            0 :'1',
-            1 :'1',
-            2 :'2',
-            3 :'2',
-            4 :'3',
-            5 :'3',
-            6 :'4',
-            7 :'4',
-            8 :'5',
-            9 :'5',
-            10:'6',
-            11:'6',
-            12:'7',
-            13:'7',
-            14:'8',
-            15:'8',
-            }
-       
-        qualifier = {'L/R' :channelSide[int(match.group(1).decode())], 'Output':translation[int(match.group(1).decode())]}
-        value = MuteState[match.group(2).decode()]
-        self.WriteStatus('PostMatrixMute', value, qualifier)
-
-    def SetPrematrixTrim(self, value, qualifier):
-
-        channelStates = {
-            'Left' : 0,
-            'Right': 1
-            }
-
-        channel = qualifier['L/R']
-        input = int(qualifier['Input'])
-        if -12 <= value <= 12:
-            if 1 <= input <= 8:
-                if channel in channelStates:
-                    level = round(value * 10)
-                    channelValue = (input * 2) - 2
-                    if channel == 'Right':
-                        channelValue = channelValue + 1
-
-                    PrematrixTrimCmdString = 'wG{0}*{1}AU\r'.format(channelValue + 30100, level)
-                    self.__SetHelper('PrematrixTrim', PrematrixTrimCmdString, value, qualifier)
-                else:
-                    self.Discard('Invalid Command for SetPrematrixTrim')
-            else:
-                self.Discard('Invalid Command for SetPrematrixTrim')
-        else:
-            self.Discard('Invalid Command for SetPrematrixTrim')
-
-    def UpdatePrematrixTrim(self, value, qualifier):
-
-        channelStates = {
-            'Left': 0,
-            'Right': 1
-            }
-
-        input = int(qualifier['Input'])
-        channel = qualifier['L/R']
-        if 1 <= input <= 8:
-            if channel in channelStates:
-                channelValue = (input * 2) - 2
-                if channel == 'Right':
-                    channelValue = channelValue + 1
-                PrematrixTrimCmdString = 'wG{0}AU\r'.format(channelValue + 30100)
-                self.__UpdateHelper('PrematrixTrim', PrematrixTrimCmdString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for UpdatePrematrixTrim')
-        else:
-            self.Discard('Invalid Command for UpdatePrematrixTrim')
-
-    def __MatchPrematrixTrim(self, match, tag):
-
-        qualifier = {}
-        inputValue = int(match.group(1).decode())  # Even
-        if inputValue % 2 == 0:
-            channelValue = int((inputValue + 2) / 2)
-            qualifier['L/R'] = 'Left'
-        else:  # Odd
-            channelValue = int((inputValue + 1) / 2)
-            qualifier['L/R'] = 'Right'
-        qualifier['Input'] = str(channelValue)
-
-        value = int(match.group(2).decode()) / 10
-        self.WriteStatus('PrematrixTrim', value, qualifier)
-
-    def SetPremixerGain(self, value, qualifier):
-
-        Input = (int(qualifier['Input'])-1)
- 
-        if -100 <= int(value) <= 12:
-            if 1 <= int(qualifier['Input']) <= 4:
-                commandString = 'WG4010{0}*{1}AU\r'.format(Input,round(value*10))
-                self.__SetHelper('PremixerGain', commandString, value, qualifier)
-            else:
-                self.Discard('Invalid Command for SetPremixerGain')      
-        else:
-            self.Discard('Invalid Command for SetPremixerGain')
-
-    def UpdatePremixerGain(self, value, qualifier):
-
-        input_ = (int(qualifier['Input'])-1)
-        if 1 <= int(qualifier['Input']) <= 4:
-            commandString = 'WG4010{0}AU\r'.format(input_)
-            self.__UpdateHelper('PremixerGain', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdatePremixerGain')
-
-    def __MatchPremixerGain(self, match, qualifier):
-
-        InputNum = {
-            '0':'1',
-            '1':'2',
-            '2':'3',
-            '3':'4'
-            }
-   
-        qualifier = {'Input': InputNum[match.group(1).decode()]}
-        value = int(match.group(2))/10
-        self.WriteStatus('PremixerGain', value, qualifier)
-
-    def SetPremixerMute(self, value, qualifier):
-
-        MicInputStates = {
-            '1' : '0', 
-            '2' : '1', 
-            '3' : '2', 
-            '4' : '3'
-            }
-
-        ValueStateValues = {
-            'On'  : '1', 
-            'Off' : '0'
-            }
-
-        Input = qualifier['Input']
-        if 1 <= int(qualifier['Input']) <= 4 and value in ValueStateValues:
-            PremixerMuteCmdString = 'WM4010{0}*{1}AU\r\n'.format(MicInputStates[Input], ValueStateValues[value])
-            self.__SetHelper('PremixerMute', PremixerMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetPremixerMute')
-            
-    def UpdatePremixerMute(self, value, qualifier):
-
-        MicInputStates = {
-            '1' : '0', 
-            '2' : '1', 
-            '3' : '2', 
-            '4' : '3'
-            }
-
-        Input = qualifier['Input']
-        if 1 <= int(qualifier['Input']) <= 4:
-            PremixerMuteCmdString = 'WM4010{0}AU\r'.format(MicInputStates[Input])
-            self.__UpdateHelper('PremixerMute', PremixerMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdatePremixerMute')
-            
-    def __MatchPremixerMute(self, match, tag):
-
-        MicInputStates = {
-            '0' : '1', 
-            '1' : '2',
-            '2' : '3',
-            '3' : '4'
-            }
-
-        ValueStateValues = {
-            '1' : 'On', 
-            '0' : 'Off'
-            }
-       
-        qualifier = {}
-        qualifier['Input'] = MicInputStates[match.group(1).decode()]
-        value = ValueStateValues[match.group(2).decode()]
-        self.WriteStatus('PremixerMute', value, qualifier)
-
-    def SetPresetRecall(self, value, qualifier):
-
-        if 1 <= int(value) <= 32:
-            PresetRecallCMDString = '{0}.'.format(value)
-            self.__SetHelper('PresetRecall',PresetRecallCMDString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetPresetRecall')
-
     def SetRefreshMatrix(self, value, qualifier):
 
         self.UpdateAllMatrixTie(value, qualifier)
@@ -2856,234 +1744,6 @@ class DeviceClass:
         value = round(float(match.group(1).decode()))
         self.WriteStatus('Temperature', value, None)
 
-    def SetScalerPresetRecall(self, value, qualifier):
-
-        Output = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max'] and 1 <= int(value) <= 128:
-            ScalerPresetRecallCmdString = '2*{0}*{1}.\r\n'.format(Output, value)
-            self.__SetHelper('ScalerPresetRecall', ScalerPresetRecallCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetScalerPresetRecall')
-    def SetScalerPresetSave(self, value, qualifier):
-
-        Output = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(Output) <= self.ScaledOutputConstraints['Max'] and 1 <= int(value) <= 128:
-            ScalerPresetSaveCmdString = '2*{0}*{1},\r\n'.format(Output, value)
-            self.__SetHelper('ScalerPresetSave', ScalerPresetSaveCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetScalerPresetSave')
-    def SetTestPattern(self, value, qualifier):
-
-        TestPattern = {
-            'Off':'0',
-            'Crop':'1',
-            'Alternating Pixels':'2',
-            'Crosshatch':'3',
-            'Color Bars':'4',
-            'Grayscale':'5',
-            'Blue Mode':'6'
-            }
-
-        OutputNum = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(OutputNum) <= self.ScaledOutputConstraints['Max'] and value in TestPattern:
-            TestPatternCMDString = 'W{0}*{1}TEST\r'.format(OutputNum,TestPattern[value])
-            self.__SetHelper('TestPattern',TestPatternCMDString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetTestPattern')
-
-    def UpdateTestPattern(self, value, qualifier):
-
-        OutputNum = qualifier['Output']
-        if self.ScaledOutputConstraints['Min'] <= int(OutputNum) <= self.ScaledOutputConstraints['Max']:
-            UpdateCMDString = 'W{0}TEST\r'.format(OutputNum)
-            self.__UpdateHelper('TestPattern', UpdateCMDString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateTestPattern')
-
-    def __MatchTestPattern(self, match, qualifier):
-
-        TestPattern={
-            '0':'Off',
-            '1':'Crop',
-            '2':'Alternating Pixels',
-            '3':'Crosshatch',
-            '4':'Color Bars',
-            '5':'Grayscale',
-            '6':'Blue Mode'
-            }
-        
-        qualifier = {'Output': str(int(match.group(1).decode()))}
-        value = TestPattern[str(int(match.group(2).decode()))]
-        self.WriteStatus('TestPattern', value, qualifier)
-
-    def SetVideoMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'Video'         : '1', 
-            'Video & Sync'  : '2', 
-            'Off'           : '0'
-            }
-
-        Output = qualifier['Output']
-        if Output in self.OutputStates and value in ValueStateValues:
-            VideoMuteCmdString = '{0}*{1}B'.format(self.OutputStates[Output], ValueStateValues[value])
-            self.__SetHelper('VideoMute', VideoMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetVideoMute')
-            
-    def UpdateVideoMute(self, value, qualifier):
-
-        Output = qualifier['Output']
-        if Output in self.OutputStates:
-            VideoMuteCmdString = '{0}B'.format(self.OutputStates[Output])
-            self.__UpdateHelper('VideoMute', VideoMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateVideoMute')
-            
-    def __MatchVideoMute(self, match, tag):
-
-        ValueStateValues = {
-            '1' : 'Video', 
-            '2' : 'Video & Sync', 
-            '0' : 'Off'
-            }
-
-        Output = self.OutputStates[match.group(1).decode().upper()]
-        value = ValueStateValues[match.group(4).decode()]
-        self.WriteStatus('VideoMute', value, {'Output':Output})
-
-    def SetVirtualReturnGain(self, value, qualifier):
-
-        ChannelTranslation = {
-            'A':'0',
-            'B':'1',
-            'C':'2',
-            'D':'3',
-            'E':'4',
-            'F':'5',
-            'G':'6',
-            'H':'7',
-            }
-
-        VirtualChannels = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
-        channel = qualifier['Input']
-        if channel in VirtualChannels and -100 <= value <= 12:
-            level = round(value*10)
-            ChannelValue = ChannelTranslation[channel]
-            commandString = 'WG5010{0}*{1}AU\r\n'.format(ChannelValue, level)
-            self.__SetHelper('VirtualReturnGain', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetVirtualReturnGain')
-
-    def UpdateVirtualReturnGain(self, value, qualifier):
-
-        ChannelTranslation = {
-            'A':'0',
-            'B':'1',
-            'C':'2',
-            'D':'3',
-            'E':'4',
-            'F':'5',
-            'G':'6',
-            'H':'7',
-            }
-
-        VirtualChannels = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
-        channel = qualifier['Input']
-        if channel in VirtualChannels:
-            ChannelValue = ChannelTranslation[channel]
-            commandString = 'WG5010{0}AU\r\n'.format(ChannelValue)
-            self.__UpdateHelper('VirtualReturnGain', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateVirtualReturnGain')
-
-    def __MatchVirtualReturnGain(self, match, tag):
-
-        ChannelRETranslation = {
-            '0':'A',
-            '1':'B',
-            '2':'C',
-            '3':'D',
-            '4':'E',
-            '5':'F',
-            '6':'G',
-            '7':'H',
-            }
-        
-        channel = ChannelRETranslation[match.group(1).decode()]
-        qualifier = {'Input' : channel}
-        value = int(match.group(2).decode())/10
-        self.WriteStatus('VirtualReturnGain', value, qualifier)
-
-    def SetVirtualReturnMute(self, value, qualifier):
-
-        ChannelTranslation = {
-            'A':'0',
-            'B':'1',
-            'C':'2',
-            'D':'3',
-            'E':'4',
-            'F':'5',
-            'G':'6',
-            'H':'7',
-            }
-
-        VirtualChannels = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
-        MuteStateValues = {
-            'On'  : '1',
-            'Off' : '0'
-            }
-
-        channel = qualifier['Input']
-        if channel in VirtualChannels and value in MuteStateValues:
-            commandString = 'WM5010{0}*{1}AU\r\n'.format(ChannelTranslation[channel], MuteStateValues[value])
-            self.__SetHelper('VirtualReturnMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetVirtualReturnMute')
-
-    def UpdateVirtualReturnMute(self, value, qualifier):
-
-        ChannelTranslation = {
-            'A':'0',
-            'B':'1',
-            'C':'2',
-            'D':'3',
-            'E':'4',
-            'F':'5',
-            'G':'6',
-            'H':'7',
-            }
-
-        VirtualChannels = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
-        channel = qualifier['Input']
-        if channel in VirtualChannels:            
-            commandString = 'WM5010{0}AU\r\n'.format(ChannelTranslation[channel])
-            self.__UpdateHelper('VirtualReturnMute', commandString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for UpdateVirtualReturnMute')
-
-    def __MatchVirtualReturnMute(self, match, tag):
-
-        MuteStateNames = {
-            '1' : 'On',
-            '0' : 'Off'
-            }
-
-        ChannelRETranslation = {
-            '0':'A',
-            '1':'B',
-            '2':'C',
-            '3':'D',
-            '4':'E',
-            '5':'F',
-            '6':'G',
-            '7':'H',
-            }
-        
-        qualifier = {'Input' : ChannelRETranslation[match.group(1).decode()]}
-        value =  MuteStateNames[match.group(2).decode()]
-        self.WriteStatus('VirtualReturnMute', value, qualifier)
-
     def SetVolume(self, value, qualifier):
     
         if -100 <= int(value) <= 12:
@@ -3099,19 +1759,36 @@ class DeviceClass:
         self.__UpdateHelper('Volume', commandString, value, qualifier)
         self.GroupFunction['1'] = 'GroupPremixerGain'
 
+    def __Send(self, commandstring, command=None, kind=''):
+        if self.Trace.Capturing:
+            self.Trace.Capture('TX', commandstring)
+        # The answer is paired in __ReceiveData by the answer key of the response that consumes
+        # it, so notifications of other kinds, such as front panel ties in verbose mode, never
+        # take its place. Set and Update commands are timed; echo and verbose mode are not. A
+        # command no response answers is only waited for by error responses.
+        key = _AnswerKeys.get(command, command)
+        count = commandstring.count('\r') or 1
+        if key in self._AnswerKeysMatched:
+            self.Latency.Sent(kind + command if kind else None, key, count)
+        else:
+            self.Latency.Sent(None, _AnyCommand, count)
+        self.Send(commandstring)
+
     def __SetHelper(self, command, commandstring, value, qualifier):
-        self.Debug = True
+        self.Trace.Debug('Set %s: %r', command, commandstring)
         if self.EchoDisabled and 'Serial' not in self.ConnectionType:
             @Wait(1)
             def SendEcho():
-                self.Send('w0echo\r\n')
+                self.__Send('w0echo\r\n', 'EchoMode')
         elif self.VerboseDisabled:
             @Wait(1)
             def SendVerbose():
-                self.Send('w3cv\r\n')
-                self.Send(commandstring)
+                self.__Send('w3cv\r\n', 'VerboseMode')
+                self.__Send(commandstring, command, 'Set')
         else:
-            self.Send(commandstring)
+            self.__Send(commandstring, command, 'Set')
+
+    _SetHelper = __SetHelper
 
     def __UpdateHelper(self, command, commandstring, value, qualifier):
         if self.initializationChk:
@@ -3127,15 +1804,17 @@ class DeviceClass:
         elif self.EchoDisabled and 'Serial' not in self.ConnectionType:
             @Wait(1)
             def SendEcho():
-                self.Send('w0echo\r\n') 
+                self.__Send('w0echo\r\n', 'EchoMode') 
         else:
             if self.VerboseDisabled:
                 @Wait(1)
                 def SendVerbose():
-                    self.Send('w3cv\r\n')
-                    self.Send(commandstring)
+                    self.__Send('w3cv\r\n', 'VerboseMode')
+                    self.__Send(commandstring, command, 'Update')
             else:
-                self.Send(commandstring)
+                self.__Send(commandstring, command, 'Update')
+
+    _UpdateHelper = __UpdateHelper
 
     def __MatchError(self, match, tag):
         self.counter = 0
@@ -3180,152 +1859,11 @@ class DeviceClass:
         self.EchoDisabled = True
         self.VerboseDisabled = True
         
-    def extr_15_2019_84(self):    
-        
-        self.InputSize = 8
-        self.OutputSize = 4
-        
-        self.OutputConstraints = {
-            'Min': 1,
-            'Max': 4
-            }
-        
-        self.ScaledOutputConstraints = {
-            'Min': 3,
-            'Max': 4
-            }
-        
-        self.EDIDStates = {
-            '1' : 'Output 1', 
-            '2' : 'Output 2', 
-            '3' : 'Output 3A', 
-            '4' : 'Output 3B', 
-            '5' : 'Output 4A', 
-            '6' : 'Output 4B', 
-            '7' : '1024x768 @ 50Hz', 
-            '8' : '1024x768 @ 60Hz', 
-            '9' : '1280x720 @ 50Hz', 
-            '10' : '1280x720 @ 60Hz', 
-            '11' : '1280x768 @ 50Hz', 
-            '12' : '1280x768 @ 60Hz', 
-            '13' : '1280x800 @ 50Hz', 
-            '14' : '1280x800 @ 60Hz', 
-            '15' : '1280x1024 @ 50Hz', 
-            '16' : '1280x1024 @ 60Hz', 
-            '17' : '1360x768 @ 50Hz', 
-            '18' : '1360x768 @ 60Hz', 
-            '19' : '1366x768 @ 50Hz', 
-            '20' : '1366x768 @ 60Hz', 
-            '21' : '1400x1050 @ 50Hz', 
-            '22' : '1400x1050 @ 60Hz', 
-            '23' : '1440x900 @ 50Hz', 
-            '24' : '1440x900 @ 60Hz', 
-            '25' : '1600x900 @ 50Hz', 
-            '26' : '1600x900 @ 60Hz', 
-            '27' : '1600x1200 @ 50Hz', 
-            '28' : '1600x1200 @ 60Hz', 
-            '29' : '1680x1050 @ 50Hz', 
-            '30' : '1680x1050 @ 60Hz', 
-            '31' : '1920x1080 @ 50Hz', 
-            '32' : '1920x1080 @ 60Hz', 
-            '33' : '1920x1200 @ 50Hz', 
-            '34' : '1920x1200 @ 60Hz', 
-            '35' : '2048x1080 @ 50Hz', 
-            '36' : '2048x1080 @ 60Hz', 
-            '37' : '480p 2_Ch Audio @ 60Hz', 
-            '38' : '576p 2_Ch Audio @ 50Hz', 
-            '39' : '720p 2_Ch Audio @ 50Hz', 
-            '40' : '720p 2_Ch Audio @ 60Hz', 
-            '41' : '720p Multi_Ch Audio @ 50Hz', 
-            '42' : '720p Multi_Ch Audio @ 60Hz', 
-            '43' : '1080i 2_Ch Audio @ 50Hz', 
-            '44' : '1080i 2_Ch Audio @ 60Hz', 
-            '45' : '1080i Multi_Ch Audio @ 50Hz', 
-            '46' : '1080i Multi_Ch Audio @ 60Hz', 
-            '47' : '1080p 2_Ch Audio @ 50Hz', 
-            '48' : '1080p 2_Ch Audio @ 60Hz', 
-            '49' : '1080p Multi_Ch Audio @ 50Hz', 
-            '50' : '1080p Multi_Ch Audio @ 60Hz', 
-            '51' : '3840x2160 2_Ch Audio @ 30Hz', 
-            '52' : '3840x2160 Multi_Ch Audio @ 30Hz', 
-            '53' : 'User Assigned 1', 
-            '54' : 'User Assigned 2', 
-            '55' : 'User Assigned 3', 
-            '56' : 'User Assigned 4', 
-            '57' : 'User Assigned 5', 
-            '58' : 'User Assigned 6', 
-            '59' : 'User Assigned 7', 
-            '60' : 'User Assigned 8'
-        }
-
-        self.MixPointInputs = {
-            'Output 1 Left'  : '00', 
-            'Output 1 Right' : '01', 
-            'Output 2 Left'  : '02', 
-            'Output 2 Right' : '03', 
-            'Output 3 Left'  : '04', 
-            'Output 3 Right' : '05', 
-            'Output 4 Left'  : '06', 
-            'Output 4 Right' : '07', 
-            'Mic 1' : '16',
-            'Mic 2' : '17',
-            'Mic 3' : '18',
-            'Mic 4' : '19',
-            'V. Return A' : '20',
-            'V. Return B' : '21',
-            'V. Return C' : '22',
-            'V. Return D' : '23',
-            'V. Return E' : '24',
-            'V. Return F' : '25',
-            'V. Return G' : '26',
-            'V. Return H' : '27',
-            'Exp. 1' : '28',
-            'Exp. 2' : '29',
-            'Exp. 3' : '30',
-            'Exp. 4' : '31',
-            'Exp. 5' : '32',
-            'Exp. 6' : '33',
-            'Exp. 7' : '34',
-            'Exp. 8' : '35',
-            'Exp. 9'  : '36',
-            'Exp. 10' : '37',
-            'Exp. 11' : '38',
-            'Exp. 12' : '39',
-            'Exp. 13' : '40',
-            'Exp. 14' : '41',
-            'Exp. 15' : '42',
-            'Exp. 16' : '43'
-        }
-
-        self.MixPointOutputs = {
-            'Output 1 Left'  : '00', 
-            'Output 1 Right' : '01', 
-            'Output 2 Left'  : '02', 
-            'Output 2 Right' : '03', 
-            'Output 3 Left'  : '04', 
-            'Output 3 Right' : '05', 
-            'Output 4 Left'  : '06', 
-            'Output 4 Right' : '07', 
-            'V. Send A' : '16', 
-            'V. Send B' : '17', 
-            'V. Send C' : '18', 
-            'V. Send D' : '19', 
-            'V. Send E' : '20', 
-            'V. Send F' : '21', 
-            'V. Send G' : '22', 
-            'V. Send H' : '23',
-        }
-        
-        self.OutputStates = {
-            '1'  : '1', 
-            '2'  : '2', 
-            '3A' : '3A',
-            '3B' : '3B',
-            '4A' : '4A',
-            '4B' : '4B'
-        }
-
+    def __LoadProfile(self, profile):
+        self.__dict__.update(profile)
 
+    def extr_15_2019_84(self):    
+        self.__LoadProfile(_Model84)
 
     def extr_15_2019_84_MA(self):
     
@@ -3338,138 +1876,7 @@ class DeviceClass:
         self.extr_15_2019_84()
 
     def extr_15_2019_82(self):
-    
-        self.InputSize = 8
-        self.OutputSize = 2        
-
-        self.OutputConstraints = {
-            'Min': 1,
-            'Max': 2
-        }
-        
-        self.ScaledOutputConstraints = {
-            'Min': 1,
-            'Max': 2
-        }
-        
-        self.EDIDStates = {
-            '1' : 'Output 1A', 
-            '2' : 'Output 1B', 
-            '3' : 'Output 2A', 
-            '4' : 'Output 2B', 
-            '5' : '1024x768 @ 50Hz', 
-            '6' : '1024x768 @ 60Hz', 
-            '7' : '1280x720 @ 50Hz', 
-            '8' : '1280x720 @ 60Hz', 
-            '9' : '1280x768 @ 50Hz', 
-            '10' : '1280x768 @ 60Hz', 
-            '11' : '1280x800 @ 50Hz', 
-            '12' : '1280x800 @ 60Hz', 
-            '13' : '1280x1024 @ 50Hz', 
-            '14' : '1280x1024 @ 60Hz', 
-            '15' : '1360x768 @ 50Hz', 
-            '16' : '1360x768 @ 60Hz', 
-            '17' : '1366x768 @ 50Hz', 
-            '18' : '1366x768 @ 60Hz', 
-            '19' : '1400x1050 @ 50Hz', 
-            '20' : '1400x1050 @ 60Hz', 
-            '21' : '1440x900 @ 50Hz', 
-            '22' : '1440x900 @ 60Hz', 
-            '23' : '1600x900 @ 50Hz', 
-            '24' : '1600x900 @ 60Hz', 
-            '25' : '1600x1200 @ 50Hz', 
-            '26' : '1600x1200 @ 60Hz', 
-            '27' : '1680x1050 @ 50Hz', 
-            '28' : '1680x1050 @ 60Hz', 
-            '29' : '1920x1080 @ 50Hz', 
-            '30' : '1920x1080 @ 60Hz', 
-            '31' : '1920x1200 @ 50Hz', 
-            '32' : '1920x1200 @ 60Hz', 
-            '33' : '2048x1080 @ 50Hz', 
-            '34' : '2048x1080 @ 60Hz', 
-            '35' : '480p 2_Ch Audio @ 60Hz', 
-            '36' : '576p 2_Ch Audio @ 50Hz', 
-            '37' : '720p 2_Ch Audio @ 50Hz', 
-            '38' : '720p 2_Ch Audio @ 60Hz', 
-            '39' : '720p Multi_Ch Audio @ 50Hz', 
-            '40' : '720p Multi_Ch Audio @ 60Hz', 
-            '41' : '1080i 2_Ch Audio @ 50Hz', 
-            '42' : '1080i 2_Ch Audio @ 60Hz', 
-            '43' : '1080i Multi_Ch Audio @ 50Hz', 
-            '44' : '1080i Multi_Ch Audio @ 60Hz', 
-            '45' : '1080p 2_Ch Audio @ 50Hz', 
-            '46' : '1080p 2_Ch Audio @ 60Hz', 
-            '47' : '1080p Multi_Ch Audio @ 50Hz', 
-            '48' : '1080p Multi_Ch Audio @ 60Hz', 
-            '49' : '3840x2160 2_Ch Audio @ 30Hz', 
-            '50' : '3840x2160 Multi_Ch Audio @ 30Hz', 
-            '51' : 'User Assigned 1', 
-            '52' : 'User Assigned 2', 
-            '53' : 'User Assigned 3', 
-            '54' : 'User Assigned 4', 
-            '55' : 'User Assigned 5', 
-            '56' : 'User Assigned 6', 
-            '57' : 'User Assigned 7', 
-            '58' : 'User Assigned 8'
-        }
-        self.MixPointInputs = {
-            'Output 1 Left'  : '00', 
-            'Output 1 Right' : '01', 
-            'Output 2 Left'  : '02', 
-            'Output 2 Right' : '03', 
-            'Mic 1' : '16',
-            'Mic 2' : '17',
-            'Mic 3' : '18',
-            'Mic 4' : '19',
-            'V. Return A' : '20',
-            'V. Return B' : '21',
-            'V. Return C' : '22',
-            'V. Return D' : '23',
-            'V. Return E' : '24',
-            'V. Return F' : '25',
-            'V. Return G' : '26',
-            'V. Return H' : '27',
-            'Exp. 1' : '28',
-            'Exp. 2' : '29',
-            'Exp. 3' : '30',
-            'Exp. 4' : '31',
-            'Exp. 5' : '32',
-            'Exp. 6' : '33',
-            'Exp. 7' : '34',
-            'Exp. 8' : '35',
-            'Exp. 9'  : '36',
-            'Exp. 10' : '37',
-            'Exp. 11' : '38',
-            'Exp. 12' : '39',
-            'Exp. 13' : '40',
-            'Exp. 14' : '41',
-            'Exp. 15' : '42',
-            'Exp. 16' : '43'
-        }
-
-        self.MixPointOutputs = {
-            'Output 1 Left'  : '00', 
-            'Output 1 Right' : '01', 
-            'Output 2 Left'  : '02', 
-            'Output 2 Right' : '03', 
-            'V. Send A' : '16', 
-            'V. Send B' : '17', 
-            'V. Send C' : '18', 
-            'V. Send D' : '19', 
-            'V. Send E' : '20', 
-            'V. Send F' : '21', 
-            'V. Send G' : '22', 
-            'V. Send H' : '23',
-        }
-        
-        self.OutputStates = {
-            '1A'  : '1A', 
-            '1B'  : '1B', 
-            '2A' : '2A',
-            '2B' : '2B'
-        } 
-
-
+        self.__LoadProfile(_Model82)
 
     def extr_15_2019_82_MA(self):    
         
@@ -3591,6 +1998,8 @@ class DeviceClass:
 
     def __ReceiveData(self, interface, data):
         # Handle incoming data
+        if self.Trace.Capturing:
+            self.Trace.Capture('RX', data)
         self.__receiveBuffer += data
         index = 0    # Start of possible good data
         
@@ -3600,7 +2009,13 @@ class DeviceClass:
                 result = re.search(regexString, self.__receiveBuffer)
                 if result:
                     index = result.start()
-                    CurrentMatch['callback'](result, CurrentMatch['para'])
+                    if self.Latency.Pending:
+                        answers = CurrentMatch.get('answers')
+                        if answers is _AnyCommand:
+                            self.Latency.AnsweredOldest(Error=True)
+                        elif answers is not None:
+                            self.Latency.Answered(answers)
+                    CurrentMatch['callback'](self, result, CurrentMatch['para'])
                     self.__receiveBuffer = self.__receiveBuffer[:result.start()] + self.__receiveBuffer[result.end():]
                 else:
                     break
@@ -3616,7 +2031,9 @@ class DeviceClass:
     # Add regular expression so that it can be check on incoming data from device.
     def AddMatchString(self, regex_string, callback, arg):
         if regex_string not in self.__matchStringDict:
-            self.__matchStringDict[regex_string] = {'callback': callback, 'para':arg}
+            if self.__matchStringDict is DeviceClass._MatchStrings:
+                self.__matchStringDict = dict(self.__matchStringDict)
+            self.__matchStringDict[regex_string] = {'callback': lambda _, match, para: callback(match, para), 'para':arg}
 
     def MissingCredentialsLog(self, credential_type):
         if isinstance(self, EthernetClientInterface):
@@ -3631,6 +2048,10 @@ class DeviceClass:
                    "review the communication sheet.\n {2}"
                    .format(__name__, credential_type, port_info), 'warning') 
 
+
+SwitcherProtocol.Install(DeviceClass)
+
+
 class SerialClass(SerialInterface, DeviceClass):
 
     def __init__(self, Host, Port, Baud=9600, Data=8, Parity='None', Stop=1, FlowControl='Off', CharDelay=0, Mode='RS232', Model =None):
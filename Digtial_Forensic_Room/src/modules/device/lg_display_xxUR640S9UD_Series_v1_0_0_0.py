@@ -1,6 +1,119 @@
 from extronlib.interface import SerialInterface, EthernetClientInterface
 import re
 from extronlib.system import Wait, ProgramLog
+from time import monotonic
+
+from modules.helper.Latency import GetRecorder
+from modules.helper.Protocol import Protocol, Range, Table
+from modules.helper.Trace import GetChannel
+
+
+_OnOff = {'On': '01', 'Off': '00'}
+
+# Protocol of DeviceSerialClass. Every command string carries the set ID; replies are
+# '<cmd2> <id> OK<data>x'.
+SerialSpec = {
+    'AspectRatio': {
+        'Value': Table({'4:3': '01', '16:9': '02', 'Original': '06', 'Just Scan': '09'}, Upper=True),
+        'Set': 'kc {id} {Value}\r',
+        'Update': 'kc {id} FF\r',
+        'Match': b'c [a-f0-9]{2} OK(0[1269])x',
+    },
+    'AudioMute': {
+        'Value': Table({'On': '00', 'Off': '01'}),
+        'Set': 'ke {id} {Value}\r',
+        'Update': 'ke {id} FF\r',
+        'Match': b'e [a-f0-9]{2} OK(0[01])x',
+    },
+    'Channel': {
+        'Value': Table({'Up': '00', 'Down': '01'}),
+        'Set': 'mc {id} {Value}\r',
+    },
+    'ClosedCaption': {
+        'Set': 'mc {id} 39\r',
+    },
+    'ExecutiveMode': {
+        'Value': Table(_OnOff),
+        'Set': 'km {id} {Value}\r',
+        'Update': 'km {id} FF\r',
+        'Match': b'm [a-f0-9]{2} OK(0[01])x',
+    },
+    'Input': {
+        'Value': Table({
+            'HDMI 1': '90',
+            'HDMI 2': '91',
+            'HDMI 3': '92',
+            'DTV': '00',
+            'ATV': '10',
+            'CADTV': '01',
+            'CATV': '11'
+        }),
+        'Set': 'xb {id} {Value}\r',
+        'Update': 'xb {id} FF\r',
+        'Match': b'b [a-f0-9]{2} OK(90|91|92|00|10|01|11)x',
+    },
+    'Keypad': {
+        'Value': Table({
+            '1': '11',
+            '2': '12',
+            '3': '13',
+            '4': '14',
+            '5': '15',
+            '6': '16',
+            '7': '17',
+            '8': '18',
+            '9': '19',
+            '0': '10',
+            '-': '4C'
+        }),
+        'Set': 'mc {id} {Value}\r',
+    },
+    'MenuNavigation': {
+        'Value': Table({
+            'Up': '40',
+            'Down': '41',
+            'Left': '07',
+            'Right': '06',
+            'Menu': '43',
+            'OK': '44',
+            'Exit': '5B',
+            'Back': '28'
+        }),
+        'Set': 'mc {id} {Value}\r',
+    },
+    'OnScreenDisplay': {
+        'Value': Table(_OnOff),
+        'Set': 'kl {id} {Value}\r',
+        'Update': 'kl {id} FF\r',
+        'Match': b'l [a-f0-9]{2} OK(0[01])x',
+    },
+    'Power': {
+        'Value': Table(_OnOff),
+        'Set': 'ka {id} {Value}\r',
+        'Update': 'ka {id} FF\r',
+        'Match': b'a [a-f0-9]{2} OK(0[01])x',
+    },
+    'VideoMute': {
+        'Value': Table({'On': '01', 'Off': '00', 'On (With OSD)': '10'}),
+        'Set': 'kd {id} {Value}\r',
+        'Update': 'kd {id} FF\r',
+        'Match': b'd [a-f0-9]{2} OK(00|01|10)x',
+    },
+    'Volume': {
+        'Value': Range(0, 100, Format='{:02X}', Base=16),
+        'Set': 'kf {id} {Value}\r',
+        'Update': 'kf {id} FF\r',
+        'Match': b'f [a-f0-9]{2} OK([0-9a-f]{2})x',
+    },
+}
+
+# DeviceEthernetClass only sends.
+EthernetSpec = {name: {key: spec[key] for key in ('Value', 'Set') if key in spec}
+                for name, spec in SerialSpec.items() if name != 'Power'}
+EthernetSpec['PowerOff'] = {'Set': 'ka {id} 00\r'}
+
+SerialProtocol = Protocol(SerialSpec, Fields={'id': '_DeviceID'}, Flags=re.I)
+EthernetProtocol = Protocol(EthernetSpec, Fields={'id': '_DeviceID'})
 
 
 class DeviceSerialClass:
@@ -18,6 +131,9 @@ class DeviceSerialClass:
         self.connectionFlag = True
         self.initializationChk = True
         self.Debug = False
+        self.Trace = GetChannel(__name__, self)
+        # Answers name the command letter and set ID they answer. See __ReceiveData.
+        self.Latency = GetRecorder(__name__, self)
         self._DeviceID = '01'
         self.Models = {}
 
@@ -38,14 +154,7 @@ class DeviceSerialClass:
         }
 
         if self.Unidirectional == 'False' and self._DeviceID != '00':
-            self.AddMatchString(re.compile(b'c [a-f0-9]{2} OK(0[1269])x', re.I), self.__MatchAspectRatio, None)
-            self.AddMatchString(re.compile(b'e [a-f0-9]{2} OK(0[01])x', re.I), self.__MatchAudioMute, None)
-            self.AddMatchString(re.compile(b'm [a-f0-9]{2} OK(0[01])x', re.I), self.__MatchExecutiveMode, None)
-            self.AddMatchString(re.compile(b'b [a-f0-9]{2} OK(90|91|92|00|10|01|11)x', re.I), self.__MatchInput, None)
-            self.AddMatchString(re.compile(b'l [a-f0-9]{2} OK(0[01])x', re.I), self.__MatchOnScreenDisplay, None)
-            self.AddMatchString(re.compile(b'a [a-f0-9]{2} OK(0[01])x', re.I), self.__MatchPower, None)
-            self.AddMatchString(re.compile(b'd [a-f0-9]{2} OK(00|01|10)x', re.I), self.__MatchVideoMute, None)
-            self.AddMatchString(re.compile(b'f [a-f0-9]{2} OK([0-9a-f]{2})x', re.I), self.__MatchVolume, None)
+            SerialProtocol.AddMatchStrings(self)
             self.AddMatchString(re.compile(b'([cembladf]) [a-f0-9]{2} NG.*?x', re.I), self.__MatchError, None)
 
             self.setRegex = re.compile(b'[cembladf] [a-f0-9]{2} (?:OK|NG).*?x', re.I)
@@ -63,296 +172,6 @@ class DeviceSerialClass:
         else:
             self.Error(['Invalid Device ID Parameter.'])
 
-    def SetAspectRatio(self, value, qualifier):
-
-        ValueStateValues = {
-            '4:3': '01',
-            '16:9': '02',
-            'Original': '06',
-            'Just Scan': '09'
-        }
-
-        if value in ValueStateValues:
-            AspectRatioCmdString = 'kc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAspectRatio')
-
-    def UpdateAspectRatio(self, value, qualifier):
-
-        AspectRatioCmdString = 'kc {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
-
-    def __MatchAspectRatio(self, match, tag):
-
-        ValueStateValues = {
-            '01': '4:3',
-            '02': '16:9',
-            '06': 'Original',
-            '09': 'Just Scan'
-        }
-
-        value = ValueStateValues[match.group(1).decode().upper()]
-        self.WriteStatus('AspectRatio', value, None)
-
-    def SetAudioMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'On': '00',
-            'Off': '01'
-        }
-
-        if value in ValueStateValues:
-            AudioMuteCmdString = 'ke {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('AudioMute', AudioMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAudioMute')
-
-    def UpdateAudioMute(self, value, qualifier):
-
-        AudioMuteCmdString = 'ke {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('AudioMute', AudioMuteCmdString, value, qualifier)
-
-    def __MatchAudioMute(self, match, tag):
-
-        ValueStateValues = {
-            '00': 'On',
-            '01': 'Off'
-        }
-
-        value = ValueStateValues[match.group(1).decode()]
-        self.WriteStatus('AudioMute', value, None)
-
-    def SetChannel(self, value, qualifier):
-
-        ValueStateValues = {
-            'Up': '00',
-            'Down': '01'
-        }
-
-        if value in ValueStateValues:
-            ChannelCmdString = 'mc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('Channel', ChannelCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetChannel')
-
-    def SetClosedCaption(self, value, qualifier):
-
-        ClosedCaptionCmdString = 'mc {id} 39\r'.format(id=self._DeviceID)
-        self.__SetHelper('ClosedCaption', ClosedCaptionCmdString, value, qualifier)
-
-    def SetExecutiveMode(self, value, qualifier):
-
-        ValueStateValues = {
-            'On': '01',
-            'Off': '00'
-        }
-
-        if value in ValueStateValues:
-            ExecutiveModeCmdString = 'km {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('ExecutiveMode', ExecutiveModeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetExecutiveMode')
-
-    def UpdateExecutiveMode(self, value, qualifier):
-
-        ExecutiveModeCmdString = 'km {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('ExecutiveMode', ExecutiveModeCmdString, value, qualifier)
-
-    def __MatchExecutiveMode(self, match, tag):
-
-        ValueStateValues = {
-            '01': 'On',
-            '00': 'Off'
-        }
-
-        value = ValueStateValues[match.group(1).decode()]
-        self.WriteStatus('ExecutiveMode', value, None)
-
-    def SetInput(self, value, qualifier):
-
-        ValueStateValues = {
-            'HDMI 1': '90',
-            'HDMI 2': '91',
-            'HDMI 3': '92',
-            'DTV': '00',
-            'ATV': '10',
-            'CADTV': '01',
-            'CATV': '11'
-        }
-
-        if value in ValueStateValues:
-            InputCmdString = 'xb {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('Input', InputCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetInput')
-
-    def UpdateInput(self, value, qualifier):
-
-        InputCmdString = 'xb {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('Input', InputCmdString, value, qualifier)
-
-    def __MatchInput(self, match, tag):
-
-        ValueStateValues = {
-            '90': 'HDMI 1',
-            '91': 'HDMI 2',
-            '92': 'HDMI 3',
-            '00': 'DTV',
-            '10': 'ATV',
-            '01': 'CADTV',
-            '11': 'CATV'
-        }
-
-        value = ValueStateValues[match.group(1).decode()]
-        self.WriteStatus('Input', value, None)
-
-    def SetKeypad(self, value, qualifier):
-
-        ValueStateValues = {
-            '1': '11',
-            '2': '12',
-            '3': '13',
-            '4': '14',
-            '5': '15',
-            '6': '16',
-            '7': '17',
-            '8': '18',
-            '9': '19',
-            '0': '10',
-            '-': '4C'
-        }
-
-        if value in ValueStateValues:
-            KeypadCmdString = 'mc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('Keypad', KeypadCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetKeypad')
-
-    def SetMenuNavigation(self, value, qualifier):
-
-        ValueStateValues = {
-            'Up': '40',
-            'Down': '41',
-            'Left': '07',
-            'Right': '06',
-            'Menu': '43',
-            'OK': '44',
-            'Exit': '5B',
-            'Back': '28'
-        }
-
-        if value in ValueStateValues:
-            MenuNavigationCmdString = 'mc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('MenuNavigation', MenuNavigationCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetMenuNavigation')
-
-    def SetOnScreenDisplay(self, value, qualifier):
-
-        ValueStateValues = {
-            'On': '01',
-            'Off': '00'
-        }
-
-        if value in ValueStateValues:
-            OnScreenDisplayCmdString = 'kl {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetOnScreenDisplay')
-
-    def UpdateOnScreenDisplay(self, value, qualifier):
-
-        OnScreenDisplayCmdString = 'kl {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
-
-    def __MatchOnScreenDisplay(self, match, tag):
-
-        ValueStateValues = {
-            '01': 'On',
-            '00': 'Off'
-        }
-
-        value = ValueStateValues[match.group(1).decode()]
-        self.WriteStatus('OnScreenDisplay', value, None)
-
-    def SetPower(self, value, qualifier):
-
-        ValueStateValues = {
-            'On': '01',
-            'Off': '00'
-        }
-
-        if value in ValueStateValues:
-            PowerCmdString = 'ka {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('Power', PowerCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetPower')
-
-    def UpdatePower(self, value, qualifier):
-
-        PowerCmdString = 'ka {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('Power', PowerCmdString, value, qualifier)
-
-    def __MatchPower(self, match, tag):
-
-        ValueStateValues = {
-            '01': 'On',
-            '00': 'Off'
-        }
-
-        value = ValueStateValues[match.group(1).decode()]
-        self.WriteStatus('Power', value, None)
-
-    def SetVideoMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'On': '01',
-            'Off': '00',
-            'On (With OSD)': '10'
-        }
-
-        if value in ValueStateValues:
-            VideoMuteCmdString = 'kd {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('VideoMute', VideoMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetVideoMute')
-
-    def UpdateVideoMute(self, value, qualifier):
-
-        VideoMuteCmdString = 'kd {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('VideoMute', VideoMuteCmdString, value, qualifier)
-
-    def __MatchVideoMute(self, match, tag):
-
-        ValueStateValues = {
-            '01': 'On',
-            '00': 'Off',
-            '10': 'On (With OSD)'
-        }
-
-        value = ValueStateValues[match.group(1).decode()]
-        self.WriteStatus('VideoMute', value, None)
-
-    def SetVolume(self, value, qualifier):
-
-        if 0 <= value <= 100:
-            VolumeCmdString = 'kf {id} {data:02X}\r'.format(id=self._DeviceID, data=value)
-            self.__SetHelper('Volume', VolumeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetVolume')
-
-    def UpdateVolume(self, value, qualifier):
-
-        VolumeCmdString = 'kf {id} FF\r'.format(id=self._DeviceID)
-        self.__UpdateHelper('Volume', VolumeCmdString, value, qualifier)
-
-    def __MatchVolume(self, match, tag):
-
-        value = int(match.group(1).decode(), 16)
-        if 0 <= value <= 100:
-            self.WriteStatus('Volume', value, None)
-
     def __CheckResponseForErrors(self, sourceCmdName, response):
 
         if isinstance(response, bytes):
@@ -364,17 +183,24 @@ class DeviceSerialClass:
         return response
 
     def __SetHelper(self, command, commandstring, value, qualifier):
-        self.Debug = True
+        self.Trace.Debug('Set %s: %r', command, commandstring)
 
+        if self.Trace.Capturing:
+            self.Trace.Capture('TX', commandstring)
         if self.Unidirectional == 'True' or self._DeviceID == '00':
             self.Send(commandstring)
         else:
+            sent = monotonic()
             res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliRex=self.setRegex)
             if not res:
+                self.Latency.Observe('Set' + command, 0.0, TimedOut=True)
                 self.Error(['{}: Invalid/unexpected response'.format(command)])
             else:
+                self.Latency.Observe('Set' + command, monotonic() - sent, Error=b'NG' in res)
                 res = self.__CheckResponseForErrors(command, res)
 
+    _SetHelper = __SetHelper
+
     def __UpdateHelper(self, command, commandstring, value, qualifier):
 
         if self.Unidirectional == 'True' or self._DeviceID == '00':
@@ -388,7 +214,13 @@ class DeviceSerialClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            self.Send(commandstring) 
+            if self.Trace.Capturing:
+                self.Trace.Capture('TX', commandstring)
+            # 'ka 01 FF' is answered by 'a 01 OK..x' or 'a 01 NG..x'.
+            self.Latency.Sent('Update' + command, commandstring[1:5].lower().encode())
+            self.Send(commandstring)
+
+    _UpdateHelper = __UpdateHelper
 
     def __MatchError(self, match, tag):
         self.counter = 0
@@ -526,6 +358,8 @@ class DeviceSerialClass:
 
     def __ReceiveData(self, interface, data):
         # Handle incoming data
+        if self.Trace.Capturing:
+            self.Trace.Capture('RX', data)
         self.__receiveBuffer += data
         index = 0    # Start of possible good data
         
@@ -535,6 +369,9 @@ class DeviceSerialClass:
                 result = re.search(regexString, self.__receiveBuffer)
                 if result:
                     index = result.start()
+                    if self.Latency.Pending:
+                        self.Latency.Answered(result.group(0)[:4].lower(),
+                                              Error=CurrentMatch['callback'] == self.__MatchError)
                     CurrentMatch['callback'](result, CurrentMatch['para'])
                     self.__receiveBuffer = self.__receiveBuffer[:result.start()] + self.__receiveBuffer[result.end():]
                 else:
@@ -559,6 +396,7 @@ class DeviceEthernetClass:
     def __init__(self):
 
         self.Debug = False
+        self.Trace = GetChannel(__name__, self)
         self._DeviceID = '01'
         self.Models = {}
 
@@ -591,168 +429,14 @@ class DeviceEthernetClass:
         else:
             self.Error(['Invalid Device ID Parameter.'])
 
-    def SetAspectRatio(self, value, qualifier):
-
-        ValueStateValues = {
-            '4:3':          '01',
-            '16:9':         '02',
-            'Original':     '06',
-            'Just Scan':    '09'
-        }
-
-        if value in ValueStateValues:
-            AspectRatioCmdString = 'kc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAspectRatio')
-
-    def SetAudioMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'On':   '00',
-            'Off':  '01'
-        }
-
-        if value in ValueStateValues:
-            AudioMuteCmdString = 'ke {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('AudioMute', AudioMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetAudioMute')
-
-    def SetChannel(self, value, qualifier):
-
-        ValueStateValues = {
-            'Up':   '00',
-            'Down': '01'
-        }
-
-        if value in ValueStateValues:
-            ChannelCmdString = 'mc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('Channel', ChannelCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetChannel')
-
-    def SetClosedCaption(self, value, qualifier):
-
-        ClosedCaptionCmdString = 'mc {id} 39\r'.format(id=self._DeviceID)
-        self.__SetHelper('ClosedCaption', ClosedCaptionCmdString, value, qualifier)
-
-    def SetExecutiveMode(self, value, qualifier):
-
-        ValueStateValues = {
-            'On':   '01',
-            'Off':  '00'
-        }
-
-        if value in ValueStateValues:
-            ExecutiveModeCmdString = 'km {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('ExecutiveMode', ExecutiveModeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetExecutiveMode')
-
-    def SetInput(self, value, qualifier):
-
-        ValueStateValues = {
-            'HDMI 1':   '90',
-            'HDMI 2':   '91',
-            'HDMI 3':   '92',
-            'DTV':      '00',
-            'ATV':      '10',
-            'CADTV':    '01',
-            'CATV':     '11'
-        }
-
-        if value in ValueStateValues:
-            InputCmdString = 'xb {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('Input', InputCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetInput')
-
-    def SetKeypad(self, value, qualifier):
-
-        ValueStateValues = {
-            '1': '11',
-            '2': '12',
-            '3': '13',
-            '4': '14',
-            '5': '15',
-            '6': '16',
-            '7': '17',
-            '8': '18',
-            '9': '19',
-            '0': '10',
-            '-': '4C'
-        }
-
-        if value in ValueStateValues:
-            KeypadCmdString = 'mc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('Keypad', KeypadCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetKeypad')
-
-    def SetMenuNavigation(self, value, qualifier):
-
-        ValueStateValues = {
-            'Up':       '40',
-            'Down':     '41',
-            'Left':     '07',
-            'Right':    '06',
-            'Menu':     '43',
-            'OK':       '44',
-            'Exit':     '5B',
-            'Back':     '28'
-        }
-
-        if value in ValueStateValues:
-            MenuNavigationCmdString = 'mc {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('MenuNavigation', MenuNavigationCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetMenuNavigation')
-
-    def SetOnScreenDisplay(self, value, qualifier):
-
-        ValueStateValues = {
-            'On':   '01',
-            'Off':  '00'
-        }
-
-        if value in ValueStateValues:
-            OnScreenDisplayCmdString = 'kl {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetOnScreenDisplay')
-
-    def SetPowerOff(self, value, qualifier):
-
-        PowerOffCmdString = 'ka {id} 00\r'.format(id=self._DeviceID)
-        self.__SetHelper('PowerOff', PowerOffCmdString, value, qualifier)
-
-    def SetVideoMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'On':               '01',
-            'Off':              '00',
-            'On (With OSD)':    '10'
-        }
-
-        if value in ValueStateValues:
-            VideoMuteCmdString = 'kd {id} {data}\r'.format(id=self._DeviceID, data=ValueStateValues[value])
-            self.__SetHelper('VideoMute', VideoMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetVideoMute')
-
-    def SetVolume(self, value, qualifier):
-
-        if 0 <= value <= 100:
-            VolumeCmdString = 'kf {id} {data:02X}\r'.format(id=self._DeviceID, data=value)
-            self.__SetHelper('Volume', VolumeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command for SetVolume')
-
     def __SetHelper(self, command, commandstring, value, qualifier):
-        self.Debug = True
+        self.Trace.Debug('Set %s: %r', command, commandstring)
+        if self.Trace.Capturing:
+            self.Trace.Capture('TX', commandstring)
         self.Send(commandstring)
 
+    _SetHelper = __SetHelper
+
     ######################################################    
     # RECOMMENDED not to modify the code below this point
     ######################################################
@@ -766,6 +450,10 @@ class DeviceEthernetClass:
             raise AttributeError(command + 'does not support Set.')
 
 
+SerialProtocol.Install(DeviceSerialClass)
+EthernetProtocol.Install(DeviceEthernetClass)
+
+
 class SerialClass(SerialInterface, DeviceSerialClass):
 
     def __init__(self, Host, Port, Baud=9600, Data=8, Parity='None', Stop=1, FlowControl='Off', CharDelay=0, Mode='RS232', Model =None):
@@ -17,10 +17,18 @@ if Platform() == 'Pro xi':
     from extronlib.interface import DanteInterface
 ## End ControlScript Import ---------------------------------------------------
 
-from collections import deque
+from collections import deque, OrderedDict
+from heapq import heapify, heappop, heappush
+from inspect import isroutine
+from itertools import count as _count
+from threading import Lock
 from time import monotonic
 
-__version__ = '2.3.0'
+from modules.helper.ModuleSupport import ClientSendQueue
+from modules.helper.Trace import GetChannel, InstanceName
+from modules.helper.Watchdog import Watch
+
+__version__ = '2.4.0'
 
 
 def ModuleVersion():
@@ -31,18 +39,25 @@ def ModuleVersion():
     return __version__
 
 
-DEBUG = False
+# Per-handler channels are named after this one with the interface appended,
+# e.g. 'modules.helper.ConnectionHandler@192.168.1.12:22023'.
+_Trace = GetChannel(__name__)
+
+# Every handler created by GetConnectionHandler, in creation order
+_handlers = []
 
 
-def _trace(*args, **kwargs):
-    if DEBUG:
-        print(*args, **kwargs)
+def _Watched(function, interface):
+    # Timer callbacks and interface events are timed by the watchdog under the function's and
+    # the interface's names, e.g. '_AttemptReconnect@192.168.1.12:22023'.
+    return Watch(function, '{}@{}'.format(function.__name__, InstanceName(interface)))
 
 
 def GetConnectionHandler(Interface, keepAliveQuery=None,
                          keepAliveQueryQualifier=None, DisconnectLimit=15,
                          pollFrequency=1, connectRetryTime=5,
-                         serverTimeout=5*60):
+                         serverTimeout=5*60, offlineQueueExpiry=None,
+                         pollScheduler=None):
     """
     Creates a new connection handler instance tailored to the object instance
     passed in the Interface argument.
@@ -87,12 +102,26 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
                           allow before disconnecing idle clients. Defaults to 5
                           minutes.
     :type serverTimeout: float.
+    :param offlineQueueExpiry: For TCP and SSH client Interfaces, length of
+                               time in seconds to hold commands issued while
+                               the interface is not connected. Held commands
+                               are sent in order once the interface connects.
+                               Defaults to None, which disables the queue.
+    :type offlineQueueExpiry: float
+    :param pollScheduler: For client Interfaces, a :py:class:`PollScheduler`
+                          that runs the keep alive polls of many handlers
+                          from one timer. Defaults to None, which gives the
+                          handler its own poll timer.
+    :type pollScheduler: PollScheduler
     :returns: An object instance with an API similar to an extronlib.interface
               object.
     :raises TypeError: if Interface is an `EthernetServerInferface` (non-Ex) or
                        is a UDP `EthernetServerInferfaceEx`.
     :raises ValueError: if Interface is an `EthernetClientInterface` and its
-                        Protocol type is not TCP, UDP, or SSH.
+                        Protocol type is not TCP, UDP, or SSH, if
+                        keepAliveQuery is a name and Interface has no
+                        matching Update function, or if offlineQueueExpiry is
+                        given for an Interface without an offline queue.
 
     The returned object instance depends on the instance type passed in
     Interface.
@@ -138,6 +167,34 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
         * DanteInterface does not have a *SendAndWait* method.
         * DanteInterface is only available in ControlScript Pro xi.
     """
+    handler = _NewConnectionHandler(Interface, keepAliveQuery,
+                                    keepAliveQueryQualifier, DisconnectLimit,
+                                    pollFrequency, connectRetryTime,
+                                    serverTimeout, offlineQueueExpiry)
+    if pollScheduler is not None and isinstance(handler, ConnectionHandler):
+        handler.UsePollScheduler(pollScheduler)
+    _handlers.append(handler)
+    return handler
+
+
+def GetHandlers():
+    """
+    Returns every connection handler created by
+    :py:meth:`GetConnectionHandler`, in the order they were created.
+
+    :rtype: list
+    """
+    return list(_handlers)
+
+
+def _NewConnectionHandler(Interface, keepAliveQuery, keepAliveQueryQualifier,
+                          DisconnectLimit, pollFrequency, connectRetryTime,
+                          serverTimeout, offlineQueueExpiry):
+    if offlineQueueExpiry is not None and not _CanQueueOffline(Interface):
+        raise ValueError('offlineQueueExpiry is only supported for TCP and '
+                         'SSH interfaces, not {}.'.format(
+                             type(Interface).__name__))
+
     if isinstance(Interface, EthernetServerInterfaceEx):
         if Interface.Protocol == 'UDP':
             raise TypeError('UDP is not a supported protocol type. Use '
@@ -160,7 +217,11 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
         if callable(UpdateAttr) and callable(SubscribeAttr):
             IsGSModule = True
         else:
-            IsGSModule = False
+            # A name is only usable with a module that has a matching Update
+            # function. Anything else would fail on every poll.
+            raise ValueError('keepAliveQuery "{}" is not an Update function '
+                             'of {}.'.format(keepAliveQuery,
+                                             type(Interface).__name__))
     elif callable(keepAliveQuery):
         IsGSModule = False
     else:
@@ -179,7 +240,7 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
                 return ModuleTcpHandler(Interface, DisconnectLimit,
                                         pollFrequency, keepAliveQuery,
                                         keepAliveQueryQualifier,
-                                        connectRetryTime)
+                                        connectRetryTime, offlineQueueExpiry)
             elif Interface.Protocol == 'UDP':
                 return ModuleSimplePipeHandler(Interface, DisconnectLimit,
                                                pollFrequency, keepAliveQuery,
@@ -193,7 +254,7 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
                 return ModuleTcpHandler(Interface, DisconnectLimit,
                                         pollFrequency, keepAliveQuery,
                                         keepAliveQueryQualifier,
-                                        connectRetryTime)
+                                        connectRetryTime, offlineQueueExpiry)
 
         if isinstance(Interface, SPInterface):
             return ModuleSimplePipeHandler(Interface, DisconnectLimit,
@@ -209,7 +270,7 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
             return ModuleTcpHandler(Interface, DisconnectLimit,
                                     pollFrequency, keepAliveQuery,
                                     keepAliveQueryQualifier,
-                                    connectRetryTime)
+                                    connectRetryTime, offlineQueueExpiry)
     else:
         if isinstance(Interface, SerialInterface):
             return RawSimplePipeHandler(Interface, DisconnectLimit,
@@ -218,7 +279,8 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
         if isinstance(Interface, EthernetClientInterface):
             if Interface.Protocol in ['TCP', 'SSH']:
                 return RawTcpHandler(Interface, DisconnectLimit, pollFrequency,
-                                     keepAliveQuery, connectRetryTime)
+                                     keepAliveQuery, connectRetryTime,
+                                     offlineQueueExpiry)
             elif Interface.Protocol == 'UDP':
                 return RawSimplePipeHandler(Interface, DisconnectLimit,
                                             pollFrequency, keepAliveQuery)
@@ -229,7 +291,8 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
         if Platform() == 'Pro xi' and isinstance(Interface, DanteInterface):
             if Interface.Protocol in ['Extron']:
                 return RawTcpHandler(Interface, DisconnectLimit, pollFrequency,
-                                     keepAliveQuery, connectRetryTime)
+                                     keepAliveQuery, connectRetryTime,
+                                     offlineQueueExpiry)
 
         if isinstance(Interface, SPInterface):
             return RawSimplePipeHandler(Interface, DisconnectLimit,
@@ -238,10 +301,35 @@ def GetConnectionHandler(Interface, keepAliveQuery=None,
     raise TypeError('"{}" is not a supported interface type.'.format(type(Interface)))
 
 
+def _CanQueueOffline(Interface):
+    # True if GetConnectionHandler returns a handler with an offline queue
+    # (RawTcpHandler or ModuleTcpHandler) for Interface.
+    if isinstance(Interface, (SerialInterface, SPInterface)):
+        return False
+    if isinstance(Interface, EthernetClientInterface):
+        return Interface.Protocol in ['TCP', 'SSH']
+    if Platform() == 'Pro xi' and isinstance(Interface, DanteInterface):
+        return Interface.Protocol in ['Extron']
+    return isinstance(Interface, SummitConnect)
+
+
 def _UnassignedEvent(*args, **kwargs):
     pass
 
 
+def _BindFallThrough(handler, name, attr):
+    # Methods defined by the wrapped interface's class do not change once the
+    # interface is created, so they are stored on the handler instance. Later
+    # lookups of the same name then find an ordinary instance attribute and
+    # never reach __getattr__. Data attributes, properties and callables
+    # assigned to the interface instance (e.g. event handlers) may change and
+    # are always looked up on the interface.
+    wrapped = handler._WrappedInterface
+    if callable(attr) and name not in getattr(wrapped, '__dict__', {}) and \
+            isroutine(getattr(type(wrapped), name, None)):
+        handler.__dict__[name] = attr
+
+
 class ScripterModuleMixin:
     """
     The ScripterModuleMixin adds methods to a ConnectionHandler subclass to
@@ -267,6 +355,437 @@ class ScripterModuleMixin:
         else:
             self._WrappedInterface.SubscribeStatus(command, qualifier, callback)
 
+    def _InterceptModuleTraffic(self):
+        # Global Scripter Modules send and parse data themselves, so their
+        # traffic is observed for health metrics by hooking the module's
+        # ReceiveData handler and send functions. The keep alive response is
+        # the module's report of the keep alive status, not whatever data
+        # arrives next, so WriteStatus is hooked for it.
+        iface = self._WrappedInterface
+        self._ModuleRxData = iface.ReceiveData
+        self._ModuleSend = iface.Send
+        self._ModuleWriteStatus = iface.WriteStatus
+        iface.ReceiveData = _Watched(self._ModuleIfaceRxData, iface)
+        iface.Send = self._ModuleIfaceSend
+        iface.WriteStatus = self._ModuleIfaceWriteStatus
+
+        self._ModuleSendAndWait = getattr(iface, 'SendAndWait', None)
+        if self._ModuleSendAndWait is not None:
+            iface.SendAndWait = self._ModuleIfaceSendAndWait
+
+    def _ModuleIfaceRxData(self, interface, data):
+        self._DataReceived(data)
+        if callable(self._ModuleRxData):
+            self._ModuleRxData(interface, data)
+
+    def _ModuleIfaceWriteStatus(self, command, value, qualifier=None):
+        # Only the keep alive status, for the queried qualifier, answers an
+        # outstanding keep alive query.
+        if command == self._keepAliveQuery and self._Health.PollPending:
+            params = self._keepAliveParams
+            if not params or (qualifier and all(
+                    qualifier.get(k) == v for k, v in params.items())):
+                self._Health.ResponseReceived()
+        self._ModuleWriteStatus(command, value, qualifier)
+
+    def _ModuleIfaceSend(self, data):
+        self._DataSent(data)
+        self._ModuleSend(data)
+
+    def _ModuleIfaceSendAndWait(self, data, timeout, **delimiter):
+        self._DataSent(data)
+        res = self._ModuleSendAndWait(data, timeout, **delimiter)
+        if res:
+            self._DataReceived(res)
+        return res
+
+
+def _QualifierKey(qualifier):
+    # Qualifiers are dicts and can not be used as part of a dict key as is.
+    if qualifier:
+        return tuple(sorted(qualifier.items()))
+    return None
+
+
+class OfflineQueueMixin:
+    """
+    The OfflineQueueMixin adds an optional offline queue to a TCP
+    ConnectionHandler subclass. Commands issued while the underlying interface
+    is not connected are held and then sent, in the order they were issued,
+    as soon as the interface connects.
+
+    A held command is replaced by a newer command with the same key, so only
+    the last ``Set('Power', ...)`` issued while offline is sent. Held commands
+    are discarded if they are still waiting when their expiry time passes.
+    """
+    def _InitOfflineQueue(self, expiry):
+        self._OfflineExpiry = expiry
+        self._CommandExpiry = {}
+        self._OfflineQueue = OrderedDict()
+        self._OfflineLock = Lock()
+        self._LinkUp = False
+
+    @property
+    def OfflineQueueLength(self):
+        """
+        :returns: the number of commands waiting to be sent when the interface
+            connects.
+        :rtype: int
+        """
+        return len(self._OfflineQueue)
+
+    def SetCommandExpiry(self, command, expiry):
+        """
+        Overrides the offline queue expiry time for a single command.
+
+        .. code-block:: python
+
+            # Only send a queued power command if the display reconnects
+            # within 10 seconds.
+            Display.SetCommandExpiry('Power', 10)
+
+        :param command: For Global Scripter Modules, the command name passed
+                        to Set or Update. Otherwise, the data passed to Send.
+        :type command: string
+        :param expiry: Time in seconds to hold the command while offline.
+        :type expiry: float
+        """
+        self._CommandExpiry[command] = expiry
+
+    def ClearOfflineQueue(self):
+        """
+        Discards all commands waiting to be sent when the interface connects.
+        """
+        with self._OfflineLock:
+            self._OfflineQueue.clear()
+
+    def _QueueWhileOffline(self, key, command, call, *args):
+        """
+        Holds call(*args) if the offline queue is enabled and the interface is
+        not connected.
+
+        :returns: True if the call was held, False if it should be made now.
+        """
+        if self._OfflineExpiry is None or self._LinkUp:
+            return False
+
+        expiry = self._CommandExpiry.get(command, self._OfflineExpiry)
+        with self._OfflineLock:
+            if self._LinkUp:
+                return False
+            # Remove any superseded command so the new one is sent in the
+            # position it was issued rather than where the old one was.
+            self._OfflineQueue.pop(key, None)
+            self._OfflineQueue[key] = (monotonic() + expiry, call, args)
+
+        self._Trace.Debug('offline queue hold: %s', key)
+        return True
+
+    def _FlushOfflineQueue(self):
+        # Commands issued while flushing are queued behind the ones already
+        # held until the queue is empty, which preserves issue order.
+        while True:
+            with self._OfflineLock:
+                if not self._OfflineQueue:
+                    self._LinkUp = True
+                    return
+                key, (deadline, call, args) = \
+                    self._OfflineQueue.popitem(last=False)
+
+            if monotonic() > deadline:
+                self._Trace.Debug('offline queue expired: %s', key)
+            else:
+                self._Trace.Debug('offline queue send: %s', key)
+                call(*args)
+
+    def _LinkDown(self):
+        self._LinkUp = False
+
+
+class HandlerHealth:
+    """
+    Rolling connection health metrics kept by every connection handler.
+
+    Keep alive round trip times are stored in a fixed-size ring buffer so the
+    memory used does not grow with uptime. All other metrics are counters or
+    timestamps. Read the metrics with the handler's ``GetHealth`` method.
+
+    :param size: Number of round trip time samples to keep.
+    :type size: int
+    """
+    def __init__(self, size=64):
+        self._RoundTrips = deque(maxlen=size)
+        self._PollSentAt = None
+
+        self.MissedResponses = 0
+        self.Reconnects = 0
+        self.BytesSent = 0
+        self.FramesSent = 0
+        self.BytesReceived = 0
+        self.FramesReceived = 0
+        self.LastFailure = None
+        self._LastFailureAt = None
+
+        self._Status = 'Unknown'
+        self._StatusSince = monotonic()
+        self._TimeIn = {'Connected': 0.0, 'Disconnected': 0.0}
+
+    @property
+    def PollPending(self):
+        """True while a keep alive query is waiting for its response."""
+        return self._PollSentAt is not None
+
+    @property
+    def LastRoundTrip(self):
+        """The most recent keep alive round trip time in seconds, or None."""
+        roundTrips = self._RoundTrips
+        return roundTrips[-1] if roundTrips else None
+
+    def PollSent(self):
+        """Records that a keep alive query was sent."""
+        if self._PollSentAt is not None:
+            self.MissedResponses += 1
+        self._PollSentAt = monotonic()
+
+    def ResponseReceived(self):
+        """Records a response to the outstanding keep alive query."""
+        if self._PollSentAt is not None:
+            self._RoundTrips.append(monotonic() - self._PollSentAt)
+            self._PollSentAt = None
+
+    def DataSent(self, data):
+        """Records one frame of outgoing data."""
+        self.FramesSent += 1
+        self.BytesSent += len(data)
+
+    def DataReceived(self, data):
+        """Records one frame of incoming data."""
+        self.FramesReceived += 1
+        self.BytesReceived += len(data)
+
+    def Failure(self, reason):
+        """Records the reason for the most recent connection failure."""
+        self.LastFailure = reason
+        self._LastFailureAt = monotonic()
+
+    def StatusChanged(self, status):
+        """Records a change of connection status."""
+        now = monotonic()
+        if self._Status in self._TimeIn:
+            self._TimeIn[self._Status] += now - self._StatusSince
+
+        if status == 'Connected' and self._Status == 'Disconnected':
+            self.Reconnects += 1
+        elif status == 'Disconnected':
+            # A query outstanding at disconnect will never be answered.
+            self._PollSentAt = None
+
+        self._Status = status
+        self._StatusSince = now
+
+    def Snapshot(self):
+        """
+        :returns: the current metric values. Times are in seconds.
+        :rtype: dict
+        """
+        now = monotonic()
+        timeIn = dict(self._TimeIn)
+        if self._Status in timeIn:
+            timeIn[self._Status] += now - self._StatusSince
+
+        samples = sorted(self._RoundTrips)
+        if samples:
+            rtt = {
+                'Last': self._RoundTrips[-1],
+                'Mean': sum(samples) / len(samples),
+                'P95': samples[max(0, -(-len(samples) * 95 // 100) - 1)],
+                'Samples': len(samples),
+            }
+        else:
+            rtt = {'Last': None, 'Mean': None, 'P95': None, 'Samples': 0}
+
+        return {
+            'RoundTrip': rtt,
+            'MissedResponses': self.MissedResponses,
+            'Reconnects': self.Reconnects,
+            'TimeConnected': timeIn['Connected'],
+            'TimeDisconnected': timeIn['Disconnected'],
+            'BytesSent': self.BytesSent,
+            'FramesSent': self.FramesSent,
+            'BytesReceived': self.BytesReceived,
+            'FramesReceived': self.FramesReceived,
+            'LastFailure': self.LastFailure,
+            'LastFailureAge': None if self._LastFailureAt is None
+                              else now - self._LastFailureAt,
+        }
+
+
+class PollScheduler:
+    """
+    Runs the keep alive polls of many connection handlers from one wait,
+    restarted for the next poll due, instead of one timer per handler, for
+    programs that control many rooms.
+
+    Handlers started at the same time are spread across their poll interval
+    so their queries are not all sent on the same tick. A poll function that
+    raises is logged and does not stop the other handlers' polls.
+
+    .. code-block:: python
+
+        Scheduler = PollScheduler()
+        for Room in Rooms:
+            Room.Display = GetConnectionHandler(DisplayModule.EthernetClass(
+                Room.DisplayIP, 23, Model='X'), 'Power', pollFrequency=5,
+                pollScheduler=Scheduler)
+
+    :param resolution: Polls due within this many seconds of the next one are
+                       run with it, on the same wake-up.
+    :type resolution: float
+    """
+    _Spread = 0.6180339887498949
+
+    def __init__(self, resolution=0.1):
+        self._Resolution = resolution
+        # Min-heap of (due, sequence, generation, SharedPollTimer). An entry
+        # whose generation differs from its timer's was superseded by a
+        # Pause, Stop, Change or Restart and is dropped when popped.
+        self._Due = []
+        self._Sequence = _count()
+        self._Started = 0
+        self._Lock = Lock()
+        # The due time the wait is set for, or None when it is not set.
+        self._WakeAt = None
+        self._Wake = Wait(0, Watch(self._Tick))
+        self._Wake.Cancel()
+
+    @property
+    def Resolution(self):
+        """
+        :returns: the time in seconds within which due polls are run together.
+        :rtype: float
+        """
+        return self._Resolution
+
+    def Timer(self, Interval, Function):
+        """
+        Returns a paused :py:class:`SharedPollTimer` run by this scheduler.
+        It has the extronlib.system.Timer API.
+
+        :param Interval: Time in seconds between calls to Function.
+        :type Interval: float
+        :param Function: Called as Function(timer, count).
+        :type Function: callable
+        :rtype: SharedPollTimer
+        """
+        return SharedPollTimer(self, Interval, Function)
+
+    def GetStats(self):
+        """
+        Returns the number of scheduled polls.
+
+        :rtype: dict
+        """
+        with self._Lock:
+            timers = {entry[3] for entry in self._Due
+                      if entry[2] == entry[3]._Generation}
+        return {'Scheduled': len(timers)}
+
+    def _Schedule(self, timer, delay):
+        now = monotonic()
+        with self._Lock:
+            heappush(self._Due, (now + delay, next(self._Sequence),
+                                 timer._Generation, timer))
+            if self._WakeAt is None or now + delay < self._WakeAt:
+                self._SetWake(now + delay, now)
+
+    def _SetWake(self, due, now):
+        # Called with the lock held.
+        self._WakeAt = due
+        self._Wake.Change(max(due - now, 0))
+        self._Wake.Restart()
+
+    def _Start(self, timer):
+        # The first poll of each timer started is offset by a fraction of its
+        # interval that differs from the previous timer's, so that handlers
+        # started together poll at different times.
+        with self._Lock:
+            self._Started += 1
+            offset = 1.0 - (self._Started * self._Spread) % 1.0
+        self._Schedule(timer, timer.Interval * offset)
+
+    def _Tick(self):
+        now = monotonic()
+        due = []
+        with self._Lock:
+            heap = self._Due
+            while heap and heap[0][0] <= now + self._Resolution:
+                when, _, generation, poll = heappop(heap)
+                if generation == poll._Generation and poll.State == 'Running':
+                    # The next poll is due one interval after this one was,
+                    # so running it early or late does not shift the ones
+                    # after it.
+                    due.append((poll, generation, max(when + poll.Interval, now)))
+            for poll, generation, when in due:
+                heappush(heap, (when, next(self._Sequence), generation, poll))
+            self._WakeAt = None
+            if heap:
+                self._SetWake(heap[0][0], now)
+
+        for poll, generation, _ in due:
+            if generation != poll._Generation:
+                # Paused, stopped or restarted by an earlier poll of this tick.
+                continue
+            poll.Count += 1
+            try:
+                poll.Function(poll, poll.Count)
+            except Exception as err:
+                _Trace.Error('poll %r raised %s: %s', poll.Function,
+                             type(err).__name__, err)
+
+
+class SharedPollTimer:
+    """
+    A poll timer run by a :py:class:`PollScheduler`. It has the
+    extronlib.system.Timer API; create these with
+    :py:meth:`PollScheduler.Timer`.
+    """
+    def __init__(self, scheduler, Interval, Function):
+        self._Scheduler = scheduler
+        self._Generation = 0
+        self.Interval = Interval
+        self.Function = Function
+        self.Count = 0
+        self.State = 'Paused'
+
+    def _Cancel(self):
+        self._Generation += 1
+
+    def Change(self, Interval):
+        self.Interval = Interval
+        if self.State == 'Running':
+            self._Cancel()
+            self._Scheduler._Schedule(self, Interval)
+
+    def Pause(self):
+        self._Cancel()
+        self.State = 'Paused'
+
+    def Resume(self):
+        if self.State != 'Running':
+            self.State = 'Running'
+            self._Scheduler._Schedule(self, self.Interval)
+
+    def Restart(self):
+        self._Cancel()
+        self.Count = 0
+        self.State = 'Running'
+        self._Scheduler._Start(self)
+
+    def Stop(self):
+        self._Cancel()
+        self.Count = 0
+        self.State = 'Stopped'
+
 
 class ConnectionHandler:
     """
@@ -278,7 +797,7 @@ class ConnectionHandler:
     """
     def __init__(self, Interface, pollFrequency):
         self._WrappedInterface = Interface
-        self._PollTimer = Timer(pollFrequency, self._PollTriggered)
+        self._PollTimer = Timer(pollFrequency, _Watched(self._PollTriggered, Interface))
         self._PollTimer.Pause()
 
         # Common Event Handlers
@@ -286,6 +805,8 @@ class ConnectionHandler:
         self._Disconnected = _UnassignedEvent
 
         self._ConnectionStatus = 'Unknown'
+        self._Health = HandlerHealth()
+        self._Trace = GetChannel(__name__, Interface)
 
     @property
     def Connected(self):
@@ -300,7 +821,7 @@ class ConnectionHandler:
 
     @Connected.setter
     def Connected(self, handler):
-        _trace('set Connected handler.', handler)
+        self._Trace.Debug('set Connected handler. %s', handler)
         if callable(handler):
             self._Connected = handler
         else:
@@ -327,7 +848,7 @@ class ConnectionHandler:
 
     @Disconnected.setter
     def Disconnected(self, handler):
-        _trace('set Disconnected handler.', handler)
+        self._Trace.Debug('set Disconnected handler. %s', handler)
         if callable(handler):
             self._Disconnected = handler
         else:
@@ -355,10 +876,79 @@ class ConnectionHandler:
     def PollTimer(self):
         """
         :returns: the timer instance used to schedule keep alive polling.
-        :rtype: extronlib.system.Timer
+        :rtype: extronlib.system.Timer or SharedPollTimer
         """
         return self._PollTimer
 
+    def UsePollScheduler(self, scheduler):
+        """
+        Moves this handler's keep alive polling onto a shared
+        :py:class:`PollScheduler`. Polling continues if it was running.
+
+        :param scheduler: The scheduler to poll from.
+        :type scheduler: PollScheduler
+        """
+        old = self._PollTimer
+        self._PollTimer = scheduler.Timer(old.Interval, self._PollTriggered)
+        if old.State == 'Running':
+            self._PollTimer.Restart()
+        old.Stop()
+
+    @property
+    def Trace(self):
+        """
+        This handler's trace channel. Set its level or turn on raw TX/RX frame
+        capture to debug one connection without affecting the others.
+
+        .. code-block:: python
+
+            Display.Trace.Level = 'debug'
+            Display.Trace.SetCapture(256)
+
+        :rtype: modules.helper.Trace.TraceChannel
+        """
+        return self._Trace
+
+    def _DataSent(self, data):
+        self._Health.DataSent(data)
+        if self._Trace.Capturing:
+            self._Trace.Capture('TX', data)
+
+    def _DataReceived(self, data):
+        self._Health.DataReceived(data)
+        if self._Trace.Capturing:
+            self._Trace.Capture('RX', data)
+
+    @property
+    def Health(self):
+        """
+        :returns: this handler's live health counters. Reading them does not
+            build a snapshot, so monitoring code can read them often; use
+            :py:meth:`GetHealth` for derived values such as round trip
+            percentiles.
+        :rtype: HandlerHealth
+        """
+        return self._Health
+
+    def GetHealth(self):
+        """
+        Returns rolling health metrics for this connection: keep alive round
+        trip time (last, mean, and 95th percentile), missed responses,
+        reconnect count, time spent connected and disconnected, bytes and
+        frames sent and received, and the last failure reason.
+
+        .. code-block:: python
+
+            health = Switcher.GetHealth()
+            print('RTT p95:', health['RoundTrip']['P95'])
+
+        :returns: metric names mapped to values. Times are in seconds.
+        :rtype: dict
+        """
+        health = self._Health.Snapshot()
+        health['ConnectionStatus'] = self._ConnectionStatus
+        return health
+
     def __getattr__(self, name):
         # This function overrides the Python-supplied version of __getattr__.
         # Under the covers, accessing obj.name causes Python to first call
@@ -367,7 +957,7 @@ class ConnectionHandler:
         # underlying interface instance for methods not implemented by this
         # class.
         try:
-            return self._WrappedInterface.__getattribute__(name)
+            attr = self._WrappedInterface.__getattribute__(name)
         except AttributeError:
             SelfName = self.__class__.__name__
             WrappedName = self._WrappedInterface.__class__.__name__
@@ -376,6 +966,9 @@ class ConnectionHandler:
                                  "one found in the underlying '{}' "
                                  "object.".format(SelfName, name, WrappedName))
 
+        _BindFallThrough(self, name, attr)
+        return attr
+
 
 class RawSimplePipeHandler(ConnectionHandler):
     def __init__(self, Interface, DisconnectLimit, pollFrequency,
@@ -411,7 +1004,7 @@ class RawSimplePipeHandler(ConnectionHandler):
         # Event Handlers
         self._ReceiveData = _UnassignedEvent
 
-        self._WrappedInterface.ReceiveData = self._IfaceRxData
+        self._WrappedInterface.ReceiveData = _Watched(self._IfaceRxData, Interface)
 
         # Bookkeeping
         self._SendCounter = 0
@@ -464,6 +1057,7 @@ class RawSimplePipeHandler(ConnectionHandler):
                     interface.ResponseAccepted()
         """
         self._SendCounter = 0
+        self._Health.ResponseReceived()
         self._NewConnectionStatus('Connected')
 
     def Send(self, data):
@@ -479,11 +1073,13 @@ class RawSimplePipeHandler(ConnectionHandler):
             MainProjector.Send('GET POWER\\r')
         '''
         self._SendCounter += 1
-        _trace('Send: data=', data, 'count=', self._SendCounter)
+        self._Trace.Debug('Send: data=%r count=%d', data, self._SendCounter)
 
         if self._DisconnectLimitExceeded():
+            self._Health.Failure('Missed responses')
             self._NewConnectionStatus('Disconnected')
 
+        self._DataSent(data)
         self._WrappedInterface.Send(data)
 
     def SendAndWait(self, data, timeout, **delimiter):
@@ -518,12 +1114,17 @@ class RawSimplePipeHandler(ConnectionHandler):
                                 'SendandWait'.".format(self.__class__.__name__))
 
         self._SendCounter += 1
-        _trace('SendAndWait: data=', data, 'count=', self._SendCounter)
+        self._Trace.Debug('SendAndWait: data=%r count=%d', data, self._SendCounter)
 
         if self._DisconnectLimitExceeded():
+            self._Health.Failure('Missed responses')
             self._NewConnectionStatus('Disconnected')
 
-        return self._WrappedInterface.SendAndWait(data, timeout, **delimiter)
+        self._DataSent(data)
+        res = self._WrappedInterface.SendAndWait(data, timeout, **delimiter)
+        if res:
+            self._DataReceived(res)
+        return res
 
     def _DisconnectLimitExceeded(self):
         return self._SendCounter > self._DisconnectLimit
@@ -533,6 +1134,7 @@ class RawSimplePipeHandler(ConnectionHandler):
         Intercepts the ReceiveData event emitted by the wrapped interface and
         passes the event up to client code.
         """
+        self._DataReceived(data)
         self._ReceiveData(self, data)
 
     def _NewConnectionStatus(self, value):
@@ -541,12 +1143,14 @@ class RawSimplePipeHandler(ConnectionHandler):
         """
         if not value == self._ConnectionStatus:
             self._ConnectionStatus = value
+            self._Health.StatusChanged(value)
             if value == 'Connected':
                 self._Connected(self, value)
             elif value == 'Disconnected':
                 self._Disconnected(self, value)
 
     def _PollTriggered(self, timer, count):
+        self._Health.PollSent()
         self._keepAliveQuery(self)
 
 
@@ -591,6 +1195,7 @@ class ModuleSimplePipeHandler(ScripterModuleMixin, ConnectionHandler):
         self._DisconnectLimit = DisconnectLimit
 
         self._AddStatusSubscriber()
+        self._InterceptModuleTraffic()
 
         # Maps command names for which the client has status subscriptions to
         # the client's callback function.
@@ -607,6 +1212,7 @@ class ModuleSimplePipeHandler(ScripterModuleMixin, ConnectionHandler):
     def _NewConnectionStatus(self, command, value, qualifier):
         if not value == self._ConnectionStatus:
             self._ConnectionStatus = value
+            self._Health.StatusChanged(value)
             if value == 'Connected':
                 self._Connected(self, value)
             elif value == 'Disconnected':
@@ -618,13 +1224,14 @@ class ModuleSimplePipeHandler(ScripterModuleMixin, ConnectionHandler):
                 client_callback('ConnectionStatus', value, None)
 
     def _PollTriggered(self, timer, count):
+        self._Health.PollSent()
         self._WrappedInterface.Update(self._keepAliveQuery,
                                       self._keepAliveParams)
 
 
-class RawTcpHandler(ConnectionHandler):
+class RawTcpHandler(OfflineQueueMixin, ConnectionHandler):
     def __init__(self, Interface, DisconnectLimit, pollFrequency,
-                 keepAliveQuery, connectRetryTime):
+                 keepAliveQuery, connectRetryTime, offlineQueueExpiry=None):
         """
         Wraps an extronlib EthernetClientInterface instance using TCP
         or SSH protocol to provide connect/disconnect events and periodic keep
@@ -650,6 +1257,9 @@ class RawTcpHandler(ConnectionHandler):
         :param connectRetryTime: Time in seconds to wait before attempting to
                                  reconnect to the remote host.
         :type connectRetryTime: float
+        :param offlineQueueExpiry: Time in seconds to hold data sent while
+                                   disconnected. None disables the queue.
+        :type offlineQueueExpiry: float
         """
         super().__init__(Interface, pollFrequency)
 
@@ -660,22 +1270,24 @@ class RawTcpHandler(ConnectionHandler):
         self._ReceiveData = _UnassignedEvent
 
         # Capture interface events
-        self._WrappedInterface.ReceiveData = self._IfaceRxData
-        self._WrappedInterface.Connected = self._IfaceConnected
-        self._WrappedInterface.Disconnected = self._IfaceDisconnected
+        self._WrappedInterface.ReceiveData = _Watched(self._IfaceRxData, Interface)
+        self._WrappedInterface.Connected = _Watched(self._IfaceConnected, Interface)
+        self._WrappedInterface.Disconnected = _Watched(self._IfaceDisconnected, Interface)
 
         # Bookkeeping
         self._SendCounter = 0
         self._DisconnectLimit = DisconnectLimit
         self._ReconnectTime = connectRetryTime
         self._ReconnectTimer = Timer(self._ReconnectTime,
-                                     self._AttemptReconnect)
+                                     _Watched(self._AttemptReconnect, Interface))
         self._ReconnectTimer.Stop()
         self._AttemptingConnect = False
 
         self._ConnectTimeout = None
         self._AutoReconnect = True
 
+        self._InitOfflineQueue(offlineQueueExpiry)
+
     @property
     def AutoReconnect(self):
         """
@@ -777,6 +1389,7 @@ class RawTcpHandler(ConnectionHandler):
                     interface.ResponseAccepted()
         """
         self._SendCounter = 0
+        self._Health.ResponseReceived()
         self._NewConnectionStatus('Connected')
 
     def Send(self, data):
@@ -787,16 +1400,26 @@ class RawTcpHandler(ConnectionHandler):
         :type data: bytes, string
         :raise: TypeError, IOError
 
+        .. note:: If the offline queue is enabled, data sent while the
+            interface is not connected is held and sent once it connects.
+
         .. code-block:: python
 
             MainProjector.Send('GET POWER\\r')
         '''
+        if not self._QueueWhileOffline(('Send', data), data, self._Send,
+                                       data):
+            self._Send(data)
+
+    def _Send(self, data):
         self._SendCounter += 1
-        _trace('Send: data=', data, 'count=', self._SendCounter)
+        self._Trace.Debug('Send: data=%r count=%d', data, self._SendCounter)
 
         if self._DisconnectLimitExceeded():
+            self._Health.Failure('Missed responses')
             self._WrappedInterface.Disconnect()
         else:
+            self._DataSent(data)
             self._WrappedInterface.Send(data)
 
     def SendAndWait(self, data, timeout, **delimiter):
@@ -827,13 +1450,17 @@ class RawTcpHandler(ConnectionHandler):
         :rtype: bytes
         '''
         self._SendCounter += 1
-        _trace('SendAndWait: data=', data, 'count=', self._SendCounter)
+        self._Trace.Debug('SendAndWait: data=%r count=%d', data, self._SendCounter)
 
         if not self._DisconnectLimitExceeded():
+            self._DataSent(data)
             res = self._WrappedInterface.SendAndWait(data, timeout,
                                                      **delimiter)
+            if res:
+                self._DataReceived(res)
             return res
 
+        self._Health.Failure('Missed responses')
         self._WrappedInterface.Disconnect()
 
     def _AttemptReconnect(self, timer=None, count=0):
@@ -841,6 +1468,7 @@ class RawTcpHandler(ConnectionHandler):
 
         connect_res = self._WrappedInterface.Connect(self._ConnectTimeout)
         if connect_res not in ['Connected', 'ConnectedAlready']:
+            self._Health.Failure(connect_res)
             self._ConnectFailed(self, connect_res)
             self._SendCounter = self._DisconnectLimit + 1
 
@@ -856,7 +1484,10 @@ class RawTcpHandler(ConnectionHandler):
         if self._ReconnectTimer.State != 'Stopped':
             self._ReconnectTimer.Stop()
 
+        self._FlushOfflineQueue()
+
     def _IfaceDisconnected(self, interface, state):
+        self._LinkDown()
         if self._AutoReconnect:
             if self._ReconnectTimer.State != 'Running':
                 self._ReconnectTimer.Resume()
@@ -864,11 +1495,13 @@ class RawTcpHandler(ConnectionHandler):
         self._NewConnectionStatus('Disconnected')
 
     def _IfaceRxData(self, interface, data):
+        self._DataReceived(data)
         self._ReceiveData(self, data)
 
     def _NewConnectionStatus(self, value):
         if not value == self._ConnectionStatus:
             self._ConnectionStatus = value
+            self._Health.StatusChanged(value)
             if value == 'Connected':
                 self._Connected(self, value)
             elif value == 'Disconnected':
@@ -876,12 +1509,15 @@ class RawTcpHandler(ConnectionHandler):
 
     def _PollTriggered(self, timer, count):
         if not self._AttemptingConnect:
+            self._Health.PollSent()
             self._keepAliveQuery(self)
 
 
-class ModuleTcpHandler(ScripterModuleMixin, ConnectionHandler):
+class ModuleTcpHandler(OfflineQueueMixin, ScripterModuleMixin,
+                       ConnectionHandler):
     def __init__(self, Interface, DisconnectLimit, pollFrequency,
-                 keepAliveQuery, keepAliveQualifiers, reconnectTime):
+                 keepAliveQuery, keepAliveQualifiers, reconnectTime,
+                 offlineQueueExpiry=None):
         """
         Wraps a Global Scripter Module instance derived from
         extronlib's EthernetClientInterface to provide connect/disconnect
@@ -906,6 +1542,10 @@ class ModuleTcpHandler(ScripterModuleMixin, ConnectionHandler):
         :param keepAliveQualifiers: parameter and value pairs to be passed to
                                     the keep-alive function.
         :type keepAliveQualifiers: dict
+        :param offlineQueueExpiry: Time in seconds to hold Set and Update
+                                   commands issued while disconnected. None
+                                   disables the queue.
+        :type offlineQueueExpiry: float
         """
         super().__init__(Interface, pollFrequency)
 
@@ -920,19 +1560,20 @@ class ModuleTcpHandler(ScripterModuleMixin, ConnectionHandler):
         self._ConnectFailed = _UnassignedEvent
 
         # Capture interface events
-        self._WrappedInterface.Connected = self._IfaceConnected
-        self._WrappedInterface.Disconnected = self._IfaceDisconnected
+        self._WrappedInterface.Connected = _Watched(self._IfaceConnected, Interface)
+        self._WrappedInterface.Disconnected = _Watched(self._IfaceDisconnected, Interface)
 
         # Bookkeeping
         self._MaxHistory = DisconnectLimit
         self._reconnectTime = reconnectTime
         self._ReconnectTimer = Timer(self._reconnectTime,
-                                     self._AttemptReconnect)
+                                     _Watched(self._AttemptReconnect, Interface))
         self._ReconnectTimer.Stop()
         self._AttemptingConnect = False
         self._ConnectHistory = deque(maxlen=self._MaxHistory)
 
         self._AddStatusSubscriber()
+        self._InterceptModuleTraffic()
 
         # Maps command names for which the client has status subscriptions to
         # the client's callback function.
@@ -940,6 +1581,8 @@ class ModuleTcpHandler(ScripterModuleMixin, ConnectionHandler):
         self._ConnectTimeout = 3
         self._AutoReconnect = True
 
+        self._InitOfflineQueue(offlineQueueExpiry)
+
     @property
     def AutoReconnect(self):
         """
@@ -1002,11 +1645,47 @@ class ModuleTcpHandler(ScripterModuleMixin, ConnectionHandler):
         if self._PollTimer.State != 'Running':
             self._PollTimer.Restart()
 
+    def Set(self, command, value, qualifier=None):
+        """
+        Calls the module's Set function. If the offline queue is enabled and
+        the interface is not connected, the command is held and sent once the
+        interface connects.
+
+        :param command: The name of the command to set.
+        :type command: string
+        :param value: The value to set.
+        :param qualifier: Any qualifiers needed by the command.
+        :type qualifier: dict
+        """
+        key = ('Set', command, _QualifierKey(qualifier))
+        if not self._QueueWhileOffline(key, command,
+                                       self._WrappedInterface.Set, command,
+                                       value, qualifier):
+            self._WrappedInterface.Set(command, value, qualifier)
+
+    def Update(self, command, qualifier=None):
+        """
+        Calls the module's Update function. If the offline queue is enabled
+        and the interface is not connected, the query is held and sent once
+        the interface connects.
+
+        :param command: The name of the command to query.
+        :type command: string
+        :param qualifier: Any qualifiers needed by the command.
+        :type qualifier: dict
+        """
+        key = ('Update', command, _QualifierKey(qualifier))
+        if not self._QueueWhileOffline(key, command,
+                                       self._WrappedInterface.Update, command,
+                                       qualifier):
+            self._WrappedInterface.Update(command, qualifier)
+
     def _AttemptReconnect(self, timer=None, count=0):
         self._AttemptingConnect = True
 
         connect_res = self._WrappedInterface.Connect(self._ConnectTimeout)
         if connect_res not in ['Connected', 'ConnectedAlready']:
+            self._Health.Failure(connect_res)
             self._ConnectFailed(self, connect_res)
 
             # Force disconnected state
@@ -1029,7 +1708,10 @@ class ModuleTcpHandler(ScripterModuleMixin, ConnectionHandler):
         if self._ReconnectTimer.State != 'Stopped':
             self._ReconnectTimer.Stop()
 
+        self._FlushOfflineQueue()
+
     def _IfaceDisconnected(self, interface, state):
+        self._LinkDown()
         if self._AutoReconnect:
             if self._ReconnectTimer.State != 'Running':
                 self._ReconnectTimer.Resume()
@@ -1039,17 +1721,20 @@ class ModuleTcpHandler(ScripterModuleMixin, ConnectionHandler):
 
     def _PollTriggered(self, timer, count):
         if not self._AttemptingConnect:
+            self._Health.PollSent()
             self._WrappedInterface.Update(self._keepAliveQuery,
                                           self._keepAliveParams)
 
             self._ConnectHistory.append(self._ConnectionStatus)
             if not self._HasBeenConnected():
+                self._Health.Failure('Missed responses')
                 self._WrappedInterface.connectionFlag = True
                 self._WrappedInterface.Disconnect()
 
     def _NewConnectionStatus(self, command, value, qualifier):
         if not value == self._ConnectionStatus:
             self._ConnectionStatus = value
+            self._Health.StatusChanged(value)
             if value == 'Connected':
                 self._Connected(self, value)
             elif value == 'Disconnected':
@@ -1084,10 +1769,11 @@ class ServerExHandler:
         self._ListenRetryTime = listenRetryTime
         self._StartListenTimeout = 0
 
-        self._IdleScanTimer = Timer(1, self._ScanClients)
+        self._IdleScanTimer = Timer(1, _Watched(self._ScanClients, Interface))
         self._IdleScanTimer.Pause()
 
-        self._RelistenWait = Wait(self._ListenRetryTime, self._StartListen)
+        self._RelistenWait = Wait(self._ListenRetryTime,
+                                  _Watched(self._StartListen, Interface))
         self._RelistenWait.Cancel()
 
         self._Connected = _UnassignedEvent
@@ -1096,13 +1782,32 @@ class ServerExHandler:
         self._ReceiveData = _UnassignedEvent
 
         # Capture interface events.
-        self._WrappedInterface.Connected = self._ClientConnect
-        self._WrappedInterface.Disconnected = self._ClientDisconnect
-        self._WrappedInterface.ReceiveData = self._IfaceReceiveData
+        self._WrappedInterface.Connected = _Watched(self._ClientConnect, Interface)
+        self._WrappedInterface.Disconnected = _Watched(self._ClientDisconnect, Interface)
+        self._WrappedInterface.ReceiveData = _Watched(self._IfaceReceiveData, Interface)
 
         # ClientObject: last_activity
         self._Clients = {}
 
+        # ClientObject: idle timeout, for clients that do not use the default.
+        self._ClientTimeouts = {}
+
+        # Min-heap of (deadline, sequence, ClientObject). Activity only
+        # updates self._Clients; an entry is checked against the client's
+        # last activity when its deadline passes and is pushed back if the
+        # client was active since. Sequence breaks ties between deadlines so
+        # client objects are never compared.
+        self._IdleDeadlines = []
+        self._IdleSequence = _count()
+        # Sequence number of each client's current heap entry; others are stale
+        self._ClientDeadlines = {}
+
+        self._Health = HandlerHealth()
+        self._Trace = GetChannel(__name__, Interface)
+        self._IdleDisconnects = 0
+
+        self._SendQueue = ClientSendQueue()
+
     @property
     def Connected(self):
         """
@@ -1191,6 +1896,110 @@ class ServerExHandler:
         else:
             raise TypeError("'handler' is not callable")
 
+    @property
+    def SendQueue(self):
+        """
+        :returns: the per-client queue used by :py:meth:`SendTo` and
+            :py:meth:`Broadcast`. Its HighWater, Overflow and BatchSize
+            attributes may be changed at any time.
+        :rtype: ClientSendQueue
+        """
+        return self._SendQueue
+
+    def Broadcast(self, data):
+        '''
+        Queues data to send to all connected clients. The call returns
+        immediately; a slow client does not delay the caller or other clients.
+
+        :param data: data to send.
+        :type data: bytes, string
+        '''
+        self._SendQueue.Broadcast(self._WrappedInterface.Clients, data)
+
+    def SendTo(self, client, data, close=False):
+        '''
+        Queues data to send to one client. The call returns immediately.
+
+        :param client: The client to send to.
+        :param data: data to send.
+        :type data: bytes, string
+        :param close: If True, disconnect the client once the data has been
+                      sent.
+        :type close: bool
+        '''
+        self._SendQueue.Send(client, data, close)
+
+    @property
+    def Trace(self):
+        """
+        This handler's trace channel. Turn on capture to record received
+        data from all clients.
+
+        :rtype: modules.helper.Trace.TraceChannel
+        """
+        return self._Trace
+
+    @property
+    def Health(self):
+        """
+        :returns: this handler's live health counters. Reading them does not
+            build a snapshot, so monitoring code can read them often; use
+            :py:meth:`GetHealth` for derived values such as round trip
+            percentiles.
+        :rtype: HandlerHealth
+        """
+        return self._Health
+
+    def GetHealth(self):
+        """
+        Returns rolling health metrics for this server: bytes and frames
+        received, connected client count, idle client disconnects, the last
+        listen failure reason, and per-client send queue statistics.
+
+        :returns: metric names mapped to values. Times are in seconds.
+        :rtype: dict
+        """
+        health = self._Health.Snapshot()
+        health['Clients'] = len(self._Clients)
+        health['IdleDisconnects'] = self._IdleDisconnects
+        health['SendQueue'] = self._SendQueue.GetStats()
+        return health
+
+    @property
+    def IdleDisconnects(self):
+        """
+        :returns: the number of clients disconnected for being idle.
+        :rtype: int
+        """
+        return self._IdleDisconnects
+
+    def SetClientIdleTimeout(self, client, timeout):
+        """
+        Overrides the idle timeout for one connected client.
+
+        .. code-block:: python
+
+            @event(Server, 'Connected')
+            def HandleConnected(client, state):
+                if client.IPAddress == DashboardAddress:
+                    Server.SetClientIdleTimeout(client, 3600)
+
+        :param client: The connected client.
+        :type client: extronlib.interface.EthernetServerInterfaceEx.ClientObject
+        :param timeout: Time in seconds to allow the client to be idle before
+                        disconnecting it. None restores the server's default.
+        :type timeout: float
+        """
+        if timeout is None:
+            self._ClientTimeouts.pop(client, None)
+        else:
+            self._ClientTimeouts[client] = timeout
+
+        last_activity = self._Clients.get(client)
+        if last_activity is not None:
+            # The new timeout may be shorter than the deadline already queued.
+            self._PushIdleDeadline(client, last_activity)
+
     def StartListen(self, timeout=0):
         '''
         Start the listener.
@@ -1202,14 +2011,20 @@ class ServerExHandler:
         self._StartListen()
 
     def _ClientConnect(self, client, state):
-        self._Clients[client] = monotonic()
+        now = monotonic()
+        self._Clients[client] = now
+        self._PushIdleDeadline(client, now)
         self._Connected(client, state)
 
         if len(self._WrappedInterface.Clients) > 0:
             self._IdleScanTimer.Restart()
 
     def _ClientDisconnect(self, client, state):
+        # Heap entries for this client are discarded when they come due.
         del self._Clients[client]
+        self._ClientTimeouts.pop(client, None)
+        self._ClientDeadlines.pop(client, None)
+        self._SendQueue.Remove(client)
         self._Disconnected(client, state)
 
         if len(self._WrappedInterface.Clients) == 0:
@@ -1217,24 +2032,58 @@ class ServerExHandler:
 
     def _IfaceReceiveData(self, client, data):
         self._Clients[client] = monotonic()
+        self._Health.DataReceived(data)
+        if self._Trace.Capturing:
+            self._Trace.Capture('RX', data)
         self._ReceiveData(client, data)
 
+    def _PushIdleDeadline(self, client, last_activity):
+        timeout = self._ClientTimeouts.get(client, self._ClientIdleTimeout)
+        sequence = next(self._IdleSequence)
+        self._ClientDeadlines[client] = sequence
+        heappush(self._IdleDeadlines, (last_activity + timeout, sequence, client))
+
+        if len(self._IdleDeadlines) > 2 * len(self._ClientDeadlines) + 16:
+            # Mostly stale entries from repeated SetClientIdleTimeout calls.
+            self._IdleDeadlines[:] = [entry for entry in self._IdleDeadlines
+                                      if self._ClientDeadlines.get(entry[2]) == entry[1]]
+            heapify(self._IdleDeadlines)
+
     def _ScanClients(self, timer, count):
-        # Finding and disconnecting idle clients occurs in two steps because
-        # collections can not be modified during iteration. Disconnecting a
-        # client causes self._Clients to be modified in _ClientDisconnect.
-        drop_list = []
-        for client, last_activity in self._Clients.items():
-            if (monotonic() - last_activity) > self._ClientIdleTimeout:
-                drop_list.append(client)
+        # Only heap entries whose deadline has passed are examined, so the
+        # cost of a scan depends on the number of clients coming due rather
+        # than the number connected. Disconnecting occurs after the heap scan
+        # because _ClientDisconnect modifies self._Clients.
+        now = monotonic()
+        deadlines = self._IdleDeadlines
+        drop_list = set()
+        while deadlines and deadlines[0][0] < now:
+            _, sequence, client = heappop(deadlines)
+            if self._ClientDeadlines.get(client) != sequence:
+                # Disconnected, or superseded by a later entry, since the
+                # entry was pushed.
+                continue
+
+            last_activity = self._Clients[client]
+            timeout = self._ClientTimeouts.get(client, self._ClientIdleTimeout)
+            if (now - last_activity) > timeout:
+                del self._ClientDeadlines[client]
+                drop_list.add(client)
+            else:
+                self._PushIdleDeadline(client, last_activity)
 
         for client in drop_list:
-            _trace('disconnecting idle client:', client.IPAddress)
+            self._Trace.Debug('disconnecting idle client: %s', client.IPAddress)
+            self._IdleDisconnects += 1
             client.Disconnect()
+            if client in self._Clients:
+                # Disconnect did not complete; check the client again later.
+                self._PushIdleDeadline(client, now)
 
     def _StartListen(self):
         result = self._WrappedInterface.StartListen(self._StartListenTimeout)
         if result != 'Listening':
+            self._Health.Failure(result)
             self._ListenFailed(self, result)
             self._RelistenWait.Restart()
 
@@ -1246,8 +2095,8 @@ class ServerExHandler:
         # underlying interface instance for methods not implemented by this
         # class.
         try:
-            _trace('__getattr__ trying', name)
-            return self._WrappedInterface.__getattribute__(name)
+            _Trace.Debug('__getattr__ trying %s', name)
+            attr = self._WrappedInterface.__getattribute__(name)
         except AttributeError:
             SelfName = self.__class__.__name__
             WrappedName = self._WrappedInterface.__class__.__name__
@@ -1256,6 +2105,9 @@ class ServerExHandler:
                                  "one found in the underlying '{}' "
                                  "object.".format(SelfName, name, WrappedName))
 
+        _BindFallThrough(self, name, attr)
+        return attr
+
     def __str__(self):
         listeningon = self._WrappedInterface.Interface
         return 'ConnectionHandler: Connected to Interface ' + str(listeningon)
@@ -0,0 +1,180 @@
+"""
+Device Registry module
+
+Loads device driver modules by name on first use and builds devices and their connection
+handlers on demand.
+
+Importing a Global Scripter Module and constructing its first instance are the slowest parts of
+program start. Defining devices through :py:func:`Define` postpones both until the device is first
+used or :py:func:`BuildAll` is called, so the program can show its start page first:
+::
+
+    import modules.helper.DeviceRegistry as DeviceRegistry
+
+    switcher01_ch = DeviceRegistry.Define('DTP CrossPoint', 'SSHClass', '192.168.1.12', 22023,
+                                          Credentials=('admin', None),
+                                          Model='DTP CrossPoint 84 4K IPCP SA',
+                                          Handler={'keepAliveQuery': 'ExecutiveMode'})
+
+    def initialize():
+        panel.ShowPage('Start')
+        DeviceRegistry.BuildAll()
+        switcher01_ch.Connect()
+"""
+
+from importlib import import_module
+from inspect import isroutine
+from threading import RLock
+
+from modules.helper.Trace import GetChannel
+
+__version__ = '1.0.0'
+
+
+# driver name: module name
+DRIVERS = {
+    'DTP CrossPoint': 'modules.device.extr_matrix_DTP_CrossPoint_82_84_4kSeriesv1872',
+    'LG UR640S': 'modules.device.lg_display_xxUR640S9UD_Series_v1_0_0_0',
+}
+
+# Devices defined and not built yet, in definition order
+_pending = []
+
+_lock = RLock()
+
+_Trace = GetChannel(__name__)
+
+
+def Register(Name, ModuleName):
+    """Make a driver module available under Name.
+
+    Parameters
+    ----------
+    Name: str
+        The driver name passed to :py:func:`GetDriver` and :py:func:`Define`.
+    ModuleName: str
+        The full module name, e.g. ``'modules.device.lg_display_xxUR640S9UD_Series_v1_0_0_0'``.
+    """
+    DRIVERS[Name] = ModuleName
+
+
+def GetDriver(Name):
+    """Return the driver module registered as Name, importing it on first use.
+
+    Parameters
+    ----------
+    Name: str
+        A registered driver name or a full module name.
+
+    Returns
+    -------
+    module
+
+    Raises
+    ------
+    ImportError
+        If the module can not be imported.
+    """
+    return import_module(DRIVERS.get(Name, Name))
+
+
+def Define(Driver, Class, *args, Handler=None, **kwargs):
+    """Define a device without importing its driver or building it.
+
+    Parameters
+    ----------
+    Driver: str
+        A registered driver name or a full module name.
+    Class: str
+        The driver class, e.g. ``'SSHClass'`` or ``'SerialOverEthernetClass'``.
+    args, kwargs
+        Passed to the driver class.
+    Handler: dict
+        Optional. When given, the device is wrapped in a connection handler and these are the
+        keyword arguments of ``GetConnectionHandler``.
+
+    Returns
+    -------
+    LazyDevice
+    """
+    device = LazyDevice(Driver, Class, args, kwargs, Handler)
+    with _lock:
+        _pending.append(device)
+    return device
+
+
+def BuildAll():
+    """Build every device defined and not built yet, in definition order.
+
+    Returns
+    -------
+    list
+        The built devices or connection handlers.
+    """
+    with _lock:
+        devices = list(_pending)
+        del _pending[:]
+    return [device.Build() for device in devices]
+
+
+class LazyDevice:
+    """A device that is built on first use. Create these with :py:func:`Define`.
+
+    Attribute access is forwarded to the built device (or its connection handler), building it
+    first if needed, so a LazyDevice can be passed anywhere the device itself would be. Methods of
+    the built object are stored on the LazyDevice so later calls are not forwarded.
+    """
+
+    def __init__(self, Driver, Class, Args, Kwargs, Handler):
+        self.Driver = Driver
+        self.Class = Class
+        self._args = Args
+        self._kwargs = Kwargs
+        self._handler = Handler
+        self._built = None
+
+    @property
+    def Built(self):
+        """True once the device has been built."""
+        return self._built is not None
+
+    @property
+    def Device(self):
+        """The built device or connection handler, building it if needed."""
+        built = self._built
+        return built if built is not None else self.Build()
+
+    def Build(self):
+        """Import the driver, build the device and its connection handler if one was requested,
+        and return it. Calling Build again returns the same object."""
+        built = self._built
+        if built is not None:
+            return built
+
+        with _lock:
+            if self._built is None:
+                cls = getattr(GetDriver(self.Driver), self.Class)
+                built = cls(*self._args, **self._kwargs)
+                if self._handler is not None:
+                    from modules.helper.ConnectionHandler import GetConnectionHandler
+                    built = GetConnectionHandler(built, **self._handler)
+                self._built = built
+                if self in _pending:
+                    _pending.remove(self)
+                _Trace.Debug('Built %s.%s%r', self.Driver, self.Class, self._args)
+        return self._built
+
+    def __getattr__(self, name):
+        # Only reached for names not found on the LazyDevice itself.
+        if name.startswith('__'):
+            raise AttributeError(name)
+        built = self.Build()
+        attr = getattr(built, name)
+        if callable(attr) and name not in getattr(built, '__dict__', {}) and \
+                isroutine(getattr(type(built), name, None)):
+            self.__dict__[name] = attr
+        return attr
+
+    def __repr__(self):
+        return '<LazyDevice {}.{}{!r}{}>'.format(self.Driver, self.Class, self._args,
+                                                 '' if self.Built else ' (not built)')
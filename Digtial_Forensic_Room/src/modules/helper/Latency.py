@@ -0,0 +1,288 @@
+"""
+Latency module
+
+Per-command response latency histograms for the device modules.
+
+Each device module instance gets a :py:class:`LatencyRecorder` from :py:func:`GetRecorder`, named
+like its trace channel. The module tells the recorder when it sends a command and when the
+device answers it, and the recorder adds the time between the two to the command's histogram.
+A command the device rejects is counted as an error, and one that is not answered within the
+recorder's timeout as a timeout. Histograms have fixed buckets, so they cost the same however
+long the program runs, and can be read at any time:
+::
+
+    import modules.helper.Latency as Latency
+
+    for device, commands in Latency.GetHistograms().items():
+        for command, histogram in commands.items():
+            print(device, command, histogram['Count'], histogram['Sum'] / histogram['Count'])
+
+Latency is measured from the module handing the command to its interface to the module
+receiving the answer, so it includes the network and the device but not the room code that
+asked for the command or the time the command waited in a send queue. Comparing a command's
+histogram before and after a firmware update shows whether the device got slower; comparing it
+with the handler's traffic counters shows whether the time is spent on the wire.
+"""
+
+from collections import deque
+from threading import Lock
+from time import monotonic
+
+from modules.helper.Trace import InstanceName
+
+__version__ = '1.0.0'
+
+
+# Upper bounds, in seconds, of the histogram buckets. Every histogram has one more bucket for
+# answers slower than the last bound.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Seconds after which a command that has not been answered is counted as a timeout
+DEFAULT_TIMEOUT = 5.0
+
+# recorder name: LatencyRecorder
+_recorders = {}
+
+_lock = Lock()
+
+
+def GetRecorder(Name, Instance=None):
+    """Return the recorder with this name, creating it if needed.
+
+    Parameters
+    ----------
+    Name: str
+        The recorder name. Device modules pass ``__name__``.
+    Instance: object
+        Optional. When given, the recorder is specific to this device and ``@<InstanceName>`` is
+        appended to Name, as for trace channels. Modules sharing one connection, such as
+        displays on one serial line, share one recorder.
+
+    Returns
+    -------
+    LatencyRecorder
+    """
+    if Instance is not None:
+        Name = '{}@{}'.format(Name, InstanceName(Instance))
+
+    recorder = _recorders.get(Name)
+    if recorder is None:
+        with _lock:
+            recorder = _recorders.get(Name)
+            if recorder is None:
+                recorder = LatencyRecorder(Name)
+                _recorders[Name] = recorder
+    return recorder
+
+
+def GetRecorders():
+    """Return a list of the names of all recorders created so far."""
+    return sorted(_recorders)
+
+
+def GetHistograms():
+    """Return the histograms of every recorder.
+
+    Returns
+    -------
+    dict
+        Recorder name: the recorder's :py:meth:`LatencyRecorder.GetHistograms`.
+    """
+    return {name: recorder.GetHistograms() for name, recorder in list(_recorders.items())}
+
+
+class LatencyRecorder:
+    """Pairs the commands a device module sends with their answers and keeps a latency histogram
+    per command. Create recorders with :py:func:`GetRecorder`.
+
+    Commands waiting for an answer are queued by key. Devices that answer strictly in order use
+    the default key; devices whose answers show which command they answer use one key per kind
+    of answer, so an answer is paired with the oldest command it can answer and unsolicited
+    notifications of another kind are not paired at all. A command sent with the
+    command name None is paired like the others but not recorded, which keeps protocol
+    housekeeping from shifting the pairs.
+
+    Parameters
+    ----------
+    Name: str
+        The recorder name.
+    Timeout: float
+        Seconds after which a command that has not been answered is counted as a timeout.
+    """
+
+    def __init__(self, Name, Timeout=DEFAULT_TIMEOUT):
+        self._name = Name
+        self.Timeout = Timeout
+        # key: deque of (command name, time sent)
+        self._pending = {}
+        # command name: [bucket counts, count, sum, errors, timeouts]
+        self._histograms = {}
+        # Time the oldest command waiting on any key was sent at or after, or None when none is
+        # waiting. Until it is older than the timeout, no key needs sweeping.
+        self._oldest = None
+        # Plain attribute so hot paths can test it without a call: True while any command is
+        # waiting for an answer.
+        self.Pending = False
+
+    @property
+    def Name(self):
+        return self._name
+
+    @property
+    def Commands(self):
+        """A live view of the names of the commands recorded so far."""
+        return self._histograms.keys()
+
+    def Sent(self, Command, Key=None, Count=1):
+        """Note that Command was sent and its answer is expected.
+
+        Parameters
+        ----------
+        Command: str
+            The name the latency is recorded under, such as ``'SetMatrixTieCommand'``. None for
+            a command whose answer must be paired but whose latency is not wanted.
+        Key: object
+            Optional. The key the answer is paired by. See the class description.
+        Count: int
+            Number of answers expected, one per command when a string holds several.
+        """
+        now = monotonic()
+        if self._oldest is not None and self._oldest < now - self.Timeout:
+            self._Sweep(now)
+        pending = self._pending.get(Key)
+        if pending is None:
+            pending = self._pending[Key] = deque()
+        pending.extend((Command, now) for _ in range(Count))
+        if self._oldest is None:
+            self._oldest = now
+        self.Pending = True
+
+    def Answered(self, Key=None, Error=False):
+        """Pair an answer with the oldest command waiting on Key and record its latency. An
+        answer with no command waiting, such as an unsolicited notification, is ignored.
+
+        Parameters
+        ----------
+        Key: object
+            Optional. The key the answer is paired by.
+        Error: bool
+            True if the device rejected the command.
+        """
+        pending = self._pending.get(Key)
+        if not pending:
+            return
+        now = monotonic()
+        if self._oldest < now - self.Timeout:
+            self._Sweep(now)
+        if pending:
+            command, sent = pending.popleft()
+            if command is not None:
+                self.Observe(command, now - sent, Error)
+        if not pending:
+            self.Pending = any(self._pending.values())
+
+    def AnsweredOldest(self, Error=False):
+        """Pair an answer that does not say which command it answers, such as an error code,
+        with the oldest command waiting on any key.
+
+        Parameters
+        ----------
+        Error: bool
+            True if the device rejected the command.
+        """
+        now = monotonic()
+        if self._oldest is not None and self._oldest < now - self.Timeout:
+            self._Sweep(now)
+        oldest = None
+        for pending in self._pending.values():
+            if pending and (oldest is None or pending[0][1] < oldest[0][1]):
+                oldest = pending
+        if oldest is not None:
+            command, sent = oldest.popleft()
+            if command is not None:
+                self.Observe(command, now - sent, Error)
+        self.Pending = any(self._pending.values())
+
+    def Observe(self, Command, Seconds, Error=False, TimedOut=False):
+        """Record one command's latency directly, for modules that wait for the answer
+        themselves (``SendAndWait``).
+
+        Parameters
+        ----------
+        Command: str
+            The command name.
+        Seconds: float
+            Time from sending the command to its answer.
+        Error: bool
+            True if the device rejected the command.
+        TimedOut: bool
+            True if no answer came. Seconds is then not added to the histogram.
+        """
+        histogram = self._histograms.get(Command)
+        if histogram is None:
+            histogram = self._histograms[Command] = [[0] * (len(BUCKETS) + 1), 0, 0.0, 0, 0]
+        if TimedOut:
+            histogram[4] += 1
+            return
+        bucket = 0
+        for bound in BUCKETS:
+            if Seconds <= bound:
+                break
+            bucket += 1
+        histogram[0][bucket] += 1
+        histogram[1] += 1
+        histogram[2] += Seconds
+        if Error:
+            histogram[3] += 1
+
+    def _Sweep(self, now):
+        # Counts the commands on every key that have waited longer than the timeout.
+        limit = now - self.Timeout
+        oldest = None
+        for pending in self._pending.values():
+            while pending and pending[0][1] < limit:
+                command, _ = pending.popleft()
+                if command is not None:
+                    self.Observe(command, 0.0, TimedOut=True)
+            if pending and (oldest is None or pending[0][1] < oldest):
+                oldest = pending[0][1]
+        self._oldest = oldest
+        self.Pending = oldest is not None
+
+    def GetHistograms(self):
+        """Return a histogram per command name.
+
+        A command that goes unanswered is counted as a timeout the next time the module sends a
+        command or receives an answer after the timeout has passed, so the recorder is only ever
+        changed by the thread running the module. A connection handler's keep alive query does
+        this at least once per poll interval.
+
+        Returns
+        -------
+        dict
+            Command name: dict with 'Buckets' (the upper bounds, ``BUCKETS``), 'Counts' (answers
+            per bucket, the last one for answers slower than the last bound), 'Count' and 'Sum'
+            (answers and their total seconds, errors included), 'Errors' and 'Timeouts'.
+        """
+        return {command: {
+            'Buckets': BUCKETS,
+            'Counts': list(counts),
+            'Count': count,
+            'Sum': total,
+            'Errors': errors,
+            'Timeouts': timeouts,
+        } for command, (counts, count, total, errors, timeouts) in list(self._histograms.items())}
+
+    def GetCounters(self, Command):
+        """Return Command's live counters, for readers that poll them often: a list of the
+        bucket counts, the count, the sum, the errors and the timeouts (see
+        :py:meth:`GetHistograms`), or None if Command has not been recorded. The list is updated
+        in place and must not be changed."""
+        return self._histograms.get(Command)
+
+    def Reset(self):
+        """Discard the histograms and forget the commands waiting for an answer."""
+        self._pending.clear()
+        self._histograms.clear()
+        self._oldest = None
+        self.Pending = False
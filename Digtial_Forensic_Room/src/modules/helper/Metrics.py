@@ -0,0 +1,358 @@
+"""
+Metrics module
+
+Serves the program's health and performance counters as a Prometheus text exposition, so a
+fleet of processors can be scraped and graphed centrally instead of read from trace output.
+
+:py:class:`MetricsServer` listens on a TCP port through a ``ServerExHandler`` and answers
+``GET /metrics`` with a snapshot of:
+
+* connection handler health - connection state, frames and bytes sent and received (the frames
+  received by a device module's handler are the frames its parser handled, so their rate is the
+  parse rate), missed responses, reconnects and the last keep alive round trip
+* queue depths - each handler's offline queue and each server's per-client send queue
+* device command latency histograms, errors and timeouts (see :py:mod:`Latency`)
+* event handler stalls (see :py:mod:`Watchdog`)
+
+Every value is a counter or gauge the program already keeps. The series names and labels of a
+handler, recorder or command are built once, when it is first seen. A scrape reads the live
+counters of the handlers, send queues, latency recorders and watchdog and formats the numbers;
+it never walks device status or copies statistics into health snapshots, and it only compares
+counts to find handlers, recorders, commands and stalled handlers added since the last one.
+Rates and percentiles are left to the monitoring server.
+
+Each response is sent with ``Connection: close`` and the scraper is disconnected once it has
+been sent.
+::
+
+    from modules.helper.Metrics import MetricsServer
+
+    metrics = MetricsServer(9100)
+
+and in ``prometheus.yml``:
+::
+
+    scrape_configs:
+      - job_name: rooms
+        static_configs:
+          - targets: ['10.0.0.21:9100', '10.0.0.22:9100']
+"""
+
+from extronlib.interface import EthernetServerInterfaceEx
+
+import modules.helper.ConnectionHandler as ConnectionHandler
+import modules.helper.Latency as Latency
+import modules.helper.Watchdog as Watchdog
+from modules.helper.Trace import GetChannel, InstanceName
+
+__version__ = '1.0.0'
+
+
+_Trace = GetChannel(__name__)
+
+_ContentType = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Longest request header accepted from a client
+_MaxRequest = 4096
+
+
+def _Label(value):
+    # A label value with backslashes, quotes and newlines escaped.
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _Labels(**labels):
+    return '{' + ','.join('{}="{}"'.format(name, _Label(value))
+                          for name, value in labels.items()) + '}'
+
+
+def _Number(value):
+    if value is None:
+        return None
+    if isinstance(value, float):
+        return repr(value)
+    return str(int(value))
+
+
+def _FromWatchdog(read):
+    # A reader of a watchdog counter; None until the watchdog is started.
+    def Read():
+        watchdog = Watchdog.GetWatchdog()
+        return None if watchdog is None else read(watchdog)
+    return Read
+
+
+class MetricsServer:
+    """Answers ``GET /metrics`` on IPPort with a Prometheus text snapshot.
+
+    Parameters
+    ----------
+    IPPort: int
+        IP port number to listen on.
+    Interface: str
+        Network interface to listen on (``'Any'``, ``'LAN'`` or ``'AVLAN'``).
+    Namespace: str
+        Prefix of every metric name.
+    clientIdleTimeout: float
+        Seconds a scraper may stay connected without sending a request.
+    """
+
+    def __init__(self, IPPort=9100, Interface='Any', Namespace='scs', clientIdleTimeout=30):
+        self.Namespace = Namespace
+        self.Scrapes = 0
+
+        # metric name: [header lines, list of emitters]. An emitter appends the metric's lines
+        # for one handler, recorder or command to the list it is passed.
+        self._families = {}
+        self._order = []
+        self._handlerCount = 0
+        self._handlerNames = set()
+        # recorder name: (LatencyRecorder, set of command names already emitted)
+        self._recorders = {}
+        self._stallNames = set()
+
+        # ClientObject: request bytes received so far
+        self._requests = {}
+
+        self._Define('handler_connected', 'gauge',
+                     '1 if the handler is connected, 0 if not.')
+        self._Define('handler_frames_sent_total', 'counter', 'Frames sent.')
+        self._Define('handler_bytes_sent_total', 'counter', 'Bytes sent.')
+        self._Define('handler_frames_received_total', 'counter',
+                     'Frames received; for device modules, frames passed to the parser.')
+        self._Define('handler_bytes_received_total', 'counter', 'Bytes received.')
+        self._Define('handler_missed_responses_total', 'counter',
+                     'Keep alive queries that were not answered.')
+        self._Define('handler_reconnects_total', 'counter', 'Reconnections after a disconnect.')
+        self._Define('handler_round_trip_seconds', 'gauge', 'Last keep alive round trip.')
+        self._Define('handler_offline_queue_length', 'gauge',
+                     'Commands held until the interface connects.')
+        self._Define('server_clients', 'gauge', 'Connected clients.')
+        self._Define('server_idle_disconnects_total', 'counter', 'Clients disconnected as idle.')
+        self._Define('server_send_queue_messages', 'gauge', 'Messages queued for clients.')
+        self._Define('server_send_queue_bytes', 'gauge', 'Bytes queued for clients.')
+        self._Define('server_send_queue_dropped_total', 'counter',
+                     'Messages dropped for connected clients that did not keep up.')
+        self._Define('server_send_queue_evictions_total', 'counter',
+                     'Clients disconnected for not keeping up.')
+        self._Define('device_command_latency_seconds', 'histogram',
+                     'Time from sending a device command to its answer.')
+        self._Define('device_command_errors_total', 'counter',
+                     'Device commands the device rejected.')
+        self._Define('device_command_timeouts_total', 'counter',
+                     'Device commands that were not answered.')
+        self._Define('watchdog_calls_total', 'counter',
+                     'Event handler and timer callback calls timed.')
+        self._Define('watchdog_stalls_total', 'counter',
+                     'Calls that ran longer than the watchdog threshold.')
+        self._Define('watchdog_stall_max_seconds', 'gauge', 'Longest call timed.')
+        self._Define('watchdog_stalled', 'gauge', 'Calls running past the threshold now.')
+        self._Define('watchdog_handler_stalls_total', 'counter', 'Stalls of one handler.')
+        self._Define('metrics_scrapes_total', 'counter', 'Snapshots served.')
+
+        self._Add('watchdog_calls_total', self._Simple(
+            'watchdog_calls_total', '', _FromWatchdog(lambda watchdog: watchdog.Calls)))
+        self._Add('watchdog_stalls_total', self._Simple(
+            'watchdog_stalls_total', '', _FromWatchdog(lambda watchdog: watchdog.Stalls)))
+        self._Add('watchdog_stall_max_seconds', self._Simple(
+            'watchdog_stall_max_seconds', '',
+            _FromWatchdog(lambda watchdog: watchdog.MaxDuration)))
+        self._Add('watchdog_stalled', self._Simple(
+            'watchdog_stalled', '', _FromWatchdog(lambda watchdog: watchdog.CountStalled())))
+        self._Add('metrics_scrapes_total', self._Simple('metrics_scrapes_total', '',
+                                                        lambda: self.Scrapes))
+
+        self._Server = ConnectionHandler.GetConnectionHandler(
+            EthernetServerInterfaceEx(IPPort, Interface=Interface),
+            serverTimeout=clientIdleTimeout)
+        # A snapshot goes out in a few large sends rather than many small ones.
+        self._Server.SendQueue.BatchSize = 16 * 1024
+        self._Server.ReceiveData = self._Request
+        self._Server.Disconnected = self._ClientDisconnected
+        self._Server.StartListen()
+
+    @property
+    def Server(self):
+        """The ``ServerExHandler`` the snapshots are served from."""
+        return self._Server
+
+    def _Define(self, name, kind, description):
+        name = '{}_{}'.format(self.Namespace, name)
+        self._families[name] = ['# HELP {} {}'.format(name, description),
+                                '# TYPE {} {}'.format(name, kind)], []
+        self._order.append(name)
+
+    def _Add(self, name, emitter):
+        self._families['{}_{}'.format(self.Namespace, name)][1].append(emitter)
+
+    def _Simple(self, name, labels, read):
+        # An emitter of one sample; a value of None is left out.
+        prefix = '{}_{}{} '.format(self.Namespace, name, labels)
+
+        def Emit(lines):
+            value = _Number(read())
+            if value is not None:
+                lines.append(prefix + value)
+        return Emit
+
+    def _HandlerName(self, handler):
+        # Handlers sharing an interface, such as displays on one serial line, are numbered.
+        if isinstance(handler, ConnectionHandler.ServerExHandler):
+            name = 'server:{}'.format(handler.Interface.IPPort)
+        else:
+            name = InstanceName(handler.Interface)
+        unique, number = name, 1
+        while unique in self._handlerNames:
+            number += 1
+            unique = '{}#{}'.format(name, number)
+        self._handlerNames.add(unique)
+        return unique
+
+    def _AddHandler(self, handler):
+        labels = _Labels(handler=self._HandlerName(handler), type=type(handler).__name__)
+        health = handler.Health
+        counters = (
+            ('handler_frames_sent_total', 'FramesSent'),
+            ('handler_bytes_sent_total', 'BytesSent'),
+            ('handler_frames_received_total', 'FramesReceived'),
+            ('handler_bytes_received_total', 'BytesReceived'),
+            ('handler_missed_responses_total', 'MissedResponses'),
+            ('handler_reconnects_total', 'Reconnects'),
+        )
+        if isinstance(handler, ConnectionHandler.ServerExHandler):
+            counters = counters[:4]
+            queue = handler.SendQueue
+            self._Add('server_clients', self._Simple('server_clients', labels,
+                                                     lambda: len(handler.Interface.Clients)))
+            self._Add('server_idle_disconnects_total', self._Simple(
+                'server_idle_disconnects_total', labels, lambda: handler.IdleDisconnects))
+            self._Add('server_send_queue_messages', self._Simple(
+                'server_send_queue_messages', labels, lambda: queue.Messages))
+            self._Add('server_send_queue_bytes', self._Simple(
+                'server_send_queue_bytes', labels, lambda: queue.Bytes))
+            self._Add('server_send_queue_dropped_total', self._Simple(
+                'server_send_queue_dropped_total', labels, lambda: queue.Dropped))
+            self._Add('server_send_queue_evictions_total', self._Simple(
+                'server_send_queue_evictions_total', labels, lambda: queue.Evictions))
+        else:
+            self._Add('handler_connected', self._Simple(
+                'handler_connected', labels,
+                lambda: 1 if handler.ConnectionStatus == 'Connected' else 0))
+            self._Add('handler_round_trip_seconds', self._Simple(
+                'handler_round_trip_seconds', labels, lambda: health.LastRoundTrip))
+            if isinstance(handler, ConnectionHandler.OfflineQueueMixin):
+                self._Add('handler_offline_queue_length', self._Simple(
+                    'handler_offline_queue_length', labels, lambda: handler.OfflineQueueLength))
+        for name, attribute in counters:
+            self._Add(name, self._Simple(name, labels,
+                                         lambda attribute=attribute: getattr(health, attribute)))
+
+    def _AddCommand(self, recorder, command):
+        driver, _, device = recorder.Name.rpartition('@')
+        labels = dict(driver=driver.rpartition('.')[2], device=device, command=command)
+        plain = _Labels(**labels)
+        base = '{}_device_command_latency_seconds'.format(self.Namespace)
+        buckets = ['{}_bucket{} '.format(base, _Labels(le=repr(bound), **labels))
+                   for bound in Latency.BUCKETS]
+        buckets.append('{}_bucket{} '.format(base, _Labels(le='+Inf', **labels)))
+        total = '{}_sum{} '.format(base, plain)
+        count = '{}_count{} '.format(base, plain)
+
+        # The recorder's live counters: [bucket counts, count, sum, errors, timeouts]. They are
+        # looked up on every scrape, as Reset replaces them.
+        def Histogram(lines):
+            counters = recorder.GetCounters(command)
+            if counters is None:
+                return
+            cumulative = 0
+            for prefix, counted in zip(buckets, counters[0]):
+                cumulative += counted
+                lines.append(prefix + str(cumulative))
+            lines.append(total + repr(counters[2]))
+            lines.append(count + str(counters[1]))
+
+        def Counter(index):
+            def Read():
+                counters = recorder.GetCounters(command)
+                return None if counters is None else counters[index]
+            return Read
+
+        self._Add('device_command_latency_seconds', Histogram)
+        self._Add('device_command_errors_total', self._Simple(
+            'device_command_errors_total', plain, Counter(3)))
+        self._Add('device_command_timeouts_total', self._Simple(
+            'device_command_timeouts_total', plain, Counter(4)))
+
+    def _Discover(self):
+        # Adds the series of handlers, commands and stalled handlers seen since the last scrape.
+        handlers = ConnectionHandler.GetHandlers()
+        for handler in handlers[self._handlerCount:]:
+            self._AddHandler(handler)
+        self._handlerCount = len(handlers)
+
+        names = Latency.GetRecorders()
+        if len(names) != len(self._recorders):
+            for name in names:
+                if name not in self._recorders:
+                    self._recorders[name] = (Latency.GetRecorder(name), set())
+        for recorder, seen in self._recorders.values():
+            commands = recorder.Commands
+            if len(seen) != len(commands):
+                for command in sorted(commands - seen):
+                    self._AddCommand(recorder, command)
+                    seen.add(command)
+
+        watchdog = Watchdog.GetWatchdog()
+        if watchdog is not None and len(watchdog.StallsByName) != len(self._stallNames):
+            for name in sorted(set(watchdog.StallsByName) - self._stallNames):
+                self._stallNames.add(name)
+                self._Add('watchdog_handler_stalls_total', self._Simple(
+                    'watchdog_handler_stalls_total', _Labels(handler=name),
+                    lambda name=name: watchdog.StallsByName.get(name)))
+
+    def Render(self):
+        """Return the current snapshot in the Prometheus text format.
+
+        Returns
+        -------
+        str
+        """
+        self.Scrapes += 1
+        self._Discover()
+
+        lines = []
+        for name in self._order:
+            header, emitters = self._families[name]
+            if not emitters:
+                continue
+            lines.extend(header)
+            for emit in emitters:
+                emit(lines)
+        lines.append('')
+        return '\n'.join(lines)
+
+    def _Request(self, client, data):
+        request = self._requests.get(client, b'') + data
+        if b'\n\n' not in request.replace(b'\r\n', b'\n'):
+            if len(request) > _MaxRequest:
+                self._requests.pop(client, None)
+                client.Disconnect()
+            else:
+                self._requests[client] = request
+            return
+        self._requests.pop(client, None)
+
+        line = request.split(b'\n', 1)[0].split()
+        if len(line) >= 2 and line[0] == b'GET' and line[1].split(b'?')[0] in (b'/', b'/metrics'):
+            status, body = '200 OK', self.Render()
+        else:
+            status, body = '404 Not Found', 'Not found. Scrape /metrics.\n'
+            _Trace.Debug('Unexpected request from %s: %r', client.IPAddress, request[:80])
+        body = body.encode('utf-8')
+        self._Server.SendTo(client, (
+            'HTTP/1.0 {}\r\nContent-Type: {}\r\nContent-Length: {}\r\n'
+            'Connection: close\r\n\r\n').format(status, _ContentType, len(body)).encode() + body,
+            close=True)
+
+    def _ClientDisconnected(self, client, state):
+        self._requests.pop(client, None)
@@ -4,28 +4,153 @@
 # Copyright 2020-2023, Extron Electronics. All rights reserved.
 
 
+from collections import deque
 from functools import partial
 from itertools import product
+from threading import Condition, Event, Lock, Thread, get_ident
+from time import monotonic, perf_counter, sleep
 
 from extronlib.interface import EthernetServerInterfaceEx
 
-from extronlib.system import ProgramLog
+from extronlib.system import ProgramLog, Wait
+
+from modules.helper.Trace import GetChannel
+from modules.helper.Watchdog import Watch
 
 __history__ = """
 Version     Date        Notes
 -------     ----        -----
 1.0.0       2/8/2023    Initial release.
+1.1.0       10/19/2026  eventEx builds a dispatcher per event and isolates handler exceptions.
+                        Optional per-handler timing. Add ClientSendQueue, which sends to each
+                        client from its own thread; TcpServerLogger queues records with it.
+                        Add AsyncEventBus. WatchVariable keeps its value, skips unchanged
+                        values, accepts several subscribers and can coalesce changes.
+                        Add BufferedLogger. eventEx dispatchers are timed by the Watchdog module
+                        once it is started.
 """
 
-__version__ = '1.0.0'
+__version__ = '1.1.0'
+
+
+_Trace = GetChannel(__name__)
 
 
+# (Object, EventName): list of handlers
 __dispatchmap = {}
 
+# (Object, EventName): (callsetter, args, kwargs) used to install the dispatcher
+__setters = {}
+
+# handler name: [calls, total seconds, max seconds] while timing is enabled, else None
+__timings = None
+
+
+def _HandlerName(handler):
+    return '{}.{}'.format(getattr(handler, '__module__', '?'),
+                          getattr(handler, '__qualname__', repr(handler)))
+
+
+def _LogHandlerException(handler, err):
+    ProgramLog('eventEx handler {} raised {}: {}'.format(
+        _HandlerName(handler), type(err).__name__, err), 'error')
+
+
+def _BuildDispatcher(handlers):
+    # Build a callable specialized for the handlers of one (Object, EventName) so that dispatch
+    # needs no dictionary lookup. Each handler is isolated: an exception is logged and does not
+    # prevent the remaining handlers from running.
+    handlers = tuple(handlers)
+
+    if __timings is not None:
+        timings = __timings
+        stats = tuple(timings.setdefault(_HandlerName(h), [0, 0.0, 0.0]) for h in handlers)
+        pairs = tuple(zip(handlers, stats))
+
+        def dispatch(*args, **kwargs):
+            for handler, stat in pairs:
+                start = perf_counter()
+                try:
+                    handler(*args, **kwargs)
+                except Exception as err:
+                    _LogHandlerException(handler, err)
+                elapsed = perf_counter() - start
+                stat[0] += 1
+                stat[1] += elapsed
+                if elapsed > stat[2]:
+                    stat[2] = elapsed
 
-def __eventExDispatch__(key, *args, **kwargs):
-    for handler in __dispatchmap[key]:
-        handler(*args, **kwargs)
+    elif len(handlers) == 1:
+        handler = handlers[0]
+
+        def dispatch(*args, **kwargs):
+            try:
+                handler(*args, **kwargs)
+            except Exception as err:
+                _LogHandlerException(handler, err)
+
+    else:
+        def dispatch(*args, **kwargs):
+            for handler in handlers:
+                try:
+                    handler(*args, **kwargs)
+                except Exception as err:
+                    _LogHandlerException(handler, err)
+
+    return dispatch
+
+
+def _InstallDispatcher(key):
+    callsetter, args, kwargs = __setters[key]
+    handlers = __dispatchmap[key]
+    # Stalls are reported under the event's handlers' names.
+    name = ', '.join(_HandlerName(handler) for handler in handlers)
+    callsetter(Watch(_BuildDispatcher(handlers), name), *args, **kwargs)
+
+
+def EnableHandlerTiming(Enable=True):
+    """Turn per-handler timing of :py:attr:`eventEx` handlers on or off.
+
+    While enabled, the number of calls and the total and maximum time spent in each handler are
+    recorded. Use :py:attr:`GetHandlerTimings` to find handlers that occupy the event thread.
+    Timing adds a small cost to every dispatch, so leave it off when not needed.
+
+    Parameters
+    ----------
+    Enable : bool
+        True to start timing, False to stop. Stopping discards recorded timings.
+    """
+    global __timings
+
+    __timings = {} if Enable else None
+    for key in __setters:
+        _InstallDispatcher(key)
+
+
+def GetHandlerTimings():
+    """Return the timings recorded since :py:attr:`EnableHandlerTiming` was called.
+
+    Returns
+    -------
+    dict
+        Handler names ('module.function') mapped to dicts with 'Calls', 'Total', 'Max' and
+        'Mean' (seconds). Empty if timing is not enabled.
+
+    Examples
+    --------
+    ::
+
+        EnableHandlerTiming()
+        ...
+        for name, t in sorted(GetHandlerTimings().items(), key=lambda i: -i[1]['Total']):
+            print(name, t['Calls'], t['Max'])
+    """
+    if __timings is None:
+        return {}
+
+    return {name: {'Calls': calls, 'Total': total, 'Max': longest,
+                   'Mean': total / calls if calls else 0.0}
+            for name, (calls, total, longest) in __timings.items()}
 
 
 def eventEx(Object, EventName, *args, **kwargs):
@@ -34,13 +159,16 @@ def eventEx(Object, EventName, *args, **kwargs):
 
         * The event can trigger multiple handlers.
         * In addition to property names, `EventName` can refer to method names.
+        * An exception raised by one handler is logged to the Program Log and does not prevent
+          the other handlers from running.
 
     The decorated function must have the exact signature as specified by the definition of
     EventName, which must appear in the `Object` class or one of its parent classes. Lists of
     `Object` and/or `EventName` can be passed in to apply the same handler to multiple events.
 
-    This decorator may be used as a drop-in replacement for extronlib's built-in event decorator;
-    however, it introduces a minimal amount of latency both in event setup and dispatch.
+    This decorator may be used as a drop-in replacement for extronlib's built-in event decorator.
+    A dispatcher specialized for the event's handlers is built when a handler is added, so
+    dispatch costs one extra function call for a single handler.
 
     Parameters
     ----------
@@ -92,26 +220,249 @@ def eventEx(Object, EventName, *args, **kwargs):
                 )
                 raise TypeError(msg)
 
-            if not (obj, evtname) in __dispatchmap.keys():
-                __dispatchmap[(obj, evtname)] = []
-
-            __dispatchmap[(obj, evtname)].append(handler)
-            callsetter(partial(__eventExDispatch__, (obj, evtname)), *args, **kwargs)
+            key = (obj, evtname)
+            __dispatchmap.setdefault(key, []).append(handler)
+            __setters[key] = (callsetter, args, kwargs)
+            _InstallDispatcher(key)
 
         return handler
 
     return deco
 
 
+class AsyncEventBus:
+    r"""Run event handlers on a bounded pool of worker threads instead of the thread that raised
+    the event.
+
+    Events raised on a device's receive thread normally run their handlers inline, so a slow
+    handler delays parsing of the next frame. Handlers opted in to an AsyncEventBus are queued and
+    run by a worker thread instead. Handlers for events from the same source are always run by
+    the same worker, in the order the events were raised. Sources are assigned to workers in
+    turn as they first submit.
+
+    Parameters
+    ----------
+    Workers: int
+        Number of worker threads. Defaults to 2.
+    QueueSize: int
+        Maximum number of pending handler calls per worker. Defaults to 256.
+    QueueFullPolicy: str
+        What to do when a worker's queue is full:
+
+            * ``'Block'`` - wait in the raising thread until there is room (default). A
+              handler that raises an event on a worker of the same bus does not wait, which
+              could deadlock the worker; the call is run inline instead, as for
+              ``'RunInline'``.
+            * ``'DropNewest'`` - discard the new call.
+            * ``'DropOldest'`` - discard the oldest pending call.
+            * ``'RunInline'`` - run the call in the raising thread. Ordering is not guaranteed
+              for calls run this way.
+    Name: str
+        A friendly name used for the worker threads and in logging output.
+
+    Examples
+    --------
+    Opt in a single event with :py:meth:`event`, which takes the same arguments as
+    :py:attr:`eventEx`:
+    ::
+
+        Bus = AsyncEventBus(Workers=2, QueueFullPolicy='DropOldest')
+
+        @Bus.event(Display, 'ReceiveData')
+        def HandleDisplayData(interface, data):
+            logger.Log('Display data', data)
+
+    Opt in every trigger of a :py:class:`GenericEvent` or :py:class:`WatchVariable`:
+    ::
+
+        RoomState = WatchVariable('Room state', Bus=Bus)
+    """
+
+    _Policies = ('Block', 'DropNewest', 'DropOldest', 'RunInline')
+
+    def __init__(self, Workers=2, QueueSize=256, QueueFullPolicy='Block', Name='event bus'):
+        if QueueFullPolicy not in self._Policies:
+            raise ValueError('QueueFullPolicy must be one of {}.'.format(', '.join(self._Policies)))
+        if Workers < 1 or QueueSize < 1:
+            raise ValueError('Workers and QueueSize must be at least 1.')
+
+        self._name = Name
+        self._size = QueueSize
+        self._policy = QueueFullPolicy
+        self._queues = tuple(deque() for _ in range(Workers))
+        self._conditions = tuple(Condition() for _ in range(Workers))
+        self._running = True
+        # Worker index per id() of each source, assigned in turn on first submit
+        self._slots = {}
+        self._slotsLock = Lock()
+        self._workers = set()
+
+        self._dispatched = 0
+        self._dropped = 0
+        self._errors = 0
+
+        for index in range(Workers):
+            Thread(target=self._Work, args=(index,), daemon=True,
+                   name='{} worker {}'.format(Name, index)).start()
+
+    @property
+    def Name(self):
+        return self._name
+
+    def Submit(self, Source, Function, *args, **kwargs):
+        """Queue a call to Function(\*args, \*\*kwargs). Once the bus is stopped, the call is run
+        in the calling thread instead.
+
+        Parameters
+        ----------
+        Source: object
+            The object that raised the event. Calls with the same Source run in submission order.
+        Function: callable
+            The handler to call.
+
+        Returns
+        -------
+        bool
+            False if the call was discarded because the queue was full, otherwise True.
+        """
+        key = id(Source)
+        index = self._slots.get(key)
+        if index is None:
+            with self._slotsLock:
+                index = self._slots.setdefault(key, len(self._slots) % len(self._queues))
+        queue = self._queues[index]
+        condition = self._conditions[index]
+        item = (Function, args, kwargs)
+
+        with condition:
+            if self._running and len(queue) >= self._size:
+                if self._policy == 'Block' and get_ident() in self._workers:
+                    item = None
+                elif self._policy == 'Block':
+                    while len(queue) >= self._size and self._running:
+                        condition.wait()
+                elif self._policy == 'DropNewest':
+                    self._dropped += 1
+                    return False
+                elif self._policy == 'DropOldest':
+                    queue.popleft()
+                    self._dropped += 1
+                else:
+                    item = None
+            if not self._running:
+                # Stopped, possibly while waiting for room: no worker would run the call.
+                item = None
+
+            if item is not None:
+                queue.append(item)
+                condition.notify_all()
+                return True
+
+        self._Call(Function, args, kwargs)
+        return True
+
+    def Handler(self, Function):
+        """Wrap Function so that calling the wrapper queues the call on this bus.
+
+        The first positional argument (the event source for extronlib and :py:attr:`eventEx`
+        handlers) determines ordering.
+
+        Parameters
+        ----------
+        Function: callable
+            The handler to wrap.
+
+        Returns
+        -------
+        callable
+            The wrapper, suitable for assigning to an event property.
+        """
+        def submit(*args, **kwargs):
+            self.Submit(args[0] if args else None, Function, *args, **kwargs)
+
+        submit.__name__ = getattr(Function, '__name__', 'handler')
+        submit.__qualname__ = getattr(Function, '__qualname__', submit.__name__)
+        submit.__module__ = getattr(Function, '__module__', __name__)
+        return submit
+
+    def event(self, Object, EventName, *args, **kwargs):
+        """Decorate a function to be an :py:attr:`eventEx` handler that runs on this bus.
+
+        Accepts the same arguments as :py:attr:`eventEx`. Returns the undecorated function.
+        """
+        def deco(handler):
+            eventEx(Object, EventName, *args, **kwargs)(self.Handler(handler))
+            return handler
+
+        return deco
+
+    def GetStats(self):
+        """Return the bus's queue depths and counters.
+
+        Returns
+        -------
+        dict
+            'Queued' (list of pending calls per worker), 'Dispatched', 'Dropped' and 'Errors'.
+        """
+        return {
+            'Queued': [len(queue) for queue in self._queues],
+            'Dispatched': self._dispatched,
+            'Dropped': self._dropped,
+            'Errors': self._errors,
+        }
+
+    def Stop(self):
+        """Stop the worker threads after they finish their current call. Pending calls are
+        discarded, and calls submitted from now on run in the submitting thread."""
+        self._running = False
+        for queue, condition in zip(self._queues, self._conditions):
+            with condition:
+                queue.clear()
+                condition.notify_all()
+
+    def _Call(self, Function, args, kwargs):
+        try:
+            Function(*args, **kwargs)
+        except Exception as err:
+            self._errors += 1
+            _LogHandlerException(Function, err)
+        self._dispatched += 1
+
+    def _Work(self, index):
+        queue = self._queues[index]
+        condition = self._conditions[index]
+        self._workers.add(get_ident())
+
+        while self._running:
+            with condition:
+                while not queue and self._running:
+                    condition.wait()
+                if not self._running:
+                    return
+                Function, args, kwargs = queue.popleft()
+                condition.notify_all()
+
+            self._Call(Function, args, kwargs)
+
+
 class _ManualEventBase:
-    def __init__(self, Name):
+    def __init__(self, Name, Bus=None):
         self._name = Name
         self._handler = None
+        self._bus = Bus
 
     @property
     def Name(self):
         return self._name
 
+    def _Dispatch(self, *args, **kwargs):
+        handler = self._handler
+        if handler:
+            if self._bus is None:
+                handler(self, *args, **kwargs)
+            else:
+                self._bus.Submit(self, handler, self, *args, **kwargs)
+
 
 class GenericEvent(_ManualEventBase):
     """Trigger an ``extronlib.event`` or :py:attr:`eventEx` event handler with a function call.
@@ -120,6 +471,14 @@ class GenericEvent(_ManualEventBase):
     call. This is incompatible with how the @event decorator in extronlib is used. This class
     connects those callbacks to an event handler compatible with @event.
 
+    Parameters
+    ----------
+    Name: str
+        A friendly name used to identify this instance. Defaults to 'unnamed event'.
+    Bus: AsyncEventBus
+        Optional. When given, the ``Triggered`` handler runs on one of the bus's worker threads
+        instead of in the thread that calls :py:meth:`Trigger`.
+
     Examples
     --------
     ::
@@ -133,8 +492,8 @@ class GenericEvent(_ManualEventBase):
         MyEvent.Trigger(123)
     """
 
-    def __init__(self, Name='unnamed event'):
-        super().__init__(Name)
+    def __init__(self, Name='unnamed event', Bus=None):
+        super().__init__(Name, Bus)
 
     @property
     def Triggered(self):
@@ -161,8 +520,7 @@ class GenericEvent(_ManualEventBase):
         It accepts a variable number of positional and keyword arguments which, along with
         this instances, are passed to the ``Triggered`` handler.
         """
-        if self._handler:
-            self._handler(self, *args, **kwargs)
+        self._Dispatch(*args, **kwargs)
 
 
 class WatchVariable(_ManualEventBase):
@@ -174,10 +532,18 @@ class WatchVariable(_ManualEventBase):
     Name: str
         A friendly name used to identify this instance. Usable in logging output, for example.
         Defaults to 'unnamed variable'.
-
+    Bus: AsyncEventBus
+        Optional. When given, the ``Changed`` handler runs on one of the bus's worker threads
+        instead of in the thread that calls :py:meth:`Change`.
+    Coalesce: float
+        Optional. When greater than 0, changes are collected for this many seconds after the first
+        change and handlers are notified once with the last value. Defaults to 0 (notify on every
+        change).
 
     Use this class to signal to other parts of your program that the state of a system variable
-    has been changed.
+    has been changed. The instance remembers the last value passed to :py:meth:`Change` and
+    handlers are only notified when the value differs from it, so a room-state variable can drive
+    many UI elements without redundant updates. Read the value at any time with :py:attr:`Value`.
 
     Examples
     --------
@@ -217,10 +583,61 @@ class WatchVariable(_ManualEventBase):
         import variables
 
         print('CallStatus is', variables.CallStatus)
+
+    Or poll the instance directly:
+    ::
+
+        print('CallStatus is', CallStatusWatch.Value)
+
+    Any number of plain callables can also be added with :py:meth:`Subscribe`:
+    ::
+
+        SystemOn = WatchVariable('System on', Coalesce=0.1)
+        SystemOn.Subscribe(lambda src, value: PowerButton.SetState(int(value)))
+        SystemOn.Subscribe(lambda src, value: SourcePanel.SetEnable(value))
     """
 
-    def __init__(self, Name='unnamed variable'):
-        super().__init__(Name)
+    def __init__(self, Name='unnamed variable', Bus=None, Coalesce=0):
+        super().__init__(Name, Bus)
+        self._subscribers = ()
+        self._state = None
+        self._pending = None
+        self._lock = Lock()
+        self._wait = Wait(Coalesce, self._FlushPending) if Coalesce > 0 else None
+        if self._wait:
+            self._wait.Cancel()
+
+    @property
+    def Value(self):
+        """The value last passed to :py:meth:`Change`, or None if it has not been called.
+
+        If :py:meth:`Change` was called with more than one positional argument, this is a tuple
+        of them. Keyword arguments are not included.
+        """
+        if self._state is None:
+            return None
+        args = self._state[0]
+        if len(args) == 1:
+            return args[0]
+        return args or None
+
+    def Subscribe(self, handler):
+        """Add a handler to be called with the same arguments as the :py:attr:`Changed` handler.
+
+        Parameters
+        ----------
+        handler: callable
+            Called as handler(instance, \*args, \*\*kwargs). Exceptions are logged and do not
+            prevent other subscribers from running.
+        """
+        if not callable(handler):
+            raise ValueError("'handler' must be callable.")
+        if handler not in self._subscribers:
+            self._subscribers = self._subscribers + (handler,)
+
+    def Unsubscribe(self, handler):
+        """Remove a handler added with :py:meth:`Subscribe`."""
+        self._subscribers = tuple(sub for sub in self._subscribers if sub is not handler)
 
     @property
     def Changed(self):
@@ -260,9 +677,266 @@ class WatchVariable(_ManualEventBase):
         ::
 
             MyWatcher.Change('newstate')    # handlers will be called at this point
+            MyWatcher.Change('newstate')    # unchanged, handlers are not called
+        """
+        state = (args, kwargs)
+        with self._lock:
+            if self._wait is not None:
+                if self._pending is None:
+                    self._wait.Restart()
+                self._pending = state
+                return
+            if state == self._state:
+                return
+            self._state = state
+
+        self._Notify(args, kwargs)
+
+    def _FlushPending(self):
+        with self._lock:
+            state, self._pending = self._pending, None
+            if state is None or state == self._state:
+                return
+            self._state = state
+
+        self._Notify(*state)
+
+    def _Notify(self, args, kwargs):
+        self._Dispatch(*args, **kwargs)
+        for subscriber in self._subscribers:
+            if self._bus is not None:
+                self._bus.Submit(self, subscriber, self, *args, **kwargs)
+                continue
+            try:
+                subscriber(self, *args, **kwargs)
+            except Exception as err:
+                _LogHandlerException(subscriber, err)
+
+
+# Client Send Queues ----------------------------------------------------------
+
+
+class ClientSendQueue:
+    r"""Buffers outgoing data for each client of a server and sends it from a thread per client,
+    so neither the thread producing the data nor the other clients wait on a client's socket.
+
+    A client's sender thread runs while data is queued for it and combines queued messages into
+    sends of up to batchSize bytes. A client is handled according to overflow when the data
+    queued for it exceeds highWater bytes:
+
+        * ``'DropOldest'`` - the oldest queued messages are discarded (default).
+        * ``'Disconnect'`` - the client's queue is discarded and the client is disconnected.
+
+    A client whose send has not completed within sendTimeout seconds is disconnected when more
+    data is queued for it, whatever overflow is.
+
+    Parameters
+    ----------
+    highWater: int
+        Maximum number of bytes to queue per client. Defaults to 64 KB.
+    overflow: str
+        ``'DropOldest'`` or ``'Disconnect'``.
+    batchSize: int
+        Maximum number of bytes to combine into one send. Defaults to 1400.
+    sendInterval: float
+        Time in seconds between sends to a client while data is queued for it. Defaults to 0.05.
+    sendTimeout: float
+        Time in seconds a single send may take. Defaults to 10.
+
+    Example
+    -------
+    ::
+
+        queue = ClientSendQueue(highWater=16384)
+        queue.Broadcast(server.Clients, 'Room 1 On\\n')
+    """
+
+    def __init__(self, highWater=64*1024, overflow='DropOldest', batchSize=1400,
+                 sendInterval=0.05, sendTimeout=10.0):
+        if overflow not in ('DropOldest', 'Disconnect'):
+            raise ValueError("overflow must be 'DropOldest' or 'Disconnect'.")
+
+        self.HighWater = highWater
+        self.Overflow = overflow
+        self.BatchSize = batchSize
+        self.SendInterval = sendInterval
+        self.SendTimeout = sendTimeout
+
+        # ClientObject: deque of bytes
+        self._queues = {}
+        # ClientObject: [queued bytes, dropped messages]
+        self._counters = {}
+        # Clients with a sender thread
+        self._senders = set()
+        # ClientObject: monotonic() time its sender started the send in progress
+        self._sending = {}
+        # Clients disconnected for not keeping up, until Remove is called for them
+        self._evicted = set()
+        # Clients to disconnect once their queue is sent
+        self._closing = set()
+        self._lock = Lock()
+
+        # Totals over all clients, kept up to date so they can be read without the lock
+        self.Messages = 0
+        self.Bytes = 0
+        self.Dropped = 0
+        self.Evictions = 0
+
+    def Send(self, client, data, close=False):
+        """Queue data to send to one client.
+
+        Parameters
+        ----------
+        client: ClientObject
+            The client to send to.
+        data: bytes, str
+            The data to send.
+        close: bool
+            If True, the client is disconnected once everything queued for it has been sent.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+
+        with self._lock:
+            self._Enqueue(client, data, monotonic())
+            if close and client in self._queues:
+                self._closing.add(client)
+
+    def Broadcast(self, clients, data):
+        """Queue data to send to every client in clients.
+
+        Parameters
+        ----------
+        clients: list
+            The clients to send to.
+        data: bytes, str
+            The data to send.
         """
-        if self._handler:
-            self._handler(self, *args, **kwargs)
+        if isinstance(data, str):
+            data = data.encode()
+
+        now = monotonic()
+        with self._lock:
+            for client in clients:
+                self._Enqueue(client, data, now)
+
+    def Remove(self, client):
+        """Discard all data queued for a client. Call this when the client disconnects."""
+        with self._lock:
+            self._Discard(client)
+            self._evicted.discard(client)
+            self._closing.discard(client)
+
+    def GetStats(self):
+        """Return the queue of every client and the number of clients evicted.
+
+        Returns
+        -------
+        dict
+            'Clients' (``'address:port'``: dict with 'Depth' and 'Bytes', the messages and bytes
+            queued, and 'Dropped', the messages discarded) and 'Evictions'.
+        """
+        with self._lock:
+            clients = {}
+            for client, queue in self._queues.items():
+                queued, dropped = self._counters[client]
+                key = '{}:{}'.format(getattr(client, 'IPAddress', '?'),
+                                     getattr(client, 'ServicePort', '?'))
+                clients[key] = {'Depth': len(queue), 'Bytes': queued, 'Dropped': dropped}
+
+        return {'Clients': clients, 'Evictions': self.Evictions}
+
+    def _Enqueue(self, client, data, now):
+        # Must be called with self._lock held.
+        if client in self._evicted:
+            return
+        started = self._sending.get(client)
+        if started is not None and now - started > self.SendTimeout:
+            self._Evict(client, 'send timed out')
+            return
+
+        queue = self._queues.get(client)
+        if queue is None:
+            queue = self._queues[client] = deque()
+            self._counters[client] = [0, 0]
+        counters = self._counters[client]
+        queue.append(data)
+        counters[0] += len(data)
+        self.Messages += 1
+        self.Bytes += len(data)
+
+        if counters[0] > self.HighWater:
+            if self.Overflow == 'Disconnect':
+                self._Evict(client, 'queue full')
+                return
+            while counters[0] > self.HighWater and len(queue) > 1:
+                size = len(queue.popleft())
+                counters[0] -= size
+                counters[1] += 1
+                self.Messages -= 1
+                self.Bytes -= size
+                self.Dropped += 1
+
+        if client not in self._senders:
+            self._senders.add(client)
+            Thread(target=self._Sender, args=(client,), daemon=True,
+                   name='send queue {}'.format(getattr(client, 'IPAddress', '?'))).start()
+
+    def _Discard(self, client):
+        # Must be called with self._lock held.
+        queue = self._queues.pop(client, None)
+        counters = self._counters.pop(client, None)
+        if queue:
+            self.Messages -= len(queue)
+            self.Bytes -= counters[0]
+            if client in self._evicted:
+                counters[1] += len(queue)
+                self.Dropped += len(queue)
+
+    def _Evict(self, client, reason):
+        # Must be called with self._lock held. The disconnect runs on its own thread: the client's
+        # sender may be blocked in a send, and the caller must not be.
+        self._evicted.add(client)
+        self._Discard(client)
+        self.Evictions += 1
+        _Trace.Debug('evicting slow client %s: %s', getattr(client, 'IPAddress', '?'), reason)
+        Thread(target=client.Disconnect, daemon=True).start()
+
+    def _Sender(self, client):
+        # Sends the client's queue, a batch every SendInterval, and ends when it is empty.
+        while True:
+            sleep(self.SendInterval)
+            with self._lock:
+                queue = self._queues.get(client)
+                if not queue or client in self._evicted:
+                    self._senders.discard(client)
+                    close = client in self._closing and client not in self._evicted
+                    self._closing.discard(client)
+                    break
+                batch = [queue.popleft()]
+                size = len(batch[0])
+                while queue and size + len(queue[0]) <= self.BatchSize:
+                    batch.append(queue.popleft())
+                    size += len(batch[-1])
+                self._counters[client][0] -= size
+                self.Messages -= len(batch)
+                self.Bytes -= size
+                self._sending[client] = monotonic()
+
+            try:
+                client.Send(b''.join(batch))
+            except Exception as err:
+                _Trace.Debug('send failed: %s %s', getattr(client, 'IPAddress', '?'), err)
+                with self._lock:
+                    self._sending.pop(client, None)
+                    self._senders.discard(client)
+                    self._Discard(client)
+                return
+            with self._lock:
+                self._sending.pop(client, None)
+
+        if close:
+            client.Disconnect()
 
 
 # Logging Implementations -----------------------------------------------------
@@ -309,6 +983,14 @@ class TcpServerLogger:
         or ``'AVLAN'``)
     end: str
         The terminator for each log record sent to clients. Defaults to '\\n'.
+    highWater: int
+        Maximum number of bytes to queue for a client that is not keeping up. The oldest records
+        are dropped beyond this. Defaults to 64 KB.
+
+    Records are queued for each client with a :py:class:`ClientSendQueue`, so a stalled client
+    does not delay the caller or the other clients. Assign client disconnect handlers to
+    :py:attr:`Disconnected` rather than to ``server.Disconnected``, which the logger uses to
+    discard the client's queue.
 
     Example
     -------
@@ -319,9 +1001,13 @@ class TcpServerLogger:
         logger.Log('This is', 'a', msg)
     """
 
-    def __init__(self, IPPort, Interface='Any', end='\n'):
+    def __init__(self, IPPort, Interface='Any', end='\n', highWater=64*1024):
         self.end = end
+        self.queue = ClientSendQueue(highWater=highWater)
         self.server = EthernetServerInterfaceEx(IPPort, Interface=Interface)
+        # A handler already on the server is chained, not replaced.
+        self._disconnected = self.server.Disconnected
+        self.server.Disconnected = self._ClientDisconnected
         self.server.StartListen()
 
     def Log(self, *recordobjs, sep=' ', severity='info'):
@@ -338,8 +1024,24 @@ class TcpServerLogger:
             User defined indicator of attention suggested (e.g. 'error', 'info', 'warning').
         """
         msg = severity + ': ' + sep.join(str(obj) for obj in recordobjs) + self.end
-        for client in self.server.Clients:
-            client.Send(msg)
+        self.queue.Broadcast(self.server.Clients, msg)
+
+    @property
+    def Disconnected(self):
+        r"""``Event:`` Triggers when a client disconnects, after its queued records are
+        discarded. The callback receives the ClientObject and the string 'Disconnected'."""
+        return self._disconnected
+
+    @Disconnected.setter
+    def Disconnected(self, handler):
+        if handler is not None and not callable(handler):
+            raise TypeError("'handler' is not callable")
+        self._disconnected = handler
+
+    def _ClientDisconnected(self, client, state):
+        self.queue.Remove(client)
+        if self._disconnected is not None:
+            self._disconnected(client, state)
 
     @property
     def IPPort(self):
@@ -377,3 +1079,159 @@ class TraceLogger:
             logger.Log('This is', 'a', msg)
         """
         print(severity + ': ' + sep.join(str(obj) for obj in recordobjs))
+
+
+# Buffered Logging ------------------------------------------------------------
+
+
+# Severity names understood by BufferedLogger. Other severities are treated as 'info'.
+SEVERITY_LEVELS = {
+    'trace': 5,
+    'debug': 10,
+    'info': 20,
+    'warning': 30,
+    'error': 40,
+    'critical': 50,
+}
+
+
+class BufferedLogger:
+    r"""Implements a logger that queues log records and writes them to other loggers from a
+    background thread.
+
+    :py:meth:`Log` only compares the record's severity to :py:attr:`Level` and appends the
+    unformatted record objects to a ring buffer, so it is cheap enough to call on routing and
+    feedback paths. Filtered records are never converted to strings. Every FlushInterval seconds
+    the background thread formats the buffered records once and passes them to each sink.
+
+    Parameters
+    ----------
+    Sinks: objects
+        One or more loggers (:py:class:`ProgramLogLogger`, :py:class:`TcpServerLogger`,
+        :py:class:`TraceLogger` or anything with a compatible Log method) that receive the
+        formatted records.
+    Level: str
+        Minimum severity to keep, one of the keys of ``SEVERITY_LEVELS``. Defaults to 'info'.
+    Capacity: int
+        Number of records held between flushes. When the buffer is full the oldest record is
+        dropped and counted. Defaults to 1024.
+    FlushInterval: float
+        Seconds between flushes. Defaults to 0.2.
+
+    Records hold references to the objects passed to :py:meth:`Log` until they are flushed, so
+    pass immutable values (or copies) if the object may change in the meantime.
+
+    Example
+    -------
+    ::
+
+        logger = BufferedLogger(TraceLogger(), TcpServerLogger(5000), Level='debug')
+        logger.Log('Routing input', 3, 'to output', 4, severity='debug')
+    """
+
+    def __init__(self, *Sinks, Level='info', Capacity=1024, FlushInterval=0.2):
+        if not Sinks:
+            raise ValueError('At least one sink is required.')
+        self._sinks = Sinks
+        self._capacity = Capacity
+        self._buffer = deque(maxlen=Capacity)
+        self._interval = FlushInterval
+        self._drain = Lock()
+        self._stop = Event()
+        self.Level = Level
+
+        self._logged = 0
+        self._filtered = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._sinkErrors = 0
+
+        Thread(target=self._Run, daemon=True, name='BufferedLogger').start()
+
+    @property
+    def Level(self):
+        r"""The minimum severity name that is kept. May be changed at any time."""
+        return self._levelName
+
+    @Level.setter
+    def Level(self, value):
+        if value not in SEVERITY_LEVELS:
+            raise ValueError('Level must be one of {}.'.format(', '.join(SEVERITY_LEVELS)))
+        self._levelName = value
+        self._level = SEVERITY_LEVELS[value]
+
+    def IsEnabledFor(self, severity):
+        """Return True if records of this severity are kept.
+
+        Use this to skip building expensive record objects:
+        ::
+
+            if logger.IsEnabledFor('debug'):
+                logger.Log('Matrix', BuildTieTable(), severity='debug')
+        """
+        return SEVERITY_LEVELS.get(severity, 20) >= self._level
+
+    def Log(self, *recordobjs, sep=' ', severity='info'):
+        """Queue recordobjs to be written to the sinks, separated by sep.
+
+        Parameters
+        ----------
+        recordobjs: objects
+            objects to log. They are converted to strings on the background thread.
+        sep: str
+            the separator to add between each recordobj. Defaults to ' '.
+        severity: str
+            One of the keys of ``SEVERITY_LEVELS``. Defaults to 'info'.
+        """
+        if SEVERITY_LEVELS.get(severity, 20) < self._level:
+            self._filtered += 1
+            return
+        buffer = self._buffer
+        if len(buffer) == self._capacity:
+            self._dropped += 1
+        buffer.append((recordobjs, sep, severity))
+        self._logged += 1
+
+    def Flush(self):
+        """Write all buffered records to the sinks now, on the calling thread."""
+        buffer = self._buffer
+        with self._drain:
+            while buffer:
+                try:
+                    recordobjs, sep, severity = buffer.popleft()
+                except IndexError:
+                    break
+                msg = sep.join(str(obj) for obj in recordobjs)
+                for sink in self._sinks:
+                    try:
+                        sink.Log(msg, severity=severity)
+                    except Exception:
+                        self._sinkErrors += 1
+                self._flushed += 1
+
+    def Close(self):
+        """Flush the buffer and stop the background thread."""
+        self._stop.set()
+        self.Flush()
+
+    def GetStats(self):
+        """Return the logger's counters.
+
+        Returns
+        -------
+        dict
+            'Buffered', 'Logged', 'Filtered', 'Dropped', 'Flushed' and 'SinkErrors'.
+        """
+        return {
+            'Buffered': len(self._buffer),
+            'Logged': self._logged,
+            'Filtered': self._filtered,
+            'Dropped': self._dropped,
+            'Flushed': self._flushed,
+            'SinkErrors': self._sinkErrors,
+        }
+
+    def _Run(self):
+        while not self._stop.wait(self._interval):
+            if self._buffer:
+                self.Flush()
@@ -0,0 +1,458 @@
+"""
+Protocol module
+
+Builds the Set, Update and response-matching methods of a Global Scripter Module from a
+declarative description of the device's protocol.
+
+A protocol specification is a dict of command names to command descriptions:
+::
+
+    SPEC = {
+        'Freeze': {
+            'Parameters': {'Output': Range(1, 'OutputSize')},
+            'Value': Table({'On': '1', 'Off': '0'}, Decode={'01': 'On', '00': 'Off'}),
+            'Set': '{Output}*{Value}F',
+            'Update': '{Output}F',
+            'Match': rb'Frz(\\d{2})\\*(00|01)\\r\\n',
+        },
+    }
+
+    FreezeProtocol = Protocol(SPEC)
+
+Command description keys:
+
+    * ``Parameters`` - qualifier parameters, in the order they appear in Match groups. Each is a
+      :py:class:`Range`, :py:class:`Table` or :py:class:`StereoChannel`.
+    * ``Value`` - how the Set value is encoded and the matched value decoded. Omit for commands
+      that take no value.
+    * ``Set`` / ``Update`` - ``str.format`` templates for the command strings. Fields are the
+      parameter names, ``Value`` and the protocol's device Fields.
+    * ``Match`` - response regular expression (bytes).
+    * ``Groups`` - names (parameter names, ``'Value'``, or None to skip) of the Match groups.
+      Defaults to the parameter names followed by ``'Value'``.
+
+Commands are compiled on first use, so importing a device module only records the specification.
+A command's templates and parameters are compiled the first time it is set or updated, and the
+response expressions when the first instance registers its match table. :py:meth:`Protocol.Install`
+adds Set<Command>, Update<Command> and a match callback to the device class, so the module's Set,
+Update, SubscribeStatus and WriteStatus work unchanged. The class provides ``_SetHelper`` and
+``_UpdateHelper`` (usually aliases of its ``__SetHelper`` and ``__UpdateHelper``), ``Discard`` and
+``WriteStatus``.
+"""
+
+import re
+
+__version__ = '1.0.0'
+
+
+def _Bound(bound):
+    # Compile a Range bound to a callable taking the device. Bounds are ints, device attribute
+    # names ('InputSize') or an attribute and dict key ('OutputConstraints.Max').
+    if isinstance(bound, int):
+        return lambda device: bound
+    attr, _, key = bound.partition('.')
+    if key:
+        return lambda device: getattr(device, attr)[key]
+    return lambda device: getattr(device, attr)
+
+
+class _Spec:
+    # Base of the parameter and value descriptions. Subclasses implement EncodeValue and
+    # DecodeValue; the qualifier forms read and write qualifier[Key].
+    Key = None
+
+    def __init__(self, Key=None):
+        self.Key = Key
+
+    def Bind(self, name):
+        self.Name = name
+        if self.Key is None:
+            self.Key = name
+
+    def Encode(self, device, qualifier, fields):
+        try:
+            text = self.EncodeValue(device, qualifier[self.Key])
+        except (KeyError, TypeError):
+            return False
+        if text is None:
+            return False
+        fields[self.Name] = text
+        return True
+
+    def Decode(self, device, text, qualifier):
+        value = self.DecodeValue(device, text)
+        if value is None:
+            return False
+        qualifier[self.Key] = str(value)
+        return True
+
+
+class Range(_Spec):
+    """An integer between Min and Max, inclusive.
+
+    Parameters
+    ----------
+    Min, Max: int or str
+        Limits. A string names a device attribute (``'InputSize'``) or an attribute and dict
+        key (``'ScaledOutputConstraints.Max'``), read on every call.
+    Offset: int
+        Added to the number when encoding. Defaults to 0.
+    MatchOffset: int
+        Added to the matched number when decoding. Defaults to -Offset.
+    Format: str
+        Format of the encoded number. Defaults to ``'{}'``.
+    Base: int
+        Base of the matched number. Defaults to 10.
+    Key: str
+        Qualifier key, when used as a parameter. Defaults to the parameter name.
+    """
+
+    def __init__(self, Min, Max, Offset=0, MatchOffset=None, Format='{}', Base=10, Key=None):
+        super().__init__(Key)
+        self._min = _Bound(Min)
+        self._max = _Bound(Max)
+        self._offset = Offset
+        self._matchOffset = -Offset if MatchOffset is None else MatchOffset
+        self._format = Format.format
+        self._base = Base
+
+    def EncodeValue(self, device, value):
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            return None
+        if self._min(device) <= number <= self._max(device):
+            return self._format(number + self._offset)
+        return None
+
+    def DecodeValue(self, device, text):
+        number = int(text, self._base) + self._matchOffset
+        if self._min(device) <= number <= self._max(device):
+            return number
+        return None
+
+    def Decode(self, device, text, qualifier):
+        # The Match expression already limits qualifiers to what the device reports.
+        qualifier[self.Key] = str(int(text, self._base) + self._matchOffset)
+        return True
+
+
+class Level(_Spec):
+    """A number between Min and Max sent as round(value * Scale), e.g. a gain in tenths of a dB.
+
+    Parameters
+    ----------
+    Min, Max: float
+        Limits of the value.
+    Scale: int
+        Defaults to 10.
+    Format: str
+        Format of the encoded integer. Defaults to ``'{}'``.
+    """
+
+    def __init__(self, Min, Max, Scale=10, Format='{}'):
+        super().__init__()
+        self._min = Min
+        self._max = Max
+        self._scale = Scale
+        self._format = Format.format
+
+    def EncodeValue(self, device, value):
+        try:
+            if self._min <= value <= self._max:
+                return self._format(round(value * self._scale))
+        except TypeError:
+            pass
+        return None
+
+    def DecodeValue(self, device, text):
+        return int(text) / self._scale
+
+
+class Table(_Spec):
+    """A value looked up in a table.
+
+    Parameters
+    ----------
+    Values: dict or str
+        Maps API values to wire values. A string names a device attribute holding the table,
+        for tables that depend on the model.
+    Decode: dict or str
+        Maps matched text to API values. Defaults to the inverse of Values.
+    Upper: bool
+        Upper-case matched text before decoding. Defaults to False.
+    Key: str
+        Qualifier key, when used as a parameter. Defaults to the parameter name.
+    """
+
+    def __init__(self, Values=None, Decode=None, Upper=False, Key=None):
+        super().__init__(Key)
+        if Decode is None and isinstance(Values, dict):
+            Decode = {wire: value for value, wire in Values.items()}
+        self._values = Values
+        self._decode = Decode
+        self._upper = Upper
+
+    @staticmethod
+    def _Lookup(table, device, key):
+        if isinstance(table, str):
+            table = getattr(device, table)
+        return table.get(key)
+
+    def EncodeValue(self, device, value):
+        try:
+            return self._Lookup(self._values, device, value)
+        except TypeError:
+            return None
+
+    def DecodeValue(self, device, text):
+        if self._upper:
+            text = text.upper()
+        return self._Lookup(self._decode, device, text)
+
+    def Decode(self, device, text, qualifier):
+        value = self.DecodeValue(device, text)
+        if value is None:
+            return False
+        qualifier[self.Key] = value
+        return True
+
+
+class StereoChannel(_Spec):
+    """A DSP channel number addressed as a numbered stereo pair and a side.
+
+    Left of pair 1 is channel 0, Right of pair 1 is channel 1, Left of pair 2 is channel 2, and
+    so on.
+
+    Parameters
+    ----------
+    Min, Max: int or str
+        Limits of the pair number, as for :py:class:`Range`.
+    Offset: int
+        Added to the channel number when encoding. Defaults to 0.
+    MatchOffset: int
+        Added to the matched channel number when decoding. Defaults to -Offset.
+    Format: str
+        Format of the encoded channel number. Defaults to ``'{}'``.
+    Key: str
+        Qualifier key of the pair number. Defaults to ``'Output'``.
+    SideKey: str
+        Qualifier key of the side (``'Left'`` or ``'Right'``). Defaults to ``'L/R'``.
+    """
+
+    _Sides = {'Left': 0, 'Right': 1}
+    _SideNames = ('Left', 'Right')
+
+    def __init__(self, Min, Max, Offset=0, MatchOffset=None, Format='{}', Key='Output',
+                 SideKey='L/R'):
+        super().__init__(Key)
+        self._pair = Range(Min, Max)
+        self._offset = Offset
+        self._matchOffset = -Offset if MatchOffset is None else MatchOffset
+        self._format = Format.format
+        self._sideKey = SideKey
+
+    def Encode(self, device, qualifier, fields):
+        try:
+            side = self._Sides[qualifier[self._sideKey]]
+            pair = int(qualifier[self.Key])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if self._pair.EncodeValue(device, pair) is None:
+            return False
+        fields[self.Name] = self._format(pair * 2 - 2 + side + self._offset)
+        return True
+
+    def Decode(self, device, text, qualifier):
+        channel = int(text) + self._matchOffset
+        qualifier[self._sideKey] = self._SideNames[channel % 2]
+        qualifier[self.Key] = str(channel // 2 + 1)
+        return True
+
+
+class _Command:
+    # One compiled command description.
+
+    def __init__(self, name, spec, fields, flags):
+        self.Name = name
+        self.Parameters = tuple(spec.get('Parameters', {}).items())
+        for pname, param in self.Parameters:
+            param.Bind(pname)
+        self.Value = spec.get('Value')
+        if self.Value is not None:
+            self.Value.Bind('Value')
+        self.Fields = fields
+
+        self.SetTemplate = spec.get('Set')
+        self.UpdateTemplate = spec.get('Update')
+
+        match = spec.get('Match')
+        self.Regex = re.compile(match, flags) if match is not None else None
+        groups = spec.get('Groups')
+        if groups is None:
+            groups = tuple(pname for pname, _ in self.Parameters) + ('Value',)
+        specs = dict(self.Parameters)
+        specs['Value'] = self.Value
+        self.Groups = tuple((index, specs[gname])
+                            for index, gname in enumerate(groups, 1) if gname is not None)
+
+    def _Fields(self, device, qualifier):
+        fields = {key: getattr(device, attr) for key, attr in self.Fields}
+        for _, param in self.Parameters:
+            if not param.Encode(device, qualifier, fields):
+                return None
+        return fields
+
+    def EncodeSet(self, device, value, qualifier):
+        fields = self._Fields(device, qualifier)
+        if fields is None:
+            return None
+        if self.Value is not None:
+            text = self.Value.EncodeValue(device, value)
+            if text is None:
+                return None
+            fields['Value'] = text
+        return self.SetTemplate.format_map(fields)
+
+    def EncodeUpdate(self, device, qualifier):
+        fields = self._Fields(device, qualifier)
+        if fields is None:
+            return None
+        return self.UpdateTemplate.format_map(fields)
+
+    def Decode(self, device, match):
+        qualifier = {}
+        value = None
+        for index, spec in self.Groups:
+            text = match.group(index).decode()
+            if spec is self.Value:
+                value = spec.DecodeValue(device, text)
+                if value is None:
+                    return None
+            elif not spec.Decode(device, text, qualifier):
+                return None
+        return value, qualifier or None
+
+
+def _MakeSet(protocol, name):
+    command = None
+
+    def Set(self, value, qualifier):
+        nonlocal command
+        if command is None:
+            command = protocol.Command(name)
+        commandstring = command.EncodeSet(self, value, qualifier)
+        if commandstring is None:
+            self.Discard('Invalid Command for Set' + name)
+        else:
+            self._SetHelper(name, commandstring, value, qualifier)
+
+    Set.__name__ = Set.__qualname__ = 'Set' + name
+    return Set
+
+
+def _MakeUpdate(protocol, name):
+    command = None
+
+    def Update(self, value, qualifier):
+        nonlocal command
+        if command is None:
+            command = protocol.Command(name)
+        commandstring = command.EncodeUpdate(self, qualifier)
+        if commandstring is None:
+            self.Discard('Invalid Command for Update' + name)
+        else:
+            self._UpdateHelper(name, commandstring, value, qualifier)
+
+    Update.__name__ = Update.__qualname__ = 'Update' + name
+    return Update
+
+
+def _MatchProtocolCommand(self, match, command):
+    decoded = command.Decode(self, match)
+    if decoded is not None:
+        self.WriteStatus(command.Name, *decoded)
+
+
+class Protocol:
+    """A compiled protocol specification.
+
+    Parameters
+    ----------
+    Spec: dict
+        Command names mapped to command descriptions (see the module documentation).
+    Fields: dict
+        Extra template fields read from device attributes on every call, e.g.
+        ``{'id': '_DeviceID'}``.
+    Flags: int
+        ``re`` flags used to compile every Match. Defaults to 0.
+    """
+
+    def __init__(self, Spec, Fields=None, Flags=0):
+        self.Spec = Spec
+        self._fields = tuple((Fields or {}).items())
+        self._flags = Flags
+        self._compiled = {}
+        self._matches = None
+
+    def Command(self, Name):
+        """Return the compiled command, compiling it on first use.
+
+        Raises
+        ------
+        KeyError
+            If the specification has no command Name.
+        """
+        command = self._compiled.get(Name)
+        if command is None:
+            command = _Command(Name, self.Spec[Name], self._fields, self._flags)
+            self._compiled[Name] = command
+        return command
+
+    @property
+    def Commands(self):
+        """All commands, compiled. Prefer :py:meth:`Command` for single lookups."""
+        return {name: self.Command(name) for name in self.Spec}
+
+    def _Matches(self):
+        if self._matches is None:
+            self._matches = tuple(self.Command(name) for name, spec in self.Spec.items()
+                                  if spec.get('Match') is not None)
+        return self._matches
+
+    def Install(self, cls):
+        """Add Set<Command>, Update<Command> and the match callback to a device class.
+
+        Raises
+        ------
+        ValueError
+            If the class already defines one of the methods.
+        """
+        methods = {'_MatchProtocolCommand': _MatchProtocolCommand}
+        for name, spec in self.Spec.items():
+            if spec.get('Set') is not None:
+                methods['Set' + name] = _MakeSet(self, name)
+            if spec.get('Update') is not None:
+                methods['Update' + name] = _MakeUpdate(self, name)
+
+        for name, method in methods.items():
+            if name in cls.__dict__:
+                raise ValueError('{} already defines {}.'.format(cls.__name__, name))
+            method.__qualname__ = '{}.{}'.format(cls.__qualname__, name)
+            method.__module__ = cls.__module__
+            setattr(cls, name, method)
+        return cls
+
+    def MatchTable(self):
+        """Return (compiled expression, function, command) entries for modules that keep one
+        response table shared by all their instances. The function is called as
+        function(device, match, command)."""
+        return tuple((command.Regex, _MatchProtocolCommand, command)
+                     for command in self._Matches())
+
+    def AddMatchStrings(self, device):
+        """Register the precompiled response expressions with a device instance's
+        AddMatchString."""
+        callback = device._MatchProtocolCommand
+        for command in self._Matches():
+            device.AddMatchString(command.Regex, callback, command)
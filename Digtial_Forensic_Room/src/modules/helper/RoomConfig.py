@@ -0,0 +1,383 @@
+"""
+Room Config module
+
+Reads room definitions from a rooms file or from a ``rooms`` list added to the project JSON. A
+room declares its devices and their connection handler settings, its router maps and its panel
+bindings. The file is validated when it is loaded, and the result is kept in a compiled,
+read-only form. Later loads of an unchanged file return the same objects without reading it
+again.
+::
+
+    import modules.helper.RoomConfig as RoomConfig
+
+    for room in RoomConfig.Load():
+        devices = room.DefineDevices()
+        ...
+
+Rooms file layout (keys not listed are rejected):
+::
+
+    {
+        "rooms": [
+            {
+                "name": "Digital Forensic Room",
+                "panel": "PrimaryTouchpanel",
+                "devices": {
+                    "switcher01": {
+                        "driver": "DTP CrossPoint",       # DeviceRegistry driver name
+                        "class": "SSHClass",
+                        "args": ["192.168.1.12", 22023],  # optional
+                        "kwargs": {"Model": "DTP CrossPoint 84 4K IPCP SA"},  # optional
+                        "handler": {"keepAliveQuery": "ExecutiveMode"}  # optional
+                    }
+                },
+                "buttons": {"Start": 8000, "Shutdown": 8022,
+                            "ShutdownConfirm": 9028, "ShutdownCancel": 9029},
+                "displays": [{"device": "display01", "power_on": 8112, "power_off": 8113}],
+                "router": {"switcher": "switcher01", "default_input": 1,
+                           "sources": [[2, 1], [8, 0]],       # [button ID, input]
+                           "destinations": [[9, 3]]}          # [button ID, output]
+            }
+        ]
+    }
+
+Lists in ``args`` and ``kwargs`` are passed to the driver as tuples. ``handler`` holds
+``GetConnectionHandler`` keyword arguments; its ``keepAliveQuery`` must name an Update function
+of the driver class. Checking it imports the driver, which only records its protocol tables, so
+devices are still built by :py:func:`DeviceRegistry.BuildAll`.
+"""
+
+import json
+import os
+from inspect import signature
+from threading import Lock
+from types import MappingProxyType
+
+from modules.helper.ConnectionHandler import GetConnectionHandler
+import modules.helper.DeviceRegistry as DeviceRegistry
+
+__version__ = '1.0.0'
+
+
+# Buttons every room must bind
+ROOM_BUTTONS = ('Start', 'Shutdown', 'ShutdownConfirm', 'ShutdownCancel')
+
+_RoomKeys = {'name', 'panel', 'devices', 'buttons', 'displays', 'router'}
+_DeviceKeys = {'driver', 'class', 'args', 'kwargs', 'handler'}
+_DisplayKeys = {'device', 'power_on', 'power_off'}
+_RouterKeys = {'switcher', 'default_input', 'sources', 'destinations'}
+# GetConnectionHandler arguments a rooms file may set; the interface and the poll scheduler are
+# supplied by the program.
+_HandlerKeys = set(signature(GetConnectionHandler).parameters) - {'Interface', 'pollScheduler'}
+
+# absolute path: ((modification time, size), rooms)
+_cache = {}
+
+_lock = Lock()
+
+
+class ConfigError(ValueError):
+    """A rooms file that can not be used. The message names the offending entry, e.g.
+    ``rooms[0].devices.display01: 'driver' is required``."""
+
+
+def DefaultPath():
+    """Return the path of ``rooms.json`` next to ``main.py``."""
+    src = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(src, 'rooms.json')
+
+
+def Load(Path=None):
+    """Load, validate and compile the rooms in Path.
+
+    Parameters
+    ----------
+    Path: str
+        A rooms file or a project JSON with a ``rooms`` list. Defaults to :py:func:`DefaultPath`.
+
+    Returns
+    -------
+    tuple
+        :py:class:`RoomSpec` objects in file order. The same tuple is returned until the file
+        changes.
+
+    Raises
+    ------
+    ConfigError
+        If the file is not valid JSON or does not describe valid rooms.
+    """
+    path = os.path.abspath(Path or DefaultPath())
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with open(path, encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except ValueError as err:
+                raise ConfigError('{}: {}'.format(path, err)) from None
+        rooms = Compile(data)
+        _cache[path] = (version, rooms)
+    return rooms
+
+
+def Compile(Data):
+    """Validate and compile already parsed rooms data. :py:func:`Load` calls this.
+
+    Returns
+    -------
+    tuple
+        :py:class:`RoomSpec` objects.
+
+    Raises
+    ------
+    ConfigError
+    """
+    _Check(isinstance(Data, dict), 'file', 'must be a JSON object')
+    entries = Data.get('rooms')
+    _Check(isinstance(entries, list) and entries, 'rooms', 'must be a non-empty list')
+
+    # A project JSON also lists the processor and panels; panels must be among them.
+    aliases = {device.get('alias') for device in Data.get('devices', ())
+               if isinstance(device, dict)}
+
+    rooms = []
+    names = set()
+    for index, entry in enumerate(entries):
+        where = 'rooms[{}]'.format(index)
+        room = _CompileRoom(entry, where)
+        _Check(room.Name not in names, where, 'duplicate room name {!r}'.format(room.Name))
+        _Check(not aliases or room.Panel in aliases, where + '.panel',
+               '{!r} is not a device alias in the project'.format(room.Panel))
+        names.add(room.Name)
+        rooms.append(room)
+    return tuple(rooms)
+
+
+def _Check(condition, where, message):
+    if not condition:
+        raise ConfigError('{}: {}'.format(where, message))
+
+
+def _Keys(entry, where, allowed, required):
+    _Check(isinstance(entry, dict), where, 'must be an object')
+    unknown = sorted(set(entry) - allowed)
+    _Check(not unknown, where, 'unknown keys {}'.format(', '.join(map(repr, unknown))))
+    for key in required:
+        _Check(key in entry, where, '{!r} is required'.format(key))
+
+
+def _String(value, where):
+    _Check(isinstance(value, str) and value, where, 'must be a non-empty string')
+    return value
+
+
+def _Number(value, where, minimum=0):
+    _Check(isinstance(value, int) and not isinstance(value, bool) and value >= minimum, where,
+           'must be an integer of at least {}'.format(minimum))
+    return value
+
+
+def _Freeze(value):
+    if isinstance(value, list):
+        return tuple(_Freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _Freeze(item) for key, item in value.items()})
+    return value
+
+
+def _CompileDevice(name, entry, where):
+    _Keys(entry, where, _DeviceKeys, ('driver', 'class'))
+    driver = _String(entry['driver'], where + '.driver')
+    _Check(driver in DeviceRegistry.DRIVERS or '.' in driver, where + '.driver',
+           'unknown driver {!r}'.format(driver))
+    args = entry.get('args', [])
+    _Check(isinstance(args, list), where + '.args', 'must be a list')
+    kwargs = entry.get('kwargs', {})
+    _Check(isinstance(kwargs, dict), where + '.kwargs', 'must be an object')
+    className = _String(entry['class'], where + '.class')
+    cls = _DriverClass(driver, className, where)
+    handler = entry.get('handler')
+    if handler is not None:
+        _CompileHandler(handler, cls, where + '.handler')
+    return DeviceSpec(name, driver, className, _Freeze(args), _Freeze(kwargs),
+                      None if handler is None else _Freeze(handler))
+
+
+def _DriverClass(driver, className, where):
+    try:
+        module = DeviceRegistry.GetDriver(driver)
+    except ImportError as err:
+        raise ConfigError('{}.driver: can not import {!r}: {}'.format(where, driver, err)) from None
+    cls = getattr(module, className, None)
+    _Check(isinstance(cls, type), where + '.class',
+           '{!r} has no class {!r}'.format(driver, className))
+    return cls
+
+
+def _CompileHandler(handler, cls, where):
+    _Keys(handler, where, _HandlerKeys, ())
+    query = handler.get('keepAliveQuery')
+    if query is not None:
+        _String(query, where + '.keepAliveQuery')
+        _Check(callable(getattr(cls, 'Update' + query, None)), where + '.keepAliveQuery',
+               '{} has no Update{}'.format(cls.__name__, query))
+    qualifier = handler.get('keepAliveQueryQualifier')
+    _Check(qualifier is None or isinstance(qualifier, dict), where + '.keepAliveQueryQualifier',
+           'must be an object')
+    for key in ('DisconnectLimit', 'pollFrequency', 'connectRetryTime', 'serverTimeout',
+                'offlineQueueExpiry'):
+        value = handler.get(key)
+        _Check(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)
+                                 and value > 0), '{}.{}'.format(where, key),
+               'must be a positive number')
+
+
+def _CompileMap(entries, where, ids):
+    _Check(isinstance(entries, list), where, 'must be a list of [button ID, number] pairs')
+    pairs = []
+    for index, pair in enumerate(entries):
+        at = '{}[{}]'.format(where, index)
+        _Check(isinstance(pair, list) and len(pair) == 2, at, 'must be [button ID, number]')
+        ids.append((_Number(pair[0], at, 1), at))
+        pairs.append((pair[0], _Number(pair[1], at)))
+    return tuple(pairs)
+
+
+def _CompileRoom(entry, where):
+    _Keys(entry, where, _RoomKeys, _RoomKeys - {'displays'})
+    name = _String(entry['name'], where + '.name')
+    panel = _String(entry['panel'], where + '.panel')
+
+    devices = entry['devices']
+    _Check(isinstance(devices, dict) and devices, where + '.devices',
+           'must be a non-empty object')
+    devices = tuple(_CompileDevice(dname, dentry, '{}.devices.{}'.format(where, dname))
+                    for dname, dentry in devices.items())
+    deviceNames = {device.Name for device in devices}
+
+    # (button ID, where) of every binding, to find IDs bound twice
+    ids = []
+
+    buttons = entry['buttons']
+    _Check(isinstance(buttons, dict), where + '.buttons', 'must be an object')
+    for bname in ROOM_BUTTONS:
+        _Check(bname in buttons, where + '.buttons', '{!r} is required'.format(bname))
+    for bname, bid in buttons.items():
+        at = '{}.buttons.{}'.format(where, bname)
+        ids.append((_Number(bid, at, 1), at))
+
+    displays = []
+    entries = entry.get('displays', [])
+    _Check(isinstance(entries, list), where + '.displays', 'must be a list')
+    for index, display in enumerate(entries):
+        at = '{}.displays[{}]'.format(where, index)
+        _Keys(display, at, _DisplayKeys, _DisplayKeys)
+        _Check(display['device'] in deviceNames, at + '.device',
+               'no device named {!r}'.format(display['device']))
+        for key in ('power_on', 'power_off'):
+            keyAt = '{}.{}'.format(at, key)
+            ids.append((_Number(display[key], keyAt, 1), keyAt))
+        displays.append(DisplaySpec(display['device'], display['power_on'],
+                                    display['power_off']))
+
+    router = entry['router']
+    at = where + '.router'
+    _Keys(router, at, _RouterKeys, _RouterKeys)
+    _Check(router['switcher'] in deviceNames, at + '.switcher',
+           'no device named {!r}'.format(router['switcher']))
+    router = RouterSpec(router['switcher'],
+                        _Number(router['default_input'], at + '.default_input'),
+                        _CompileMap(router['sources'], at + '.sources', ids),
+                        _CompileMap(router['destinations'], at + '.destinations', ids))
+
+    seen = {}
+    for bid, at in ids:
+        _Check(bid not in seen, at, 'button ID {} is also bound at {}'.format(bid, seen.get(bid)))
+        seen[bid] = at
+
+    return RoomSpec(name, panel, devices, MappingProxyType(dict(buttons)), tuple(displays),
+                    router)
+
+
+class DeviceSpec:
+    """A compiled device entry."""
+
+    def __init__(self, Name, Driver, Class, Args, Kwargs, Handler):
+        self.Name = Name
+        self.Driver = Driver
+        self.Class = Class
+        self.Args = Args
+        self.Kwargs = Kwargs
+        self.Handler = Handler
+
+    def Define(self, **HandlerOptions):
+        """Define the device with :py:func:`DeviceRegistry.Define` and return the
+        :py:class:`DeviceRegistry.LazyDevice`.
+
+        Parameters
+        ----------
+        HandlerOptions
+            Extra ``GetConnectionHandler`` keyword arguments, such as ``pollScheduler``, used if
+            the device has a connection handler.
+        """
+        handler = None
+        if self.Handler is not None:
+            handler = dict(self.Handler)
+            handler.update(HandlerOptions)
+        return DeviceRegistry.Define(self.Driver, self.Class, *self.Args, Handler=handler,
+                                     **self.Kwargs)
+
+
+class DisplaySpec:
+    """A display and the IDs of its power buttons."""
+
+    def __init__(self, Device, PowerOn, PowerOff):
+        self.Device = Device
+        self.PowerOn = PowerOn
+        self.PowerOff = PowerOff
+
+
+class RouterSpec:
+    """The switcher a room routes with and its (button ID, input) and (button ID, output)
+    maps. Input 0 clears an output."""
+
+    def __init__(self, Switcher, DefaultInput, Sources, Destinations):
+        self.Switcher = Switcher
+        self.DefaultInput = DefaultInput
+        self.Sources = Sources
+        self.Destinations = Destinations
+
+
+class RoomSpec:
+    """A compiled room. Rooms returned by :py:func:`Load` are shared and must not be changed."""
+
+    def __init__(self, Name, Panel, Devices, Buttons, Displays, Router):
+        self.Name = Name
+        self.Panel = Panel
+        self.Devices = Devices
+        self.Buttons = Buttons
+        self.Displays = Displays
+        self.Router = Router
+
+    def DefineDevices(self, **HandlerOptions):
+        """Define every device of the room with :py:mod:`DeviceRegistry`.
+
+        Parameters
+        ----------
+        HandlerOptions
+            Passed to :py:meth:`DeviceSpec.Define`.
+
+        Returns
+        -------
+        dict
+            Device names mapped to :py:class:`DeviceRegistry.LazyDevice` objects.
+        """
+        return {device.Name: device.Define(**HandlerOptions) for device in self.Devices}
@@ -0,0 +1,396 @@
+"""
+Status Snapshot module
+
+Keeps the status stores of device modules on local storage, so a restarted program starts from
+the last known state instead of an empty one.
+
+A device module keeps every status it has received in ``Commands[command]['Status']``. After a
+reboot or a program reload those stores are empty, and the panel shows nothing until the
+keep alive polls and the first refreshes have rebuilt them. :py:class:`StatusSnapshot` mirrors
+the stores of the devices it tracks and writes them, behind the program, to a small compressed
+file whenever they have changed. At the next start the saved values are put back into the
+stores as *provisional* values before the devices connect, so :py:meth:`ReadStatus` answers at
+once. The first time the device reports a provisional status it is confirmed, or corrected and
+its subscribers told; :py:meth:`StatusSnapshot.IsProvisional` tells which statuses are still
+waiting, so start-up queries can be limited to the state that needs checking:
+::
+
+    from modules.helper.StatusSnapshot import StatusSnapshot
+
+    snapshot = StatusSnapshot()
+    DeviceRegistry.BuildAll()
+    snapshot.Track('Room 1/switcher01', switcher01, Attributes=('matrix_tie_status',))
+    snapshot.Track('Room 1/display01', display01)
+    if not snapshot.IsProvisional('Room 1/display01', 'Power'):
+        display01.Update('Power')
+
+Only status changes reach the mirror (the module's ``NewStatus``), so the stores are walked
+once, when a device is tracked, and never on a write. ``ConnectionStatus`` is not kept.
+"""
+
+import json
+import os
+import zlib
+from threading import Lock
+from time import monotonic
+
+from extronlib.system import Timer
+
+import modules.helper.ConnectionHandler as ConnectionHandler
+import modules.helper.DeviceRegistry as DeviceRegistry
+from modules.helper.Trace import GetChannel
+from modules.helper.Watchdog import Watch
+
+__version__ = '1.0.0'
+
+
+_Trace = GetChannel(__name__)
+
+# File header; the rest of the file is zlib-compressed JSON
+_Magic = b'STSNAP\x01'
+
+# Statuses that describe this program's connection rather than the device
+_Skipped = frozenset({'ConnectionStatus'})
+
+_Missing = object()
+
+
+def DefaultPath():
+    """Return the path of ``status.snap`` next to ``main.py``."""
+    src = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(src, 'status.snap')
+
+
+def Encode(Devices):
+    """Return Devices in the snapshot file format.
+
+    Parameters
+    ----------
+    Devices: dict
+        Device name: ``{'Status': [[command, [qualifier values], value], ...],
+        'Attributes': {name: value}}``. Values must be JSON types.
+
+    Returns
+    -------
+    bytes
+    """
+    body = json.dumps(Devices, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return _Magic + zlib.compress(body, 6)
+
+
+def Decode(Data):
+    """Return the devices stored in a snapshot file's contents. See :py:func:`Encode`.
+
+    Raises
+    ------
+    ValueError
+        If Data is not a snapshot.
+    """
+    if not Data.startswith(_Magic):
+        raise ValueError('Not a status snapshot.')
+    try:
+        return json.loads(zlib.decompress(Data[len(_Magic):]).decode('utf-8'))
+    except (zlib.error, UnicodeDecodeError) as err:
+        raise ValueError('Damaged status snapshot: {}'.format(err)) from None
+
+
+def _Module(Device):
+    # The Global Scripter Module whose status store is kept: the device itself, or the module
+    # behind a LazyDevice or connection handler.
+    if isinstance(Device, DeviceRegistry.LazyDevice):
+        Device = Device.Device
+    if isinstance(Device, (ConnectionHandler.ConnectionHandler,
+                           ConnectionHandler.ServerExHandler)):
+        Device = Device.Interface
+    if not isinstance(getattr(Device, 'Commands', None), dict):
+        raise TypeError('{!r} has no status store.'.format(Device))
+    return Device
+
+
+def _Path(commands, command, qualifier):
+    # The qualifier values that locate a status in its command's store, or None if the status
+    # is not stored.
+    if command in _Skipped or command not in commands:
+        return None
+    if not qualifier:
+        return ()
+    try:
+        return tuple(qualifier[parameter]
+                     for parameter in commands[command].get('Parameters', ()))
+    except KeyError:
+        return None
+
+
+def _Flatten(commands):
+    # Yields ((command, path), value) for every status in a module's store.
+    for command, spec in commands.items():
+        if command in _Skipped:
+            continue
+        depth = len(spec.get('Parameters', ()))
+        nodes = [((), spec.get('Status', {}))]
+        while nodes:
+            path, node = nodes.pop()
+            if len(path) == depth:
+                if 'Live' in node:
+                    yield (command, path), node['Live']
+                continue
+            for key, child in node.items():
+                if isinstance(child, dict):
+                    nodes.append((path + (key,), child))
+
+
+def _Jsonable(value):
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+class _Tracked:
+    # One tracked module: its mirror of the store and its provisional statuses.
+
+    def __init__(self, name, module, attributes):
+        self.Name = name
+        self.Module = module
+        self.Attributes = attributes
+        # The module's own WriteStatus instance attribute, such as a connection
+        # handler's hook, put back once no statuses are provisional
+        self.WriteStatus = None
+        # (command, path): value
+        self.Mirror = {}
+        # (command, path): restored value, until the device reports the status
+        self.Provisional = {}
+
+
+class StatusSnapshot:
+    """Mirrors the status stores of tracked devices and writes them to Path when they change.
+
+    The saved snapshot is read when the object is created and restored into each device as it
+    is tracked.
+
+    Parameters
+    ----------
+    Path: str
+        The snapshot file. Defaults to :py:func:`DefaultPath`.
+    Interval: float
+        Seconds between checks for changes to write.
+    ConfirmTimeout: float
+        Seconds after which a provisional status the device has not reported is no longer
+        waited for. Its value is kept.
+    """
+
+    def __init__(self, Path=None, Interval=30.0, ConfirmTimeout=300.0):
+        self.Path = Path or DefaultPath()
+        self.ConfirmTimeout = ConfirmTimeout
+        self._started = monotonic()
+        self._lock = Lock()
+        self._dirty = False
+        # device name: _Tracked
+        self._devices = {}
+
+        self.Restored = 0
+        self.Confirmed = 0
+        self.Corrected = 0
+        self.Expired = 0
+        self.Writes = 0
+
+        self._saved = {}
+        try:
+            with open(self.Path, 'rb') as f:
+                self._saved = Decode(f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as err:
+            _Trace.Warning('Ignoring %s: %s', self.Path, err)
+
+        self._timer = Timer(Interval, Watch(self._Tick))
+
+    def Track(self, Name, Device, Attributes=()):
+        """Restore Device's saved statuses as provisional values and keep its status store from
+        now on.
+
+        Parameters
+        ----------
+        Name: str
+            A name for the device that stays the same across restarts, such as
+            ``'Room 1/switcher01'``.
+        Device: object
+            A Global Scripter Module, or a connection handler or LazyDevice of one.
+        Attributes: tuple
+            Names of other module attributes to keep, such as ``'matrix_tie_status'``. A saved
+            attribute is restored if the module does not have it yet.
+
+        Returns
+        -------
+        int
+            The number of statuses restored.
+        """
+        module = _Module(Device)
+        if Name in self._devices:
+            raise ValueError('{} is already tracked.'.format(Name))
+        tracked = _Tracked(Name, module, tuple(Attributes))
+
+        saved = self._saved.pop(Name, {})
+        for command, path, value in saved.get('Status', ()):
+            self._Restore(tracked, command, tuple(path), value)
+        for attribute, value in saved.get('Attributes', {}).items():
+            if attribute in tracked.Attributes and getattr(module, attribute, None) is None:
+                setattr(module, attribute, value)
+
+        tracked.Mirror.update(_Flatten(module.Commands))
+        self._Intercept(tracked)
+        with self._lock:
+            self._devices[Name] = tracked
+        self.Restored += len(tracked.Provisional)
+        _Trace.Debug('Tracking %s: %d statuses restored', Name, len(tracked.Provisional))
+        return len(tracked.Provisional)
+
+    def _Restore(self, tracked, command, path, value):
+        spec = tracked.Module.Commands.get(command)
+        if spec is None or command in _Skipped or len(path) != len(spec.get('Parameters', ())):
+            return
+        node = spec.setdefault('Status', {})
+        for key in path:
+            node = node.setdefault(key, {})
+        # A status the device reported before it was tracked is already current.
+        if 'Live' not in node:
+            node['Live'] = value
+            tracked.Provisional[(command, path)] = value
+
+    def _Intercept(self, tracked):
+        # NewStatus sees every change and keeps the mirror; WriteStatus sees every report and,
+        # while statuses are provisional, confirms them. Both are instance attributes, so the
+        # module's own calls go through them.
+        module = tracked.Module
+        commands = module.Commands
+        mirror = tracked.Mirror
+        newStatus = module.NewStatus
+
+        def NewStatus(command, value, qualifier):
+            path = _Path(commands, command, qualifier)
+            if path is not None:
+                with self._lock:
+                    mirror[(command, path)] = value
+                    self._dirty = True
+            newStatus(command, value, qualifier)
+
+        module.NewStatus = NewStatus
+        if not tracked.Provisional:
+            return
+
+        provisional = tracked.Provisional
+        writeStatus = module.WriteStatus
+        tracked.WriteStatus = module.__dict__.get('WriteStatus')
+
+        def WriteStatus(command, value, qualifier=None):
+            # pop, not a test and pop: the timer may expire the provisional statuses meanwhile.
+            restored = provisional.pop((command, _Path(commands, command, qualifier)), _Missing)
+            if restored is not _Missing:
+                if restored == value:
+                    self.Confirmed += 1
+                else:
+                    self.Corrected += 1
+                    _Trace.Info('%s: %s corrected to %r', tracked.Name, command, value)
+                if not provisional:
+                    self._Settled(tracked)
+            writeStatus(command, value, qualifier)
+
+        module.WriteStatus = WriteStatus
+
+    def _Settled(self, tracked):
+        # No provisional statuses are left: the module's own WriteStatus is used again.
+        if tracked.WriteStatus is None:
+            tracked.Module.__dict__.pop('WriteStatus', None)
+        else:
+            tracked.Module.WriteStatus = tracked.WriteStatus
+        _Trace.Debug('%s: all restored statuses checked', tracked.Name)
+
+    def IsProvisional(self, Name, Command, Qualifier=None):
+        """Return True if the status is a restored value the device has not reported yet.
+
+        Parameters
+        ----------
+        Name: str
+            The name the device was tracked under.
+        Command: str
+        Qualifier: dict
+        """
+        tracked = self._devices[Name]
+        return (Command, _Path(tracked.Module.Commands, Command, Qualifier)) in tracked.Provisional
+
+    def GetProvisional(self, Name):
+        """Return the (command, qualifier) pairs of Name's statuses still waiting to be
+        reported.
+
+        Returns
+        -------
+        list
+        """
+        tracked = self._devices[Name]
+        commands = tracked.Module.Commands
+        result = []
+        for command, path in list(tracked.Provisional):
+            parameters = commands[command].get('Parameters', ())
+            result.append((command, dict(zip(parameters, path)) if path else None))
+        return result
+
+    def GetStats(self):
+        """Return the numbers of statuses restored, confirmed, corrected and expired, statuses
+        still provisional, and snapshot files written.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            'Restored': self.Restored,
+            'Confirmed': self.Confirmed,
+            'Corrected': self.Corrected,
+            'Expired': self.Expired,
+            'Provisional': sum(len(tracked.Provisional)
+                               for tracked in list(self._devices.values())),
+            'Writes': self.Writes,
+        }
+
+    def Save(self):
+        """Write the snapshot now."""
+        with self._lock:
+            self._dirty = False
+            devices = {name: {'Status': [[command, list(path), value]
+                                         for (command, path), value in tracked.Mirror.items()
+                                         if _Jsonable(value)]}
+                       for name, tracked in self._devices.items()}
+        for name, tracked in list(self._devices.items()):
+            attributes = {}
+            for attribute in tracked.Attributes:
+                value = getattr(tracked.Module, attribute, None)
+                if value is not None and _Jsonable(value):
+                    attributes[attribute] = value
+            if attributes:
+                devices[name]['Attributes'] = attributes
+
+        data = Encode(devices)
+        temporary = self.Path + '.tmp'
+        try:
+            with open(temporary, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, self.Path)
+        except OSError as err:
+            self._dirty = True
+            _Trace.Warning('Could not write %s: %s', self.Path, err)
+            return
+        self.Writes += 1
+        _Trace.Debug('Wrote %s: %d bytes', self.Path, len(data))
+
+    def _Tick(self, timer, count):
+        if self.ConfirmTimeout is not None and monotonic() - self._started > self.ConfirmTimeout:
+            for tracked in list(self._devices.values()):
+                if tracked.Provisional:
+                    self.Expired += len(tracked.Provisional)
+                    _Trace.Info('%s: %d restored statuses were not reported', tracked.Name,
+                                len(tracked.Provisional))
+                    tracked.Provisional.clear()
+                    self._Settled(tracked)
+        if self._dirty:
+            self.Save()
@@ -0,0 +1,454 @@
+"""
+Trace module
+
+Named, level-gated trace channels shared by the helper and device modules.
+
+Each module or device instance gets its own :py:class:`TraceChannel` from :py:func:`GetChannel`.
+A channel only builds its message when the message's level is enabled, so trace calls cost one
+comparison on channels that are quiet. Levels can be changed at runtime for one channel or, with
+a wildcard pattern, for a group of channels:
+::
+
+    import modules.helper.Trace as Trace
+
+    # Deep tracing for the one display that misbehaves. Every other channel stays quiet.
+    Trace.SetLevel('*lg_display*@192.168.1.12:2004', 'debug')
+    Trace.SetCapture('*@192.168.1.12:2004', 256)
+    ...
+    with open('/var/nortxfer/display02.cap', 'wb') as f:
+        f.write(Trace.GetChannel('modules.device.lg_display_xxUR640S9UD_Series_v1_0_0_0',
+                                 display02).DumpCapture())
+
+Captured frames can also be written to a :py:class:`CaptureLog` as they pass, with no limit, so a
+day of production traffic can be replayed later through a device module with the
+``tools/replay`` package (``python3 -m replay LOG``, run from ``tools/``):
+::
+
+    log = Trace.CaptureLog('/var/nortxfer/traffic.log')
+    Trace.SetRecorder('modules.device.*', log)
+    ...
+    log.Close()
+"""
+
+from collections import deque
+from fnmatch import fnmatchcase
+from struct import Struct
+from threading import Lock
+from time import monotonic
+
+__version__ = '1.0.0'
+
+
+TRACE_LEVELS = {
+    'debug': 10,
+    'info': 20,
+    'warning': 30,
+    'error': 40,
+    'off': 100,
+}
+
+DEFAULT_LEVEL = 'warning'
+
+# Capture record header: timestamp (monotonic seconds), direction, frame length
+_CaptureHeader = Struct('<dBI')
+_Directions = {'TX': 0, 'RX': 1}
+_DirectionNames = ('TX', 'RX')
+
+# Capture log: file header, then records of timestamp (monotonic seconds), kind, channel number
+# and payload length. Kinds are the directions, and _LogChannel, whose payload names the channel
+# number used by the records after it.
+_LogMagic = b'TRLOG\x01'
+_LogRecord = Struct('<dBHI')
+_LogChannel = 255
+
+# channel name: TraceChannel
+_channels = {}
+
+# (pattern, level), (pattern, capture size) and (pattern, capture log) applied, in order, to new
+# channels
+_levelRules = []
+_captureRules = []
+_recordRules = []
+
+_lock = Lock()
+
+
+def _Print(channel, level, message):
+    print('[{}] {}: {}'.format(channel, level, message))
+
+
+_sink = _Print
+
+
+def InstanceName(Instance):
+    """Return a short name identifying an interface instance, such as ``'192.168.1.12:22023'``
+    or ``'MainProcessor:COM1'``.
+
+    Parameters
+    ----------
+    Instance: object
+        An extronlib interface, a Global Scripter Module instance, or anything else.
+
+    Returns
+    -------
+    str
+    """
+    host = getattr(Instance, 'IPAddress', None) or getattr(Instance, 'Hostname', None)
+    if host is not None:
+        port = getattr(Instance, 'IPPort', None)
+        return host if port is None else '{}:{}'.format(host, port)
+    alias = getattr(getattr(Instance, 'Host', None), 'DeviceAlias', None)
+    port = getattr(Instance, 'Port', None)
+    if alias is not None or port is not None:
+        return '{}:{}'.format(alias, port)
+    return hex(id(Instance))
+
+
+def GetChannel(Name, Instance=None):
+    """Return the channel with this name, creating it if needed.
+
+    Parameters
+    ----------
+    Name: str
+        The channel name. Modules normally pass ``__name__``.
+    Instance: object
+        Optional. When given, the channel is specific to this device or interface and
+        ``@<InstanceName>`` is appended to Name.
+
+    Returns
+    -------
+    TraceChannel
+    """
+    if Instance is not None:
+        Name = '{}@{}'.format(Name, InstanceName(Instance))
+
+    channel = _channels.get(Name)
+    if channel is None:
+        with _lock:
+            channel = _channels.get(Name)
+            if channel is None:
+                channel = TraceChannel(Name)
+                _channels[Name] = channel
+    return channel
+
+
+def GetChannels():
+    """Return a list of the names of all channels created so far."""
+    return sorted(_channels)
+
+
+def SetLevel(Pattern, Level):
+    """Set the level of every channel whose name matches Pattern, including channels created
+    later.
+
+    Parameters
+    ----------
+    Pattern: str
+        A channel name or an ``fnmatch`` pattern such as ``'modules.device.*'``.
+    Level: str
+        One of the keys of ``TRACE_LEVELS``.
+    """
+    if Level not in TRACE_LEVELS:
+        raise ValueError('Level must be one of {}.'.format(', '.join(TRACE_LEVELS)))
+    with _lock:
+        _levelRules.append((Pattern, Level))
+        for name, channel in _channels.items():
+            if fnmatchcase(name, Pattern):
+                channel.Level = Level
+
+
+def SetCapture(Pattern, Size):
+    """Capture raw TX and RX frames for every channel whose name matches Pattern, including
+    channels created later.
+
+    Parameters
+    ----------
+    Pattern: str
+        A channel name or an ``fnmatch`` pattern.
+    Size: int
+        Number of frames kept per channel. 0 stops capturing and discards captured frames.
+    """
+    with _lock:
+        _captureRules.append((Pattern, Size))
+        for name, channel in _channels.items():
+            if fnmatchcase(name, Pattern):
+                channel.SetCapture(Size)
+
+
+def SetRecorder(Pattern, Log):
+    """Write raw TX and RX frames to Log for every channel whose name matches Pattern, including
+    channels created later.
+
+    Parameters
+    ----------
+    Pattern: str
+        A channel name or an ``fnmatch`` pattern.
+    Log: CaptureLog
+        The log to write to. None stops recording.
+    """
+    with _lock:
+        _recordRules.append((Pattern, Log))
+        for name, channel in _channels.items():
+            if fnmatchcase(name, Pattern):
+                channel.SetRecorder(Log)
+
+
+def SetSink(Sink):
+    """Send trace messages to Sink instead of printing them.
+
+    Parameters
+    ----------
+    Sink: callable
+        Called as Sink(ChannelName, Level, Message). For example, to route traces through a
+        ``ModuleSupport.BufferedLogger``:
+        ::
+
+            Trace.SetSink(lambda name, level, msg: logger.Log(name, msg, severity=level))
+    """
+    global _sink
+    _sink = Sink if Sink is not None else _Print
+
+
+def LoadCapture(Data):
+    """Parse data produced by :py:meth:`TraceChannel.DumpCapture`.
+
+    Returns
+    -------
+    list
+        (timestamp, direction, frame) tuples where direction is ``'TX'`` or ``'RX'``.
+    """
+    frames = []
+    offset = 0
+    size = _CaptureHeader.size
+    while offset + size <= len(Data):
+        stamp, direction, length = _CaptureHeader.unpack_from(Data, offset)
+        offset += size
+        frames.append((stamp, _DirectionNames[direction], bytes(Data[offset:offset + length])))
+        offset += length
+    return frames
+
+
+def LoadLog(Data):
+    """Parse data written by a :py:class:`CaptureLog`. A record cut short at the end, as in the
+    log of a program that stopped while writing, is ignored.
+
+    Returns
+    -------
+    list
+        (timestamp, channel name, direction, frame) tuples where direction is ``'TX'`` or
+        ``'RX'``.
+
+    Raises
+    ------
+    ValueError
+        If Data is not a capture log.
+    """
+    if bytes(Data[:len(_LogMagic)]) != _LogMagic:
+        raise ValueError('Not a capture log.')
+    names = {}
+    frames = []
+    offset = len(_LogMagic)
+    size = _LogRecord.size
+    while offset + size <= len(Data):
+        stamp, kind, number, length = _LogRecord.unpack_from(Data, offset)
+        offset += size
+        if offset + length > len(Data):
+            break
+        payload = bytes(Data[offset:offset + length])
+        offset += length
+        if kind == _LogChannel:
+            names[number] = payload.decode('utf-8')
+        else:
+            frames.append((stamp, names.get(number, str(number)), _DirectionNames[kind], payload))
+    return frames
+
+
+class CaptureLog:
+    """An unbounded, compact binary log of the frames captured on any number of channels, read
+    back with :py:func:`LoadLog`. Each frame costs 15 bytes over its own length.
+
+    Parameters
+    ----------
+    File: str or file
+        A path, which is created or truncated, or a file opened for binary writing.
+    """
+
+    def __init__(self, File):
+        if isinstance(File, str):
+            File = open(File, 'wb')
+        self._file = File
+        self._numbers = {}
+        self._lock = Lock()
+        self.Frames = 0
+        self._file.write(_LogMagic)
+
+    def Write(self, Channel, Direction, Data, Timestamp=None):
+        """Append one frame.
+
+        Parameters
+        ----------
+        Channel: str
+            The name of the channel the frame was captured on.
+        Direction: str
+            ``'TX'`` or ``'RX'``.
+        Data: bytes
+        Timestamp: float
+            Optional. ``time.monotonic()`` when the frame passed; defaults to now.
+        """
+        if Timestamp is None:
+            Timestamp = monotonic()
+        with self._lock:
+            file = self._file
+            if file is None:
+                return
+            number = self._numbers.get(Channel)
+            if number is None:
+                number = self._numbers[Channel] = len(self._numbers)
+                name = Channel.encode('utf-8')
+                file.write(_LogRecord.pack(Timestamp, _LogChannel, number, len(name)))
+                file.write(name)
+            file.write(_LogRecord.pack(Timestamp, _Directions[Direction], number, len(Data)))
+            file.write(Data)
+            self.Frames += 1
+
+    def Flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def Close(self):
+        """Flush and close the log. Frames written after this are dropped."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class TraceChannel:
+    """A named trace channel. Create channels with :py:func:`GetChannel`.
+
+    Messages use ``%`` formatting and are only formatted when their level is enabled:
+    ::
+
+        trace.Debug('Send: data=%r count=%d', data, counter)
+
+    A message may also be a callable taking no arguments, which is only called when enabled.
+    """
+
+    def __init__(self, Name):
+        self._name = Name
+        self._capture = None
+        self._log = None
+        self.Capturing = False
+        self.Level = DEFAULT_LEVEL
+        for pattern, level in _levelRules:
+            if fnmatchcase(Name, pattern):
+                self.Level = level
+        for pattern, size in _captureRules:
+            if fnmatchcase(Name, pattern):
+                self.SetCapture(size)
+        for pattern, log in _recordRules:
+            if fnmatchcase(Name, pattern):
+                self.SetRecorder(log)
+
+    @property
+    def Name(self):
+        return self._name
+
+    @property
+    def Level(self):
+        """The lowest level that is emitted. One of the keys of ``TRACE_LEVELS``."""
+        return self._levelName
+
+    @Level.setter
+    def Level(self, value):
+        if value not in TRACE_LEVELS:
+            raise ValueError('Level must be one of {}.'.format(', '.join(TRACE_LEVELS)))
+        self._levelName = value
+        self._level = TRACE_LEVELS[value]
+        # Plain attribute so hot paths can test it without a call.
+        self.DebugEnabled = self._level <= TRACE_LEVELS['debug']
+
+    def IsEnabled(self, Level):
+        """Return True if messages of Level are emitted on this channel."""
+        return TRACE_LEVELS[Level] >= self._level
+
+    def Log(self, Level, Message, *args):
+        """Emit Message at Level if that level is enabled.
+
+        Parameters
+        ----------
+        Level: str
+            One of the keys of ``TRACE_LEVELS``.
+        Message: str or callable
+            A ``%`` format string for args, or a callable returning the message.
+        """
+        if TRACE_LEVELS[Level] < self._level:
+            return
+        if callable(Message):
+            Message = Message()
+        elif args:
+            Message = Message % args
+        _sink(self._name, Level, Message)
+
+    def Debug(self, Message, *args):
+        if self.DebugEnabled:
+            self.Log('debug', Message, *args)
+
+    def Info(self, Message, *args):
+        self.Log('info', Message, *args)
+
+    def Warning(self, Message, *args):
+        self.Log('warning', Message, *args)
+
+    def Error(self, Message, *args):
+        self.Log('error', Message, *args)
+
+    def SetCapture(self, Size):
+        """Keep the last Size raw frames passed to :py:meth:`Capture`. 0 turns capture off."""
+        if Size:
+            previous = self._capture or ()
+            self._capture = deque(previous, maxlen=Size)
+        else:
+            self._capture = None
+        self.Capturing = self._capture is not None or self._log is not None
+
+    def SetRecorder(self, Log):
+        """Also write every frame passed to :py:meth:`Capture` to Log, a :py:class:`CaptureLog`.
+        None stops recording."""
+        self._log = Log
+        self.Capturing = self._capture is not None or self._log is not None
+
+    def Capture(self, Direction, Data):
+        """Record a raw frame if capture is on for this channel.
+
+        Callers on hot paths should test :py:attr:`Capturing` first.
+
+        Parameters
+        ----------
+        Direction: str
+            ``'TX'`` or ``'RX'``.
+        Data: bytes or str
+        """
+        if isinstance(Data, str):
+            Data = Data.encode('latin-1', 'replace')
+        stamp = monotonic()
+        capture = self._capture
+        if capture is not None:
+            capture.append((stamp, Direction, Data))
+        log = self._log
+        if log is not None:
+            log.Write(self._name, Direction, bytes(Data), stamp)
+
+    def GetCapture(self):
+        """Return the captured (timestamp, direction, frame) tuples, oldest first."""
+        return list(self._capture or ())
+
+    def DumpCapture(self):
+        """Return the captured frames in a compact binary form readable by
+        :py:func:`LoadCapture`."""
+        parts = []
+        for stamp, direction, frame in self.GetCapture():
+            parts.append(_CaptureHeader.pack(stamp, _Directions[direction], len(frame)))
+            parts.append(bytes(frame))
+        return b''.join(parts)
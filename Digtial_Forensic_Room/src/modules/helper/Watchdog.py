@@ -0,0 +1,229 @@
+"""
+Watchdog module
+
+Times event handlers and timer callbacks and records the ones that stall.
+
+Everything in a ControlScript program runs from extronlib events and timers, so a handler that
+blocks (a ``SendAndWait`` with a long timeout, a synchronous ``Connect()``, a long loop) delays
+every event queued behind it: a button press that does nothing usually means one. Functions
+wrapped with :py:func:`Watch` are timed, and one that runs longer than the threshold is logged
+as a stall with its name, its duration and the stack it was stuck in. A monitor thread samples
+that stack while the function is still running, so it shows where the time went, and a function
+that never returns is reported too.
+
+The connection handlers wrap their timers and interface events, and the rooms wrap their event
+and status callbacks. :py:func:`Start` must be called before they are created; until then
+:py:func:`Watch` returns functions unchanged and costs nothing:
+::
+
+    import modules.helper.Watchdog as Watchdog
+
+    Watchdog.Start(Threshold=0.25)
+    ...
+    for stall in Watchdog.GetStalls():
+        print(stall['Name'], stall['Duration'], ''.join(stall['Stack']))
+"""
+
+import sys
+import traceback
+from collections import deque
+from threading import Lock, Thread, get_ident
+from time import monotonic, sleep, time
+
+from modules.helper.Trace import GetChannel
+
+__version__ = '1.0.0'
+
+
+_Trace = GetChannel(__name__)
+
+# Innermost frames kept of a stalled function's stack
+_StackDepth = 12
+
+# The running watchdog, or None
+_watchdog = None
+
+
+def Start(Threshold=0.25, Size=64):
+    """Start timing the functions wrapped by :py:func:`Watch` from now on.
+
+    Parameters
+    ----------
+    Threshold: float
+        Seconds a function may run before it is reported as a stall.
+    Size: int
+        Number of stalls kept by :py:func:`GetStalls`.
+
+    Returns
+    -------
+    Watchdog
+    """
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = Watchdog(Threshold, Size)
+    return _watchdog
+
+
+def Watch(Function, Name=None):
+    """Return Function timed by the watchdog, or Function itself if :py:func:`Start` has not
+    been called.
+
+    Parameters
+    ----------
+    Function: callable
+        An event handler or timer callback.
+    Name: str
+        Optional. The name stalls are reported under. Defaults to the function's qualified name.
+
+    Returns
+    -------
+    callable
+    """
+    if _watchdog is None:
+        return Function
+    return _watchdog.Watch(Function, Name)
+
+
+def GetStalls():
+    """Return the recorded stalls, oldest first. See :py:meth:`Watchdog.GetStalls`."""
+    return [] if _watchdog is None else _watchdog.GetStalls()
+
+
+def GetStats():
+    """Return the watchdog's counters. See :py:meth:`Watchdog.GetStats`."""
+    return {} if _watchdog is None else _watchdog.GetStats()
+
+
+def GetWatchdog():
+    """Return the :py:class:`Watchdog` created by :py:func:`Start`, or None before it is called."""
+    return _watchdog
+
+
+def _Name(Function):
+    return '{}.{}'.format(getattr(Function, '__module__', '?'),
+                          getattr(Function, '__qualname__', repr(Function)))
+
+
+class Watchdog:
+    """Times watched functions and keeps the last Size stalls. Create it with :py:func:`Start`.
+
+    Parameters
+    ----------
+    Threshold: float
+        Seconds a function may run before it is reported as a stall.
+    Size: int
+        Number of stalls kept.
+    """
+
+    def __init__(self, Threshold=0.25, Size=64):
+        self.Threshold = Threshold
+        self._stalls = deque(maxlen=Size)
+        # thread ident: [name, start, stack or None] of the outermost watched call running on
+        # the thread
+        self._running = {}
+        self._lock = Lock()
+        self.Calls = 0
+        self.Stalls = 0
+        self.MaxDuration = 0.0
+        # name: stalls
+        self.StallsByName = {}
+        self._monitor = Thread(target=self._Monitor, name='Watchdog', daemon=True)
+        self._monitor.start()
+
+    def Watch(self, Function, Name=None):
+        """Return Function wrapped so that each call is timed.
+
+        A watched function called from another watched function on the same thread is not
+        timed on its own: the stall is reported under the outermost one, and its stack shows
+        the inner one.
+        """
+        name = Name or _Name(Function)
+        running = self._running
+
+        def watched(*args, **kwargs):
+            thread = get_ident()
+            if thread in running:
+                return Function(*args, **kwargs)
+            entry = running[thread] = [name, monotonic(), None]
+            try:
+                return Function(*args, **kwargs)
+            finally:
+                del running[thread]
+                self._Finished(entry, monotonic() - entry[1])
+
+        watched.__name__ = getattr(Function, '__name__', 'watched')
+        watched.__wrapped__ = Function
+        return watched
+
+    def _Finished(self, entry, duration):
+        name, _, stack = entry
+        with self._lock:
+            self.Calls += 1
+            if duration > self.MaxDuration:
+                self.MaxDuration = duration
+            if duration <= self.Threshold:
+                return
+            self.Stalls += 1
+            self.StallsByName[name] = self.StallsByName.get(name, 0) + 1
+            self._stalls.append({
+                'Name': name,
+                'Started': time() - duration,
+                'Duration': duration,
+                'Stack': stack or ['(returned before its stack was sampled)\n'],
+            })
+        _Trace.Warning('%s ran for %.0f ms', name, duration * 1e3)
+
+    def _Monitor(self):
+        # Samples the stack of each watched call once it passes the threshold, while it is
+        # still stuck.
+        interval = max(self.Threshold / 4, 0.005)
+        while True:
+            sleep(interval)
+            now = monotonic()
+            late = [(thread, entry) for thread, entry in list(self._running.items())
+                    if entry[2] is None and now - entry[1] > self.Threshold]
+            if not late:
+                continue
+            frames = sys._current_frames()
+            for thread, entry in late:
+                frame = frames.get(thread)
+                if frame is None or self._running.get(thread) is not entry:
+                    continue
+                entry[2] = traceback.format_stack(frame)[-_StackDepth:]
+                _Trace.Warning('%s still running after %.0f ms', entry[0], (now - entry[1]) * 1e3)
+
+    def GetStalls(self):
+        """Return the recorded stalls, oldest first.
+
+        Returns
+        -------
+        list
+            Dicts with 'Name', 'Started' (``time.time()``), 'Duration' (seconds) and 'Stack'
+            (formatted stack lines, innermost last).
+        """
+        with self._lock:
+            return list(self._stalls)
+
+    def CountStalled(self):
+        """Return the number of watched calls running past the threshold now."""
+        limit = monotonic() - self.Threshold
+        return sum(1 for entry in list(self._running.values()) if entry[1] < limit)
+
+    def GetStats(self):
+        """Return the number of watched calls and stalls, stalls per name, the longest call, and
+        the names of watched calls running past the threshold now.
+
+        Returns
+        -------
+        dict
+        """
+        now = monotonic()
+        with self._lock:
+            return {
+                'Calls': self.Calls,
+                'Stalls': self.Stalls,
+                'StallsByName': dict(self.StallsByName),
+                'MaxDuration': self.MaxDuration,
+                'Stalled': sorted(entry[0] for entry in list(self._running.values())
+                                  if now - entry[1] > self.Threshold),
+            }
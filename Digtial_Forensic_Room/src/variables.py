@@ -3,25 +3,7 @@ The variables file is for data that will be used throughout the project.  This c
 dynamic data.  After being initial loaded by main.py, it can be imported and used in any module
 throughout the system.
 """
-StartID = 8000
-ShutdownID = 8022
-ShutdownConfirmID = 9028
-ShutdownCancelID = 9029
-Disp1PowerOnID = 8112
-Disp1PowerOffID = 8113
-Disp2PowerOnID = 8222
-Disp2PowerOffID = 8223
-Src1BtnID = 2
-Src2BtnID = 6
-Src3BtnID = 3
-Src4BtnID = 4
-Src5BtnID = 5
-Src6BtnID = 7
-ClearBtnID = 8
-Dest1BtnID = 9
-Dest2BtnID = 10
-
-DefaultInput = 1
+# Devices, button IDs and router maps are in rooms.json (see modules.helper.RoomConfig).
 
 PageStart = 'Start'
 PageMain = 'Main'
@@ -0,0 +1,13 @@
+"""
+Puts the extronlib stand-in and the project source on sys.path so benchmark
+scripts can import project modules unmodified.
+"""
+import os
+import sys
+
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(os.path.dirname(TOOLS_DIR), 'src')
+
+for path in (SRC_DIR, TOOLS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,128 @@
+"""
+Set throughput on a multi-drop RS-232 display bus: several LG displays share
+one serial line of the LG UR640S simulator, each driven by its own device
+module behind a ConnectionHandler on the extronlib stand-in.
+
+Each Set waits for its OK/NG reply (SendAndWait), so a Set's time covers the
+command and reply crossing the line at the given baud rate, queued behind
+the other displays' traffic and the handlers' keep-alive polls. The
+benchmark reports per display the Sets answered OK and their time, and per
+bus the Sets per second and the Sets that failed (timed out or NG), for each
+baud rate (0 leaves the line unlimited).
+
+    python tools/benchmarks/bench_display_bus.py [--displays N] [--seconds S]
+        [--bauds 9600 115200 ...] [--latency S]
+"""
+import argparse
+import contextlib
+import io
+import random
+import statistics
+import threading
+import time
+
+import _setup
+
+import extronlib
+import extronlib.interface
+
+from simulators.lg_ur640s import LGUR640S
+
+from modules.device.lg_display_xxUR640S9UD_Series_v1_0_0_0 import SerialOverEthernetClass
+from modules.helper.ConnectionHandler import GetConnectionHandler
+
+BAUDS = (9600, 38400, 115200, 0)
+
+
+def _Percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _Run(displays, seconds, baud, latency):
+    sim = LGUR640S(SetIDs=range(1, displays + 1), Baud=baud or None, Latency=latency, Seed=1)
+    sim.Start()
+    extronlib.interface.Redirect('192.168.1.12', 2003, '127.0.0.1', sim.Port)
+    loop = extronlib.GetLoop()
+
+    handlers = []
+    for setID in range(1, displays + 1):
+        device = SerialOverEthernetClass('192.168.1.12', 2003, 'TCP')
+        device.DeviceID = setID
+        handler = GetConnectionHandler(device, 'Power', DisconnectLimit=15, pollFrequency=1)
+        handler.Connect()
+        handlers.append(handler)
+    deadline = time.monotonic() + 5
+    while sim.GetStats()['Clients'] < displays:
+        if time.monotonic() > deadline:
+            raise SystemExit('displays did not connect')
+        time.sleep(0.05)
+
+    # The module reports a Set that timed out or was answered NG through
+    # Error().
+    failures = []
+    for handler in handlers:
+        handler.Error = failures.append
+
+    # Set ID: times of the Sets answered OK
+    times = {setID: [] for setID in range(1, displays + 1)}
+    rng = random.Random(1)
+    done = threading.Event()
+
+    def SetNext():
+        if done.is_set():
+            return
+        index = rng.randrange(displays)
+        failed = len(failures)
+        start = time.perf_counter()
+        handlers[index].Set('Volume', rng.randint(0, 100))
+        elapsed = time.perf_counter() - start
+        if len(failures) == failed:
+            times[index + 1].append(elapsed)
+        loop.CallSoon(SetNext)
+
+    start = time.perf_counter()
+    loop.CallSoon(SetNext)
+    time.sleep(seconds)
+    done.set()
+    extronlib.Sync(5)
+    elapsed = time.perf_counter() - start
+
+    for handler in handlers:
+        handler.PollTimer.Stop()
+    sim.Stop()
+    return times, elapsed, len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--displays', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--bauds', type=int, nargs='+', default=BAUDS)
+    parser.add_argument('--latency', type=float, default=0.005)
+    args = parser.parse_args()
+
+    print('{} displays on one line, simulator latency {} s, {} s per rate'.format(
+        args.displays, args.latency, args.seconds))
+    print('{:>8} {:>8} {:>8} {:>10} {:>10} {:>10} {:>10}'.format(
+        'baud', 'set id', 'sets', 'sets/s', 'p50', 'p95', 'max'))
+    for baud in args.bauds:
+        with contextlib.redirect_stdout(io.StringIO()):
+            times, elapsed, failed = _Run(args.displays, args.seconds, baud, args.latency)
+        rate = baud or 'none'
+        for setID, values in sorted(times.items()):
+            if not values:
+                print('{:>8} {:>8} {:>8}'.format(rate, setID, 0))
+                continue
+            print('{:>8} {:>8} {:>8} {:>10.1f} {:>7.2f} ms {:>7.2f} ms {:>7.2f} ms'.format(
+                rate, setID, len(values), len(values) / elapsed,
+                statistics.median(values) * 1e3, _Percentile(values, 0.95) * 1e3,
+                max(values) * 1e3))
+        total = [value for values in times.values() for value in values]
+        print('{:>8} {:>8} {:>8} {:>10.1f} {:>10} {:>10} {:>10}'.format(
+            rate, 'bus', len(total), len(total) / elapsed, '', '',
+            '{} failed'.format(failed)))
+
+
+if __name__ == '__main__':
+    main()
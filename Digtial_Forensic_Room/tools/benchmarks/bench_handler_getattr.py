@@ -0,0 +1,46 @@
+"""
+Micro-benchmark of calling module methods through a connection handler versus
+calling the module directly.
+
+    python tools/benchmarks/bench_handler_getattr.py
+"""
+import timeit
+
+import _setup  # noqa: F401
+
+import modules.device.lg_display_xxUR640S9UD_Series_v1_0_0_0 as LGDisplayModule
+from modules.helper.ConnectionHandler import GetConnectionHandler
+
+NUMBER = 200000
+
+
+def _Report(label, seconds):
+    print('{:<32} {:8.1f} ns/call'.format(label, seconds / NUMBER * 1e9))
+
+
+def main():
+    display = LGDisplayModule.SerialOverEthernetClass('127.0.0.1', 2003, 'TCP',
+                                                      Model='86UR640S9UD')
+    handler = GetConnectionHandler(display, keepAliveQuery='Power')
+    display.WriteStatus('Power', 'On')
+
+    # Set is measured with a command the module rejects before sending so
+    # that only call dispatch is timed.
+    cases = [
+        ('module.ReadStatus', lambda: display.ReadStatus('Power')),
+        ('handler.ReadStatus', lambda: handler.ReadStatus('Power')),
+        ('module.Set', lambda: display.Set('Volume', -1)),
+        ('handler.Set', lambda: handler.Set('Volume', -1)),
+        ('module.SubscribeStatus attr', lambda: display.SubscribeStatus),
+        ('handler.SubscribeStatus attr', lambda: handler.SubscribeStatus),
+        ('module.ReadStatus attr', lambda: display.ReadStatus),
+        ('handler.ReadStatus attr', lambda: handler.ReadStatus),
+    ]
+
+    display.Discard = lambda message: None
+    for label, func in cases:
+        _Report(label, min(timeit.repeat(func, number=NUMBER, repeat=5)))
+
+
+if __name__ == '__main__':
+    main()
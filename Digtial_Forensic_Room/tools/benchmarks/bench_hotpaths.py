@@ -0,0 +1,273 @@
+"""
+Micro-benchmarks of the control hot paths on the stand-in:
+
+    * receive - frames per second through the DTP module's __ReceiveData,
+      a mix of tie, signal, temperature, DSP and error responses
+    * tie_refresh - a full matrix refresh: UpdateAllMatrixTie and the two
+      tie dumps through __MatchAllMatrixTie and the tie status helpers
+    * write_status - WriteStatus of changing values with a subscriber, so
+      each write reaches NewStatus and the callback
+    * write_status_unchanged - WriteStatus of the value already stored
+    * tie_set - Set('MatrixTieCommand') encode and send, with the socket
+      send stubbed out
+    * event_1, event_4 - eventEx dispatch of a connection handler event to
+      one and to four handlers
+    * poll_N, poll_shared_N - CPU per keep-alive poll of N LG display
+      handlers polling every second, on their own timers and on one
+      PollScheduler; run for 10 minutes of virtual time in a child process
+
+Module sends go nowhere, so only Python work is measured. Each result is
+the best of several repeats. --json writes the results with the commit and
+interpreter they were measured on; --compare prints the change from an
+earlier --json file.
+
+    python tools/benchmarks/bench_hotpaths.py [--json FILE] [--compare FILE]
+        [--quick] [cases...]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+import _setup
+
+REPEAT = 5
+POLL_COUNTS = (1, 10, 100)
+POLL_SECONDS = 600.0
+
+SWITCHER_MODEL = 'DTP CrossPoint 84 4K IPCP SA'
+
+# Responses a DTP CrossPoint 84 sends in normal operation.
+RECEIVE_FRAMES = (
+    b'Out1 In2 All\r\n',
+    b'Out2 In3 Vid\r\n',
+    b'Out3 In4 Aud\r\n',
+    b'Frq00 10101010\r\n',
+    b'Sts00*12.05 41.50 0 0\r\n',
+    b'Exe0\r\n',
+    b'DsG60000*-100\r\n',
+    b'DsM60000*1\r\n',
+    b'Frz01*00\r\n',
+    b'E13\r\n',
+)
+
+
+def _Quiet(device):
+    # Module sends, errors and discards do nothing.
+    device.Send = lambda data: None
+    device.Error = lambda message: None
+    device.Discard = lambda message: None
+    return device
+
+
+def _Switcher():
+    import modules.device.extr_matrix_DTP_CrossPoint_82_84_4kSeriesv1872 as SwitcherModule
+
+    switcher = _Quiet(SwitcherModule.SSHClass('127.0.0.1', 22023, Credentials=('admin', None),
+                                              Model=SWITCHER_MODEL))
+    switcher.EchoDisabled = False
+    switcher.VerboseDisabled = False
+    switcher.initializationChk = False
+    # As after connecting: the tie matrix exists once the first refresh is
+    # requested.
+    switcher.UpdateAllMatrixTie(None, None)
+    return switcher
+
+
+def _Best(function, number, repeat):
+    # Seconds per call of function, the best of repeat runs of number calls.
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def _Receive(number, repeat):
+    switcher = _Switcher()
+    receive = switcher.ReceiveData
+    frames = RECEIVE_FRAMES
+
+    def Run():
+        for frame in frames:
+            receive(switcher, frame)
+
+    seconds = _Best(Run, number, repeat)
+    return {'ns_per_op': seconds / len(frames) * 1e9, 'per_second': len(frames) / seconds,
+            'unit': 'frames'}
+
+
+def _TieRefresh(number, repeat):
+    switcher = _Switcher()
+    receive = switcher.ReceiveData
+    # Every output changes input on each refresh, as after a preset recall.
+    dumps = []
+    for first in (1, 5):
+        inputs = ' '.join('{:02d}'.format(first + index) for index in range(4))
+        rest = ' --' * 12
+        dumps.append((b'Vgp00 Out01*' + inputs.encode() + rest.encode() + b'Vid\r\n',
+                      b'Vgp00 Out01*' + inputs.encode() + rest.encode() + b'Aud\r\n'))
+    state = [0]
+
+    def Run():
+        state[0] ^= 1
+        video, audio = dumps[state[0]]
+        switcher.UpdateAllMatrixTie(None, None)
+        receive(switcher, video)
+        receive(switcher, audio)
+
+    seconds = _Best(Run, number, repeat)
+    return {'ns_per_op': seconds * 1e9, 'per_second': 1 / seconds, 'unit': 'refreshes'}
+
+
+def _WriteStatus(number, repeat, changed):
+    switcher = _Switcher()
+    received = []
+    qualifier = {'Output': '1', 'Tie Type': 'Audio/Video'}
+    switcher.SubscribeStatus('OutputTieStatus', qualifier,
+                             lambda command, value, qualifier: received.append(value))
+    write = switcher.WriteStatus
+    values = ('1', '2') if changed else ('1', '1')
+
+    def Run():
+        write('OutputTieStatus', values[0], qualifier)
+        write('OutputTieStatus', values[1], qualifier)
+
+    seconds = _Best(Run, number, repeat) / 2
+    return {'ns_per_op': seconds * 1e9, 'per_second': 1 / seconds, 'unit': 'writes'}
+
+
+def _TieSet(number, repeat):
+    switcher = _Switcher()
+    qualifier = {'Input': '3', 'Output': '2', 'Tie Type': 'Audio/Video'}
+    seconds = _Best(lambda: switcher.Set('MatrixTieCommand', None, qualifier), number, repeat)
+    return {'ns_per_op': seconds * 1e9, 'per_second': 1 / seconds, 'unit': 'sets'}
+
+
+def _Event(number, repeat, handlers):
+    import modules.device.lg_display_xxUR640S9UD_Series_v1_0_0_0 as DisplayModule
+    from modules.helper.ConnectionHandler import GetConnectionHandler
+    from modules.helper.ModuleSupport import eventEx
+
+    display = GetConnectionHandler(
+        _Quiet(DisplayModule.SerialOverEthernetClass('127.0.0.1', 2003, 'TCP')), 'Power')
+    reasons = []
+    for _ in range(handlers):
+        @eventEx(display, 'ConnectFailed')
+        def ConnectFailed(interface, reason):
+            reasons.append(reason)
+
+    seconds = _Best(lambda: display.ConnectFailed(display, 'TimedOut'), number, repeat)
+    return {'ns_per_op': seconds * 1e9, 'per_second': 1 / seconds, 'unit': 'events'}
+
+
+def _PollChild(count, shared, seconds):
+    # Runs in the child interpreter. The clock is installed before anything
+    # creates a timer.
+    from extronlib.virtualtime import VirtualClock
+    clock = VirtualClock.Install()
+
+    import modules.device.lg_display_xxUR640S9UD_Series_v1_0_0_0 as DisplayModule
+    from modules.helper.ConnectionHandler import GetConnectionHandler, PollScheduler
+
+    scheduler = PollScheduler() if shared else None
+    handlers = []
+    for index in range(count):
+        display = _Quiet(DisplayModule.SerialOverEthernetClass('127.0.0.1', 2003 + index, 'TCP'))
+        handlers.append(GetConnectionHandler(display, 'Power', pollFrequency=1,
+                                             pollScheduler=scheduler))
+    for handler in handlers:
+        handler.PollTimer.Restart()
+
+    cpu = time.process_time()
+    clock.RunFor(seconds)
+    cpu = time.process_time() - cpu
+    polls = sum(handler.GetHealth()['FramesSent'] for handler in handlers)
+    return {'cpu': cpu, 'polls': polls}
+
+
+def _Poll(count, shared, seconds):
+    code = ('import sys, json; sys.path.insert(0, {here!r}); import bench_hotpaths; '
+            'print("POLL", json.dumps(bench_hotpaths._PollChild({count!r}, {shared!r}, '
+            '{seconds!r})))')
+    code = code.format(here=os.path.dirname(os.path.abspath(__file__)), count=count,
+                       shared=shared, seconds=seconds)
+    with open(os.devnull, 'w') as devnull:
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=_setup.SRC_DIR,
+                                         stderr=devnull, universal_newlines=True)
+    line = next(line for line in output.splitlines() if line.startswith('POLL '))
+    result = json.loads(line[len('POLL '):])
+    perPoll = result['cpu'] / max(result['polls'], 1)
+    return {'ns_per_op': perPoll * 1e9, 'per_second': 1 / perPoll if perPoll else 0.0,
+            'unit': 'polls', 'cpu_per_handler_hour': result['cpu'] / count * 3600 / seconds}
+
+
+def _Cases(quick):
+    number = 200 if quick else 2000
+    repeat = 3 if quick else REPEAT
+    seconds = POLL_SECONDS / 10 if quick else POLL_SECONDS
+    cases = [
+        ('receive', lambda: _Receive(number, repeat)),
+        ('tie_refresh', lambda: _TieRefresh(number // 4, repeat)),
+        ('write_status', lambda: _WriteStatus(number * 10, repeat, True)),
+        ('write_status_unchanged', lambda: _WriteStatus(number * 10, repeat, False)),
+        ('tie_set', lambda: _TieSet(number * 10, repeat)),
+        ('event_1', lambda: _Event(number * 10, repeat, 1)),
+        ('event_4', lambda: _Event(number * 10, repeat, 4)),
+    ]
+    for count in POLL_COUNTS:
+        cases.append(('poll_{}'.format(count), lambda count=count: _Poll(count, False, seconds)))
+        cases.append(('poll_shared_{}'.format(count),
+                      lambda count=count: _Poll(count, True, seconds)))
+    return cases
+
+
+def _Commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=_setup.TOOLS_DIR, stderr=subprocess.DEVNULL,
+                                       universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('cases', nargs='*', help='case names to run (default all)')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='an earlier --json file to compare with')
+    parser.add_argument('--quick', action='store_true', help='fewer, shorter runs')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    print('{:<24} {:>14} {:>16} {:>10}'.format('case', 'ns/op', 'per second', 'change'))
+    for name, case in _Cases(args.quick):
+        if args.cases and name not in args.cases:
+            continue
+        result = case()
+        results[name] = result
+        change = ''
+        if name in baseline:
+            change = '{:+.1f}%'.format((result['ns_per_op'] / baseline[name]['ns_per_op'] - 1) * 100)
+        print('{:<24} {:>14.0f} {:>10.0f} {:<5} {:>10}'.format(
+            name, result['ns_per_op'], result['per_second'], result['unit'], change))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'commit': _Commit(),
+                'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'quick': args.quick,
+                'results': results,
+            }, f, indent=1, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
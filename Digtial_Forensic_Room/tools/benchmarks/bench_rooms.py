@@ -0,0 +1,154 @@
+"""
+Scaling of one program running many rooms: 10, 50 and 100 copies of the
+room in src/rooms.json, each with its own panel, switcher and displays,
+against the extronlib stand-in. Every device connects to one local sink
+server that accepts connections and drops what it receives.
+
+For each room count it reports set-up time and memory per room, the CPU
+used and threads alive while every room polls its devices, and the latency
+of button presses handled while the polls run.
+
+    python tools/benchmarks/bench_rooms.py [--unshared] [seconds] [counts...]
+
+--unshared gives every connection handler its own poll timer instead of
+one shared PollScheduler, for comparison.
+"""
+import contextlib
+import copy
+import gc
+import io
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+
+import _setup
+
+import extronlib.interface
+from extronlib.interface import EthernetServerInterfaceEx
+
+import modules.helper.DeviceRegistry as DeviceRegistry
+import modules.helper.RoomConfig as RoomConfig
+from modules.helper.ConnectionHandler import PollScheduler
+
+import control.av
+
+COUNTS = (10, 50, 100)
+SECONDS = 5.0
+POLL_FREQUENCY = 1
+PRESSES = 2000
+SINK_PORT = 47001
+
+
+class _Log:
+    # Stands in for the program's BufferedLogger; records are dropped.
+    def Log(self, *args, **kwargs):
+        pass
+
+
+def _Specs(count):
+    with open(RoomConfig.DefaultPath()) as f:
+        data = json.load(f)
+    template = data['rooms'][0]
+    rooms = []
+    for index in range(count):
+        room = copy.deepcopy(template)
+        room['name'] = 'Room {:03d}'.format(index + 1)
+        room['panel'] = 'Panel{:03d}'.format(index + 1)
+        for device in room['devices'].values():
+            device['args'][0] = '10.{}.{}.10'.format(index // 200, index % 200)
+            device['handler']['pollFrequency'] = POLL_FREQUENCY
+        rooms.append(room)
+    return RoomConfig.Compile({'rooms': rooms})
+
+
+def _Percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _Run(count, seconds, shared):
+    specs = _Specs(count)
+    log = _Log()
+    scheduler = PollScheduler() if shared else None
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    rooms = [control.av.Room(spec, log, scheduler) for spec in specs]
+    DeviceRegistry.BuildAll()
+    for room in rooms:
+        room.guard(room.connect)()
+    setup = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Presses are spread over the measurement window while the polls run.
+    buttons = [(room, button) for room in rooms
+               for button in list(room.src_btns_dict) + list(room.dest_btns_dict)]
+    interval = seconds / PRESSES
+    latencies = []
+    threads = threading.active_count()
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    for index in range(PRESSES):
+        room, button = random.choice(buttons)
+        pressed = time.perf_counter()
+        button.Pressed(button, 'Pressed')
+        latencies.append(time.perf_counter() - pressed)
+        threads = max(threads, threading.active_count())
+        remaining = wall + (index + 1) * interval - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+
+    errors = sum(room.errors for room in rooms)
+    for room in rooms:
+        for handler in room.devices.values():
+            handler.PollTimer.Stop()
+    return {
+        'setup': setup / count,
+        'memory': memory / count,
+        'cpu': cpu / wall,
+        'threads': threads,
+        'p50': statistics.median(latencies),
+        'p95': _Percentile(latencies, 0.95),
+        'max': max(latencies),
+        'errors': errors,
+    }
+
+
+def main():
+    sink = EthernetServerInterfaceEx(SINK_PORT, Interface='127.0.0.1')
+    if sink.StartListen() != 'Listening':
+        sys.exit('port {} is in use'.format(SINK_PORT))
+    extronlib.interface.Redirect('*', None, '127.0.0.1', SINK_PORT)
+
+    args = sys.argv[1:]
+    shared = '--unshared' not in args
+    args = [arg for arg in args if arg != '--unshared']
+    seconds = float(args[0]) if args else SECONDS
+    counts = [int(arg) for arg in args[1:]] or COUNTS
+
+    print('{} poll timers, {} s per room count, polls every {} s'.format(
+        'shared' if shared else 'per-handler', seconds, POLL_FREQUENCY))
+    print('{:>6} {:>10} {:>10} {:>6} {:>8} {:>9} {:>9} {:>9} {:>7}'.format(
+        'rooms', 'setup/room', 'mem/room', 'cpu', 'threads', 'press p50', 'press p95',
+        'press max', 'errors'))
+    for count in counts:
+        # Device modules print their own errors; keep the table readable.
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = _Run(count, seconds, shared)
+        print('{:>6} {:>7.2f} ms {:>6.1f} KiB {:>5.1f}% {:>8} {:>6.0f} us {:>6.0f} us '
+              '{:>6.0f} us {:>7}'.format(
+                  count, result['setup'] * 1e3, result['memory'] / 1024, result['cpu'] * 100,
+                  result['threads'], result['p50'] * 1e6, result['p95'] * 1e6,
+                  result['max'] * 1e6, result['errors']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Keep-alive soak in virtual time: rooms from src/rooms.json poll their devices
+for a simulated day (by default) on the extronlib stand-in's virtual clock.
+
+Every device connects to a local sink server that accepts connections and
+never answers, so each handler misses its keep-alive responses until it
+declares the device disconnected. The benchmark reports the real time and
+CPU the simulated polling took, the frames sent per handler, and the failure
+detection latency: the virtual time from connecting until the handler first
+reports Disconnected.
+
+Each configuration runs twice, each in a fresh interpreter; the two runs must
+agree on every handler's status changes to the microsecond.
+
+    python tools/benchmarks/bench_soak.py [--unshared] [hours] [counts...]
+"""
+import json
+import os
+import subprocess
+import sys
+
+import _setup
+
+HOURS = 24.0
+COUNTS = (1, 10)
+SINK_PORT = 47002
+
+
+def _Child(hours, count, shared):
+    # Runs in the child interpreter. The clock is installed before anything
+    # creates a timer.
+    from extronlib.virtualtime import VirtualClock
+    clock = VirtualClock.Install()
+
+    import copy
+    import time
+
+    import extronlib.interface
+    from extronlib.interface import EthernetServerInterfaceEx
+
+    import modules.helper.DeviceRegistry as DeviceRegistry
+    import modules.helper.RoomConfig as RoomConfig
+    from modules.helper.ConnectionHandler import PollScheduler
+
+    import control.av
+
+    sink = EthernetServerInterfaceEx(SINK_PORT, Interface='127.0.0.1')
+    if sink.StartListen() != 'Listening':
+        raise SystemExit('port {} is in use'.format(SINK_PORT))
+    extronlib.interface.Redirect('*', None, '127.0.0.1', SINK_PORT)
+
+    with open(RoomConfig.DefaultPath()) as f:
+        template = json.load(f)['rooms'][0]
+    rooms = []
+    for index in range(count):
+        room = copy.deepcopy(template)
+        room['name'] = 'Room {:03d}'.format(index + 1)
+        room['panel'] = 'Panel{:03d}'.format(index + 1)
+        rooms.append(room)
+    specs = RoomConfig.Compile({'rooms': rooms})
+
+    class _Log:
+        def Log(self, *args, **kwargs):
+            pass
+
+    scheduler = PollScheduler() if shared else None
+    rooms = [control.av.Room(spec, _Log(), scheduler) for spec in specs]
+    DeviceRegistry.BuildAll()
+
+    # (virtual time, status) changes per handler, recorded through each
+    # handler's health metrics.
+    changes = []
+    for room in rooms:
+        for handler in room.devices.values():
+            health = handler._Health
+            record = []
+            changes.append(record)
+
+            def StatusChanged(status, changed=health.StatusChanged, record=record):
+                record.append((round(clock.Now, 6), status))
+                changed(status)
+            health.StatusChanged = StatusChanged
+
+    start = clock.Now
+    for room in rooms:
+        room.guard(room.connect)()
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    clock.RunFor(hours * 3600)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+
+    handlers = [handler for room in rooms for handler in room.devices.values()]
+    detection = [next((at - start for at, status in record if status == 'Disconnected'), None)
+                 for record in changes]
+    return {
+        'wall': wall,
+        'cpu': cpu,
+        'handlers': len(handlers),
+        'frames': sum(handler.GetHealth()['FramesSent'] for handler in handlers),
+        'detection': detection,
+        'changes': changes,
+    }
+
+
+def _Run(hours, count, shared):
+    code = ('import sys, json; sys.path.insert(0, {here!r}); import bench_soak; '
+            'print("SOAK", json.dumps(bench_soak._Child({hours!r}, {count!r}, {shared!r})))')
+    code = code.format(here=os.path.dirname(os.path.abspath(__file__)), hours=hours,
+                       count=count, shared=shared)
+    with open(os.devnull, 'w') as devnull:
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=_setup.SRC_DIR,
+                                         stderr=devnull, universal_newlines=True)
+    line = next(line for line in output.splitlines() if line.startswith('SOAK '))
+    return json.loads(line[len('SOAK '):])
+
+
+def main():
+    args = sys.argv[1:]
+    shared = '--unshared' not in args
+    args = [arg for arg in args if arg != '--unshared']
+    hours = float(args[0]) if args else HOURS
+    counts = [int(arg) for arg in args[1:]] or COUNTS
+
+    print('{} poll timers, {} simulated hours'.format(
+        'shared' if shared else 'per-handler', hours))
+    print('{:>6} {:>9} {:>8} {:>9} {:>14} {:>12} {:>12} {:>13}'.format(
+        'rooms', 'handlers', 'wall', 'speed-up', 'cpu/handler-h', 'frames/h', 'detection',
+        'deterministic'))
+    for count in counts:
+        first = _Run(hours, count, shared)
+        second = _Run(hours, count, shared)
+        detected = [value for value in first['detection'] if value is not None]
+        handlers = first['handlers']
+        print('{:>6} {:>9} {:>6.2f} s {:>8.0f}x {:>11.2f} ms {:>12.1f} {:>12} {:>13}'.format(
+            count, handlers, first['wall'], hours * 3600 / first['wall'],
+            first['cpu'] / (handlers * hours) * 1e3, first['frames'] / (handlers * hours),
+            '{:.0f}-{:.0f} s'.format(min(detected), max(detected)) if detected else 'never',
+            'yes' if first['changes'] == second['changes'] else 'NO'))
+
+
+if __name__ == '__main__':
+    main()
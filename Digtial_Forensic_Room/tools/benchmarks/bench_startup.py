@@ -0,0 +1,72 @@
+"""
+Program start timing: how long main.py takes to import and how long until the
+panel shows its first page, against the extronlib stand-in.
+
+Each run imports main.py in a fresh interpreter so that nothing is cached
+between runs except bytecode, as on a processor. A first, unreported run
+writes the bytecode. The median of the runs is reported.
+
+    python tools/benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+import _setup
+
+RUNS = 5
+
+# Runs in the child interpreter. Points every device address at the local
+# host, where nothing listens, so connects fail at once instead of timing out.
+# Records the time of the first ShowPage call, then imports main and reports
+# times relative to interpreter start-up of the script.
+_CHILD = r'''
+import os, sys, time
+start = time.perf_counter()
+sys.path[:0] = [{src!r}, {tools!r}]
+import extronlib.device, extronlib.interface
+extronlib_done = time.perf_counter()
+extronlib.interface.Redirect('*', None, '127.0.0.1')
+first_page = []
+_ShowPage = extronlib.device.UIDevice.ShowPage
+def ShowPage(self, page):
+    if not first_page:
+        first_page.append(time.perf_counter())
+    return _ShowPage(self, page)
+extronlib.device.UIDevice.ShowPage = ShowPage
+import main
+done = time.perf_counter()
+drivers = sorted(name for name in sys.modules if name.startswith('modules.device.'))
+print('STARTUP', extronlib_done - start, (first_page or [done])[0] - start, done - start, len(drivers))
+sys.stdout.flush()
+os._exit(0)
+'''
+
+
+def _Run():
+    code = _CHILD.format(src=_setup.SRC_DIR, tools=_setup.TOOLS_DIR)
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    with open(os.devnull, 'w') as devnull:
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=_setup.SRC_DIR,
+                                         env=env, stderr=devnull, universal_newlines=True)
+    line = next(line for line in output.splitlines() if line.startswith('STARTUP '))
+    fields = line.split()[1:]
+    return [float(value) for value in fields[:3]] + [int(fields[3])]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    _Run()
+    results = [_Run() for _ in range(runs)]
+
+    labels = ('extronlib import', 'time to first page', 'main import (devices built)')
+    for index, label in enumerate(labels):
+        median = statistics.median(result[index] for result in results)
+        print('{:<32} {:8.2f} ms'.format(label, median * 1e3))
+    print('{:<32} {:8d}'.format('driver modules loaded', results[-1][3]))
+
+
+if __name__ == '__main__':
+    main()
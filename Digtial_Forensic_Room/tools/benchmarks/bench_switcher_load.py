@@ -0,0 +1,134 @@
+"""
+Tie load against the DTP CrossPoint simulator: several switcher connections,
+each a device module behind a ConnectionHandler on the extronlib stand-in,
+issue random audio/video ties for a while.
+
+It reports the ties sent and confirmed, and the latency from Set to the
+module's OutputTieStatus feedback. That latency covers the simulator's
+shaped response, the module's parser and the tie engine. Each tie changes
+its output, since the module only reports changes; a tie superseded on the
+same connection and output before its feedback arrived is counted apart.
+The simulator's latency, jitter, fragmentation and busy rate are options.
+
+    python tools/benchmarks/bench_switcher_load.py [--clients N] [--seconds S]
+        [--rate TIES_PER_S] [--latency S] [--jitter S] [--fragment BYTES] [--busy RATE]
+"""
+import argparse
+import contextlib
+import io
+import random
+import statistics
+import time
+
+import _setup
+
+import extronlib
+import extronlib.interface
+
+from simulators.dtp_crosspoint import DTPCrossPoint
+
+from modules.device.extr_matrix_DTP_CrossPoint_82_84_4kSeriesv1872 import SSHClass
+from modules.helper.ConnectionHandler import GetConnectionHandler
+
+MODEL = 'DTP CrossPoint 84 4K IPCP SA'
+
+
+def _Percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _Connect(sim, clients):
+    extronlib.interface.Redirect('192.168.1.12', 22023, '127.0.0.1', sim.Port)
+    switchers = []
+    for _ in range(clients):
+        switcher = GetConnectionHandler(
+            SSHClass('192.168.1.12', 22023, Credentials=('admin', ''), Model=MODEL),
+            'ExecutiveMode', DisconnectLimit=15, pollFrequency=1)
+        switcher.Connect()
+        switchers.append(switcher)
+
+    # The module turns echo off and verbose mode on over its first polls.
+    deadline = time.monotonic() + 15
+    while any(switcher.VerboseDisabled for switcher in switchers):
+        if time.monotonic() > deadline:
+            raise SystemExit('switchers did not finish connecting')
+        time.sleep(0.1)
+    return switchers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--clients', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--rate', type=float, default=200.0)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--jitter', type=float, default=0.005)
+    parser.add_argument('--fragment', type=int, default=0)
+    parser.add_argument('--busy', type=float, default=0.0)
+    args = parser.parse_args()
+
+    sim = DTPCrossPoint(Model='84', Latency=args.latency, Jitter=args.jitter,
+                        Fragment=args.fragment, BusyRate=args.busy, Seed=1)
+    sim.Start()
+    loop = extronlib.GetLoop()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        switchers = _Connect(sim, args.clients)
+
+        # (switcher index, output): (input, sent at) of the tie in flight
+        pending = {}
+        latencies = []
+
+        def Feedback(index, command, value, qualifier):
+            key = (index, int(qualifier['Output']))
+            tie = pending.get(key)
+            if tie is not None and tie[0] == int(value):
+                latencies.append(time.perf_counter() - tie[1])
+                del pending[key]
+
+        for index, switcher in enumerate(switchers):
+            for output in range(1, 5):
+                switcher.SubscribeStatus('OutputTieStatus',
+                                         {'Output': str(output), 'Tie Type': 'Audio/Video'},
+                                         lambda c, v, q, i=index: Feedback(i, c, v, q))
+
+        rng = random.Random(1)
+        count = int(args.seconds * args.rate)
+        superseded = 0
+        start = time.perf_counter()
+        for sent in range(count):
+            index = rng.randrange(len(switchers))
+            output = rng.randint(1, 4)
+            current = switchers[index].ReadStatus(
+                'OutputTieStatus', {'Output': str(output), 'Tie Type': 'Audio/Video'})
+            input_ = rng.choice([i for i in range(1, 9) if str(i) != current])
+            if (index, output) in pending:
+                superseded += 1
+            pending[(index, output)] = (input_, time.perf_counter())
+            loop.CallSoon(switchers[index].Set, 'MatrixTieCommand', None,
+                          {'Input': str(input_), 'Output': str(output),
+                           'Tie Type': 'Audio/Video'})
+            remaining = start + (sent + 1) / args.rate - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+        time.sleep(0.5 + args.latency + args.jitter)
+
+    stats = sim.GetStats()
+    print('{} clients, {:.0f} ties/s for {} s, simulator latency {} s + up to {} s, '
+          'fragment {}, busy {}'.format(args.clients, args.rate, args.seconds, args.latency,
+                                        args.jitter, args.fragment or 'off', args.busy))
+    print('{:<28} {:>10}'.format('ties sent', count))
+    print('{:<28} {:>10}'.format('ties confirmed', len(latencies)))
+    print('{:<28} {:>10}'.format('ties superseded', superseded))
+    print('{:<28} {:>10}'.format('refused busy (E22)', stats['Busy']))
+    if latencies:
+        print('{:<28} {:>7.2f} ms'.format('tie feedback p50', statistics.median(latencies) * 1e3))
+        print('{:<28} {:>7.2f} ms'.format('tie feedback p95', _Percentile(latencies, 0.95) * 1e3))
+        print('{:<28} {:>7.2f} ms'.format('tie feedback max', max(latencies) * 1e3))
+    print('{:<28} {:>10}'.format('simulator commands', stats['Commands']))
+    print('{:<28} {:>10}'.format('simulator bytes out', stats['BytesOut']))
+
+
+if __name__ == '__main__':
+    main()
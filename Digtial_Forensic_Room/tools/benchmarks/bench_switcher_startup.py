@@ -0,0 +1,63 @@
+"""
+Startup time and memory of instantiating many DTP CrossPoint modules, as a
+processor running many rooms does.
+
+    python tools/benchmarks/bench_switcher_startup.py [count]
+"""
+import sys
+import time
+import tracemalloc
+
+import _setup  # noqa: F401
+
+COUNT = 50
+MODELS = (
+    'DTP CrossPoint 84 4K IPCP SA',
+    'DTP CrossPoint 82 4K IPCP MA 70',
+)
+
+
+def _Instantiate(module, count):
+    switchers = []
+    for index in range(count):
+        switchers.append(module.SSHClass('127.0.0.1', 22023 + index,
+                                         Credentials=('admin', None),
+                                         Model=MODELS[index % len(MODELS)]))
+    return switchers
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    start = time.perf_counter()
+    import modules.device.extr_matrix_DTP_CrossPoint_82_84_4kSeriesv1872 as SwitcherModule
+    importTime = time.perf_counter() - start
+
+    # First instance builds the shared response table; time it separately.
+    start = time.perf_counter()
+    first = _Instantiate(SwitcherModule, 1)
+    firstTime = time.perf_counter() - start
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    switchers = _Instantiate(SwitcherModule, count)
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in snapshot.compare_to(baseline, 'filename'))
+    shared = all(switcher.EDIDStates is switchers[index % len(MODELS)].EDIDStates
+                 for index, switcher in enumerate(switchers))
+
+    print('{:<32} {:8.2f} ms'.format('module import', importTime * 1e3))
+    print('{:<32} {:8.2f} ms'.format('first instance', firstTime * 1e3))
+    print('{:<32} {:8.2f} ms'.format('{} instances'.format(count), elapsed * 1e3))
+    print('{:<32} {:8.1f} us'.format('per instance', elapsed / count * 1e6))
+    print('{:<32} {:8.1f} KiB'.format('per instance memory', allocated / count / 1024))
+    print('{:<32} {!s:>8}'.format('model tables shared', shared))
+    return first, switchers
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Stand-in for the ControlScript extronlib package.
+
+This package runs the project's program and its helper and device modules
+unmodified on a development machine, against local device simulators.
+Interfaces use real sockets; events, timers and waits run on one event
+loop thread (see _loop). Run a program with:
+
+    python -m extronlib path/to/main.py [--map HOST:PORT=HOST:PORT] \
+        [--serial ALIAS:PORT=HOST:PORT] [--for SECONDS] [--virtual]
+
+extronlib.virtualtime runs Timer, Wait and time.monotonic() in virtual time.
+"""
+from extronlib._loop import loop as _loop
+
+__version__ = '0.2.0'
+
+
+def Platform():
+    return 'Stand-in'
+
+
+def Version():
+    return __version__
+
+
+def event(Object, EventName):
+    if not isinstance(Object, list):
+        Object = [Object]
+
+    if not isinstance(EventName, list):
+        EventName = [EventName]
+
+    def deco(handler):
+        for obj in Object:
+            for evtname in EventName:
+                setattr(obj, evtname, handler)
+        return handler
+
+    return deco
+
+
+def GetLoop():
+    """Stand-in only. The event loop every event runs on."""
+    return _loop
+
+
+def Sync(timeout=5):
+    """Stand-in only. Wait until the events queued so far have run."""
+    return _loop.Sync(timeout)
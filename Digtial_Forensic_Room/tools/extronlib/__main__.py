@@ -0,0 +1,65 @@
+"""
+Runs a ControlScript program on the stand-in.
+
+    python -m extronlib path/to/main.py [--map HOST:PORT=HOST:PORT]...
+        [--serial ALIAS:PORT=HOST:PORT]... [--for SECONDS] [--virtual]
+
+--map connects clients of HOST:PORT to the second address instead; a PORT
+of * maps every port of HOST. --serial carries serial port PORT of the
+device ALIAS (e.g. MainProcessor:COM1) over TCP. Without --for the program
+runs until interrupted. --virtual runs the --for SECONDS in virtual time
+(see extronlib.virtualtime), as fast as the program allows.
+"""
+import argparse
+import os
+import runpy
+import sys
+
+import extronlib.interface
+from extronlib._loop import loop
+
+
+def _Address(text):
+    host, _, port = text.rpartition(':')
+    return host, None if port == '*' else int(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m extronlib')
+    parser.add_argument('program')
+    parser.add_argument('--map', action='append', default=[])
+    parser.add_argument('--serial', action='append', default=[])
+    parser.add_argument('--for', dest='seconds', type=float)
+    parser.add_argument('--virtual', action='store_true')
+    args = parser.parse_args()
+    if args.virtual and args.seconds is None:
+        parser.error('--virtual needs --for')
+
+    clock = None
+    if args.virtual:
+        from extronlib.virtualtime import VirtualClock
+        clock = VirtualClock.Install()
+
+    for item in args.map:
+        source, _, target = item.partition('=')
+        extronlib.interface.Redirect(*_Address(source), *_Address(target))
+    for item in args.serial:
+        source, _, target = item.partition('=')
+        alias, _, port = source.partition(':')
+        extronlib.interface.MapSerialPort(alias, port, *_Address(target))
+
+    program = os.path.abspath(args.program)
+    sys.path.insert(0, os.path.dirname(program))
+    sys.argv = [program]
+    runpy.run_path(program, run_name='main')
+    if clock is not None:
+        clock.RunFor(args.seconds)
+        return
+    try:
+        loop.Join(args.seconds)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
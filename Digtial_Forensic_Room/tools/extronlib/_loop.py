@@ -0,0 +1,193 @@
+"""
+The stand-in's event loop.
+
+One daemon thread waits on a selector for socket data and runs due timers
+and queued calls. Every extronlib event of the stand-in (ReceiveData,
+Connected, Disconnected, button events, Timer and Wait functions) runs on
+this thread, one at a time. An exception raised by an event handler is
+printed with its traceback and the loop carries on, as the ControlScript
+trace does.
+
+In virtual time (see virtualtime) there is no loop thread: the thread that
+advances the clock runs everything.
+"""
+import heapq
+import itertools
+import selectors
+import socket
+import threading
+import traceback
+from collections import deque
+from time import monotonic
+
+
+class Handle:
+    """A scheduled call. Cancel() stops it if it has not run yet."""
+    __slots__ = ('When', 'Callback', 'Args', 'Cancelled')
+
+    def __init__(self, when, callback, args):
+        self.When = when
+        self.Callback = callback
+        self.Args = args
+        self.Cancelled = False
+
+    def Cancel(self):
+        self.Cancelled = True
+
+
+class Loop:
+    def __init__(self):
+        # Time source for every Timer and Wait. Replaceable, e.g. by a
+        # virtual clock.
+        self.Clock = monotonic
+        # True when driven by a virtual clock instead of the loop thread.
+        self.Virtual = False
+        self._selector = selectors.DefaultSelector()
+        self._timers = []
+        self._calls = deque()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._wakeRead, self._wakeWrite = socket.socketpair()
+        self._wakeRead.setblocking(False)
+        self._wakeWrite.setblocking(False)
+        self._selector.register(self._wakeRead, selectors.EVENT_READ, None)
+
+    def InLoop(self):
+        """True when called from the loop thread."""
+        return self.Virtual or threading.current_thread() is self._thread
+
+    def Started(self):
+        return self._thread is not None
+
+    def Start(self):
+        if self.Virtual:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._Run, name='extronlib',
+                                                daemon=True)
+                self._thread.start()
+
+    def Join(self, timeout=None):
+        """Block until the loop thread ends (it runs until the process
+        exits) or timeout seconds pass."""
+        self.Start()
+        self._thread.join(timeout)
+
+    def CallSoon(self, callback, *args):
+        """Run callback(*args) on the loop thread."""
+        with self._lock:
+            self._calls.append((callback, args))
+        if not self.InLoop():
+            self._Wake()
+        self.Start()
+
+    def CallAt(self, when, callback, *args):
+        """Run callback(*args) on the loop thread once Clock() reaches
+        when. Returns a Handle."""
+        handle = Handle(when, callback, args)
+        with self._lock:
+            heapq.heappush(self._timers, (when, next(self._sequence), handle))
+            # The loop only needs waking when it may be sleeping past when.
+            first = self._timers[0][2] is handle
+        if first and not self.InLoop():
+            self._Wake()
+        self.Start()
+        return handle
+
+    def CallLater(self, delay, callback, *args):
+        """Run callback(*args) on the loop thread after delay seconds.
+        Returns a Handle."""
+        return self.CallAt(self.Clock() + delay, callback, *args)
+
+    def Register(self, sock, callback):
+        """Call callback(sock) on the loop thread whenever sock is
+        readable."""
+        if self.InLoop():
+            self._selector.register(sock, selectors.EVENT_READ, callback)
+        else:
+            self.CallSoon(self._selector.register, sock, selectors.EVENT_READ, callback)
+
+    def Unregister(self, sock):
+        if self.InLoop():
+            self._Unregister(sock)
+        else:
+            self.CallSoon(self._Unregister, sock)
+
+    def Sync(self, timeout=5):
+        """Block until every call queued before this one has run. Returns
+        False if that took longer than timeout seconds."""
+        if self.InLoop():
+            return True
+        done = threading.Event()
+        self.CallSoon(done.set)
+        return done.wait(timeout)
+
+    def _Unregister(self, sock):
+        try:
+            self._selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+
+    def _Wake(self):
+        try:
+            self._wakeWrite.send(b'\0')
+        except OSError:
+            # The wake-up socket is full, so the loop is already due to wake.
+            pass
+
+    def NextDue(self):
+        """Clock() time of the next timer, the current time when calls are
+        queued and None when nothing is scheduled."""
+        with self._lock:
+            if self._calls:
+                return self.Clock()
+            if self._timers:
+                return self._timers[0][0]
+        return None
+
+    def Timeout(self):
+        """Seconds until there is something to run, or None."""
+        due = self.NextDue()
+        return None if due is None else max(0.0, due - self.Clock())
+
+    def _Run(self):
+        while True:
+            self.RunOnce(self.Timeout())
+
+    def RunOnce(self, timeout=0):
+        """Wait up to timeout seconds for socket data, then run the socket
+        callbacks, the timers due and the calls queued."""
+        for key, _ in self._selector.select(timeout):
+            if key.data is None:
+                try:
+                    while self._wakeRead.recv(4096):
+                        pass
+                except OSError:
+                    pass
+            else:
+                self._Invoke(key.data, (key.fileobj,))
+
+        now = self.Clock()
+        ready = []
+        with self._lock:
+            while self._timers and self._timers[0][0] <= now:
+                handle = heapq.heappop(self._timers)[2]
+                if not handle.Cancelled:
+                    ready.append((handle.Callback, handle.Args))
+            while self._calls:
+                ready.append(self._calls.popleft())
+        for callback, args in ready:
+            self._Invoke(callback, args)
+
+    @staticmethod
+    def _Invoke(callback, args):
+        try:
+            callback(*args)
+        except Exception:
+            traceback.print_exc()
+
+
+# The stand-in's one loop.
+loop = Loop()
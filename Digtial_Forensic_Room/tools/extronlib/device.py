@@ -0,0 +1,50 @@
+"""
+Stand-in for extronlib.device.
+
+UIDevice keeps the page and popups it was told to show, so a program run
+off-box can be checked without a panel. Press() stands in for a finger on
+the panel.
+"""
+from extronlib._loop import loop as _loop
+
+
+class ProcessorDevice:
+    def __init__(self, DeviceAlias, PartNumber=None):
+        self.DeviceAlias = DeviceAlias
+        self.PartNumber = PartNumber
+
+
+class UIDevice:
+    def __init__(self, DeviceAlias, PartNumber=None):
+        self.DeviceAlias = DeviceAlias
+        self.PartNumber = PartNumber
+        self.CurrentPage = None
+        # popup name: Handle of its hide call, or None when shown until hidden
+        self.Popups = {}
+        # ID: Button
+        self._Buttons = {}
+
+    def ShowPage(self, page):
+        self.CurrentPage = page
+
+    def ShowPopup(self, popup, duration=0):
+        handle = self.Popups.get(popup)
+        if handle is not None:
+            handle.Cancel()
+        self.Popups[popup] = _loop.CallLater(duration, self.HidePopup, popup) if duration else None
+
+    def HidePopup(self, popup):
+        handle = self.Popups.pop(popup, None)
+        if handle is not None:
+            handle.Cancel()
+
+    def HideAllPopups(self):
+        for popup in list(self.Popups):
+            self.HidePopup(popup)
+
+    def Press(self, ID, Hold=0):
+        """Stand-in only. Press and release the button with ID on the loop
+        thread, Hold seconds apart."""
+        button = self._Buttons[ID]
+        _loop.CallSoon(button._Fire, 'Pressed')
+        _loop.CallLater(Hold, button._Fire, 'Released')
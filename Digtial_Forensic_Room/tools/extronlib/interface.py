@@ -0,0 +1,433 @@
+"""
+Stand-in for extronlib.interface on real sockets.
+
+Ethernet clients and servers use TCP or UDP sockets. SSH clients use plain
+TCP: the local simulators speak the device protocol without SSH. Serial
+and SP interfaces have no port to open, so they send to and receive from
+a TCP endpoint mapped with MapSerialPort(), or drop what they send when
+unmapped.
+
+Programs address devices by their installed IP addresses. Redirect()
+points those addresses at local simulators without changing the program:
+::
+
+    import extronlib.interface
+    extronlib.interface.Redirect('192.168.1.12', 22023, '127.0.0.1', 42023)
+    extronlib.interface.Redirect('192.168.1.12', None, '127.0.0.1')  # every port
+
+Events run on the stand-in's event loop thread (see extronlib._loop).
+"""
+import re
+import select
+import socket
+import threading
+
+from extronlib._loop import loop as _loop
+
+# (Hostname, IPPort or None, to hostname, to port or None), newest last
+_redirects = []
+
+# (DeviceAlias, Port): (hostname, port)
+_serialPorts = {}
+
+_DefaultConnectTimeout = 5
+
+
+def Redirect(Hostname, IPPort, ToHostname, ToIPPort=None):
+    """Stand-in only. Connect to ToHostname:ToIPPort whenever a client
+    interface connects to Hostname:IPPort. IPPort None matches every port,
+    ToIPPort None keeps the port and Hostname '*' matches every host."""
+    _redirects.append((Hostname, IPPort, ToHostname, ToIPPort))
+
+
+def MapSerialPort(DeviceAlias, Port, Hostname, IPPort):
+    """Stand-in only. Carry the serial port Port of the device DeviceAlias
+    (e.g. 'MainProcessor', 'COM1') over a TCP connection to
+    Hostname:IPPort."""
+    _serialPorts[(DeviceAlias, Port)] = (Hostname, IPPort)
+
+
+def _Resolve(hostname, port):
+    for host, ipport, tohost, toport in reversed(_redirects):
+        if host in (hostname, '*') and ipport in (port, None):
+            return tohost, port if toport is None else toport
+    return hostname, port
+
+
+def _Encode(data):
+    if isinstance(data, str):
+        return data.encode('latin-1', 'replace')
+    return bytes(data)
+
+
+class _Waiter:
+    # Collects data for a SendAndWait call until its delimiter is seen.
+
+    def __init__(self, delimiter):
+        self.Event = threading.Event()
+        self.Buffer = b''
+        self.End = None
+        self._tag = delimiter.get('deliTag')
+        if isinstance(self._tag, str):
+            self._tag = self._tag.encode('latin-1')
+        self._length = delimiter.get('deliLen')
+        rex = delimiter.get('deliRex')
+        if isinstance(rex, (str, bytes)):
+            rex = re.compile(_Encode(rex))
+        self._rex = rex
+
+    def Feed(self, data):
+        self.Buffer += data
+        if self._tag is not None:
+            index = self.Buffer.find(self._tag)
+            if index >= 0:
+                self.End = index + len(self._tag)
+        elif self._length is not None:
+            if len(self.Buffer) >= self._length:
+                self.End = self._length
+        elif self._rex is not None:
+            match = self._rex.search(self.Buffer)
+            if match:
+                self.End = match.end()
+        else:
+            self.End = len(self.Buffer)
+        if self.End is not None:
+            self.Event.set()
+        return self.End is not None
+
+
+class _InterfaceBase:
+    def __init__(self):
+        self.Connected = None
+        self.Disconnected = None
+        self.ReceiveData = None
+        self._Socket = None
+        self._Waiter = None
+        self._SendLock = threading.Lock()
+
+    def _Fire(self, name, *args):
+        handler = getattr(self, name)
+        if handler:
+            handler(self, *args)
+
+    def _Attach(self, sock):
+        self._Socket = sock
+        _loop.Register(sock, self._Readable)
+
+    def _Detach(self):
+        sock, self._Socket = self._Socket, None
+        if sock is not None:
+            _loop.Unregister(sock)
+            # Closed on the loop thread, after it stopped selecting on sock.
+            _loop.CallSoon(sock.close)
+        return sock is not None
+
+    def _Readable(self, sock):
+        if sock is not self._Socket:
+            return
+        try:
+            data = sock.recv(65536)
+        except OSError:
+            data = b''
+        if data:
+            self._Data(data)
+        elif self._Detach():
+            self._Lost()
+
+    def _Data(self, data):
+        waiter = self._Waiter
+        if waiter is not None and waiter.End is None:
+            if not waiter.Feed(data):
+                return
+            data = waiter.Buffer[waiter.End:]
+            if not data:
+                return
+        if self.ReceiveData:
+            self.ReceiveData(self, data)
+
+    def _Lost(self):
+        self._Fire('Disconnected', 'Disconnected')
+
+    def Send(self, data):
+        sock = self._Socket
+        if sock is None:
+            return
+        try:
+            with self._SendLock:
+                sock.sendall(_Encode(data))
+        except OSError:
+            if self._Detach():
+                _loop.CallSoon(self._Lost)
+
+    def SendAndWait(self, data, timeout, **delimiter):
+        waiter = _Waiter(delimiter)
+        self._Waiter = waiter
+        try:
+            self.Send(data)
+            sock = self._Socket
+            if sock is None:
+                return b''
+            if _loop.InLoop():
+                # The loop can not read for us while we block it, so read
+                # directly.
+                deadline = _loop.Clock() + timeout
+                while waiter.End is None:
+                    remaining = deadline - _loop.Clock()
+                    if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                        break
+                    self._Readable(sock)
+                    if self._Socket is None:
+                        break
+            else:
+                waiter.Event.wait(timeout)
+        finally:
+            self._Waiter = None
+        if waiter.End is None:
+            return b''
+        return waiter.Buffer[:waiter.End]
+
+
+class EthernetClientInterface(_InterfaceBase):
+    def __init__(self, Hostname, IPPort, Protocol='TCP', ServicePort=0,
+                 Credentials=None, bufferSize=4096):
+        super().__init__()
+        self.Hostname = Hostname
+        self.IPAddress = Hostname
+        self.IPPort = IPPort
+        self.Protocol = Protocol
+        self.ServicePort = ServicePort
+        self.Credentials = Credentials
+        self._KeepAlive = None
+        if Protocol == 'UDP':
+            self._OpenUDP()
+
+    def _OpenUDP(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('', self.ServicePort or 0))
+        self._Attach(sock)
+
+    def _Readable(self, sock):
+        if self.Protocol != 'UDP':
+            return super()._Readable(sock)
+        try:
+            data = sock.recv(65536)
+        except OSError:
+            return
+        self._Data(data)
+
+    def Send(self, data):
+        if self.Protocol == 'UDP':
+            if self._Socket is not None:
+                self._Socket.sendto(_Encode(data), _Resolve(self.Hostname, self.IPPort))
+        else:
+            super().Send(data)
+
+    def Connect(self, timeout=None):
+        if self.Protocol == 'UDP':
+            return 'Connected'
+        if self._Socket is not None:
+            return 'ConnectedAlready'
+
+        address = _Resolve(self.Hostname, self.IPPort)
+        source = ('', self.ServicePort) if self.ServicePort else None
+        try:
+            sock = socket.create_connection(address, timeout or _DefaultConnectTimeout, source)
+        except socket.timeout:
+            return 'TimedOut'
+        except ConnectionRefusedError:
+            return 'ConnectionRefused'
+        except socket.gaierror:
+            return 'HostNotFound'
+        except OSError as err:
+            return err.strerror or type(err).__name__
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._Attach(sock)
+        _loop.CallSoon(self._Fire, 'Connected', 'Connected')
+        return 'Connected'
+
+    def Disconnect(self):
+        if self.Protocol != 'UDP' and self._Detach():
+            _loop.CallSoon(self._Lost)
+
+    def StartKeepAlive(self, interval, data):
+        from extronlib.system import Timer
+        self.StopKeepAlive()
+        self._KeepAlive = Timer(interval, lambda timer, count: self.Send(data))
+
+    def StopKeepAlive(self):
+        if self._KeepAlive is not None:
+            self._KeepAlive.Stop()
+            self._KeepAlive = None
+
+
+class SerialInterface(_InterfaceBase):
+    def __init__(self, Host, Port, Baud=9600, Data=8, Parity='None', Stop=1,
+                 FlowControl='Off', CharDelay=0, Mode='RS232'):
+        super().__init__()
+        self.Host = Host
+        self.Port = Port
+        self.Initialize(Baud, Data, Parity, Stop, FlowControl, CharDelay, Mode)
+        self._Open()
+
+    def Initialize(self, Baud=9600, Data=8, Parity='None', Stop=1, FlowControl='Off',
+                   CharDelay=0, Mode='RS232'):
+        self.Baud = Baud
+        self.Data = Data
+        self.Parity = Parity
+        self.Stop = Stop
+        self.FlowControl = FlowControl
+        self.CharDelay = CharDelay
+        self.Mode = Mode
+
+    def _Open(self):
+        address = _serialPorts.get((getattr(self.Host, 'DeviceAlias', self.Host), self.Port))
+        if address is None or self._Socket is not None:
+            return
+        try:
+            sock = socket.create_connection(address, _DefaultConnectTimeout)
+        except OSError:
+            return
+        sock.settimeout(None)
+        self._Attach(sock)
+
+    def _Lost(self):
+        # A serial port does not disconnect; the mapped connection is
+        # reopened on the next send.
+        pass
+
+    def Send(self, data):
+        if self._Socket is None:
+            self._Open()
+        super().Send(data)
+
+
+class SPInterface(SerialInterface):
+    def __init__(self, Host):
+        super().__init__(Host, 'SPI')
+
+
+class ClientObject:
+    """A client connected to an EthernetServerInterfaceEx."""
+
+    def __init__(self, server, sock, address):
+        self._Server = server
+        self._Socket = sock
+        self.IPAddress = address[0]
+        self.ServicePort = address[1]
+        self.Hostname = address[0]
+        self._SendLock = threading.Lock()
+
+    def Send(self, data):
+        sock = self._Socket
+        if sock is None:
+            return
+        data = _Encode(data)
+        if self._Server.Protocol == 'UDP':
+            sock.sendto(data, (self.IPAddress, self.ServicePort))
+            return
+        try:
+            with self._SendLock:
+                sock.sendall(data)
+        except OSError:
+            self._Server._Drop(self)
+
+    def Disconnect(self):
+        self._Server._Drop(self)
+
+
+class EthernetServerInterfaceEx:
+    def __init__(self, IPPort, Protocol='TCP', Interface='Any', MaxClients=None):
+        self.IPPort = IPPort
+        self.Protocol = Protocol
+        self.Interface = Interface
+        self.MaxClients = MaxClients
+        self.Clients = []
+        self.Connected = None
+        self.Disconnected = None
+        self.ReceiveData = None
+        self._Socket = None
+        self._StopHandle = None
+        # UDP: (address, port): ClientObject
+        self._Peers = {}
+
+    def StartListen(self, timeout=0):
+        if self._Socket is not None:
+            return 'Listening'
+        address = '' if self.Interface in ('Any', 'LAN', 'AVLAN') else self.Interface
+        kind = socket.SOCK_DGRAM if self.Protocol == 'UDP' else socket.SOCK_STREAM
+        sock = socket.socket(socket.AF_INET, kind)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((address, self.IPPort))
+            if kind == socket.SOCK_STREAM:
+                sock.listen(socket.SOMAXCONN)
+        except OSError:
+            sock.close()
+            return 'PortUnavailable'
+        self._Socket = sock
+        _loop.Register(sock, self._Accept if kind == socket.SOCK_STREAM else self._Datagram)
+        if timeout:
+            self._StopHandle = _loop.CallLater(timeout, self.StopListen)
+        return 'Listening'
+
+    def StopListen(self):
+        if self._StopHandle is not None:
+            self._StopHandle.Cancel()
+            self._StopHandle = None
+        sock, self._Socket = self._Socket, None
+        if sock is not None:
+            _loop.Unregister(sock)
+            _loop.CallSoon(sock.close)
+
+    def _Fire(self, name, client, *args):
+        handler = getattr(self, name)
+        if handler:
+            handler(client, *args)
+
+    def _Accept(self, sock):
+        try:
+            conn, address = sock.accept()
+        except OSError:
+            return
+        if self.MaxClients is not None and len(self.Clients) >= self.MaxClients:
+            conn.close()
+            return
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = ClientObject(self, conn, address)
+        self.Clients.append(client)
+        _loop.Register(conn, lambda conn: self._Readable(client, conn))
+        self._Fire('Connected', client, 'Connected')
+
+    def _Readable(self, client, conn):
+        try:
+            data = conn.recv(65536)
+        except OSError:
+            data = b''
+        if data:
+            self._Fire('ReceiveData', client, data)
+        else:
+            self._Drop(client)
+
+    def _Datagram(self, sock):
+        try:
+            data, address = sock.recvfrom(65536)
+        except OSError:
+            return
+        client = self._Peers.get(address)
+        if client is None:
+            client = self._Peers[address] = ClientObject(self, sock, address)
+            self.Clients.append(client)
+        self._Fire('ReceiveData', client, data)
+
+    def _Drop(self, client):
+        if client not in self.Clients:
+            return
+        self.Clients.remove(client)
+        if self.Protocol == 'UDP':
+            self._Peers.pop((client.IPAddress, client.ServicePort), None)
+            return
+        sock, client._Socket = client._Socket, None
+        _loop.Unregister(sock)
+        _loop.CallSoon(sock.close)
+        _loop.CallSoon(self._Fire, 'Disconnected', client, 'Disconnected')
@@ -0,0 +1,150 @@
+"""
+Stand-in for extronlib.system: ProgramLog, Timer, Wait and MESet.
+
+Timer and Wait functions run on the stand-in's event loop thread.
+"""
+from extronlib._loop import loop as _loop
+
+
+def ProgramLog(Entry, Severity='error'):
+    print('{}: {}'.format(Severity, Entry))
+
+
+class Timer:
+    """Calls Function(timer, count) every Interval seconds. Starts running
+    when created."""
+
+    def __init__(self, Interval, Function=None):
+        self.Interval = Interval
+        self.Function = Function
+        self.Count = 0
+        self.State = 'Stopped'
+        self._Handle = None
+        self._Due = 0.0
+        self.Restart()
+
+    def __call__(self, Function):
+        self.Function = Function
+        return Function
+
+    def _Run(self):
+        self._Handle = None
+        if self.State != 'Running':
+            return
+        self.Count += 1
+        # The next call is due one Interval after this one was due, so a
+        # late call does not delay the ones after it.
+        self._Due = max(self._Due + self.Interval, _loop.Clock())
+        self._Handle = _loop.CallAt(self._Due, self._Run)
+        if self.Function:
+            self.Function(self, self.Count)
+
+    def _Schedule(self):
+        self._Due = _loop.Clock() + self.Interval
+        self._Handle = _loop.CallAt(self._Due, self._Run)
+
+    def _Cancel(self):
+        if self._Handle:
+            self._Handle.Cancel()
+            self._Handle = None
+
+    def Change(self, Interval):
+        self.Interval = Interval
+
+    def Pause(self):
+        self._Cancel()
+        self.State = 'Paused'
+
+    def Resume(self):
+        if self.State != 'Running':
+            self.State = 'Running'
+            self._Schedule()
+
+    def Restart(self):
+        self._Cancel()
+        self.Count = 0
+        self.State = 'Running'
+        self._Schedule()
+
+    def Stop(self):
+        self._Cancel()
+        self.Count = 0
+        self.State = 'Stopped'
+
+
+class Wait:
+    """Calls Function() once, Time seconds after it is created or
+    restarted."""
+
+    def __init__(self, Time, Function=None):
+        self.Time = Time
+        self.Function = Function
+        self._Handle = None
+        self.Restart()
+
+    def __call__(self, Function):
+        self.Function = Function
+        return Function
+
+    def _Run(self):
+        self._Handle = None
+        if self.Function:
+            self.Function()
+
+    def Add(self, Time):
+        self.Time += Time
+        if self._Handle:
+            self._Handle.Cancel()
+            self._Handle = _loop.CallAt(self._Handle.When + Time, self._Run)
+
+    def Cancel(self):
+        if self._Handle:
+            self._Handle.Cancel()
+            self._Handle = None
+
+    def Change(self, Time):
+        self.Time = Time
+
+    def Restart(self):
+        self.Cancel()
+        self._Handle = _loop.CallLater(self.Time, self._Run)
+
+
+class MESet:
+    """A mutually exclusive set of buttons."""
+
+    def __init__(self, Objects):
+        self._Objects = list(Objects)
+        self._Current = None
+        # object: (off state, on state) set by SetStates
+        self._States = {}
+
+    @property
+    def Objects(self):
+        return self._Objects
+
+    def Append(self, obj):
+        self._Objects.append(obj)
+
+    def Remove(self, obj):
+        if isinstance(obj, int):
+            obj = self._Objects[obj]
+        self._Objects.remove(obj)
+        if obj is self._Current:
+            self._Current = None
+
+    def GetCurrent(self):
+        return self._Current
+
+    def SetCurrent(self, obj):
+        if isinstance(obj, int):
+            obj = self._Objects[obj]
+        self._Current = obj
+        for item in self._Objects:
+            off, on = self._States.get(item, (0, 1))
+            item.SetState(on if item is obj else off)
+
+    def SetStates(self, obj, offState, onState):
+        if isinstance(obj, int):
+            obj = self._Objects[obj]
+        self._States[obj] = (offState, onState)
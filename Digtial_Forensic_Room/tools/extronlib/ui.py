@@ -0,0 +1,64 @@
+"""
+Stand-in for extronlib.ui.
+
+Controls keep what the program set on them. Button events are plain
+attributes, so @event and eventEx can assign them.
+"""
+__all__ = ['Button', 'Label']
+
+
+class Button:
+    def __init__(self, Host, ID, holdTime=None, repeatTime=None):
+        self.Host = Host
+        self.ID = ID
+        self.Name = str(ID)
+        self.holdTime = holdTime
+        self.repeatTime = repeatTime
+        self.State = 0
+        self.Text = ''
+        self.Visible = True
+        self.Enabled = True
+        self.BlinkState = 'Not blinking'
+        self.PressedState = False
+        self.Pressed = None
+        self.Released = None
+        self.Held = None
+        self.Repeated = None
+        self.Tapped = None
+        Host._Buttons[ID] = self
+
+    def _Fire(self, name):
+        self.PressedState = name == 'Pressed'
+        handler = getattr(self, name)
+        if handler:
+            handler(self, name)
+
+    def SetState(self, State):
+        self.State = State
+
+    def SetText(self, Text):
+        self.Text = Text
+
+    def SetVisible(self, visible):
+        self.Visible = visible
+
+    def SetEnable(self, enable):
+        self.Enabled = enable
+
+    def SetBlinking(self, rate, state_list):
+        self.BlinkState = 'Blinking'
+
+
+class Label:
+    def __init__(self, Host, ID):
+        self.Host = Host
+        self.ID = ID
+        self.Name = str(ID)
+        self.Text = ''
+        self.Visible = True
+
+    def SetText(self, text):
+        self.Text = text
+
+    def SetVisible(self, visible):
+        self.Visible = visible
@@ -0,0 +1,74 @@
+"""
+Virtual time for the stand-in.
+
+Once installed, Timer, Wait and time.monotonic() follow a clock that only
+moves when told to, and there is no loop thread. RunFor() steps the clock
+from one due timer to the next, so a simulated day of polling runs in
+seconds of real time, and the same program with the same inputs always
+runs the same timers in the same order.
+::
+
+    from extronlib.virtualtime import VirtualClock
+    clock = VirtualClock.Install()   # before importing the program
+    import main
+    clock.RunFor(24 * 3600)
+
+time.monotonic() is replaced for the whole process, including modules that
+already did `from time import monotonic`. Socket data is still read as it
+arrives, between timers; SendAndWait and Connect still wait in real time.
+"""
+import sys
+import time
+
+from extronlib._loop import loop as _loop
+
+_monotonic = time.monotonic
+
+
+class VirtualClock:
+    _installed = None
+
+    def __init__(self, start=0.0):
+        self.Now = float(start)
+
+    def __call__(self):
+        return self.Now
+
+    @classmethod
+    def Install(cls, start=0.0):
+        """Drive the stand-in's loop and time.monotonic() from a new
+        VirtualClock and return it. Must be called before any Timer or Wait
+        starts the loop thread."""
+        if cls._installed is not None:
+            return cls._installed
+        if _loop.Started():
+            raise RuntimeError('the extronlib loop is already running in real time')
+
+        clock = cls(start)
+        _loop.Clock = clock
+        _loop.Virtual = True
+        time.monotonic = clock
+        for module in list(sys.modules.values()):
+            if getattr(module, 'monotonic', None) is _monotonic:
+                module.monotonic = clock
+        cls._installed = clock
+        return clock
+
+    def RunUntil(self, when):
+        """Run everything due up to time when, then leave the clock at
+        when."""
+        while True:
+            _loop.RunOnce(0)
+            due = _loop.NextDue()
+            if due is None or due > when:
+                break
+            self.Now = max(self.Now, due)
+        self.Now = max(self.Now, when)
+
+    def RunFor(self, seconds):
+        """Run the next seconds of virtual time."""
+        self.RunUntil(self.Now + seconds)
+
+    def RunPending(self):
+        """Run what is due now without moving the clock."""
+        self.RunUntil(self.Now)
@@ -0,0 +1,138 @@
+"""
+Replays recorded device traffic through a device module on the stand-in.
+
+A program records traffic with a Trace.CaptureLog (see
+modules.helper.Trace). Replaying one channel's frames feeds its RX frames to
+a fresh module's ReceiveData, at the original pace or as fast as possible,
+and collects the statuses the module reports and the frames it sends back.
+Saved results make a production trace a regression test for the module's
+parser, and the fast replay rate is its parser throughput.
+::
+
+    frames = Replayer.Load('traffic.log', 'modules.device.extr_matrix_*@192.168.1.12:22023')
+    device = SSHClass('192.168.1.12', 22023, Credentials=('admin', ''), Model=MODEL)
+    result = Replayer(frames, device).Run(Speed=None)
+
+Run it from tools/ with `python -m replay LOG` (see __main__).
+`python -m replay.check` runs the saved transcripts of the device modules
+(see check).
+"""
+import threading
+import time
+from fnmatch import fnmatchcase
+
+import extronlib
+
+
+class Replayer:
+    """Feeds frames, (timestamp, direction, frame) tuples of one channel,
+    through Device. Device's Send and SendAndWait are replaced so nothing
+    reaches the network: sent frames are collected and SendAndWait gets no
+    response."""
+
+    def __init__(self, Frames, Device):
+        self.Frames = list(Frames)
+        self.Device = Device
+        self.Statuses = []
+        self.Sent = []
+
+        newStatus = Device.NewStatus
+
+        def NewStatus(command, value, qualifier):
+            self.Statuses.append((command, value, qualifier))
+            newStatus(command, value, qualifier)
+
+        Device.NewStatus = NewStatus
+        Device.Send = self._Sent
+        Device.SendAndWait = lambda data, timeout, **delimiter: self._Sent(data) or b''
+
+    @staticmethod
+    def Channels(Path):
+        """The names of the channels recorded in the log at Path, with their
+        frame counts."""
+        counts = {}
+        for _, channel, _, _ in _Read(Path):
+            counts[channel] = counts.get(channel, 0) + 1
+        return counts
+
+    @staticmethod
+    def Load(Path, Channel):
+        """The (timestamp, direction, frame) tuples recorded in the log at
+        Path on the one channel matching the fnmatch pattern Channel."""
+        frames = [(stamp, channel, direction, frame)
+                  for stamp, channel, direction, frame in _Read(Path)
+                  if fnmatchcase(channel, Channel)]
+        names = {channel for _, channel, _, _ in frames}
+        if len(names) != 1:
+            raise ValueError('{} channels match {!r}: {}'.format(
+                len(names), Channel, ', '.join(sorted(names)) or 'none'))
+        return [(stamp, direction, frame) for stamp, _, direction, frame in frames]
+
+    def _Sent(self, data):
+        if isinstance(data, str):
+            data = data.encode('latin-1')
+        self.Sent.append(data)
+
+    def Run(self, Speed=1.0, timeout=None):
+        """Feed the RX frames on the stand-in's loop and return the results.
+
+        Speed scales the recorded pace (2.0 replays twice as fast); None
+        feeds every frame at once. The module's own timers still run in
+        real time, so a fast replay may return before a Wait the module
+        started has fired.
+
+        Returns a dict of Frames and Bytes fed, Seconds taken, FramesPerSecond
+        and BytesPerSecond, and the Statuses reported and frames Sent.
+        """
+        received = [(stamp, frame) for stamp, direction, frame in self.Frames
+                    if direction == 'RX']
+        loop = extronlib.GetLoop()
+        receive = self.Device.ReceiveData
+        done = threading.Event()
+        finished = []
+
+        def Feed(frames):
+            for _, frame in frames:
+                receive(self.Device, frame)
+
+        def Finish():
+            finished.append(time.perf_counter())
+            done.set()
+
+        start = time.perf_counter()
+        if Speed is None or not received:
+            loop.CallSoon(Feed, received)
+        else:
+            first = received[0][0]
+            base = loop.Clock()
+            for stamp, frame in received:
+                loop.CallAt(base + (stamp - first) / Speed, Feed, [(stamp, frame)])
+        if received and Speed is not None:
+            loop.CallAt(base + (received[-1][0] - first) / Speed, Finish)
+        else:
+            loop.CallSoon(Finish)
+        if timeout is None:
+            timeout = 10 + (0 if Speed is None or not received else
+                            (received[-1][0] - received[0][0]) / Speed)
+        if not done.wait(timeout):
+            raise TimeoutError('replay did not finish in {} s'.format(timeout))
+
+        seconds = max(finished[0] - start, 1e-9)
+        size = sum(len(frame) for _, frame in received)
+        return {
+            'Frames': len(received),
+            'Bytes': size,
+            'Seconds': seconds,
+            'FramesPerSecond': len(received) / seconds,
+            'BytesPerSecond': size / seconds,
+            'Statuses': list(self.Statuses),
+            'Sent': list(self.Sent),
+        }
+
+
+def _Read(Path):
+    # Imported here so that `python -m replay` can put src/ on sys.path
+    # first.
+    from modules.helper.Trace import LoadLog
+    with open(Path, 'rb') as f:
+        return LoadLog(f.read())
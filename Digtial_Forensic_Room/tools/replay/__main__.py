@@ -0,0 +1,107 @@
+"""
+Replays one device's recorded traffic through its device module.
+
+    python -m replay LOG [--channel PATTERN] [--class NAME] [--model MODEL]
+        [--speed X | --fast] [--save RESULT.json | --expect RESULT.json]
+
+The channel (e.g. 'modules.device.lg_display_*@192.168.1.12:2003') names
+the driver module and the device's address; it may be left out when the log
+holds one device channel. The module is built from --class (SSHClass, else
+SerialOverEthernetClass) and --model. --fast feeds every frame at once and
+reports the parser throughput. --save writes the statuses reported and the
+frames sent; --expect compares them with a saved result and exits 1 on a
+difference.
+"""
+import argparse
+import json
+import os
+import sys
+from fnmatch import fnmatchcase
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                       'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from replay import Replayer
+
+_Classes = ('SSHClass', 'SerialOverEthernetClass')
+
+
+def _Channel(path, pattern):
+    # The one device channel matching pattern. Handler channels hold the same
+    # traffic but do not name the driver.
+    channels = Replayer.Channels(path)
+    devices = [name for name in channels if name.startswith('modules.device.') and
+               fnmatchcase(name, pattern or '*')]
+    if len(devices) != 1:
+        for name, count in sorted(channels.items()):
+            print('{:>8}  {}'.format(count, name))
+        raise SystemExit('pick one device channel with --channel')
+    return devices[0]
+
+
+def _Device(channel, className, model):
+    from modules.helper.DeviceRegistry import GetDriver
+
+    moduleName, _, address = channel.partition('@')
+    host, _, port = address.rpartition(':')
+    driver = GetDriver(moduleName)
+    if className is None:
+        className = next(name for name in _Classes if hasattr(driver, name))
+    return getattr(driver, className)(host, int(port), Model=model)
+
+
+def _Result(result):
+    return {
+        'Statuses': [[command, value, qualifier] for command, value, qualifier in result['Statuses']],
+        'Sent': [frame.decode('latin-1') for frame in result['Sent']],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m replay')
+    parser.add_argument('log')
+    parser.add_argument('--channel')
+    parser.add_argument('--class', dest='className')
+    parser.add_argument('--model')
+    parser.add_argument('--speed', type=float, default=1.0)
+    parser.add_argument('--fast', action='store_true')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--save')
+    group.add_argument('--expect')
+    args = parser.parse_args()
+
+    channel = _Channel(args.log, args.channel)
+    frames = Replayer.Load(args.log, channel)
+    device = _Device(channel, args.className, args.model)
+    result = Replayer(frames, device).Run(Speed=None if args.fast else args.speed)
+
+    print(channel)
+    print('{:<20} {:>12}'.format('frames fed', result['Frames']))
+    print('{:<20} {:>12}'.format('bytes fed', result['Bytes']))
+    print('{:<20} {:>10.3f} s'.format('time', result['Seconds']))
+    print('{:<20} {:>12.0f}'.format('frames/s', result['FramesPerSecond']))
+    print('{:<20} {:>12.0f}'.format('bytes/s', result['BytesPerSecond']))
+    print('{:<20} {:>12}'.format('statuses', len(result['Statuses'])))
+    print('{:<20} {:>12}'.format('frames sent', len(result['Sent'])))
+
+    actual = _Result(result)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(actual, f, indent=1)
+    elif args.expect:
+        with open(args.expect) as f:
+            expected = json.load(f)
+        for key in ('Statuses', 'Sent'):
+            for index, (want, got) in enumerate(zip(expected[key], actual[key])):
+                if want != got:
+                    raise SystemExit('{} {}: expected {!r}, got {!r}'.format(key, index, want, got))
+            if len(expected[key]) != len(actual[key]):
+                raise SystemExit('{}: expected {}, got {}'.format(
+                    key, len(expected[key]), len(actual[key])))
+        print('matches {}'.format(args.expect))
+
+
+if __name__ == '__main__':
+    main()
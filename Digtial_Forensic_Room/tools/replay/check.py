@@ -0,0 +1,187 @@
+"""
+Checks device modules against saved transcripts of recorded device traffic.
+
+Each file in replay/transcripts/ names a device module class and model and
+holds a transcript of steps: a Set or Update call, the frames the module must
+send for it, the response the simulator recorded for those frames and the
+WriteStatus calls, in order, the module must make for that response. The
+recorded responses are then fed again in chunks of several responses, as a
+device sends them when the module falls behind, which checks the order the
+module's match table parses them in.
+
+The transcripts were saved from the device modules as they were before they
+were ported to the protocol engine (modules.helper.Protocol), so a difference
+is a change in the module's behaviour. Run it from tools/ with:
+
+    python -m replay.check [TRANSCRIPT ...]
+
+--save rewrites the expected frames and statuses of the transcripts from the
+modules of another source tree, such as an earlier revision:
+
+    git archive b6f4c69 Digtial_Forensic_Room/src | tar -x -C /tmp/old
+    python -m replay.check --save --src /tmp/old/Digtial_Forensic_Room/src
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+TRANSCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'transcripts')
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                       'src')
+
+# Responses fed at once by the chunked pass
+CHUNK = 8
+
+
+def _Text(data):
+    return data if isinstance(data, str) else data.decode('latin-1')
+
+
+def _Plain(value):
+    # Tuples and lists compare equal once saved.
+    return json.loads(json.dumps(value))
+
+
+class Check:
+    """Runs one transcript through a fresh instance of its device module.
+
+    Sent frames are collected instead of reaching the network; SendAndWait
+    gets no response. Echo and verbose mode are taken as set, as they are
+    once the module has connected.
+    """
+
+    def __init__(self, Transcript):
+        self.Transcript = Transcript
+        module = __import__(Transcript['Module'], fromlist=['_'])
+        self.Device = getattr(module, Transcript['Class'])('check', 1, Model=Transcript['Model'])
+        self.Sent = []
+        self.Statuses = []
+
+        device = self.Device
+        # Set-only modules, such as the LG Ethernet class, keep no statuses.
+        writeStatus = getattr(device, 'WriteStatus', None)
+
+        def WriteStatus(command, value, qualifier=None):
+            self.Statuses.append([command, value, qualifier])
+            writeStatus(command, value, qualifier)
+
+        if writeStatus is not None:
+            device.WriteStatus = WriteStatus
+        device.Send = self._Sent
+        device.SendAndWait = lambda data, timeout, **delimiter: self._Sent(data) or b''
+        device.Discard = device.Error = lambda message: None
+        for attribute in ('EchoDisabled', 'VerboseDisabled'):
+            if hasattr(device, attribute):
+                setattr(device, attribute, False)
+
+    def _Sent(self, data):
+        self.Sent.append(_Text(data))
+
+    def _Take(self, collected):
+        taken = _Plain(collected)
+        del collected[:]
+        return taken
+
+    def Run(self):
+        """Return the steps and chunks with the frames and statuses this
+        module produced, in the transcript's format."""
+        device = self.Device
+        steps = []
+        for kind, command, value, qualifier, _, response, _ in self.Transcript['Steps']:
+            if kind == 'Set':
+                device.Set(command, value, qualifier)
+            else:
+                device.Update(command, qualifier)
+            sent = self._Take(self.Sent)
+            if response:
+                device.ReceiveData(device, response.encode('latin-1'))
+            steps.append([kind, command, value, qualifier, sent, response,
+                          self._Take(self.Statuses)])
+
+        chunks = []
+        responses = [step[5] for step in steps if step[5]] if self.Transcript.get('Chunks') else []
+        for start in range(0, len(responses), CHUNK):
+            chunk = ''.join(responses[start:start + CHUNK])
+            device.ReceiveData(device, chunk.encode('latin-1'))
+            chunks.append(self._Take(self.Statuses))
+        return steps, chunks
+
+
+def _Save(path, transcript):
+    # One step or chunk per line, so a change to a transcript diffs by step.
+    lines = ['{']
+    for key, value in transcript.items():
+        if isinstance(value, list):
+            lines.append(' {}: ['.format(json.dumps(key)))
+            lines.append(',\n'.join('  ' + json.dumps(item) for item in value))
+            lines.append(' ],')
+        else:
+            lines.append(' {}: {},'.format(json.dumps(key), json.dumps(value)))
+    lines[-1] = lines[-1].rstrip(',')
+    lines.append('}')
+    with open(path, 'w') as f:
+        f.write('\n'.join(line for line in lines if line) + '\n')
+
+
+def _Compare(name, transcript, steps, chunks):
+    # Prints the differences; returns their number.
+    differences = 0
+    expected = transcript.get('ChunkStatuses', [])
+    if len(expected) != len(chunks):
+        differences += 1
+        print('{} chunks: expected {}, got {}'.format(name, len(expected), len(chunks)))
+    for index, (want, got) in enumerate(zip(transcript['Steps'], steps)):
+        call = '{} {}({!r}, {!r})'.format(want[0], want[1], want[2], want[3])
+        for label, position in (('sent', 4), ('statuses', 6)):
+            if want[position] != got[position]:
+                differences += 1
+                print('{} step {} {}: {} expected {!r}, got {!r}'.format(
+                    name, index, call, label, want[position], got[position]))
+    for index, (want, got) in enumerate(zip(expected, chunks)):
+        if want != got:
+            differences += 1
+            print('{} chunk {}: statuses expected {!r}, got {!r}'.format(name, index, want, got))
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m replay.check')
+    parser.add_argument('transcripts', nargs='*',
+                        help='transcript files (default: all in replay/transcripts)')
+    parser.add_argument('--save', action='store_true',
+                        help='rewrite the expected frames and statuses')
+    parser.add_argument('--src', default=SRC_DIR,
+                        help='source tree the device modules are imported from')
+    args = parser.parse_args()
+
+    if args.src not in sys.path:
+        sys.path.insert(0, args.src)
+    paths = args.transcripts or sorted(glob.glob(os.path.join(TRANSCRIPTS, '*.json')))
+
+    differences = 0
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        with open(path) as f:
+            transcript = json.load(f)
+        steps, chunks = Check(transcript).Run()
+        statuses = sum(len(step[6]) for step in steps) + sum(len(chunk) for chunk in chunks)
+        if args.save:
+            transcript['Steps'] = steps
+            transcript['ChunkStatuses'] = chunks
+            _Save(path, transcript)
+            print('{:<40} saved {} steps, {} statuses'.format(name, len(steps), statuses))
+            continue
+        found = _Compare(name, transcript, steps, chunks)
+        differences += found
+        print('{:<40} {} steps, {} statuses, {}'.format(
+            name, len(steps), statuses, '{} differences'.format(found) if found else 'ok'))
+
+    if differences:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
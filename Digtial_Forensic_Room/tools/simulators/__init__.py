@@ -0,0 +1,12 @@
+"""
+Local simulators of the devices the project's modules drive, for load and
+failure testing against the extronlib stand-in without production hardware.
+
+    * dtp_crosspoint - Extron DTP CrossPoint 82/84 4K (SIS over TCP)
+    * lg_ur640s - LG UR640S series displays (RS-232C through a serial device
+      server, several Set IDs on one line)
+
+Each simulator is a TCP server on its own thread (see _server) and can be
+started from a program or run standalone with `python -m simulators.<name>`
+from the tools directory.
+"""
@@ -0,0 +1,321 @@
+"""
+Base of the device simulators: a TCP server on its own thread that shapes
+what it sends like a slow or unreliable device would.
+
+A simulator subclasses SimulatorServer and implements Receive(), which
+parses the client's bytes and answers with Reply() or Broadcast(). The
+server adds the configured delays: a response goes out Latency plus up to
+Jitter seconds after its command was read, optionally split into fragments
+FragmentGap seconds apart, and no faster than the line rate when Baud is
+set. Responses on one connection always leave in order.
+
+Random choices (jitter, fragment sizes, busy injection) come from one
+random.Random seeded with Seed, so a run with a given seed and the same
+client traffic shapes its responses the same way.
+
+With SharedLine set, every connection shares one line, as clients of a
+serial device server share the device's serial port: the line rate then
+limits the device's traffic as a whole rather than per connection.
+"""
+import argparse
+import heapq
+import itertools
+import random
+import selectors
+import socket
+import threading
+from time import monotonic
+
+
+class Connection:
+    """One client connection. Simulators keep their per-connection state
+    (modes, buffered input) in its attributes."""
+
+    def __init__(self, sock, address):
+        self.Socket = sock
+        self.Address = address
+        self.Buffer = b''
+        # Time the last scheduled response on this connection goes out.
+        self._LastDue = 0.0
+        # Times the line is free to send and to receive more.
+        self._LineFree = 0.0
+        self._RxFree = 0.0
+
+
+class SimulatorServer:
+    Name = 'Simulator'
+
+    # Reply sent to a client over MaxConnections before it is closed.
+    Refusal = b''
+
+    # True when all connections share one line (see the module docstring).
+    SharedLine = False
+
+    def __init__(self, Port=0, Host='127.0.0.1', Latency=0.0, Jitter=0.0, Fragment=0,
+                 FragmentGap=0.0, BusyRate=0.0, MaxConnections=None, Baud=None, Seed=None):
+        self.Host = Host
+        self.Port = Port
+        self.Latency = Latency
+        self.Jitter = Jitter
+        self.Fragment = Fragment
+        self.FragmentGap = FragmentGap
+        self.BusyRate = BusyRate
+        self.MaxConnections = MaxConnections
+        self.Baud = Baud
+        self.Random = random.Random(Seed)
+        self.Connections = []
+        self._LineFree = 0.0
+        self._RxFree = 0.0
+        self.Stats = {'Connections': 0, 'Refused': 0, 'Commands': 0, 'Errors': 0, 'Busy': 0,
+                      'BytesIn': 0, 'BytesOut': 0}
+
+        self._lock = threading.RLock()
+        self._selector = selectors.DefaultSelector()
+        self._listener = None
+        self._thread = None
+        self._running = False
+        # (due, sequence, function, args) run on the server thread
+        self._calls = []
+        self._sequence = itertools.count()
+        self._wakeRead, self._wakeWrite = socket.socketpair()
+        self._wakeRead.setblocking(False)
+        self._wakeWrite.setblocking(False)
+
+    # -- Overridden by simulators ---------------------------------------
+
+    def Connected(self, conn):
+        """Called when a client connects. Reply() a greeting here."""
+
+    def Receive(self, conn, data):
+        """Called with each chunk of bytes a client sends."""
+        raise NotImplementedError
+
+    # -- Used by simulators ---------------------------------------------
+
+    def Reply(self, conn, data, delay=None):
+        """Send data to conn after the configured latency and jitter (or
+        after delay seconds), shaped by Fragment and Baud."""
+        if isinstance(data, str):
+            data = data.encode('latin-1')
+        if not data:
+            return
+        now = monotonic()
+        if delay is None:
+            delay = self.Latency + (self.Random.uniform(0, self.Jitter) if self.Jitter else 0)
+        due = max(now + delay, conn._LastDue)
+
+        size = len(data)
+        pieces = []
+        while data:
+            length = self.Random.randint(1, self.Fragment) if self.Fragment else len(data)
+            pieces.append(data[:length])
+            data = data[length:]
+        for index, piece in enumerate(pieces):
+            if index:
+                due += self.FragmentGap
+            if self.Baud:
+                # The piece goes out once the line is free, and occupies it
+                # for ten bit times per byte.
+                line = self._Line(conn)
+                due = max(due, line._LineFree)
+                line._LineFree = due + len(piece) * 10 / self.Baud
+                due = line._LineFree
+            self.CallAt(due, self._Send, conn, piece)
+        conn._LastDue = due
+        self.Stats['BytesOut'] += size
+
+    def Broadcast(self, data, exclude=None, where=None):
+        """Reply() data to every connection but exclude for which
+        where(conn) is true."""
+        for conn in list(self.Connections):
+            if conn is not exclude and (where is None or where(conn)):
+                self.Reply(conn, data)
+
+    def Busy(self):
+        """True when this command should be refused as busy, at
+        BusyRate."""
+        if self.BusyRate and self.Random.random() < self.BusyRate:
+            self.Stats['Busy'] += 1
+            return True
+        return False
+
+    def Arrival(self, conn, size):
+        """monotonic() time at which size bytes read from conn now have
+        fully crossed the line: now, with no Baud set."""
+        now = monotonic()
+        if not self.Baud:
+            return now
+        line = self._Line(conn)
+        line._RxFree = max(now, line._RxFree) + size * 10 / self.Baud
+        return line._RxFree
+
+    def _Line(self, conn):
+        return self if self.SharedLine else conn
+
+    def CallAt(self, when, function, *args):
+        """Run function(*args) on the server thread at monotonic() time
+        when."""
+        with self._lock:
+            heapq.heappush(self._calls, (when, next(self._sequence), function, args))
+        if threading.current_thread() is not self._thread:
+            try:
+                self._wakeWrite.send(b'\0')
+            except OSError:
+                pass
+
+    def Close(self, conn):
+        """Close conn once everything scheduled for it has been sent."""
+        self.CallAt(max(monotonic(), conn._LastDue), self._Drop, conn)
+
+    # -- Server ---------------------------------------------------------
+
+    def Start(self):
+        """Start listening on its own thread. Returns the port, which is
+        chosen by the system when Port is 0."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.Host, self.Port))
+        sock.listen(socket.SOMAXCONN)
+        sock.setblocking(False)
+        self._listener = sock
+        self.Port = sock.getsockname()[1]
+        self._selector.register(sock, selectors.EVENT_READ, self._Accept)
+        self._selector.register(self._wakeRead, selectors.EVENT_READ, None)
+        self._running = True
+        self._thread = threading.Thread(target=self._Run, name=self.Name, daemon=True)
+        self._thread.start()
+        return self.Port
+
+    def Stop(self):
+        """Close every connection and stop listening."""
+        self._running = False
+        self.CallAt(0, lambda: None)
+        if self._thread is not None:
+            self._thread.join(5)
+            self._thread = None
+
+    def Serve(self):
+        """Start and block until interrupted."""
+        self.Start()
+        print('{} listening on {}:{}'.format(self.Name, self.Host, self.Port))
+        try:
+            while self._thread.is_alive():
+                self._thread.join(1)
+        except KeyboardInterrupt:
+            self.Stop()
+
+    def GetStats(self):
+        with self._lock:
+            stats = dict(self.Stats)
+        stats['Clients'] = len(self.Connections)
+        return stats
+
+    def _Accept(self, listener):
+        try:
+            sock, address = listener.accept()
+        except OSError:
+            return
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn = Connection(sock, address)
+        if self.MaxConnections is not None and len(self.Connections) >= self.MaxConnections:
+            self.Stats['Refused'] += 1
+            if self.Refusal:
+                try:
+                    sock.send(self.Refusal)
+                except OSError:
+                    pass
+            sock.close()
+            return
+        self.Stats['Connections'] += 1
+        self.Connections.append(conn)
+        self._selector.register(sock, selectors.EVENT_READ, lambda s: self._Read(conn))
+        self.Connected(conn)
+
+    def _Read(self, conn):
+        try:
+            data = conn.Socket.recv(65536)
+        except OSError:
+            data = b''
+        if not data:
+            self._Drop(conn)
+            return
+        self.Stats['BytesIn'] += len(data)
+        self.Receive(conn, data)
+
+    def _Send(self, conn, data):
+        if conn not in self.Connections:
+            return
+        try:
+            conn.Socket.sendall(data)
+        except OSError:
+            self._Drop(conn)
+
+    def _Drop(self, conn):
+        if conn in self.Connections:
+            self.Connections.remove(conn)
+            self._selector.unregister(conn.Socket)
+            conn.Socket.close()
+
+    def _Run(self):
+        while self._running:
+            with self._lock:
+                timeout = max(0.0, self._calls[0][0] - monotonic()) if self._calls else None
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    try:
+                        while self._wakeRead.recv(4096):
+                            pass
+                    except OSError:
+                        pass
+                else:
+                    with self._lock:
+                        key.data(key.fileobj)
+            now = monotonic()
+            while True:
+                with self._lock:
+                    if not self._calls or self._calls[0][0] > now:
+                        break
+                    _, _, function, args = heapq.heappop(self._calls)
+                    function(*args)
+
+        for conn in list(self.Connections):
+            self._Drop(conn)
+        self._selector.unregister(self._listener)
+        self._listener.close()
+
+
+def ArgumentParser(description):
+    """An argparse parser with the options every simulator takes."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds before each response')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='up to this many more seconds, at random')
+    parser.add_argument('--fragment', type=int, default=0,
+                        help='split responses into pieces of at most this many bytes')
+    parser.add_argument('--fragment-gap', type=float, default=0.0,
+                        help='seconds between the pieces of a response')
+    parser.add_argument('--busy', type=float, default=0.0,
+                        help='fraction of commands refused as busy')
+    parser.add_argument('--max-connections', type=int)
+    parser.add_argument('--baud', type=int, help='limit the line to this bit rate')
+    parser.add_argument('--seed', type=int)
+    return parser
+
+
+def ServerOptions(args):
+    """SimulatorServer keyword arguments from ArgumentParser() options."""
+    return {
+        'Host': args.host,
+        'Port': args.port,
+        'Latency': args.latency,
+        'Jitter': args.jitter,
+        'Fragment': args.fragment,
+        'FragmentGap': args.fragment_gap,
+        'BusyRate': args.busy,
+        'MaxConnections': args.max_connections,
+        'Baud': args.baud,
+        'Seed': args.seed,
+    }
@@ -0,0 +1,515 @@
+"""
+Extron DTP CrossPoint 82/84 4K simulator.
+
+Speaks the SIS subset the DTP CrossPoint device module uses, over plain
+TCP (no SSH login):
+
+    * ties: in*out! / $ / %, in*! (all outputs), Esc Q ... | quick ties (Qik)
+    * tie dumps: w0*1*1VC (video) and w0*1*2VC (audio)
+    * echo (w0echo) and verbose (w3cv) modes; in verbose mode 2 and 3
+      queries are answered with their tags, and in 1 and 3 tie changes made
+      by other clients arrive unsolicited
+    * DSP gain and mute (WG/WM ...AU to DsG/DsM), mic signal levels and
+      group masters (WD...GRPM)
+    * input signal status (0LS), temperature (S), executive mode (X)
+    * HDCP authorization and status, video mute, freeze, test pattern,
+      aspect ratio, audio switch modes, EDID and logo queries
+    * global presets (n, to save and n. to recall) and scaler presets
+    * E codes for invalid commands and values, E22 when busy and E26 to
+      clients over the connection limit
+
+All clients share one device state. Run it standalone from tools/ with:
+
+    python -m simulators.dtp_crosspoint --port 22023 --model 84 [--latency 0.02]
+        [--jitter 0.01] [--fragment 4] [--busy 0.05] [--max-connections 4]
+
+or start it in a program and point the stand-in at it:
+::
+
+    sim = DTPCrossPoint(Model='84', Latency=0.01)
+    extronlib.interface.Redirect('192.168.1.12', 22023, '127.0.0.1', sim.Start())
+"""
+import re
+
+from simulators._server import ArgumentParser, ServerOptions, SimulatorServer
+
+# Model: (inputs, outputs)
+MODELS = {'82': (8, 2), '84': (8, 4)}
+
+# Highest output a tie dump reports; the rest of the row is '--'.
+_DumpWidth = 16
+
+_TieTypes = {b'!': 'All', b'%': 'Vid', b'$': 'Aud'}
+
+# Commands that are not W/w commands, tried in order at the start of the
+# buffer. The command character ends each one.
+_Simple = (
+    ('Tie', rb'(\d+)\*(\d+)([!$%])'),
+    ('TieAll', rb'(\d+)\*([!$%])'),
+    ('VideoMute', rb'(\d[AB]?)\*(\d)B'),
+    ('VideoMuteQuery', rb'(\d[AB]?)B'),
+    ('GlobalVideoMute', rb'(\d)\*B'),
+    ('Freeze', rb'(\d+)\*(\d)F'),
+    ('FreezeQuery', rb'(\d+)F'),
+    ('AutoImage', rb'(\d+)\*A'),
+    ('ExecutiveMode', rb'(\d)X'),
+    ('ExecutiveModeQuery', rb'X'),
+    ('SignalStatus', rb'0LS'),
+    ('Temperature', rb'S'),
+    ('ScalerPresetRecall', rb'2\*(\d+)\*(\d+)\.'),
+    ('ScalerPresetSave', rb'2\*(\d+)\*(\d+),'),
+    ('PresetRecall', rb'(\d+)\.'),
+    ('PresetSave', rb'(\d+),'),
+    ('Firmware', rb'Q'),
+    ('PartNumber', rb'N'),
+)
+_Simple = tuple((name, re.compile(rb'\A' + pattern)) for name, pattern in _Simple)
+
+# Bytes that can still turn into a simple command.
+_SimplePrefix = re.compile(rb'\A[0-9ABL*]*\Z')
+
+# The body of W/w commands, between the W and the CR (or | for quick ties).
+_Escaped = (
+    ('Echo', rb'([01])ECHO'),
+    ('EchoQuery', rb'ECHO'),
+    ('Verbose', rb'([0-3])CV'),
+    ('VerboseQuery', rb'CV'),
+    ('TieDump', rb'0\*(\d+)\*([12])VC'),
+    ('Dsp', rb'([GM])(\d{5})\*([-+]?\d+)AU'),
+    ('DspQuery', rb'([GM])(\d{5})AU'),
+    ('MicSignal', rb'V4000([0-3])(?:\*[01])?AU'),
+    ('Group', rb'D(\d+)\*([-+]?\d+)GRPM'),
+    ('GroupQuery', rb'D(\d+)GRPM'),
+    ('HdcpAuthorization', rb'E(\d+)\*([01])HDCP'),
+    ('HdcpAuthorizationQuery', rb'E(\d+)HDCP'),
+    ('HdcpInput', rb'I(\d+)HDCP'),
+    ('HdcpOutputAuthorization', rb'S(\d[AB]?)\*([01])HDCP'),
+    ('HdcpOutputAuthorizationQuery', rb'S(\d[AB]?)HDCP'),
+    ('HdcpOutput', rb'O(\d[AB]?)HDCP'),
+    ('InputAudioMode', rb'I(\d+)\*([0-2])AFMT'),
+    ('InputAudioModeQuery', rb'IAFMT'),
+    ('OutputAudioSelect', rb'O(\d+)\*([0-2])AFMT'),
+    ('OutputAudioSelectQuery', rb'OAFMT'),
+    ('Edid', rb'A(\d+)EDID'),
+    ('TestPattern', rb'(\d+)\*(\d)TEST'),
+    ('TestPatternQuery', rb'(\d+)TEST'),
+    ('Aspect', rb'(\d+)\*([12])ASPR'),
+    ('AspectQuery', rb'(\d+)ASPR'),
+    ('LogoQuery', rb'QLOGO'),
+)
+_Escaped = tuple((name, re.compile(rb'\A' + pattern + rb'\Z', re.I)) for name, pattern in _Escaped)
+
+_QuickTie = re.compile(rb'(\d+)\*(\d+)([!$%])')
+
+
+class SisError(Exception):
+    """Answered with E<code>."""
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.Code = code
+
+
+class DTPCrossPoint(SimulatorServer):
+    Name = 'DTP CrossPoint simulator'
+    Refusal = b'E26\r\n'
+
+    def __init__(self, Model='84', Echo=True, Verbose=0, **options):
+        super().__init__(**options)
+        self.Model = Model
+        self.Inputs, self.Outputs = MODELS[Model]
+        self.DefaultEcho = Echo
+        self.DefaultVerbose = Verbose
+
+        # Tied input per output, 0 when untied.
+        self.Video = [0] * self.Outputs
+        self.Audio = [0] * self.Outputs
+        self.ExecutiveMode = 0
+        # ('G' or 'M', object ID): value
+        self.Dsp = {}
+        self.Groups = {}
+        self.Signal = [1 if index % 2 == 0 else 0 for index in range(self.Inputs)]
+        self.HdcpAuthorization = [1] * self.Inputs
+        self.HdcpInput = [1 if signal else 0 for signal in self.Signal]
+        self.HdcpOutputAuthorization = {}
+        self.HdcpOutput = {}
+        self.VideoMute = {}
+        self.Freeze = {}
+        self.TestPattern = {}
+        self.Aspect = [2] * self.Inputs
+        self.InputAudioMode = [0] * self.Inputs
+        self.OutputAudio = [0] * self.Outputs
+        self.Edid = [1] * self.Inputs
+        # Preset number: (video ties, audio ties)
+        self.Presets = {}
+        self.Temperature = 41.5
+
+    # -- Connections ----------------------------------------------------
+
+    def Connected(self, conn):
+        conn.Echo = self.DefaultEcho
+        conn.Verbose = self.DefaultVerbose
+        self.Reply(conn, '(c) Copyright 2019, Extron Electronics, DTP CrossPoint {} 4K, '
+                         'V1.08, 60-1606-01\r\n'.format(self.Model))
+
+    def Receive(self, conn, data):
+        conn.Buffer += data
+        while True:
+            command = self._NextCommand(conn)
+            if command is None:
+                break
+            raw, kind, name, match = command
+            self.Stats['Commands'] += 1
+            response = self._Execute(conn, raw, kind, name, match)
+            if conn.Echo:
+                response = raw + b'\r\n' + response
+            self.Reply(conn, response)
+
+    def _NextCommand(self, conn):
+        # Returns (raw bytes, 'Escaped', 'Simple' or 'Error', name, match) for
+        # the next whole command in conn.Buffer, or None to wait for more.
+        buffer = conn.Buffer.lstrip(b'\r\n ')
+        conn.Buffer = buffer
+        if not buffer:
+            return None
+
+        if buffer[:1] in (b'w', b'W', b'\x1b'):
+            end = re.search(rb'[\r|]', buffer)
+            if end is None:
+                if len(buffer) > 256:
+                    conn.Buffer = b''
+                    return buffer, 'Error', None, None
+                return None
+            raw = buffer[:end.end()]
+            conn.Buffer = buffer[end.end():]
+            if buffer[:1] == b'\x1b':
+                return raw, 'Quick', None, raw
+            body = raw[1:-1]
+            for name, regex in _Escaped:
+                match = regex.match(body)
+                if match:
+                    return raw, 'Escaped', name, match
+            return raw, 'Error', None, None
+
+        for name, regex in _Simple:
+            match = regex.match(buffer)
+            if match:
+                conn.Buffer = buffer[match.end():]
+                return match.group(0), 'Simple', name, match
+        if _SimplePrefix.match(buffer) and len(buffer) < 32:
+            return None
+        # Not a command: drop up to the next terminator.
+        end = re.search(rb'[\r\n]', buffer)
+        index = end.end() if end else len(buffer)
+        conn.Buffer = buffer[index:]
+        return buffer[:index].rstrip(b'\r\n'), 'Error', None, None
+
+    def _Execute(self, conn, raw, kind, name, match):
+        if kind == 'Error':
+            self.Stats['Errors'] += 1
+            return b'E10\r\n'
+        if self.Busy():
+            return b'E22\r\n'
+        try:
+            if kind == 'Quick':
+                text = self._QuickTies(conn, match)
+            else:
+                text = getattr(self, '_' + name)(conn, *[group.decode() if group else group
+                                                         for group in match.groups()])
+        except SisError as err:
+            self.Stats['Errors'] += 1
+            text = 'E{:02d}'.format(err.Code)
+        return text.encode('latin-1') + b'\r\n'
+
+    # -- Helpers ----------------------------------------------------------
+
+    @staticmethod
+    def _Tagged(conn, tag, value):
+        return tag + value if conn.Verbose in (2, 3) else value
+
+    def _Input(self, text, allowZero=True):
+        number = int(text)
+        if number > self.Inputs or (number == 0 and not allowZero):
+            raise SisError(1)
+        return number
+
+    def _Output(self, text):
+        number = int(text.rstrip('ABab'))
+        if not 1 <= number <= self.Outputs:
+            raise SisError(12)
+        return number
+
+    def _Notify(self, conn, text):
+        # Tie changes reach the other clients in verbose modes 1 and 3.
+        self.Broadcast(text + '\r\n', exclude=conn, where=lambda other: other.Verbose in (1, 3))
+
+    def _ApplyTie(self, input_, output, kind):
+        if kind in ('All', 'Vid'):
+            self.Video[output - 1] = input_
+        if kind in ('All', 'Aud'):
+            self.Audio[output - 1] = input_
+
+    # -- Ties -------------------------------------------------------------
+
+    def _Tie(self, conn, input_, output, tie):
+        input_ = self._Input(input_)
+        output = self._Output(output)
+        kind = _TieTypes[tie.encode()]
+        self._ApplyTie(input_, output, kind)
+        text = 'Out{:02d} In{:02d} {}'.format(output, input_, kind)
+        self._Notify(conn, text)
+        return text
+
+    def _TieAll(self, conn, input_, tie):
+        input_ = self._Input(input_)
+        kind = _TieTypes[tie.encode()]
+        for output in range(1, self.Outputs + 1):
+            self._ApplyTie(input_, output, kind)
+        text = 'In{:02d} {}'.format(input_, kind)
+        self._Notify(conn, text)
+        return text
+
+    def _QuickTies(self, conn, raw):
+        # Esc Q in*out! in*out$ ... |
+        if raw[1:2] not in (b'Q', b'q') or not raw.endswith(b'|'):
+            raise SisError(10)
+        ties = _QuickTie.findall(raw[2:-1])
+        if not ties:
+            raise SisError(10)
+        checked = [(self._Input(i.decode()), self._Output(o.decode()), _TieTypes[t])
+                   for i, o, t in ties]
+        for input_, output, kind in checked:
+            self._ApplyTie(input_, output, kind)
+        self._Notify(conn, 'Qik')
+        return 'Qik'
+
+    def _TieDump(self, conn, start, plane):
+        start = int(start)
+        if not 1 <= start <= _DumpWidth:
+            raise SisError(12)
+        ties, tag = (self.Video, 'Vid') if plane == '1' else (self.Audio, 'Aud')
+        row = ['{:02d}'.format(ties[output - 1]) if output <= self.Outputs else '--'
+               for output in range(start, _DumpWidth + 1)]
+        return 'Vgp00 Out{:02d}*{}{}'.format(start, ' '.join(row), tag)
+
+    # -- Presets ----------------------------------------------------------
+
+    def _PresetSave(self, conn, number):
+        number = int(number)
+        if not 1 <= number <= 32:
+            raise SisError(11)
+        self.Presets[number] = (list(self.Video), list(self.Audio))
+        return 'Spr{:02d}'.format(number)
+
+    def _PresetRecall(self, conn, number):
+        number = int(number)
+        if number not in self.Presets:
+            raise SisError(11)
+        video, audio = self.Presets[number]
+        self.Video[:] = video
+        self.Audio[:] = audio
+        self._Notify(conn, 'Rpr{:02d}'.format(number))
+        return 'PrstR{}'.format(number)
+
+    def _ScalerPresetSave(self, conn, output, number):
+        self._Output(output)
+        if not 1 <= int(number) <= 128:
+            raise SisError(11)
+        return 'Spr{}*{:02d}'.format(output, int(number))
+
+    def _ScalerPresetRecall(self, conn, output, number):
+        self._Output(output)
+        if not 1 <= int(number) <= 128:
+            raise SisError(11)
+        return 'Rpr{}*{:02d}'.format(output, int(number))
+
+    # -- Modes ------------------------------------------------------------
+
+    def _Echo(self, conn, value):
+        conn.Echo = value == '1'
+        return 'Echo' + value
+
+    def _EchoQuery(self, conn):
+        return self._Tagged(conn, 'Echo', '1' if conn.Echo else '0')
+
+    def _Verbose(self, conn, value):
+        conn.Verbose = int(value)
+        return 'Vrb' + value
+
+    def _VerboseQuery(self, conn):
+        return self._Tagged(conn, 'Vrb', str(conn.Verbose))
+
+    def _ExecutiveMode(self, conn, mode):
+        if mode not in '012':
+            raise SisError(13)
+        self.ExecutiveMode = int(mode)
+        return 'Exe' + mode
+
+    def _ExecutiveModeQuery(self, conn):
+        return self._Tagged(conn, 'Exe', str(self.ExecutiveMode))
+
+    def _Firmware(self, conn):
+        return self._Tagged(conn, 'Ver01*', '1.08.0001')
+
+    def _PartNumber(self, conn):
+        return self._Tagged(conn, 'Pno', '60-1606-01')
+
+    # -- Audio ------------------------------------------------------------
+
+    def _Dsp(self, conn, kind, oid, value):
+        kind = kind.upper()
+        number = int(value)
+        if kind == 'M' and number not in (0, 1):
+            raise SisError(13)
+        if kind == 'G' and not -1000 <= number <= 240:
+            raise SisError(13)
+        self.Dsp[(kind, oid)] = number
+        return 'Ds{}{}*{}'.format(kind, oid, number)
+
+    def _DspQuery(self, conn, kind, oid):
+        kind = kind.upper()
+        return self._Tagged(conn, 'Ds{}{}*'.format(kind, oid), str(self.Dsp.get((kind, oid), 0)))
+
+    def _MicSignal(self, conn, mic):
+        return 'DsV4000{}*1*{}'.format(mic, 300 + 100 * int(mic))
+
+    def _Group(self, conn, group, value):
+        if not 1 <= int(group) <= 32:
+            raise SisError(13)
+        self.Groups[int(group)] = int(value)
+        return 'GrpmD{}*{:+05d}'.format(int(group), int(value))
+
+    def _GroupQuery(self, conn, group):
+        if not 1 <= int(group) <= 32:
+            raise SisError(13)
+        return 'GrpmD{}*{:+05d}'.format(int(group), self.Groups.get(int(group), 0))
+
+    def _InputAudioMode(self, conn, input_, mode):
+        input_ = self._Input(input_, allowZero=False)
+        self.InputAudioMode[input_ - 1] = int(mode)
+        return 'AfmtI{:02d}*{}'.format(input_, mode)
+
+    def _InputAudioModeQuery(self, conn):
+        return 'AfmtI' + ''.join(str(mode) for mode in self.InputAudioMode)
+
+    def _OutputAudioSelect(self, conn, output, mode):
+        output = self._Output(output)
+        self.OutputAudio[output - 1] = int(mode)
+        return 'AfmtO{:02d}*{}'.format(output, mode)
+
+    def _OutputAudioSelectQuery(self, conn):
+        return 'AfmtO' + ''.join(str(mode) for mode in self.OutputAudio)
+
+    # -- Video ------------------------------------------------------------
+
+    def _SignalStatus(self, conn):
+        return 'Frq00 ' + ''.join(str(signal) for signal in self.Signal)
+
+    def _Temperature(self, conn):
+        return 'Sts00*12.05 {:.2f} 0 0'.format(self.Temperature)
+
+    def _HdcpAuthorization(self, conn, input_, value):
+        input_ = self._Input(input_, allowZero=False)
+        self.HdcpAuthorization[input_ - 1] = int(value)
+        return 'HdcpE{:02d}*{}'.format(input_, value)
+
+    def _HdcpAuthorizationQuery(self, conn, input_):
+        input_ = self._Input(input_, allowZero=False)
+        return self._Tagged(conn, 'HdcpE{:02d}*'.format(input_),
+                            str(self.HdcpAuthorization[input_ - 1]))
+
+    def _HdcpInput(self, conn, input_):
+        input_ = self._Input(input_, allowZero=False)
+        return self._Tagged(conn, 'HdcpI{:02d}*'.format(input_), str(self.HdcpInput[input_ - 1]))
+
+    def _HdcpOutputAuthorization(self, conn, output, value):
+        self._Output(output)
+        self.HdcpOutputAuthorization[output.upper()] = int(value)
+        return 'HdcpS{}*{}'.format(output.upper(), value)
+
+    def _HdcpOutputAuthorizationQuery(self, conn, output):
+        self._Output(output)
+        return self._Tagged(conn, 'HdcpS{}*'.format(output.upper()),
+                            str(self.HdcpOutputAuthorization.get(output.upper(), 0)))
+
+    def _HdcpOutput(self, conn, output):
+        self._Output(output)
+        return self._Tagged(conn, 'HdcpO{}*'.format(output.upper()),
+                            str(self.HdcpOutput.get(output.upper(), 2)))
+
+    def _VideoMute(self, conn, output, value):
+        self._Output(output)
+        if value not in '012':
+            raise SisError(13)
+        self.VideoMute[output.upper()] = int(value)
+        return 'Vmt{}*{}'.format(output.upper(), value)
+
+    def _VideoMuteQuery(self, conn, output):
+        self._Output(output)
+        return self._Tagged(conn, 'Vmt{}*'.format(output.upper()),
+                            str(self.VideoMute.get(output.upper(), 0)))
+
+    def _GlobalVideoMute(self, conn, value):
+        if value not in '012':
+            raise SisError(13)
+        for output in range(1, self.Outputs + 1):
+            self.VideoMute[str(output)] = int(value)
+        return 'Vmt' + value
+
+    def _Freeze(self, conn, output, value):
+        output = self._Output(output)
+        if value not in '01':
+            raise SisError(13)
+        self.Freeze[output] = int(value)
+        return 'Frz{:02d}*{:02d}'.format(output, int(value))
+
+    def _FreezeQuery(self, conn, output):
+        output = self._Output(output)
+        return self._Tagged(conn, 'Frz{:02d}*'.format(output),
+                            '{:02d}'.format(self.Freeze.get(output, 0)))
+
+    def _AutoImage(self, conn, output):
+        output = self._Output(output)
+        return 'Img{:02d}'.format(output)
+
+    def _TestPattern(self, conn, output, value):
+        output = self._Output(output)
+        if not 0 <= int(value) <= 6:
+            raise SisError(13)
+        self.TestPattern[output] = int(value)
+        return 'Test{:02d}*{:02d}'.format(output, int(value))
+
+    def _TestPatternQuery(self, conn, output):
+        output = self._Output(output)
+        return self._Tagged(conn, 'Test{:02d}*'.format(output),
+                            '{:02d}'.format(self.TestPattern.get(output, 0)))
+
+    def _Aspect(self, conn, input_, value):
+        input_ = self._Input(input_, allowZero=False)
+        self.Aspect[input_ - 1] = int(value)
+        return 'Aspr{:02d}*{}'.format(input_, value)
+
+    def _AspectQuery(self, conn, input_):
+        input_ = self._Input(input_, allowZero=False)
+        return self._Tagged(conn, 'Aspr{:02d}*'.format(input_), str(self.Aspect[input_ - 1]))
+
+    def _Edid(self, conn, input_):
+        input_ = self._Input(input_, allowZero=False)
+        return self._Tagged(conn, 'EdidA{:02d}*'.format(input_), str(self.Edid[input_ - 1]))
+
+    def _LogoQuery(self, conn):
+        return 'LogoQ00*' + '1' * 4 + '0' * 12 + '*0'
+
+
+def main():
+    parser = ArgumentParser('Extron DTP CrossPoint 82/84 4K SIS simulator.')
+    parser.add_argument('--model', choices=sorted(MODELS), default='84')
+    parser.add_argument('--verbose-mode', type=int, choices=range(4), default=0)
+    parser.add_argument('--no-echo', action='store_true')
+    args = parser.parse_args()
+    DTPCrossPoint(Model=args.model, Echo=not args.no_echo, Verbose=args.verbose_mode,
+                  **ServerOptions(args)).Serve()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+LG UR640S series display simulator.
+
+Speaks the RS-232C protocol the LG display module uses, over plain TCP as a
+serial device server carries it:
+
+    * commands '<cmd1><cmd2> <set id> <data>\\r', answered with
+      '<cmd2> <set id> OK<data>x' or '<cmd2> <set id> NG<code>x'
+    * power (ka), input (xb), aspect ratio (kc), audio mute (ke), screen
+      mute (kd), volume (kf), OSD (kl), remote lock (km) and remote keys
+      (mc); data FF queries the current value
+    * several displays on one line (multi-drop), one per Set ID; Set ID 00
+      reaches every display and none of them answers, and a command to a Set
+      ID nobody has goes unanswered
+    * NG01 for data a command does not take, NG03 to anything but power
+      while a display is off or still warming up after power on
+
+Every connection shares the one serial line, so with --baud set the line
+rate limits the whole bus: commands are read and answered no faster than
+ten bit times per byte, whichever client sent them. Run it standalone from
+tools/ with:
+
+    python -m simulators.lg_ur640s --port 2003 --set-ids 1 2 3 [--baud 9600]
+        [--warm-up 8] [--latency 0.02]
+
+or start it in a program and point the stand-in at it:
+::
+
+    sim = LGUR640S(SetIDs=(1, 2), Baud=9600)
+    extronlib.interface.Redirect('192.168.1.12', 2003, '127.0.0.1', sim.Start())
+"""
+import re
+from time import monotonic
+
+from simulators._server import ArgumentParser, ServerOptions, SimulatorServer
+
+_Command = re.compile(rb'\A([a-z])([a-z]) ([0-9a-f]{2}) ([0-9a-f]{2})\Z', re.I)
+
+# Command: (display attribute, values it takes); None takes any hex byte up to
+# the attribute's limit in _Limits.
+_Settings = {
+    'ka': ('Power', ('00', '01')),
+    'xb': ('Input', ('90', '91', '92', '00', '10', '01', '11')),
+    'kc': ('AspectRatio', ('01', '02', '06', '09')),
+    'ke': ('AudioMute', ('00', '01')),
+    'kd': ('VideoMute', ('00', '01', '10')),
+    'kf': ('Volume', None),
+    'kl': ('OnScreenDisplay', ('00', '01')),
+    'km': ('ExecutiveMode', ('00', '01')),
+}
+
+_Limits = {'Volume': 0x64}
+
+# Remote key codes the module sends with mc.
+_Keys = {'00', '01', '06', '07', '10', '11', '12', '13', '14', '15', '16', '17', '18', '19',
+         '28', '39', '40', '41', '43', '44', '4C', '5B'}
+
+# NG codes
+_Illegal = '01'
+_Wait = '03'
+
+
+class Display:
+    """State of one display on the line."""
+
+    def __init__(self, SetID, Power='01'):
+        self.SetID = SetID
+        self.Power = Power
+        self.Input = '90'
+        self.AspectRatio = '02'
+        self.AudioMute = '01'
+        self.VideoMute = '00'
+        self.Volume = '14'
+        self.OnScreenDisplay = '01'
+        self.ExecutiveMode = '00'
+        # monotonic() time the display finishes warming up
+        self.ReadyAt = 0.0
+        self.Keys = 0
+
+    def Ready(self):
+        return self.Power == '01' and monotonic() >= self.ReadyAt
+
+
+class LGUR640S(SimulatorServer):
+    Name = 'LG UR640S simulator'
+    SharedLine = True
+
+    def __init__(self, SetIDs=(1,), WarmUp=0.0, Power='01', **options):
+        super().__init__(**options)
+        self.WarmUp = WarmUp
+        self.Displays = {'{:02X}'.format(int(setID)): Display(setID, Power) for setID in SetIDs}
+        self.Stats['Broadcasts'] = 0
+        self.Stats['Unanswered'] = 0
+        # Set ID: commands answered
+        self.Stats['PerDisplay'] = {setID: 0 for setID in self.Displays}
+
+    def GetStats(self):
+        stats = super().GetStats()
+        stats['PerDisplay'] = dict(stats['PerDisplay'])
+        return stats
+
+    def Receive(self, conn, data):
+        conn.Buffer += data
+        while b'\r' in conn.Buffer:
+            frame, conn.Buffer = conn.Buffer.split(b'\r', 1)
+            frame = frame.strip(b'\n ')
+            if not frame:
+                continue
+            # A command is acted on once all of it (and its CR) has crossed
+            # the line.
+            self.CallAt(self.Arrival(conn, len(frame) + 1), self._Command, conn, frame)
+        if len(conn.Buffer) > 256:
+            conn.Buffer = b''
+
+    def _Command(self, conn, frame):
+        self.Stats['Commands'] += 1
+        match = _Command.match(frame)
+        if not match:
+            self.Stats['Errors'] += 1
+            return
+        cmd1, cmd2, setID, data = (group.decode() for group in match.groups())
+        command = (cmd1 + cmd2).lower()
+        setID = setID.upper()
+        data = data.upper()
+
+        if setID == '00':
+            self.Stats['Broadcasts'] += 1
+            for display in self.Displays.values():
+                self._Execute(display, command, data)
+            return
+        display = self.Displays.get(setID)
+        if display is None:
+            self.Stats['Unanswered'] += 1
+            return
+        result = self._Execute(display, command, data)
+        if result is None:
+            self.Stats['Unanswered'] += 1
+            return
+        status, value = result
+        if status == 'NG':
+            self.Stats['Errors'] += 1
+        self.Stats['PerDisplay'][setID] += 1
+        # The display answers with the Set ID in lower case hex.
+        self.Reply(conn, '{} {} {}{}x'.format(cmd2.lower(), setID.lower(), status, value))
+
+    def _Execute(self, display, command, data):
+        # Returns ('OK' or 'NG', data) to answer with, or None for no answer.
+        if command == 'mc':
+            if not display.Ready():
+                return 'NG', _Wait
+            if data not in _Keys:
+                return 'NG', _Illegal
+            display.Keys += 1
+            return 'OK', data
+
+        setting = _Settings.get(command)
+        if setting is None:
+            return None
+        attribute, values = setting
+
+        if attribute == 'Power':
+            if data == 'FF':
+                return 'OK', display.Power
+            if data not in values:
+                return 'NG', _Illegal
+            if data == '01' and display.Power != '01':
+                display.ReadyAt = monotonic() + self.WarmUp
+            display.Power = data
+            return 'OK', data
+
+        if not display.Ready():
+            return 'NG', _Wait
+        if data == 'FF':
+            return 'OK', getattr(display, attribute)
+        if values is None:
+            if int(data, 16) > _Limits[attribute]:
+                return 'NG', _Illegal
+        elif data not in values:
+            return 'NG', _Illegal
+        setattr(display, attribute, data)
+        return 'OK', data
+
+
+def main():
+    parser = ArgumentParser('LG UR640S series RS-232C display simulator.')
+    parser.add_argument('--set-ids', type=int, nargs='+', default=[1],
+                        help='Set IDs of the displays on the line')
+    parser.add_argument('--warm-up', type=float, default=0.0,
+                        help='seconds a display takes to answer after power on')
+    parser.add_argument('--off', action='store_true', help='start with the displays off')
+    args = parser.parse_args()
+    LGUR640S(SetIDs=args.set_ids, WarmUp=args.warm_up, Power='00' if args.off else '01',
+             **ServerOptions(args)).Serve()
+
+
+if __name__ == '__main__':
+    main()